@@ -24,6 +24,7 @@
 )
 from dagster._core.definitions.asset_graph_differ import AssetGraphDiffer
 from dagster._core.definitions.data_time import CachingDataTimeResolver
+from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
 from dagster._core.definitions.partition import (
     CachingDynamicPartitionsLoader,
     PartitionsDefinition,
@@ -605,6 +606,38 @@ def build_partition_statuses(
         check.failed("Should not reach this point")
 
 
+def _get_dim2_partition_subsets_by_dim1(
+    partitions_subset: PartitionsSubset, partitions_def: MultiPartitionsDefinition
+) -> Dict[str, PartitionsSubset]:
+    """Splits a subset of a MultiPartitionsDefinition into, for each key of the primary dimension,
+    the subset of the secondary dimension's partitions that appear alongside it.
+    """
+    primary_dim = partitions_def.primary_dimension
+    secondary_dim = partitions_def.secondary_dimension
+
+    dim2_keys_by_dim1: Dict[str, List[str]] = defaultdict(list)
+    if isinstance(partitions_subset, MultiPartitionsSubset):
+        # already grouped by secondary key, so no need to parse each partition key
+        for dim2_key, dim1_subset in partitions_subset.subsets_by_secondary_key.items():
+            for dim1_key in dim1_subset.get_partition_keys():
+                dim2_keys_by_dim1[dim1_key].append(dim2_key)
+    else:
+        for partition_key in partitions_subset.get_partition_keys():
+            multipartition_key = partitions_def.get_partition_key_from_str(partition_key)
+            dim2_keys_by_dim1[multipartition_key.keys_by_dimension[primary_dim.name]].append(
+                multipartition_key.keys_by_dimension[secondary_dim.name]
+            )
+
+    dim2_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
+        lambda: secondary_dim.partitions_def.empty_subset()
+    )
+    for dim1_key, dim2_keys in dim2_keys_by_dim1.items():
+        dim2_partition_subset_by_dim1[dim1_key] = (
+            secondary_dim.partitions_def.empty_subset().with_partition_keys(dim2_keys)
+        )
+    return dim2_partition_subset_by_dim1
+
+
 def get_2d_run_length_encoded_partitions(
     dynamic_partitions_store: DynamicPartitionsStore,
     materialized_partitions_subset: PartitionsSubset,
@@ -625,38 +658,15 @@ def get_2d_run_length_encoded_partitions(
     primary_dim = partitions_def.primary_dimension
     secondary_dim = partitions_def.secondary_dimension
 
-    dim2_materialized_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
+    dim2_materialized_partition_subset_by_dim1 = _get_dim2_partition_subsets_by_dim1(
+        materialized_partitions_subset, partitions_def
     )
-    for partition_key in materialized_partitions_subset.get_partition_keys():
-        multipartition_key = partitions_def.get_partition_key_from_str(partition_key)
-        dim2_materialized_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_materialized_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys([multipartition_key.keys_by_dimension[secondary_dim.name]])
-
-    dim2_failed_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
+    dim2_failed_partition_subset_by_dim1 = _get_dim2_partition_subsets_by_dim1(
+        failed_partitions_subset, partitions_def
     )
-    for partition_key in failed_partitions_subset.get_partition_keys():
-        multipartition_key = partitions_def.get_partition_key_from_str(partition_key)
-        dim2_failed_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_failed_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys([multipartition_key.keys_by_dimension[secondary_dim.name]])
-
-    dim2_in_progress_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
+    dim2_in_progress_partition_subset_by_dim1 = _get_dim2_partition_subsets_by_dim1(
+        in_progress_partitions_subset, partitions_def
     )
-    for partition_key in in_progress_partitions_subset.get_partition_keys():
-        multipartition_key = partitions_def.get_partition_key_from_str(partition_key)
-        dim2_in_progress_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_in_progress_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys([multipartition_key.keys_by_dimension[secondary_dim.name]])
 
     materialized_2d_ranges = []
 
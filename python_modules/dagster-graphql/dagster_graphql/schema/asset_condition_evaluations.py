@@ -100,9 +100,7 @@ def __init__(self, evaluation: AutomationConditionEvaluation):
             startTimestamp=evaluation.start_timestamp,
             endTimestamp=evaluation.end_timestamp,
             numTrue=evaluation.true_subset.size,
-            numCandidates=evaluation.candidate_subset.size
-            if isinstance(evaluation.candidate_subset, SerializableEntitySubset)
-            else None,
+            numCandidates=_get_num_candidates(evaluation),
             childUniqueIds=[
                 child.condition_snapshot.unique_id for child in evaluation.child_evaluations
             ],
@@ -221,6 +219,7 @@ class GrapheneAutomationConditionEvaluationNode(graphene.ObjectType):
 
     numTrue = graphene.NonNull(graphene.Int)
     numCandidates = graphene.Field(graphene.Int)
+    numStorageQueries = graphene.Field(graphene.Int)
 
     isPartitioned = graphene.NonNull(graphene.Boolean)
 
@@ -238,9 +237,8 @@ def __init__(self, evaluation: AutomationConditionEvaluation):
             startTimestamp=evaluation.start_timestamp,
             endTimestamp=evaluation.end_timestamp,
             numTrue=evaluation.true_subset.size,
-            numCandidates=evaluation.candidate_subset.size
-            if isinstance(evaluation.candidate_subset, SerializableEntitySubset)
-            else None,
+            numCandidates=_get_num_candidates(evaluation),
+            numStorageQueries=evaluation.num_storage_queries,
             isPartitioned=evaluation.true_subset.is_partitioned,
             childUniqueIds=[
                 child.condition_snapshot.unique_id for child in evaluation.child_evaluations
@@ -321,6 +319,13 @@ class Meta:
         name = "AssetConditionEvaluationRecordsOrError"
 
 
+def _get_num_candidates(evaluation: AutomationConditionEvaluation) -> Optional[int]:
+    if isinstance(evaluation.candidate_subset, SerializableEntitySubset):
+        return evaluation.candidate_subset.size
+    # the size of an all-partitions candidate subset is recorded at evaluation time
+    return evaluation.candidate_subset_size
+
+
 def _flatten_evaluation(
     e: AutomationConditionEvaluation,
 ) -> Sequence[AutomationConditionEvaluation]:
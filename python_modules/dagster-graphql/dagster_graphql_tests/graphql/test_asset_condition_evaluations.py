@@ -334,6 +334,8 @@ def test_get_tick_range(self, graphql_context):
                     startTimestamp
                     endTimestamp
                     numTrue
+                    numCandidates
+                    numStorageQueries
                     uniqueId
                     childUniqueIds
                 }
@@ -693,6 +695,8 @@ def A() -> None: ...
             "(NOT (in_progress))",
         ]
         assert rootNode["numTrue"] == 0
+        assert rootNode["numCandidates"] == 4
+        assert rootNode["numStorageQueries"] > 0
         assert len(rootNode["childUniqueIds"]) == 5
 
         def _get_node(id):
@@ -0,0 +1,216 @@
+# ruff: noqa: T201
+import argparse
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+from dagster._core.storage.event_log.base import EventLogStorage
+from dagster._core.utils import make_new_run_id
+from dagster._utils.concurrency import ConcurrencyClaimStatus, ConcurrencySlotClaim
+from dagster._utils.test import ConcurrencyEnabledSqliteTestEventLogStorage
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare claiming op concurrency slots one step at a time (`claim_concurrency_slot`) against claiming
+them in batches (`claim_concurrency_slots`), which is what the executor does on each iteration of
+its loop.
+
+The benchmark simulates `--runs` runs, each with `--steps` steps spread round-robin across `--keys`
+concurrency keys that each have `--slots` slots. Every run repeatedly claims slots for all of its
+steps that are not yet running, and frees the slots of the steps it was granted, until every step
+has run. Only the time spent claiming slots is compared. The per-step and batched modes are checked
+to grant the same steps in the same order.
+
+Uses a sqlite storage in a temporary directory by default. Pass `--postgres-url` to run against
+Postgres instead, which also exercises the single-statement slot claim.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="concurrency_slots",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--runs",
+    type=int,
+    default=10,
+    help="Number of concurrently executing runs.",
+)
+
+parser.add_argument(
+    "--steps",
+    type=int,
+    default=200,
+    help="Number of steps in each run.",
+)
+
+parser.add_argument(
+    "--keys",
+    type=int,
+    default=5,
+    help="Number of concurrency keys that the steps are spread across.",
+)
+
+parser.add_argument(
+    "--slots",
+    type=int,
+    default=20,
+    help="Number of slots for each concurrency key.",
+)
+
+parser.add_argument(
+    "--postgres-url",
+    type=str,
+    default=None,
+    help="Run against the Postgres database at this url instead of sqlite.",
+)
+
+ClaimFn = Callable[
+    [EventLogStorage, str, Sequence[ConcurrencySlotClaim]], Sequence[ConcurrencyClaimStatus]
+]
+
+
+def claim_per_step(
+    storage: EventLogStorage, run_id: str, claims: Sequence[ConcurrencySlotClaim]
+) -> Sequence[ConcurrencyClaimStatus]:
+    return [
+        storage.claim_concurrency_slot(
+            claim.concurrency_key, run_id, claim.step_key, claim.priority
+        )
+        for claim in claims
+    ]
+
+
+def claim_batched(
+    storage: EventLogStorage, run_id: str, claims: Sequence[ConcurrencySlotClaim]
+) -> Sequence[ConcurrencyClaimStatus]:
+    return storage.claim_concurrency_slots(run_id, claims)
+
+
+@contextmanager
+def get_storage(postgres_url: Optional[str]) -> Iterator[EventLogStorage]:
+    if postgres_url:
+        from dagster_postgres.event_log import PostgresEventLogStorage
+
+        storage = PostgresEventLogStorage(postgres_url)
+        try:
+            yield storage
+        finally:
+            storage.dispose()
+    else:
+        with tempfile.TemporaryDirectory() as tmpdir_path:
+            storage = ConcurrencyEnabledSqliteTestEventLogStorage(base_dir=tmpdir_path)
+            try:
+                yield storage
+            finally:
+                storage.dispose()
+
+
+def simulate(
+    storage: EventLogStorage,
+    claim_fn: ClaimFn,
+    num_runs: int,
+    num_steps: int,
+    keys: Sequence[str],
+    num_slots: int,
+) -> Tuple[float, int, List[Tuple[int, str]]]:
+    """Runs every step of every run through the slot queue. Returns the time spent claiming slots,
+    the number of claim rounds, and the (run index, step key) of each step that was granted a slot,
+    in order.
+    """
+    for key in keys:
+        storage.set_concurrency_slots(key, num_slots)
+
+    run_ids = [make_new_run_id() for _ in range(num_runs)]
+    remaining = {
+        run_index: [
+            ConcurrencySlotClaim(concurrency_key=keys[i % len(keys)], step_key=f"step_{i}")
+            for i in range(num_steps)
+        ]
+        for run_index in range(num_runs)
+    }
+
+    granted: List[Tuple[int, str]] = []
+    claim_time = 0.0
+    rounds = 0
+    while any(remaining.values()):
+        rounds += 1
+        running = []
+        for run_index, run_id in enumerate(run_ids):
+            claims = remaining[run_index]
+            if not claims:
+                continue
+            start = time.perf_counter()
+            statuses = claim_fn(storage, run_id, claims)
+            claim_time += time.perf_counter() - start
+            still_pending = []
+            for claim, status in zip(claims, statuses):
+                if status.is_claimed:
+                    granted.append((run_index, claim.step_key))
+                    running.append((run_id, claim.step_key))
+                else:
+                    still_pending.append(claim)
+            remaining[run_index] = still_pending
+
+        # every step that was granted a slot this round completes before the next round
+        for run_id, step_key in running:
+            storage.free_concurrency_slot_for_step(run_id, step_key)
+
+    for run_id in run_ids:
+        storage.free_concurrency_slots_for_run(run_id)
+    for key in keys:
+        storage.delete_concurrency_limit(key)
+
+    return claim_time, rounds, granted
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(
+    num_runs: int, num_steps: int, num_keys: int, num_slots: int, postgres_url: Optional[str]
+) -> None:
+    session = ProfilingSession(
+        name="Op concurrency slot claims",
+        experiment_settings={
+            "runs": num_runs,
+            "steps": num_steps,
+            "keys": num_keys,
+            "slots": num_slots,
+            "storage": "postgres" if postgres_url else "sqlite",
+        },
+    ).start()
+    session.log_start_message()
+
+    results = {}
+    with get_storage(postgres_url) as storage:
+        for mode, claim_fn in [("per-step", claim_per_step), ("batched", claim_batched)]:
+            # use distinct keys for each mode so that the runs do not contend with each other
+            keys = [f"benchmark_{mode}_{i}" for i in range(num_keys)]
+            with session.logged_execution_time(f"Claim slots for all steps ({mode})"):
+                results[mode] = simulate(storage, claim_fn, num_runs, num_steps, keys, num_slots)
+
+    session.log_result_summary()
+
+    per_step_time, per_step_rounds, per_step_granted = results["per-step"]
+    batched_time, batched_rounds, batched_granted = results["batched"]
+    assert per_step_rounds == batched_rounds, "Number of claim rounds differs across modes"
+    assert per_step_granted == batched_granted, "Granted steps differ across modes"
+
+    # the time spent freeing slots is the same in both modes, so only the claims are compared
+    print(
+        f"{num_runs * num_steps} pending steps, {batched_rounds} claim rounds, time spent claiming:"
+    )
+    print(
+        f"{per_step_time:.4f}s -> {batched_time:.4f}s"
+        f" ({per_step_time / max(batched_time, 1e-9):.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.runs, args.steps, args.keys, args.slots, args.postgres_url)
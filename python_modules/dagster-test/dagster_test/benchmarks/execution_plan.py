@@ -0,0 +1,145 @@
+# ruff: noqa: T201
+import argparse
+import time
+from typing import Callable, Dict, List, Sequence, Tuple, TypeVar
+
+from dagster import DependencyDefinition, GraphDefinition, In, JobDefinition, Nothing, op
+from dagster._core.definitions.dependency import NodeInvocation
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.snap.execution_plan_snapshot import (
+    ExecutionPlanSnapshot,
+    snapshot_from_execution_plan,
+)
+from dagster._serdes import deserialize_value, serialize_value
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+T = TypeVar("T")
+
+DESC = """
+Measure execution plan construction for jobs of N ops, arranged in chains of `--chain-length` ops.
+For each job size, times:
+
+    * building the job definition
+    * building the full execution plan, as the run orchestrator does
+    * building the plan for a single step from the job definition, as a step worker does
+    * building and serializing the snapshot of the plan for a single step that is sent to a step
+      worker, as the orchestrator does when launching a step
+    * deserializing and rehydrating that snapshot, as a step worker does when it is sent one
+
+Longer chains make for deeper graphs, which exercises the topological sorts of the job and plan.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="execution_plan",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--sizes",
+    type=int,
+    nargs="+",
+    default=[1000, 10000, 50000],
+    help="Numbers of ops in the benchmark jobs.",
+)
+
+parser.add_argument(
+    "--chain-length",
+    type=int,
+    default=10,
+    help="Number of ops in each chain of dependent ops.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+@op(ins={"start": In(Nothing)})
+def noop() -> None:
+    pass
+
+
+def build_job(num_ops: int, chain_length: int) -> JobDefinition:
+    dependencies: Dict[NodeInvocation, Dict[str, DependencyDefinition]] = {}
+    for i in range(num_ops):
+        dependencies[NodeInvocation("noop", f"op_{i}")] = (
+            {"start": DependencyDefinition(f"op_{i - 1}")} if i % chain_length else {}
+        )
+    return GraphDefinition(
+        name=f"job_{num_ops}", node_defs=[noop], dependencies=dependencies
+    ).to_job()
+
+
+def timed(fn: Callable[[], T]) -> Tuple[T, float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(sizes: Sequence[int], chain_length: int) -> None:
+    session = ProfilingSession(
+        name="Execution plan construction",
+        experiment_settings={"sizes": sizes, "chain_length": chain_length},
+    ).start()
+    session.log_start_message()
+
+    results: List[Tuple[int, Dict[str, float]]] = []
+    for num_ops in sizes:
+        timings = {}
+        # the last op of the first chain, so that the step has an upstream step
+        step_key = f"op_{min(chain_length, num_ops) - 1}"
+
+        with session.logged_execution_time(f"{num_ops} ops: build job definition"):
+            job_def, timings["job definition"] = timed(lambda: build_job(num_ops, chain_length))
+
+        with session.logged_execution_time(f"{num_ops} ops: build full plan"):
+            plan, timings["full plan"] = timed(lambda: create_execution_plan(job_def))
+
+        with session.logged_execution_time(f"{num_ops} ops: build single step plan"):
+            step_plan, timings["single step plan"] = timed(
+                lambda: create_execution_plan(job_def, step_keys_to_execute=[step_key])
+            )
+
+        # the orchestrator reads the job snapshot id from the run rather than computing it
+        job_snapshot_id = job_def.get_job_snapshot_id()
+
+        with session.logged_execution_time(f"{num_ops} ops: build single step snapshot"):
+            serialized, timings["single step snapshot"] = timed(
+                lambda: serialize_value(
+                    snapshot_from_execution_plan(
+                        plan.build_isolated_subset_plan([step_key], job_def),
+                        job_snapshot_id,
+                    )
+                )
+            )
+
+        with session.logged_execution_time(f"{num_ops} ops: rehydrate single step snapshot"):
+            rehydrated_plan, timings["rehydrate snapshot"] = timed(
+                lambda: create_execution_plan(
+                    job_def,
+                    step_keys_to_execute=[step_key],
+                    execution_plan_snapshot=deserialize_value(serialized, ExecutionPlanSnapshot),
+                )
+            )
+
+        assert rehydrated_plan.step_keys_to_execute == step_plan.step_keys_to_execute
+        results.append((num_ops, timings))
+
+    session.log_result_summary()
+
+    for num_ops, timings in results:
+        print(
+            f"{num_ops} ops: "
+            + ", ".join(f"{name} {duration:.3f}s" for name, duration in timings.items())
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.sizes, args.chain_length)
@@ -0,0 +1,181 @@
+# ruff: noqa: T201
+import argparse
+import os
+import time
+from functools import partial
+from typing import Callable, List, Mapping, Sequence
+
+from dagster import AssetExecutionContext, Definitions, asset, materialize
+from dagster._core.definitions.assets import AssetsDefinition
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.remote_representation.external_data import RepositorySnap
+from dagster._core.snap.execution_plan_snapshot import snapshot_from_execution_plan
+from dagster._serdes import deserialize_value, serialize_value
+from dagster._serdes.serdes import PackableValue
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the generic serdes path against the per-class compiled packers enabled by
+`DAGSTER_SERDES_COMPILED_PACKERS` on representative payloads:
+
+    * RepositorySnap for a repository of N assets arranged in chains of 10
+    * ExecutionPlanSnapshot for the asset job of that repository
+    * the EventLogEntry records produced by materializing a subset of those assets
+
+Each payload is serialized and deserialized `--iterations` times in each mode and the best time is
+reported. Serialized output is checked to be identical across modes.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="serdes",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-assets",
+    type=int,
+    default=500,
+    help="Number of assets in the benchmark repository.",
+)
+
+parser.add_argument(
+    "--num-materialized",
+    type=int,
+    default=50,
+    help="Number of assets materialized to produce the event log payload.",
+)
+
+parser.add_argument(
+    "--iterations",
+    type=int,
+    default=10,
+    help="Number of times each payload is serialized and deserialized per mode.",
+)
+
+_COMPILED_ENV_VAR = "DAGSTER_SERDES_COMPILED_PACKERS"
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def build_assets(num_assets: int) -> Sequence[AssetsDefinition]:
+    assets = []
+    for i in range(num_assets):
+        deps = [f"asset_{i - 1}"] if i % 10 else []
+
+        @asset(name=f"asset_{i}", deps=deps, group_name=f"group_{i // 10}")
+        def _asset(context: AssetExecutionContext) -> None:
+            context.add_output_metadata({"index": i, "name": context.asset_key.to_user_string()})
+
+        assets.append(_asset)
+    return assets
+
+
+def build_payloads(num_assets: int, num_materialized: int) -> Mapping[str, PackableValue]:
+    assets = build_assets(num_assets)
+    repo = Definitions(assets=assets).get_repository_def()
+    asset_job = repo.get_implicit_global_asset_job_def()
+    plan_snapshot = snapshot_from_execution_plan(
+        create_execution_plan(asset_job), asset_job.get_job_snapshot_id()
+    )
+
+    with instance_for_test() as instance:
+        result = materialize(assets[:num_materialized], instance=instance)
+        records = instance.all_logs(result.run_id)
+
+    return {
+        "RepositorySnap": RepositorySnap.from_def(repo),
+        "ExecutionPlanSnapshot": plan_snapshot,
+        "EventLogEntry": records,
+    }
+
+
+def best_time(fn: Callable[[], object], iterations: int) -> float:
+    # best-of-N is much less sensitive to GC pauses and scheduling noise than the mean
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def serialize_payload(payload: PackableValue) -> List[str]:
+    # event log entries are stored and read one row at a time
+    if isinstance(payload, list):
+        return [serialize_value(entry) for entry in payload]
+    return [serialize_value(payload)]
+
+
+def deserialize_payload(serialized: Sequence[str]) -> None:
+    for value in serialized:
+        deserialize_value(value)
+
+
+def set_compiled(enabled: bool) -> None:
+    if enabled:
+        os.environ[_COMPILED_ENV_VAR] = "1"
+    else:
+        os.environ.pop(_COMPILED_ENV_VAR, None)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, num_materialized: int, iterations: int) -> None:
+    session = ProfilingSession(
+        name="Serdes compiled packers",
+        experiment_settings={
+            "num_assets": num_assets,
+            "num_materialized": num_materialized,
+            "iterations": iterations,
+        },
+    ).start()
+    session.log_start_message()
+
+    with session.logged_execution_time("Build payloads"):
+        payloads = build_payloads(num_assets, num_materialized)
+
+    results = []
+    for name, payload in payloads.items():
+        timings = {}
+        outputs = {}
+        for compiled in (False, True):
+            set_compiled(compiled)
+            # also warms up the compiled packers and unpackers before timing
+            serialized = serialize_payload(payload)
+            deserialize_payload(serialized)
+
+            with session.logged_execution_time(
+                f"{name}: {'compiled' if compiled else 'generic'} serialize + deserialize"
+            ):
+                serialize_time = best_time(partial(serialize_payload, payload), iterations)
+                deserialize_time = best_time(partial(deserialize_payload, serialized), iterations)
+
+            timings[compiled] = (serialize_time, deserialize_time)
+            outputs[compiled] = serialized
+
+        set_compiled(False)
+        assert outputs[False] == outputs[True], f"Serialized output for {name} differs across modes"
+        results.append((name, timings))
+
+    session.log_result_summary()
+
+    for name, timings in results:
+        generic_ser, generic_de = timings[False]
+        compiled_ser, compiled_de = timings[True]
+        print(
+            f"{name} (best of {iterations}): serialize {generic_ser:.4f}s -> {compiled_ser:.4f}s"
+            f" ({generic_ser / compiled_ser:.2f}x), deserialize {generic_de:.4f}s ->"
+            f" {compiled_de:.4f}s ({generic_de / compiled_de:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.num_materialized, args.iterations)
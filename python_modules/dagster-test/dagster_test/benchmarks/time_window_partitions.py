@@ -0,0 +1,176 @@
+# ruff: noqa: T201
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Mapping, Tuple
+from unittest import mock
+
+from dagster import TimeWindowPartitionsDefinition
+from dagster._time import create_datetime
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the arithmetic key <-> index mapping used by TimeWindowPartitionsDefinition for fixed-period
+cron schedules against iterating over the cron schedule, which is what happens for schedules
+without a fixed period (and what happened for every schedule before the fast path existed).
+
+The benchmark partitions definition has `--minutes`-minute partitions spanning `--years` years, so
+the defaults (5 minutes, 4 years) produce ~420k partitions. Each operation is run `--iterations`
+times in each mode and the best time is reported. Results are checked to be identical across modes.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="time_window_partitions",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--minutes",
+    type=int,
+    default=5,
+    help="Length of each partition, in minutes. Must divide 60.",
+)
+
+parser.add_argument(
+    "--years",
+    type=int,
+    default=4,
+    help="Number of years covered by the partitions definition.",
+)
+
+parser.add_argument(
+    "--timezone",
+    type=str,
+    default="UTC",
+    help="Timezone of the partitions definition.",
+)
+
+parser.add_argument(
+    "--iterations",
+    type=int,
+    default=3,
+    help="Number of times each operation is run per mode.",
+)
+
+# methods with an lru_cache, which is shared between equal partitions definitions
+_CACHED_METHODS = [
+    TimeWindowPartitionsDefinition.time_window_for_partition_key,
+    TimeWindowPartitionsDefinition.time_windows_for_partition_keys,
+    TimeWindowPartitionsDefinition.get_partition_keys_in_time_window,
+    TimeWindowPartitionsDefinition._get_first_partition_window,  # noqa: SLF001
+    TimeWindowPartitionsDefinition._get_last_partition_window,  # noqa: SLF001
+]
+
+
+def build_partitions_def(minutes: int, timezone: str) -> TimeWindowPartitionsDefinition:
+    return TimeWindowPartitionsDefinition(
+        start="2020-01-01-00:00",
+        fmt="%Y-%m-%d-%H:%M",
+        cron_schedule=f"*/{minutes} * * * *",
+        timezone=timezone,
+    )
+
+
+def build_operations(
+    minutes: int, current_time: datetime
+) -> Mapping[str, Callable[[TimeWindowPartitionsDefinition], object]]:
+    # a day of partition keys from the middle of the range
+    middle = create_datetime(2022, 1, 1)
+    sampled_keys = frozenset(
+        (middle + timedelta(minutes=minutes * i)).strftime("%Y-%m-%d-%H:%M")
+        for i in range(24 * 60 // minutes)
+    )
+    last_key = (current_time - timedelta(minutes=minutes)).strftime("%Y-%m-%d-%H:%M")
+
+    return {
+        "get_partition_keys": lambda partitions_def: partitions_def.get_partition_keys(
+            current_time=current_time
+        ),
+        "get_num_partitions": lambda partitions_def: partitions_def.get_num_partitions(
+            current_time=current_time
+        ),
+        "get_partition_keys_between_indexes (last page)": (
+            lambda partitions_def: partitions_def.get_partition_keys_between_indexes(
+                partitions_def.get_num_partitions(current_time=current_time) - 100,
+                partitions_def.get_num_partitions(current_time=current_time),
+                current_time=current_time,
+            )
+        ),
+        "has_partition_key": lambda partitions_def: partitions_def.has_partition_key(
+            last_key, current_time=current_time
+        ),
+        "time_windows_for_partition_keys (one day)": (
+            lambda partitions_def: partitions_def.time_windows_for_partition_keys(
+                sampled_keys, validate=False
+            )
+        ),
+    }
+
+
+def best_time(fn: Callable[[], object], iterations: int) -> Tuple[float, object]:
+    # best-of-N is much less sensitive to GC pauses and scheduling noise than the mean
+    timings = []
+    result = None
+    for _ in range(iterations):
+        for method in _CACHED_METHODS:
+            method.cache_clear()  # type: ignore
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(minutes: int, years: int, timezone: str, iterations: int) -> None:
+    session = ProfilingSession(
+        name="Time window partitions fixed-period fast path",
+        experiment_settings={
+            "minutes": minutes,
+            "years": years,
+            "timezone": timezone,
+            "iterations": iterations,
+        },
+    ).start()
+    session.log_start_message()
+
+    current_time = create_datetime(2020 + years, 1, 1)
+    operations = build_operations(minutes, current_time)
+
+    results: List[Tuple[str, float, float]] = []
+    for name, operation in operations.items():
+        with session.logged_execution_time(f"{name}: arithmetic"):
+            partitions_def = build_partitions_def(minutes, timezone)
+            assert partitions_def._fixed_period_seconds  # noqa: SLF001
+            fast_time, fast_result = best_time(lambda: operation(partitions_def), iterations)
+
+        with session.logged_execution_time(f"{name}: iteration"):
+            with mock.patch.object(TimeWindowPartitionsDefinition, "_fixed_period_seconds", None):
+                partitions_def = build_partitions_def(minutes, timezone)
+                iterated_time, iterated_result = best_time(
+                    lambda: operation(partitions_def), iterations
+                )
+
+        assert fast_result == iterated_result, f"Results for {name} differ across modes"
+        results.append((name, iterated_time, fast_time))
+
+    session.log_result_summary()
+
+    num_partitions = build_partitions_def(minutes, timezone).get_num_partitions(
+        current_time=current_time
+    )
+    print(f"{num_partitions} partitions, best of {iterations}:")
+    for name, iterated_time, fast_time in results:
+        print(
+            f"{name}: {iterated_time:.4f}s -> {fast_time:.4f}s"
+            f" ({iterated_time / max(fast_time, 1e-9):.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.minutes, args.years, args.timezone, args.iterations)
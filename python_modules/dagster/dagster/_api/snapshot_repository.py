@@ -1,15 +1,35 @@
-from typing import TYPE_CHECKING, Mapping
+import os
+from typing import TYPE_CHECKING, Mapping, Union
 
 import dagster._check as check
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.remote_representation.external_data import RepositoryErrorSnap, RepositorySnap
-from dagster._serdes import deserialize_value
+from dagster._core.snap.job_snapshot import JobSnap
+from dagster._serdes import deserialize_value, deserialize_value_lazily
 
 if TYPE_CHECKING:
     from dagster._core.remote_representation import CodeLocation
     from dagster._grpc.client import DagsterGrpcClient
 
 
+def _lazy_job_snapshots_enabled() -> bool:
+    return str(os.getenv("DAGSTER_LAZY_LOAD_JOB_SNAPSHOTS")).lower() in ("1", "true", "t")
+
+
+def _deserialize_repository_snap(
+    serialized_repository_snap: str,
+) -> Union[RepositorySnap, RepositoryErrorSnap]:
+    # Most consumers of a RepositorySnap only touch a few of its jobs, so optionally defer
+    # unpacking each JobSnap until it is accessed.
+    if _lazy_job_snapshots_enabled():
+        return deserialize_value_lazily(
+            serialized_repository_snap,
+            (RepositorySnap, RepositoryErrorSnap),
+            lazy_types=[JobSnap],
+        )
+    return deserialize_value(serialized_repository_snap, (RepositorySnap, RepositoryErrorSnap))
+
+
 def sync_get_streaming_external_repositories_data_grpc(
     api_client: "DagsterGrpcClient", code_location: "CodeLocation"
 ) -> Mapping[str, RepositorySnap]:
@@ -28,14 +48,13 @@ def sync_get_streaming_external_repositories_data_grpc(
             )
         )
 
-        result = deserialize_value(
+        result = _deserialize_repository_snap(
             "".join(
                 [
                     chunk["serialized_external_repository_chunk"]
                     for chunk in external_repository_chunks
                 ]
-            ),
-            (RepositorySnap, RepositoryErrorSnap),
+            )
         )
 
         if isinstance(result, RepositoryErrorSnap):
@@ -64,14 +83,13 @@ async def gen_streaming_external_repositories_data_grpc(
             )
         ]
 
-        result = deserialize_value(
+        result = _deserialize_repository_snap(
             "".join(
                 [
                     chunk["serialized_external_repository_chunk"]
                     for chunk in external_repository_chunks
                 ]
-            ),
-            (RepositorySnap, RepositoryErrorSnap),
+            )
         )
 
         if isinstance(result, RepositoryErrorSnap):
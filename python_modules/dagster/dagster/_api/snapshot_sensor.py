@@ -45,8 +45,7 @@ def sync_get_external_sensor_execution_data_ephemeral_grpc(
         )
 
 
-def sync_get_external_sensor_execution_data_grpc(
-    api_client: "DagsterGrpcClient",
+def _get_sensor_execution_args(
     instance: "DagsterInstance",
     repository_handle: RepositoryHandle,
     sensor_name: str,
@@ -54,9 +53,9 @@ def sync_get_external_sensor_execution_data_grpc(
     last_run_key: Optional[str],
     cursor: Optional[str],
     log_key: Optional[Sequence[str]],
-    last_sensor_start_time: Optional[float] = None,
-    timeout: Optional[int] = None,
-) -> SensorExecutionData:
+    last_sensor_start_time: Optional[float],
+    timeout: Optional[int],
+) -> SensorExecutionArgs:
     check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
     check.str_param(sensor_name, "sensor_name")
     check.opt_float_param(last_tick_completion_time, "last_tick_completion_time")
@@ -64,22 +63,22 @@ def sync_get_external_sensor_execution_data_grpc(
     check.opt_str_param(last_run_key, "last_run_key")
     check.opt_str_param(cursor, "cursor")
 
-    origin = repository_handle.get_remote_origin()
+    return SensorExecutionArgs(
+        repository_origin=repository_handle.get_remote_origin(),
+        instance_ref=instance.get_ref(),
+        sensor_name=sensor_name,
+        last_tick_completion_time=last_tick_completion_time,
+        last_run_key=last_run_key,
+        cursor=cursor,
+        log_key=log_key,
+        timeout=timeout,
+        last_sensor_start_time=last_sensor_start_time,
+    )
+
 
+def _deserialize_sensor_execution_data(serialized_result: str) -> SensorExecutionData:
     result = deserialize_value(
-        api_client.external_sensor_execution(
-            sensor_execution_args=SensorExecutionArgs(
-                repository_origin=origin,
-                instance_ref=instance.get_ref(),
-                sensor_name=sensor_name,
-                last_tick_completion_time=last_tick_completion_time,
-                last_run_key=last_run_key,
-                cursor=cursor,
-                log_key=log_key,
-                timeout=timeout,
-                last_sensor_start_time=last_sensor_start_time,
-            ),
-        ),
+        serialized_result,
         (SensorExecutionData, SensorExecutionErrorSnap),
     )
 
@@ -87,3 +86,61 @@ def sync_get_external_sensor_execution_data_grpc(
         raise DagsterUserCodeProcessError.from_error_info(result.error)
 
     return result
+
+
+def sync_get_external_sensor_execution_data_grpc(
+    api_client: "DagsterGrpcClient",
+    instance: "DagsterInstance",
+    repository_handle: RepositoryHandle,
+    sensor_name: str,
+    last_tick_completion_time: Optional[float],
+    last_run_key: Optional[str],
+    cursor: Optional[str],
+    log_key: Optional[Sequence[str]],
+    last_sensor_start_time: Optional[float] = None,
+    timeout: Optional[int] = None,
+) -> SensorExecutionData:
+    return _deserialize_sensor_execution_data(
+        api_client.external_sensor_execution(
+            sensor_execution_args=_get_sensor_execution_args(
+                instance,
+                repository_handle,
+                sensor_name,
+                last_tick_completion_time,
+                last_run_key,
+                cursor,
+                log_key,
+                last_sensor_start_time,
+                timeout,
+            ),
+        )
+    )
+
+
+async def gen_external_sensor_execution_data_grpc(
+    api_client: "DagsterGrpcClient",
+    instance: "DagsterInstance",
+    repository_handle: RepositoryHandle,
+    sensor_name: str,
+    last_tick_completion_time: Optional[float],
+    last_run_key: Optional[str],
+    cursor: Optional[str],
+    log_key: Optional[Sequence[str]],
+    last_sensor_start_time: Optional[float] = None,
+    timeout: Optional[int] = None,
+) -> SensorExecutionData:
+    return _deserialize_sensor_execution_data(
+        await api_client.gen_external_sensor_execution(
+            sensor_execution_args=_get_sensor_execution_args(
+                instance,
+                repository_handle,
+                sensor_name,
+                last_tick_completion_time,
+                last_run_key,
+                cursor,
+                log_key,
+                last_sensor_start_time,
+                timeout,
+            ),
+        )
+    )
@@ -511,6 +511,7 @@ def _execute_step_command_body(
             step_keys_to_execute=args.step_keys_to_execute,
             known_state=args.known_state,
             repository_load_data=repository_load_data,
+            execution_plan_snapshot=args.execution_plan_snapshot,
         )
 
         yield from execute_plan_iterator(
@@ -1,4 +1,4 @@
-from typing import Mapping
+from typing import Iterator, Mapping, Sequence
 
 import click
 
@@ -10,6 +10,9 @@
 )
 from dagster._core.definitions.asset_selection import AssetSelection
 from dagster._core.definitions.backfill_policy import BackfillPolicyType
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionEvaluation,
+)
 from dagster._core.definitions.events import AssetKey
 from dagster._core.errors import DagsterInvalidSubsetError, DagsterUnknownPartitionError
 from dagster._core.execution.api import execute_job
@@ -270,3 +273,117 @@ def asset_wipe_cache_command(key, **cli_args):
             click.echo("Cleared the partitions status cache")
         else:
             click.echo("Exiting without wiping the partitions status cache")
+
+
+def _iter_condition_nodes(
+    evaluation: AutomationConditionEvaluation,
+) -> Iterator[AutomationConditionEvaluation]:
+    yield evaluation
+    for child_evaluation in evaluation.child_evaluations:
+        yield from _iter_condition_nodes(child_evaluation)
+
+
+def _format_condition_profile(
+    evaluations: Sequence[AutomationConditionEvaluation], sort_by: str, limit: int
+) -> Sequence[str]:
+    rows = [
+        (evaluation.key, node)
+        for evaluation in evaluations
+        for node in _iter_condition_nodes(evaluation)
+    ]
+    if sort_by == "queries":
+        rows = sorted(rows, key=lambda row: row[1].self_num_storage_queries or 0, reverse=True)
+    else:
+        rows = sorted(rows, key=lambda row: row[1].self_duration or 0.0, reverse=True)
+
+    def _ms(duration) -> str:
+        return f"{duration * 1000:.1f}" if duration is not None else "-"
+
+    def _num(value) -> str:
+        return str(value) if value is not None else "-"
+
+    lines = [
+        f"{'self ms':>9} {'total ms':>9} {'self queries':>12} {'queries':>8} "
+        f"{'true':>8} {'candidates':>10}  key / condition"
+    ]
+    for key, node in rows[:limit]:
+        snapshot = node.condition_snapshot
+        lines.append(
+            f"{_ms(node.self_duration):>9} {_ms(node.duration):>9} "
+            f"{_num(node.self_num_storage_queries):>12} {_num(node.num_storage_queries):>8} "
+            f"{node.true_subset.size:>8} {_num(node.candidate_subset_size):>10}  "
+            f"{key.to_user_string()} / {snapshot.label or snapshot.name or snapshot.description}"
+        )
+    return lines
+
+
+@asset_cli.command(name="condition-profile")
+@click.argument("key", nargs=-1)
+@click.option(
+    "--evaluation-id",
+    type=int,
+    help="Profile every asset that was evaluated on the tick with this evaluation ID.",
+)
+@click.option(
+    "--sort-by",
+    type=click.Choice(["time", "queries"]),
+    default="time",
+    show_default=True,
+    help="Rank conditions by the time or number of storage queries spent in the condition itself.",
+)
+@click.option(
+    "--limit",
+    type=int,
+    default=25,
+    show_default=True,
+    help="Maximum number of conditions to display.",
+)
+def asset_condition_profile_command(key, **cli_args):
+    r"""Display the most expensive conditions from stored automation condition evaluations.
+
+    Each row is a single node of an evaluated condition tree. Time and storage queries are shown
+    both for the node alone and including its children.
+
+    \b
+    Usage:
+      dagster asset condition-profile --evaluation-id 42
+      dagster asset condition-profile <unstructured_asset_key_name>
+      dagster asset condition-profile <json_string_of_structured_asset_key>
+    """
+    evaluation_id = cli_args.get("evaluation_id")
+    if evaluation_id is None and len(key) == 0:
+        raise click.UsageError("Error, you must specify an asset key or use `--evaluation-id`.")
+
+    if evaluation_id is not None and len(key) > 0:
+        raise click.UsageError("Error, cannot use more than one of: asset key, `--evaluation-id`.")
+
+    with get_instance_for_cli() as instance:
+        schedule_storage = check.not_none(instance.schedule_storage)
+        if not schedule_storage.supports_auto_materialize_asset_evaluations:
+            raise click.UsageError(
+                "Error, the instance does not support storing automation condition evaluations."
+            )
+
+        if evaluation_id is not None:
+            records = schedule_storage.get_auto_materialize_evaluations_for_evaluation_id(
+                evaluation_id
+            )
+        else:
+            # the most recent evaluation of each asset
+            records = [
+                record
+                for key_string in key
+                for record in schedule_storage.get_auto_materialize_asset_evaluations(
+                    AssetKey.from_db_string(key_string), limit=1
+                )
+            ]
+
+        if not records:
+            click.echo("No evaluations found.")
+            return
+
+        evaluations = [record.get_evaluation_with_run_ids().evaluation for record in records]
+        for line in _format_condition_profile(
+            evaluations, sort_by=cli_args["sort_by"], limit=cli_args["limit"]
+        ):
+            click.echo(line)
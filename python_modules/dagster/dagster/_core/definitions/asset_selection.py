@@ -22,12 +22,7 @@
 from dagster._core.definitions.resolved_asset_deps import resolve_similar_asset_names
 from dagster._core.definitions.source_asset import SourceAsset
 from dagster._core.errors import DagsterInvalidSubsetError
-from dagster._core.selector.subset_selector import (
-    fetch_connected,
-    fetch_sinks,
-    fetch_sources,
-    parse_clause,
-)
+from dagster._core.selector.subset_selector import fetch_connected, parse_clause
 from dagster._model import DagsterModel
 from dagster._serdes.serdes import whitelist_for_serdes
 
@@ -761,7 +756,7 @@ def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
         selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
-        return fetch_sinks(asset_graph.asset_dep_graph, selection)
+        return asset_graph.reachability_index.get_sinks(selection)
 
 
 @whitelist_for_serdes
@@ -782,7 +777,7 @@ def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
         selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
-        return fetch_sources(asset_graph.asset_dep_graph, selection)
+        return asset_graph.reachability_index.get_sources(selection)
 
 
 @whitelist_for_serdes
@@ -806,6 +801,9 @@ def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
         selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
+        if self.depth is None:
+            descendants = asset_graph.reachability_index.get_descendants_of_items(selection)
+            return (set(selection) | descendants) - (selection if not self.include_self else set())
         return operator.sub(
             reduce(
                 operator.or_,
@@ -996,6 +994,9 @@ def _fetch_all_upstream(
     depth: Optional[int] = None,
     include_self: bool = True,
 ) -> AbstractSet[AssetKey]:
+    if depth is None:
+        ancestors = asset_graph.reachability_index.get_ancestors_of_items(selection)
+        return (set(selection) | ancestors) - (selection if not include_self else set())
     return operator.sub(
         reduce(
             operator.or_,
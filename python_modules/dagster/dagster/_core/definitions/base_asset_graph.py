@@ -44,7 +44,7 @@
 )
 from dagster._core.errors import DagsterInvalidInvocationError
 from dagster._core.instance import DynamicPartitionsStore
-from dagster._core.selector.subset_selector import DependencyGraph, fetch_sources
+from dagster._core.selector.subset_selector import DependencyGraph, ReachabilityIndex, fetch_sources
 from dagster._core.utils import toposort
 from dagster._utils.cached_method import cached_method
 
@@ -265,6 +265,13 @@ def entity_dep_graph(self) -> DependencyGraph[EntityKey]:
             "downstream": {node.key: node.child_entity_keys for node in self.nodes},
         }
 
+    @cached_property
+    def reachability_index(self) -> ReachabilityIndex[AssetKey]:
+        """Index of the ancestors, descendants and topological levels of every asset, built the
+        first time each is needed.
+        """
+        return ReachabilityIndex(self.asset_dep_graph)
+
     @property
     def all_asset_keys(self) -> AbstractSet[AssetKey]:
         return set(self._asset_nodes_by_key)
@@ -305,11 +312,21 @@ def toposorted_entity_keys(self) -> Sequence[EntityKey]:
         """Return topologically sorted entity keys in graph. Keys with the same topological level are
         sorted alphabetically to provide stability.
         """
-        sort_key = lambda e: (e, None) if isinstance(e, AssetKey) else (e.asset_key, e.name)
         return [
             item
+            for items_in_level in self.toposorted_entity_keys_by_level
+            for item in items_in_level
+        ]
+
+    @cached_property
+    def toposorted_entity_keys_by_level(self) -> Sequence[Sequence[EntityKey]]:
+        """Return topologically sorted entity keys grouped into lists containing keys of the same
+        topological level. Keys within each level are sorted alphabetically to provide stability.
+        """
+        sort_key = lambda e: (e, None) if isinstance(e, AssetKey) else (e.asset_key, e.name)
+        return [
+            sorted(items_in_level, key=sort_key)
             for items_in_level in toposort(self.entity_dep_graph["upstream"], sort_key=sort_key)
-            for item in sorted(items_in_level, key=sort_key)
         ]
 
     @cached_property
@@ -386,22 +403,20 @@ def get_ancestor_asset_keys(
         self, asset_key: AssetKey, include_self: bool = False
     ) -> AbstractSet[AssetKey]:
         """Returns all nth-order dependencies of an asset."""
-        ancestors = set()
-        next_parents = self.get(asset_key).parent_keys - {asset_key}  # remove self-dependencies
-        while next_parents:
-            pending_next_parents = set()
-            for node_key in next_parents:
-                if node_key in ancestors:
-                    continue
-                ancestors.add(node_key)
-                pending_next_parents.update(self.get(node_key).parent_keys)
-
-            next_parents = pending_next_parents
-
+        ancestors = set(self.reachability_index.get_ancestors(asset_key))
         if include_self:
             ancestors.add(asset_key)
         return ancestors
 
+    def get_descendant_asset_keys(
+        self, asset_key: AssetKey, include_self: bool = False
+    ) -> AbstractSet[AssetKey]:
+        """Returns all assets that have the given asset as an nth-order dependency."""
+        descendants = set(self.reachability_index.get_descendants(asset_key))
+        if include_self:
+            descendants.add(asset_key)
+        return descendants
+
     def get_partitions_in_range(
         self,
         asset_key: AssetKey,
@@ -598,7 +613,7 @@ def get_materializable_roots(self, asset_key: AssetKey) -> AbstractSet[AssetKey]
             return {asset_key}
         return {
             key
-            for key in self.upstream_key_iterator(asset_key)
+            for key in self.get_ancestor_asset_keys(asset_key)
             if self.has(key)
             and self.get(key).is_materializable
             and not self.has_materializable_parents(key)
@@ -878,11 +893,6 @@ def __init__(
         self._asset_graph = asset_graph
         self._include_full_execution_set = include_full_execution_set
 
-        self._toposort_level_by_asset_key = {
-            asset_key: i
-            for i, asset_keys in enumerate(asset_graph.toposorted_asset_keys_by_level)
-            for asset_key in asset_keys
-        }
         self._heap = [self._queue_item(asset_partition) for asset_partition in items]
         heapify(self._heap)
 
@@ -905,9 +915,8 @@ def _queue_item(
         else:
             execution_set_keys = {asset_key}
 
-        level = max(
-            self._toposort_level_by_asset_key[asset_key] for asset_key in execution_set_keys
-        )
+        reachability_index = self._asset_graph.reachability_index
+        level = max(reachability_index.get_level(asset_key) for asset_key in execution_set_keys)
 
         return ToposortedPriorityQueue.QueueItem(
             level,
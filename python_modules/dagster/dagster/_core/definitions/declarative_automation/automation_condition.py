@@ -26,6 +26,7 @@
 )
 from dagster._core.definitions.partition import AllPartitionsSubset
 from dagster._core.definitions.time_window_partitions import BaseTimeWindowPartitionsSubset
+from dagster._core.storage.query_count import get_storage_query_count
 from dagster._record import copy, record
 from dagster._serdes.serdes import is_whitelisted_for_serdes_object
 from dagster._time import get_current_timestamp
@@ -671,6 +672,7 @@ def __init__(
 
         self._start_timestamp = context.create_time.timestamp()
         self._end_timestamp = get_current_timestamp()
+        self._num_storage_queries = get_storage_query_count() - context.create_storage_query_count
 
         # hidden_param which should only be set by legacy RuleConditions
         self._subsets_with_metadata = check.opt_sequence_param(
@@ -710,6 +712,11 @@ def start_timestamp(self) -> float:
     def end_timestamp(self) -> float:
         return self._end_timestamp
 
+    @property
+    def num_storage_queries(self) -> int:
+        """The number of storage queries issued while evaluating this condition and its children."""
+        return self._num_storage_queries
+
     @property
     def child_results(self) -> Sequence["AutomationResult"]:
         return self._child_results
@@ -767,6 +774,8 @@ def serializable_evaluation(self) -> AutomationConditionEvaluation:
             child_evaluations=[
                 child_result.serializable_evaluation for child_result in self._child_results
             ],
+            num_storage_queries=self._num_storage_queries,
+            candidate_subset_size=self._context.candidate_subset.size,
         )
 
     def set_internal_serializable_subset_override(self, override: SerializableEntitySubset) -> None:
@@ -782,12 +791,16 @@ def get_child_node_cursors(self) -> Mapping[str, AutomationConditionNodeCursor]:
         return node_cursors
 
     def get_new_cursor(self) -> AutomationConditionCursor:
+        previous_cursor = self._context._cursor  # noqa
         return AutomationConditionCursor(
             previous_requested_subset=self.serializable_evaluation.true_subset,
             effective_timestamp=self._context.evaluation_time.timestamp(),
             last_event_id=self._context.max_storage_id,
             node_cursors_by_unique_id=self.get_child_node_cursors(),
             result_value_hash=self.value_hash,
+            condition_unique_id=self.condition.get_unique_id(),
+            result_value_hash_unchanged=previous_cursor is not None
+            and previous_cursor.result_value_hash == self.value_hash,
         )
 
     def get_serializable_subset(self) -> SerializableEntitySubset:
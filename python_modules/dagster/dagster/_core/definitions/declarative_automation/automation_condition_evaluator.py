@@ -1,8 +1,20 @@
 import datetime
 import logging
 from collections import defaultdict
-from typing import TYPE_CHECKING, AbstractSet, Dict, Mapping, Optional, Sequence, Tuple
+from contextlib import ExitStack
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
+import dagster._check as check
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
 from dagster._core.asset_graph_view.entity_subset import EntitySubset
 from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
@@ -12,15 +24,39 @@
 from dagster._core.definitions.declarative_automation.automation_condition import (
     AutomationCondition,
     AutomationResult,
+    BuiltinAutomationCondition,
 )
 from dagster._core.definitions.declarative_automation.automation_context import AutomationContext
+from dagster._core.definitions.declarative_automation.legacy.rule_condition import RuleCondition
+from dagster._core.definitions.declarative_automation.operands import (
+    CodeVersionChangedCondition,
+    CronTickPassedCondition,
+)
+from dagster._core.definitions.declarative_automation.operators import (
+    AnyDownstreamConditionsCondition,
+)
+from dagster._core.definitions.declarative_automation.operators.check_operators import (
+    ChecksAutomationCondition,
+)
 from dagster._core.definitions.events import AssetKey
+from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsDefinition
+from dagster._core.definitions.partition import PartitionsDefinition, StaticPartitionsDefinition
+from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
+from dagster._core.event_api import RunStatusChangeRecordsFilter
+from dagster._core.events import DagsterEventType
 from dagster._core.instance import DagsterInstance
+from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._time import get_current_datetime
+from dagster._utils.cached_method import cached_method
+from dagster._utils.schedules import reverse_cron_string_iterator
 
 if TYPE_CHECKING:
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
+# if more than this many runs of a given status have ended since the previous evaluation, all
+# entities will be evaluated rather than determining which ones were affected by those runs
+_MAX_RUN_STATUS_CHANGES_FOR_INCREMENTAL_EVALUATION = 1000
+
 
 class AutomationConditionEvaluator:
     def __init__(
@@ -60,6 +96,11 @@ def __init__(
             _instance.auto_materialize_respect_materialization_data_versions
         )
         self.emit_backfills = emit_backfills or _instance.da_request_backfills()
+        self.num_evaluation_workers = _instance.auto_materialize_evaluation_num_workers
+        self.incremental_evaluation = _instance.auto_materialize_incremental_evaluation
+        self.incremental_evaluation_max_skip_seconds = (
+            _instance.auto_materialize_incremental_evaluation_max_skip_seconds
+        )
 
         self.legacy_expected_data_time_by_key: Dict[AssetKey, Optional[datetime.datetime]] = {}
         self.legacy_data_time_resolver = CachingDataTimeResolver(self.instance_queryer)
@@ -103,44 +144,303 @@ def prefetch(self) -> None:
 
     def evaluate(self) -> Tuple[Sequence[AutomationResult], Sequence[EntitySubset[EntityKey]]]:
         self.prefetch()
+        skippable_keys = self._get_skippable_entity_keys() if self.incremental_evaluation else set()
         num_conditions = len(self.entity_keys)
         num_evaluated = 0
-        for entity_key in self.asset_graph.toposorted_entity_keys:
-            if entity_key not in self.entity_keys:
-                continue
-
-            self.logger.debug(
-                f"Evaluating {entity_key.to_user_string()} ({num_evaluated+1}/{num_conditions})"
+        num_skipped = 0
+        # keys which are requested on this tick, or are downstream of a key requested on this tick
+        keys_downstream_of_requests: Set[EntityKey] = set()
+        with ExitStack() as stack:
+            executor = (
+                stack.enter_context(
+                    InheritContextThreadPoolExecutor(
+                        max_workers=self.num_evaluation_workers,
+                        thread_name_prefix="automation_condition_evaluator_worker",
+                    )
+                )
+                if self.num_evaluation_workers and self.num_evaluation_workers > 1
+                else None
             )
+            for entity_keys_batch in self._get_entity_key_batches():
+                entity_keys_to_evaluate = []
+                for entity_key in entity_keys_batch:
+                    if any(
+                        parent_key in keys_downstream_of_requests
+                        for parent_key in self.asset_graph.get(entity_key).parent_entity_keys
+                    ):
+                        keys_downstream_of_requests.add(entity_key)
+
+                    if entity_key not in self.entity_keys:
+                        continue
+
+                    # an entity may be affected by a request for one of its ancestors, which will
+                    # not be reflected in the event log until the following tick
+                    if (
+                        entity_key in skippable_keys
+                        and entity_key not in keys_downstream_of_requests
+                    ):
+                        num_skipped += 1
+                        continue
+
+                    self.logger.debug(
+                        f"Evaluating {entity_key.to_user_string()} ({num_evaluated+1}/{num_conditions})"
+                    )
+                    entity_keys_to_evaluate.append(entity_key)
+                    num_evaluated += 1
+
+                # entities within a batch do not depend on each other, so they may be evaluated in
+                # parallel. results are always recorded in topological order, so that the output
+                # is identical regardless of the order in which evaluations complete
+                results = (
+                    executor.map(self._evaluate_condition, entity_keys_to_evaluate)
+                    if executor
+                    else map(self._evaluate_condition, entity_keys_to_evaluate)
+                )
+                for result in results:
+                    self._record_result(result)
+                    if result.true_subset.size > 0:
+                        keys_downstream_of_requests.add(result.key)
 
-            try:
-                self.evaluate_entity(entity_key)
-            except Exception as e:
-                raise Exception(
-                    f"Error while evaluating conditions for {entity_key.to_user_string()}"
-                ) from e
-
-            result = self.current_results_by_key[entity_key]
-            num_requested = result.true_subset.size
-            if result.true_subset.is_partitioned:
-                requested_str = ",".join(result.true_subset.expensively_compute_partition_keys())
-            else:
-                requested_str = "(no partition)"
-            log_fn = self.logger.info if num_requested > 0 else self.logger.debug
-            log_fn(
-                f"{entity_key.to_user_string()} evaluation result: {num_requested} "
-                f"requested ({requested_str}) "
-                f"({format(result.end_timestamp - result.start_timestamp, '.3f')} seconds)"
+        if self.incremental_evaluation:
+            self.logger.info(
+                f"Skipped evaluating {num_skipped} entities whose inputs have not changed since "
+                "their previous evaluation."
             )
-            num_evaluated += 1
         return list(self.current_results_by_key.values()), [
             v for v in self.request_subsets_by_key.values() if not v.is_empty
         ]
 
+    def _get_entity_key_batches(self) -> Iterator[Sequence[EntityKey]]:
+        """Splits the topologically sorted entity keys into batches of keys that do not depend on
+        the results of any other key in the same batch.
+        """
+        for entity_keys_in_level in self.asset_graph.toposorted_entity_keys_by_level:
+            batch = []
+            for entity_key in entity_keys_in_level:
+                # requesting an entity that must be executed with others modifies the results of
+                # those others, so these entities are placed in a batch of their own
+                if (
+                    isinstance(entity_key, AssetKey)
+                    and len(self.asset_graph.get(entity_key).execution_set_entity_keys) > 1
+                ):
+                    if batch:
+                        yield batch
+                    yield [entity_key]
+                    batch = []
+                else:
+                    batch.append(entity_key)
+            if batch:
+                yield batch
+
+    def _can_skip_evaluation(self, key: EntityKey) -> bool:
+        """Returns True if the previous evaluation of this entity may be reused, provided that none
+        of its inputs have changed since that evaluation.
+        """
+        if not isinstance(key, AssetKey):
+            return False
+
+        cursor = self.cursor.get_previous_condition_cursor(key)
+        condition = self.asset_graph.get(key).automation_condition or self.default_condition
+        return (
+            cursor is not None
+            and condition is not None
+            # the result must have reached a steady state, meaning that conditions which depend on
+            # the previous evaluation (e.g. newly_true) will produce the same result again
+            and cursor.result_value_hash_unchanged
+            and cursor.condition_unique_id == condition.get_unique_id()
+            and cursor.last_event_id is not None
+            and cursor.previous_requested_subset.is_empty
+            and self.evaluation_time.timestamp() - cursor.effective_timestamp
+            < self.incremental_evaluation_max_skip_seconds
+            # entities that must be executed together may have their results modified after
+            # evaluation, so they are always evaluated
+            and len(self.asset_graph.get(key).execution_set_entity_keys) <= 1
+            and _supports_incremental_evaluation(condition)
+        )
+
+    def _get_skippable_entity_keys(self) -> AbstractSet[EntityKey]:
+        """Returns the set of entity keys for which nothing that could impact the result of their
+        condition has changed since their previous evaluation. This includes any event for the asset
+        or one of its ancestors, the end of any run that targeted one of those assets, a change to
+        the set of partitions of one of those assets, and any cron tick within the condition.
+        """
+        candidate_keys = {key for key in self.entity_keys if self._can_skip_evaluation(key)}
+        if not candidate_keys:
+            return set()
+
+        cursors = {
+            key: check.not_none(self.cursor.get_previous_condition_cursor(key))
+            for key in candidate_keys
+        }
+        run_end_storage_id_by_key = self._get_run_end_storage_id_by_key(
+            after_storage_id=min(
+                check.not_none(cursor.last_event_id) for cursor in cursors.values()
+            )
+        )
+        if run_end_storage_id_by_key is None:
+            return set()
+
+        upstream_keys = self.asset_graph.reachability_index.get_ancestors_of_items(candidate_keys)
+        self.instance_queryer.prefetch_asset_records(upstream_keys - candidate_keys)
+        backfill_keys = (
+            self.instance_queryer.get_active_backfill_target_asset_graph_subset().asset_keys
+        )
+
+        # for each asset, find the latest storage id and timestamp at which any of its inputs or the
+        # inputs of its ancestors changed
+        latest_storage_id_by_key: Dict[AssetKey, int] = {}
+        latest_timestamp_by_key: Dict[AssetKey, float] = {}
+        for key in self.asset_graph.toposorted_asset_keys:
+            if key not in candidate_keys and key not in upstream_keys:
+                continue
+
+            storage_id = max(
+                self._get_latest_storage_id(key), run_end_storage_id_by_key.get(key, 0)
+            )
+            timestamp = (
+                self.evaluation_time.timestamp()
+                if key in backfill_keys
+                else self._get_latest_change_timestamp(key)
+            )
+            for parent_key in self.asset_graph.get(key).parent_keys:
+                if parent_key in latest_storage_id_by_key:
+                    storage_id = max(storage_id, latest_storage_id_by_key[parent_key])
+                    timestamp = max(timestamp, latest_timestamp_by_key[parent_key])
+            latest_storage_id_by_key[key] = storage_id
+            latest_timestamp_by_key[key] = timestamp
+
+        skippable_keys = set()
+        for key in candidate_keys:
+            cursor = cursors[key]
+            condition = self.asset_graph.get(key).automation_condition or self.default_condition
+            timestamp = max(
+                [
+                    latest_timestamp_by_key[key],
+                    *(
+                        self._get_previous_cron_tick_timestamp(
+                            cron_schedule=cron_condition.cron_schedule,
+                            timezone=cron_condition.cron_timezone,
+                        )
+                        for cron_condition in _get_cron_tick_passed_conditions(
+                            check.not_none(condition)
+                        )
+                    ),
+                ]
+            )
+            if (
+                latest_storage_id_by_key[key] <= check.not_none(cursor.last_event_id)
+                and timestamp < cursor.effective_timestamp
+            ):
+                skippable_keys.add(key)
+
+        return skippable_keys
+
+    def _get_run_end_storage_id_by_key(
+        self, after_storage_id: int
+    ) -> Optional[Mapping[AssetKey, int]]:
+        """Returns a mapping from each asset that was planned to be materialized by a run that ended
+        after the given storage id to the storage id of the latest such run end event. Returns None
+        if too many runs have ended to efficiently compute this mapping.
+        """
+        instance = self.asset_graph_view.instance
+        storage_id_by_run_id: Dict[str, int] = {}
+        for event_type in (
+            DagsterEventType.RUN_SUCCESS,
+            DagsterEventType.RUN_FAILURE,
+            DagsterEventType.RUN_CANCELED,
+        ):
+            result = instance.fetch_run_status_changes(
+                RunStatusChangeRecordsFilter(
+                    event_type=event_type, after_storage_id=after_storage_id
+                ),
+                limit=_MAX_RUN_STATUS_CHANGES_FOR_INCREMENTAL_EVALUATION,
+            )
+            if result.has_more:
+                return None
+            for record in result.records:
+                storage_id_by_run_id[record.run_id] = record.storage_id
+
+        storage_id_by_key: Dict[AssetKey, int] = {}
+        for run_id, storage_id in storage_id_by_run_id.items():
+            planned_records = instance.get_records_for_run(
+                run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED
+            ).records
+            for record in planned_records:
+                if record.asset_key is not None:
+                    storage_id_by_key[record.asset_key] = max(
+                        storage_id_by_key.get(record.asset_key, 0), storage_id
+                    )
+        return storage_id_by_key
+
+    def _get_latest_storage_id(self, key: AssetKey) -> int:
+        """Returns the storage id of the latest materialization, observation, or planned
+        materialization event for the given asset.
+        """
+        record = self.instance_queryer.get_asset_record(key)
+        if record is None:
+            return 0
+        entry = record.asset_entry
+        return max(
+            entry.last_materialization_storage_id or 0,
+            entry.last_observation_record.storage_id if entry.last_observation_record else 0,
+            entry.last_planned_materialization_storage_id or 0,
+        )
+
+    def _get_latest_change_timestamp(self, key: AssetKey) -> float:
+        """Returns the latest time at which the given asset was wiped or its set of partitions may
+        have changed.
+        """
+        record = self.instance_queryer.get_asset_record(key)
+        wipe_timestamp = (
+            record.asset_entry.asset_details.last_wipe_timestamp
+            if record and record.asset_entry.asset_details
+            else None
+        )
+        return max(
+            wipe_timestamp or 0.0,
+            self._get_partitions_change_timestamp(self.asset_graph.get(key).partitions_def),
+        )
+
+    def _get_partitions_change_timestamp(
+        self, partitions_def: Optional[PartitionsDefinition]
+    ) -> float:
+        if partitions_def is None or isinstance(partitions_def, StaticPartitionsDefinition):
+            return 0.0
+        elif isinstance(partitions_def, TimeWindowPartitionsDefinition):
+            # the latest time window shifts on each tick of the cron schedule
+            return self._get_previous_cron_tick_timestamp(
+                cron_schedule=partitions_def.cron_schedule, timezone=partitions_def.timezone
+            )
+        elif isinstance(partitions_def, MultiPartitionsDefinition):
+            return max(
+                self._get_partitions_change_timestamp(dimension.partitions_def)
+                for dimension in partitions_def.partitions_defs
+            )
+        else:
+            # dynamic partitions may be added or removed at any time
+            return self.evaluation_time.timestamp()
+
+    @cached_method
+    def _get_previous_cron_tick_timestamp(self, *, cron_schedule: str, timezone: str) -> float:
+        previous_ticks = reverse_cron_string_iterator(
+            end_timestamp=self.evaluation_time.timestamp(),
+            cron_string=cron_schedule,
+            execution_timezone=timezone,
+        )
+        return next(previous_ticks).timestamp()
+
     def evaluate_entity(self, key: EntityKey) -> None:
-        # evaluate the condition of this asset
-        context = AutomationContext.create(key=key, evaluator=self)
-        result = context.condition.evaluate(context)
+        self._record_result(self._evaluate_condition(key))
+
+    def _evaluate_condition(self, key: EntityKey) -> AutomationResult:
+        try:
+            context = AutomationContext.create(key=key, evaluator=self)
+            return context.condition.evaluate(context)
+        except Exception as e:
+            raise Exception(f"Error while evaluating conditions for {key.to_user_string()}") from e
+
+    def _record_result(self, result: AutomationResult) -> None:
+        key = result.key
 
         # update dictionaries to keep track of this result
         self.current_results_by_key[key] = result
@@ -151,6 +451,18 @@ def evaluate_entity(self, key: EntityKey) -> None:
             # handle cases where an entity must be materialized with others
             self._handle_execution_set(result)
 
+        num_requested = result.true_subset.size
+        if result.true_subset.is_partitioned:
+            requested_str = ",".join(result.true_subset.expensively_compute_partition_keys())
+        else:
+            requested_str = "(no partition)"
+        log_fn = self.logger.info if num_requested > 0 else self.logger.debug
+        log_fn(
+            f"{key.to_user_string()} evaluation result: {num_requested} "
+            f"requested ({requested_str}) "
+            f"({format(result.end_timestamp - result.start_timestamp, '.3f')} seconds)"
+        )
+
     def _add_request_subset(self, subset: EntitySubset) -> None:
         """Adds the provided subset to the dictionary tracking what we will request on this tick."""
         if subset.key not in self.request_subsets_by_key:
@@ -188,3 +500,32 @@ def _handle_execution_set(self, result: AutomationResult[AssetKey]) -> None:
                     )
 
                 self._add_request_subset(neighbor_true_subset)
+
+
+def _supports_incremental_evaluation(condition: AutomationCondition) -> bool:
+    """Returns True if the result of the given condition can only change in response to changes
+    that are tracked by incremental evaluation.
+    """
+    if not isinstance(condition, BuiltinAutomationCondition) or isinstance(
+        condition,
+        (
+            RuleCondition,
+            CodeVersionChangedCondition,
+            ChecksAutomationCondition,
+            AnyDownstreamConditionsCondition,
+        ),
+    ):
+        return False
+    return all(_supports_incremental_evaluation(child) for child in condition.children)
+
+
+def _get_cron_tick_passed_conditions(
+    condition: AutomationCondition,
+) -> Sequence[CronTickPassedCondition]:
+    if isinstance(condition, CronTickPassedCondition):
+        return [condition]
+    return [
+        cron_condition
+        for child in condition.children
+        for cron_condition in _get_cron_tick_passed_conditions(child)
+    ]
@@ -136,11 +136,17 @@ def my_dbt_assets(context: AssetExecutionContext, dbt: DbtCliResource):
         else AssetDaemonCursor.empty(),
     )
     results, requested_subsets = evaluator.evaluate()
+    condition_cursors = {result.key: result.get_new_cursor() for result in results}
+    # entities that were skipped by an incremental evaluation retain their previous cursor
+    for key in evaluator.entity_keys - condition_cursors.keys():
+        previous_cursor = evaluator.cursor.get_previous_condition_cursor(key)
+        if previous_cursor is not None:
+            condition_cursors[key] = previous_cursor
     cursor = AssetDaemonCursor(
         evaluation_id=0,
         last_observe_request_timestamp_by_asset_key={},
         previous_evaluation_state=None,
-        previous_condition_cursors=[result.get_new_cursor() for result in results],
+        previous_condition_cursors=list(condition_cursors.values()),
     )
 
     return EvaluateAutomationConditionsResult(
@@ -22,6 +22,7 @@
 )
 from dagster._core.definitions.partition import PartitionsDefinition
 from dagster._core.errors import DagsterInvalidDefinitionError
+from dagster._core.storage.query_count import get_storage_query_count
 from dagster._time import get_current_datetime
 
 if TYPE_CHECKING:
@@ -50,6 +51,7 @@ class AutomationContext(Generic[T_EntityKey]):
     candidate_subset: EntitySubset[T_EntityKey]
 
     create_time: datetime.datetime
+    create_storage_query_count: int
 
     asset_graph_view: AssetGraphView
     request_subsets_by_key: Mapping[EntityKey, EntitySubset]
@@ -79,6 +81,7 @@ def create(key: EntityKey, evaluator: "AutomationConditionEvaluator") -> "Automa
             condition_unique_id=condition_unqiue_id,
             candidate_subset=evaluator.asset_graph_view.get_full_subset(key=key),
             create_time=get_current_datetime(),
+            create_storage_query_count=get_storage_query_count(),
             asset_graph_view=asset_graph_view,
             request_subsets_by_key=evaluator.request_subsets_by_key,
             parent_context=None,
@@ -103,6 +106,7 @@ def for_child_condition(
             condition_unique_id=condition_unqiue_id,
             candidate_subset=candidate_subset,
             create_time=get_current_datetime(),
+            create_storage_query_count=get_storage_query_count(),
             asset_graph_view=self.asset_graph_view,
             request_subsets_by_key=self.request_subsets_by_key,
             parent_context=self,
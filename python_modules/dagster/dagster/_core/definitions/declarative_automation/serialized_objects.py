@@ -104,10 +104,37 @@ class AutomationConditionEvaluation(Generic[T_EntityKey]):
 
     child_evaluations: Sequence["AutomationConditionEvaluation"]
 
+    # profiling information, which includes the cost of evaluating all child conditions
+    num_storage_queries: Optional[int] = None
+    candidate_subset_size: Optional[int] = None
+
     @property
     def key(self) -> T_EntityKey:
         return self.true_subset.key
 
+    @property
+    def duration(self) -> Optional[float]:
+        """The number of seconds spent evaluating this condition, including its children."""
+        if self.start_timestamp is None or self.end_timestamp is None:
+            return None
+        return self.end_timestamp - self.start_timestamp
+
+    @property
+    def self_duration(self) -> Optional[float]:
+        """The number of seconds spent evaluating this condition, excluding its children."""
+        if self.duration is None:
+            return None
+        return self.duration - sum(child.duration or 0.0 for child in self.child_evaluations)
+
+    @property
+    def self_num_storage_queries(self) -> Optional[int]:
+        """The number of storage queries issued by this condition, excluding its children."""
+        if self.num_storage_queries is None:
+            return None
+        return self.num_storage_queries - sum(
+            child.num_storage_queries or 0 for child in self.child_evaluations
+        )
+
     def for_child(self, child_unique_id: str) -> Optional["AutomationConditionEvaluation"]:
         """Returns the evaluation of a given child condition by finding the child evaluation that
         has an identical hash to the given condition.
@@ -180,6 +207,10 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
             tree to any incremental state calculated for it.
         result_hash: A unique hash of the result for this tick. Used to determine if anything
             has changed since the last time this was evaluated.
+        condition_unique_id: The unique ID of the full condition tree that was evaluated.
+        result_value_hash_unchanged: True if the result of this evaluation was identical to the
+            result of the evaluation before it. Used to determine if this evaluation may be skipped
+            on subsequent ticks when evaluating incrementally.
     """
 
     previous_requested_subset: SerializableEntitySubset
@@ -189,6 +220,9 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
     node_cursors_by_unique_id: Mapping[str, AutomationConditionNodeCursor]
     result_value_hash: str
 
+    condition_unique_id: Optional[str] = None
+    result_value_hash_unchanged: bool = False
+
     @staticmethod
     def backcompat_from_evaluation_state(
         evaluation_state: "AutomationConditionEvaluationState",
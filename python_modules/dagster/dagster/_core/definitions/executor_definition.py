@@ -6,7 +6,7 @@
 
 import dagster._check as check
 from dagster._annotations import public
-from dagster._builtins import Int
+from dagster._builtins import Bool, Int
 from dagster._config import Field, Noneable, Selector, UserConfigSchema
 from dagster._core.definitions.configurable import (
     ConfiguredDefinitionConfigSchema,
@@ -23,6 +23,7 @@
 from dagster._core.execution.tags import get_tag_concurrency_limits_config
 
 if TYPE_CHECKING:
+    from dagster._core.executor.async_in_process import AsyncInProcessExecutor
     from dagster._core.executor.base import Executor
     from dagster._core.executor.in_process import InProcessExecutor
     from dagster._core.executor.init import InitExecutorContext
@@ -305,6 +306,75 @@ def in_process_executor(init_context):
     return _core_in_process_executor_creation(init_context.executor_config)
 
 
+def _core_async_in_process_executor_creation(config: ExecutorConfig) -> "AsyncInProcessExecutor":
+    from dagster._core.executor.async_in_process import AsyncInProcessExecutor
+
+    return AsyncInProcessExecutor(
+        retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
+        max_concurrent=check.opt_int_elem(config, "max_concurrent"),
+        tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
+        max_sync_step_threads=check.opt_int_elem(config, "max_sync_step_threads"),
+    )
+
+
+ASYNC_IN_PROC_CONFIG = Field(
+    {
+        "max_concurrent": Field(
+            Noneable(Int),
+            default_value=None,
+            description=(
+                "The number of steps that may execute concurrently. By default, this is set to 32."
+            ),
+        ),
+        "max_sync_step_threads": Field(
+            Noneable(Int),
+            default_value=None,
+            description=(
+                "The number of threads used to execute the steps of synchronous ops. Steps of"
+                " async ops do not use these threads. By default, this is the default size of a"
+                " Python ThreadPoolExecutor."
+            ),
+        ),
+        "tag_concurrency_limits": get_tag_concurrency_limits_config(),
+        "retries": get_retries_config(),
+    },
+    description="Execute steps concurrently in a single process.",
+)
+
+
+@executor(
+    name="async_in_process",
+    config_schema=ASYNC_IN_PROC_CONFIG,
+)
+def async_in_process_executor(init_context):
+    """The async in-process executor executes steps concurrently in a single process.
+
+    The steps of ``async def`` ops all run as coroutines on a single asyncio event loop, so ops that
+    spend most of their time waiting on I/O can overlap with each other without each holding a
+    thread. The steps of synchronous ops run in a separate pool of threads, sized by
+    ``max_sync_step_threads``. Resources are initialized once for the run and shared by all steps,
+    so they must be safe to use from multiple threads.
+
+    To select it, include the following top-level fragment in config:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            max_concurrent: 50
+
+    The ``max_concurrent`` arg is optional and tells the execution engine how many steps may execute
+    concurrently. By default, or if you set ``max_concurrent`` to be None, this is 32. The
+    ``max_sync_step_threads`` arg is optional and limits how many steps of synchronous ops may
+    execute at once, independently of ``max_concurrent``.
+
+    Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
+    where the higher the number the higher the priority. 0 is the default and both positive
+    and negative numbers can be used.
+    """
+    return _core_async_in_process_executor_creation(init_context.executor_config)
+
+
 @executor(name="execute_in_process_executor")
 def execute_in_process_executor(_) -> "InProcessExecutor":
     """Executor used by execute_in_process.
@@ -331,12 +401,22 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = next(iter(start_selector.items()))
 
+    worker_pool_cfg = check.opt_nullable_dict_elem(config, "worker_pool")
+
     return MultiprocessExecutor(
         max_concurrent=check.opt_int_elem(config, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        use_worker_pool=worker_pool_cfg is not None,
+        max_steps_per_worker=(
+            check.opt_int_elem(worker_pool_cfg, "max_steps_per_worker") if worker_pool_cfg else None
+        ),
+        max_worker_memory_mb=(
+            check.opt_int_elem(worker_pool_cfg, "max_worker_memory_mb") if worker_pool_cfg else None
+        ),
+        send_execution_plan_snapshot=check.bool_elem(config, "send_execution_plan_snapshot"),
     )
 
 
@@ -389,6 +469,44 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                 "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods."
             ),
         ),
+        "worker_pool": Field(
+            {
+                "max_steps_per_worker": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "Replace a worker process after it has executed this many steps. By"
+                        " default, worker processes are reused for the rest of the run."
+                    ),
+                ),
+                "max_worker_memory_mb": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "Replace a worker process after a step if its peak memory usage has"
+                        " reached this many megabytes. Not supported on Windows."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Execute steps in a pool of long-lived worker processes that each execute many"
+                " steps in sequence, instead of starting a new process for every step. This avoids"
+                " importing user code and reconstructing the job for each step. Resources are"
+                " still initialized and torn down for every step, but module-level state is shared"
+                " by the steps that execute in the same worker process."
+            ),
+        ),
+        "send_execution_plan_snapshot": Field(
+            Bool,
+            default_value=False,
+            description=(
+                "Send each step's process a snapshot of the part of the execution plan that the"
+                " step needs, so that it does not build the plan for the whole job again. This"
+                " speeds up the steps of jobs with many ops, at the cost of building and"
+                " serializing a snapshot for every step in the parent process."
+            ),
+        ),
         "retries": get_retries_config(),
     },
     description="Execute each step in an individual process.",
@@ -418,6 +536,17 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be None or 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    To avoid paying the cost of starting a process and importing your code for every step, steps
+    can instead be executed in a pool of long-lived worker processes:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            multiprocess:
+              worker_pool:
+                max_steps_per_worker: 50
+
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -1,9 +1,14 @@
 import hashlib
 import itertools
+import json
+import os
+from collections import defaultdict
 from datetime import datetime
 from functools import lru_cache, reduce
 from typing import (
+    Any,
     Dict,
+    Iterable,
     List,
     Mapping,
     NamedTuple,
@@ -19,6 +24,7 @@
 import dagster._check as check
 from dagster._annotations import public
 from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
     DefaultPartitionsSubset,
     DynamicPartitionsDefinition,
     PartitionsDefinition,
@@ -29,9 +35,11 @@
 from dagster._core.definitions.time_window_partitions import (
     TimeWindow,
     TimeWindowPartitionsDefinition,
+    TimeWindowPartitionsSubset,
 )
 from dagster._core.errors import (
     DagsterInvalidDefinitionError,
+    DagsterInvalidDeserializationVersionError,
     DagsterInvalidInvocationError,
     DagsterUnknownPartitionError,
 )
@@ -47,6 +55,10 @@
 MULTIPARTITION_KEY_DELIMITER = "|"
 
 
+def _multi_partitions_subsets_enabled() -> bool:
+    return str(os.getenv("DAGSTER_MULTI_PARTITIONS_SUBSETS")).lower() in ("1", "true", "t")
+
+
 class PartitionDimensionKey(
     NamedTuple("_PartitionDimensionKey", [("dimension_name", str), ("partition_key", str)])
 ):
@@ -219,7 +231,19 @@ def __init__(self, partitions_defs: Mapping[str, PartitionsDefinition]):
 
     @property
     def partitions_subset_class(self) -> Type["PartitionsSubset"]:
-        return DefaultPartitionsSubset
+        return (
+            MultiPartitionsSubset
+            if _multi_partitions_subsets_enabled()
+            else DefaultPartitionsSubset
+        )
+
+    def deserialize_subset(self, serialized: str) -> "PartitionsSubset":
+        if self.partitions_subset_class is DefaultPartitionsSubset and (
+            _is_serialized_multi_partitions_subset(serialized)
+        ):
+            # written while MultiPartitionsSubsets were enabled
+            return MultiPartitionsSubset.from_serialized(self, serialized).to_serializable_subset()
+        return super().deserialize_subset(serialized)
 
     def get_partition_keys_in_range(
         self,
@@ -349,8 +373,10 @@ def filter_valid_partition_keys(
         self, partition_keys: Set[str], dynamic_partitions_store: DynamicPartitionsStore
     ) -> Set[MultiPartitionKey]:
         partition_keys_by_dimension = {
-            dim.name: dim.partitions_def.get_partition_keys(
-                dynamic_partitions_store=dynamic_partitions_store
+            dim.name: set(
+                dim.partitions_def.get_partition_keys(
+                    dynamic_partitions_store=dynamic_partitions_store
+                )
             )
             for dim in self.partitions_defs
         }
@@ -365,7 +391,7 @@ def filter_valid_partition_keys(
             )
 
             if all(
-                key in partition_keys_by_dimension.get(dim, [])
+                key in partition_keys_by_dimension.get(dim, set())
                 for dim, key in multipartition_key.keys_by_dimension.items()
             ):
                 validated_partitions.add(partition_key)
@@ -549,6 +575,380 @@ def get_num_partitions(
         return reduce(lambda x, y: x * y, dimension_counts, 1)
 
 
+class MultiPartitionsSubset(PartitionsSubset[MultiPartitionKey]):
+    """A PartitionsSubset for a MultiPartitionsDefinition, which internally stores, for each key of
+    the secondary dimension, the subset of the primary dimension's partitions that are included
+    alongside it.
+
+    When the primary dimension is time-based, each of those subsets is a TimeWindowPartitionsSubset,
+    so contiguous runs of partitions are held (and serialized) as time windows rather than as
+    individual keys. Otherwise they are whatever subset the primary dimension's partitions
+    definition creates. Unions, intersections and differences with another MultiPartitionsSubset of
+    the same partitions definition are computed one secondary key at a time, and the subset can be
+    sliced by a key of either dimension without parsing every multi-partition key.
+
+    This is an in-memory representation: it converts to a DefaultPartitionsSubset when it needs to
+    be serialized with serdes.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # This will ensure that we can gracefully degrade when deserializing old data. Subsets of a
+    # MultiPartitionsDefinition may also have been serialized by DefaultPartitionsSubset or
+    # BitmapPartitionsSubset, whose forms are versions 1 and 2, so this version must stay distinct
+    # from theirs for readers that only know those forms to reject it.
+    SERIALIZATION_VERSION = 3
+
+    def __init__(
+        self,
+        partitions_def: MultiPartitionsDefinition,
+        subsets_by_secondary_key: Optional[Mapping[str, PartitionsSubset]] = None,
+    ):
+        self._partitions_def = check.inst_param(
+            partitions_def, "partitions_def", MultiPartitionsDefinition
+        )
+        self._primary_dimension = partitions_def.primary_dimension
+        self._secondary_dimension = partitions_def.secondary_dimension
+        # multi-partition keys are ordered by dimension name
+        self._primary_index = partitions_def.partition_dimension_names.index(
+            self._primary_dimension.name
+        )
+        self._subsets_by_secondary_key: Mapping[str, PartitionsSubset] = {
+            secondary_key: subset
+            for secondary_key, subset in (subsets_by_secondary_key or {}).items()
+            if not subset.is_empty
+        }
+
+    @property
+    def partitions_def(self) -> MultiPartitionsDefinition:
+        return self._partitions_def
+
+    @property
+    def subsets_by_secondary_key(self) -> Mapping[str, PartitionsSubset]:
+        """Mapping from each key of the secondary dimension that appears in the subset to the
+        subset of the primary dimension's partitions that appear alongside it.
+        """
+        return self._subsets_by_secondary_key
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._subsets_by_secondary_key
+
+    def _empty_primary_subset(self) -> PartitionsSubset:
+        primary_partitions_def = self._primary_dimension.partitions_def
+        if isinstance(primary_partitions_def, TimeWindowPartitionsDefinition):
+            return TimeWindowPartitionsSubset.empty_subset(primary_partitions_def)
+        return primary_partitions_def.empty_subset()
+
+    def _split_partition_key(self, partition_key: str) -> Optional[Tuple[str, str]]:
+        dimension_keys = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+        if len(dimension_keys) != 2:
+            return None
+        return (
+            dimension_keys[self._primary_index],
+            dimension_keys[1 - self._primary_index],
+        )
+
+    def _build_partition_key(self, primary_key: str, secondary_key: str) -> MultiPartitionKey:
+        return MultiPartitionKey(
+            {
+                self._primary_dimension.name: primary_key,
+                self._secondary_dimension.name: secondary_key,
+            }
+        )
+
+    def _with_subsets(
+        self, subsets_by_secondary_key: Mapping[str, PartitionsSubset]
+    ) -> "MultiPartitionsSubset":
+        return MultiPartitionsSubset(self._partitions_def, subsets_by_secondary_key)
+
+    def _coerce(self, other: PartitionsSubset) -> "MultiPartitionsSubset":
+        if (
+            isinstance(other, MultiPartitionsSubset)
+            and other.partitions_def == self._partitions_def
+        ):
+            return other
+        return self.empty_subset(self._partitions_def).with_partition_keys(
+            other.get_partition_keys()
+        )
+
+    def get_subset_for_dimension_key(
+        self, dimension_name: str, partition_key: str
+    ) -> PartitionsSubset:
+        """Returns the subset of the other dimension's partitions that appear in this subset
+        together with the given key of the given dimension.
+        """
+        if dimension_name == self._secondary_dimension.name:
+            return self._subsets_by_secondary_key.get(partition_key) or self._empty_primary_subset()
+
+        check.invariant(
+            dimension_name == self._primary_dimension.name,
+            f"Invalid dimension name {dimension_name}",
+        )
+        return self._secondary_dimension.partitions_def.empty_subset().with_partition_keys(
+            secondary_key
+            for secondary_key, subset in self._subsets_by_secondary_key.items()
+            if partition_key in subset
+        )
+
+    def get_dimension_subset(self, dimension_name: str) -> PartitionsSubset:
+        """Returns the subset of the given dimension's partitions that appear in at least one
+        partition key in this subset.
+        """
+        if dimension_name == self._secondary_dimension.name:
+            return self._secondary_dimension.partitions_def.empty_subset().with_partition_keys(
+                self._subsets_by_secondary_key.keys()
+            )
+
+        check.invariant(
+            dimension_name == self._primary_dimension.name,
+            f"Invalid dimension name {dimension_name}",
+        )
+        return reduce(
+            lambda result, subset: result | subset,
+            self._subsets_by_secondary_key.values(),
+            self._empty_primary_subset(),
+        )
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[MultiPartitionKey]:
+        if partitions_def != self._partitions_def:
+            return {
+                partition_key
+                for partition_key in partitions_def.get_partition_keys(
+                    current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+                )
+                if partition_key not in self
+            }
+
+        primary_partitions_def = self._primary_dimension.partitions_def
+        all_primary_keys = None
+        result: Set[MultiPartitionKey] = set()
+        for secondary_key in self._secondary_dimension.partitions_def.get_partition_keys(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        ):
+            subset = self._subsets_by_secondary_key.get(secondary_key)
+            if subset is not None:
+                primary_keys = subset.get_partition_keys_not_in_subset(
+                    primary_partitions_def,
+                    current_time=current_time,
+                    dynamic_partitions_store=dynamic_partitions_store,
+                )
+            else:
+                if all_primary_keys is None:
+                    all_primary_keys = primary_partitions_def.get_partition_keys(
+                        current_time=current_time,
+                        dynamic_partitions_store=dynamic_partitions_store,
+                    )
+                primary_keys = all_primary_keys
+            result.update(
+                self._build_partition_key(primary_key, secondary_key)
+                for primary_key in primary_keys
+            )
+        return result
+
+    def get_partition_keys(self) -> Iterable[MultiPartitionKey]:
+        return {
+            self._build_partition_key(primary_key, secondary_key)
+            for secondary_key, subset in self._subsets_by_secondary_key.items()
+            for primary_key in subset.get_partition_keys()
+        }
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        return DefaultPartitionsSubset(set(self.get_partition_keys())).get_partition_key_ranges(
+            partitions_def,
+            current_time=current_time,
+            dynamic_partitions_store=dynamic_partitions_store,
+        )
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "MultiPartitionsSubset":
+        primary_index = self._primary_index
+        primary_keys_by_secondary_key: Dict[str, List[str]] = defaultdict(list)
+        for partition_key in partition_keys:
+            dimension_keys = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+            if len(dimension_keys) != 2:
+                check.failed(f"Expected 2 partition keys in partition key string {partition_key}")
+            primary_keys_by_secondary_key[dimension_keys[1 - primary_index]].append(
+                dimension_keys[primary_index]
+            )
+
+        if not primary_keys_by_secondary_key:
+            return self
+
+        subsets_by_secondary_key = dict(self._subsets_by_secondary_key)
+        for secondary_key, primary_keys in primary_keys_by_secondary_key.items():
+            subsets_by_secondary_key[secondary_key] = (
+                subsets_by_secondary_key.get(secondary_key) or self._empty_primary_subset()
+            ).with_partition_keys(primary_keys)
+        return self._with_subsets(subsets_by_secondary_key)
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other or other.is_empty:
+            return self
+        # Anything | AllPartitionsSubset = AllPartitionsSubset
+        if isinstance(other, AllPartitionsSubset):
+            return other
+        other_subsets = self._coerce(other).subsets_by_secondary_key
+        subsets_by_secondary_key = dict(self._subsets_by_secondary_key)
+        for secondary_key, other_subset in other_subsets.items():
+            subset = subsets_by_secondary_key.get(secondary_key)
+            subsets_by_secondary_key[secondary_key] = (
+                subset | other_subset if subset is not None else other_subset
+            )
+        return self._with_subsets(subsets_by_secondary_key)
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self.empty_subset(self._partitions_def)
+        if other.is_empty:
+            return self
+        # Anything - AllPartitionsSubset = Empty
+        if isinstance(other, AllPartitionsSubset):
+            return self.empty_subset(self._partitions_def)
+        other_subsets = self._coerce(other).subsets_by_secondary_key
+        return self._with_subsets(
+            {
+                secondary_key: (
+                    subset - other_subsets[secondary_key]
+                    if secondary_key in other_subsets
+                    else subset
+                )
+                for secondary_key, subset in self._subsets_by_secondary_key.items()
+            }
+        )
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self
+        if other.is_empty:
+            return other
+        # Anything & AllPartitionsSubset = Anything
+        if isinstance(other, AllPartitionsSubset):
+            return self
+        other_subsets = self._coerce(other).subsets_by_secondary_key
+        return self._with_subsets(
+            {
+                secondary_key: subset & other_subsets[secondary_key]
+                for secondary_key, subset in self._subsets_by_secondary_key.items()
+                if secondary_key in other_subsets
+            }
+        )
+
+    def serialize(self) -> str:
+        # Serialize version number, so attempting to deserialize old versions can be handled gracefully.
+        # Any time the serialization format changes, we should increment the version number.
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                # sort to ensure that equivalent partition subsets have identical serialized forms
+                "subsets_by_secondary_key": {
+                    secondary_key: json.loads(subset.serialize())
+                    for secondary_key, subset in sorted(self._subsets_by_secondary_key.items())
+                },
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "PartitionsSubset":
+        partitions_def = check.inst_param(
+            partitions_def, "partitions_def", MultiPartitionsDefinition
+        )
+        if not _is_serialized_multi_partitions_subset(serialized):
+            # written by DefaultPartitionsSubset
+            return cls.empty_subset(partitions_def).with_partition_keys(
+                DefaultPartitionsSubset.from_serialized(
+                    partitions_def, serialized
+                ).get_partition_keys()
+            )
+
+        data = json.loads(serialized)
+        if data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only version {cls.SERIALIZATION_VERSION} is supported."
+            )
+
+        primary_partitions_def = partitions_def.primary_dimension.partitions_def
+        return cls(
+            partitions_def,
+            {
+                secondary_key: primary_partitions_def.deserialize_subset(
+                    json.dumps(serialized_subset)
+                )
+                for secondary_key, serialized_subset in data["subsets_by_secondary_key"].items()
+            },
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        if serialized_partitions_def_class_name is not None:
+            return serialized_partitions_def_class_name == partitions_def.__class__.__name__
+
+        return _is_serialized_multi_partitions_subset(
+            serialized
+        ) or DefaultPartitionsSubset.can_deserialize(
+            partitions_def,
+            serialized,
+            serialized_partitions_def_unique_id,
+            serialized_partitions_def_class_name,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, MultiPartitionsSubset)
+            and self._partitions_def == other.partitions_def
+            and self._subsets_by_secondary_key == other.subsets_by_secondary_key
+        )
+
+    def __len__(self) -> int:
+        return sum(len(subset) for subset in self._subsets_by_secondary_key.values())
+
+    def __contains__(self, value) -> bool:
+        if not isinstance(value, str):
+            return False
+        split_key = self._split_partition_key(value)
+        if split_key is None:
+            return False
+        primary_key, secondary_key = split_key
+        subset = self._subsets_by_secondary_key.get(secondary_key)
+        return subset is not None and primary_key in subset
+
+    def __repr__(self) -> str:
+        return f"MultiPartitionsSubset(num_partitions={len(self)})"
+
+    @classmethod
+    def empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "MultiPartitionsSubset":
+        if partitions_def is None:
+            check.failed("Must provide a partitions definition to create a MultiPartitionsSubset")
+        return cls(cast(MultiPartitionsDefinition, partitions_def))
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        return DefaultPartitionsSubset(set(self.get_partition_keys()))
+
+
+def _is_serialized_multi_partitions_subset(serialized: str) -> bool:
+    data: Any = json.loads(serialized)
+    return isinstance(data, dict) and data.get("subsets_by_secondary_key") is not None
+
+
 def get_tags_from_multi_partition_key(multi_partition_key: MultiPartitionKey) -> Mapping[str, str]:
     check.inst_param(multi_partition_key, "multi_partition_key", MultiPartitionKey)
 
@@ -1,6 +1,10 @@
+import base64
 import copy
 import hashlib
 import json
+import os
+import threading
+import zlib
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from datetime import datetime
@@ -12,6 +16,7 @@
     Dict,
     Generic,
     Iterable,
+    List,
     Mapping,
     NamedTuple,
     Optional,
@@ -280,6 +285,10 @@ def validate_partition_key(
             )
 
 
+def _bitmap_partitions_subsets_enabled() -> bool:
+    return str(os.getenv("DAGSTER_BITMAP_PARTITIONS_SUBSETS")).lower() in ("1", "true", "t")
+
+
 def raise_error_on_invalid_partition_key_substring(partition_keys: Sequence[str]) -> None:
     for partition_key in partition_keys:
         found_invalid_substrs = [
@@ -364,6 +373,18 @@ def __eq__(self, other) -> bool:
     def __repr__(self) -> str:
         return f"{type(self).__name__}(partition_keys={self._partition_keys})"
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        return (
+            BitmapPartitionsSubset
+            if _bitmap_partitions_subsets_enabled()
+            else DefaultPartitionsSubset
+        )
+
+    @cached_method
+    def get_partition_key_index(self) -> "PartitionKeyIndex":
+        return PartitionKeyIndex(self._partition_keys)
+
     def get_num_partitions(
         self,
         current_time: Optional[datetime] = None,
@@ -486,6 +507,32 @@ def __eq__(self, other):
     def __hash__(self):
         return hash(tuple(self.__repr__()))
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        return (
+            BitmapPartitionsSubset
+            if _bitmap_partitions_subsets_enabled()
+            else DefaultPartitionsSubset
+        )
+
+    @cached_method
+    def _get_partition_key_index_holder(self) -> List["PartitionKeyIndex"]:
+        # holds the current index, which is replaced once any of its keys has been deleted
+        return [PartitionKeyIndex()]
+
+    def get_partition_key_index(self) -> "PartitionKeyIndex":
+        # the keys of a dynamic partitions definition are only known to the instance, so they are
+        # registered with the index as subsets that contain them are created
+        return self._get_partition_key_index_holder()[0]
+
+    def _evict_deleted_partition_keys(self, partition_keys: Sequence[str]) -> None:
+        # Positions are never reused, so keys that were deleted from the instance would otherwise
+        # be held by the index, and widen every bitmap built against it, for the lifetime of the
+        # process. Subsets built against the replaced index keep referencing it.
+        holder = self._get_partition_key_index_holder()
+        if holder[0].has_keys_not_in(partition_keys):
+            holder[0] = PartitionKeyIndex()
+
     def __str__(self) -> str:
         if self.name:
             return f'Dynamic partitions: "{self._validated_name()}"'
@@ -532,9 +579,11 @@ def get_partition_keys(
                     " threaded down a call stack."
                 )
 
-            return dynamic_partitions_store.get_dynamic_partitions(
+            partition_keys = dynamic_partitions_store.get_dynamic_partitions(
                 partitions_def_name=self._validated_name()
             )
+            self._evict_deleted_partition_keys(partition_keys)
+            return partition_keys
 
     def has_partition_key(
         self,
@@ -1163,19 +1212,12 @@ def serialize(self) -> str:
     def from_serialized(
         cls, partitions_def: PartitionsDefinition, serialized: str
     ) -> "PartitionsSubset":
-        # Check the version number, so only valid versions can be deserialized.
-        data = json.loads(serialized)
-
-        if isinstance(data, list):
-            # backwards compatibility
-            return cls(subset=set(data))
-        else:
-            if data.get("version") != cls.SERIALIZATION_VERSION:
-                raise DagsterInvalidDeserializationVersionError(
-                    f"Attempted to deserialize partition subset with version {data.get('version')},"
-                    f" but only version {cls.SERIALIZATION_VERSION} is supported."
-                )
-            return cls(subset=set(data.get("subset")))
+        return cls(
+            subset=_deserialize_partition_keys(
+                serialized,
+                [cls.SERIALIZATION_VERSION, _COMPRESSED_PARTITION_KEYS_SERIALIZATION_VERSION],
+            ),
+        )
 
     @classmethod
     def can_deserialize(
@@ -1185,12 +1227,11 @@ def can_deserialize(
         serialized_partitions_def_unique_id: Optional[str],
         serialized_partitions_def_class_name: Optional[str],
     ) -> bool:
-        if serialized_partitions_def_class_name is not None:
-            return serialized_partitions_def_class_name == partitions_def.__class__.__name__
-
-        data = json.loads(serialized)
-        return isinstance(data, list) or (
-            data.get("subset") is not None and data.get("version") == cls.SERIALIZATION_VERSION
+        return _can_deserialize_partition_keys(
+            partitions_def,
+            serialized,
+            serialized_partitions_def_class_name,
+            [cls.SERIALIZATION_VERSION, _COMPRESSED_PARTITION_KEYS_SERIALIZATION_VERSION],
         )
 
     def __eq__(self, other: object) -> bool:
@@ -1212,6 +1253,360 @@ def empty_subset(
         return cls()
 
 
+# DefaultPartitionsSubset and BitmapPartitionsSubset can each read the serialized form of the other,
+# so that stored subsets remain readable when switching between them. The serialized form of
+# DefaultPartitionsSubset holds a list of partition keys, and the serialized form of
+# BitmapPartitionsSubset holds the same list compressed.
+_COMPRESSED_PARTITION_KEYS_SERIALIZATION_VERSION = 2
+
+
+def _get_serialized_partition_keys_field(version: int) -> str:
+    return (
+        "compressed_subset"
+        if version == _COMPRESSED_PARTITION_KEYS_SERIALIZATION_VERSION
+        else "subset"
+    )
+
+
+def _deserialize_partition_keys(
+    serialized: str, serialization_versions: Sequence[int]
+) -> AbstractSet[str]:
+    # Check the version number, so only valid versions can be deserialized.
+    data = json.loads(serialized)
+
+    if isinstance(data, list):
+        # backwards compatibility
+        return set(data)
+
+    version = data.get("version")
+    if version not in serialization_versions:
+        supported_versions = " or ".join(f"version {v}" for v in serialization_versions)
+        raise DagsterInvalidDeserializationVersionError(
+            f"Attempted to deserialize partition subset with version {version},"
+            f" but only {supported_versions} is supported."
+        )
+    if version == _COMPRESSED_PARTITION_KEYS_SERIALIZATION_VERSION:
+        return set(
+            json.loads(zlib.decompress(base64.b64decode(data["compressed_subset"])).decode("utf-8"))
+        )
+    return set(data.get("subset"))
+
+
+def _can_deserialize_partition_keys(
+    partitions_def: PartitionsDefinition,
+    serialized: str,
+    serialized_partitions_def_class_name: Optional[str],
+    serialization_versions: Sequence[int],
+) -> bool:
+    if serialized_partitions_def_class_name is not None:
+        return serialized_partitions_def_class_name == partitions_def.__class__.__name__
+
+    data = json.loads(serialized)
+    if isinstance(data, list):
+        return True
+    version = data.get("version")
+    return (
+        version in serialization_versions
+        and data.get(_get_serialized_partition_keys_field(version)) is not None
+    )
+
+
+class PartitionKeyIndex:
+    """Assigns each partition key of a PartitionsDefinition a position, so that subsets of its
+    partitions can be represented as bitmaps over those positions.
+
+    Positions are only ever appended, so a bitmap built against the index stays valid as new keys
+    (e.g. newly added dynamic partitions) are registered. Positions are local to the process and are
+    never serialized. A DynamicPartitionsDefinition starts over with a new index once partition keys
+    registered with its current index have been deleted.
+    """
+
+    def __init__(self, partition_keys: Iterable[str] = ()):
+        self._lock = threading.Lock()
+        self._keys: List[str] = list(partition_keys)
+        self._positions: Dict[str, int] = {key: i for i, key in enumerate(self._keys)}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def get_position(self, partition_key: str) -> Optional[int]:
+        return self._positions.get(partition_key)
+
+    def has_keys_not_in(self, partition_keys: Sequence[str]) -> bool:
+        """Whether any key registered with the index is missing from the given keys."""
+        if not self._keys:
+            return False
+        if len(self._keys) > len(partition_keys):
+            return True
+        partition_keys_set = set(partition_keys)
+        return any(key not in partition_keys_set for key in self._keys)
+
+    def get_bitmap(self, partition_keys: Iterable[str], register: bool = True) -> bytes:
+        """Returns the bitmap with the bits for the given keys set. Keys that the index has not seen
+        before are registered, unless register is False, in which case they are left out.
+        """
+        positions = self._positions
+        bitmap = bytearray((len(self._keys) >> 3) + 1)
+        unregistered = []
+        for partition_key in partition_keys:
+            position = positions.get(partition_key)
+            if position is not None:
+                bitmap[position >> 3] |= 1 << (position & 7)
+            elif register:
+                unregistered.append(partition_key)
+
+        if unregistered:
+            with self._lock:
+                for partition_key in unregistered:
+                    position = positions.get(partition_key)
+                    if position is None:
+                        position = len(self._keys)
+                        self._keys.append(partition_key)
+                        positions[partition_key] = position
+                    if (position >> 3) >= len(bitmap):
+                        bitmap.extend(bytes((position >> 3) + 1 - len(bitmap)))
+                    bitmap[position >> 3] |= 1 << (position & 7)
+
+        # drop trailing zero bytes so that every set of positions has exactly one bitmap
+        return bytes(bitmap.rstrip(b"\x00"))
+
+    def get_partition_keys(self, bitmap: bytes) -> Sequence[str]:
+        keys = self._keys
+        partition_keys = []
+        for byte_index, byte in enumerate(bitmap):
+            if not byte:
+                continue
+            offset = byte_index << 3
+            for bit in range(8):
+                if byte & (1 << bit):
+                    partition_keys.append(keys[offset + bit])
+        return partition_keys
+
+
+def _bitmap_to_bytes(value: int) -> bytes:
+    return value.to_bytes((value.bit_length() + 7) >> 3, "little")
+
+
+class BitmapPartitionsSubset(PartitionsSubset):
+    """A PartitionsSubset for a StaticPartitionsDefinition or DynamicPartitionsDefinition, which
+    internally represents the included partitions as a bitmap over the positions that the
+    PartitionsDefinition's PartitionKeyIndex assigns to their keys.
+
+    Unions, intersections and differences of subsets that share an index are computed on the
+    bitmaps, without materializing any partition keys. This is an in-memory representation: it
+    serializes to a compressed list of its partition keys, and converts to a DefaultPartitionsSubset
+    when it needs to be serialized with serdes.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # This will ensure that we can gracefully degrade when deserializing old data. Version 1 is the
+    # serialized form of DefaultPartitionsSubset, which readers of version 1 expect to hold a plain
+    # list of partition keys.
+    SERIALIZATION_VERSION = _COMPRESSED_PARTITION_KEYS_SERIALIZATION_VERSION
+
+    def __init__(
+        self,
+        partitions_def: PartitionsDefinition,
+        bitmap: bytes = b"",
+        key_index: Optional[PartitionKeyIndex] = None,
+    ):
+        self._partitions_def = check.inst_param(
+            partitions_def,
+            "partitions_def",
+            (StaticPartitionsDefinition, DynamicPartitionsDefinition),
+        )
+        # the index that the bitmap was built against, which may have since been replaced on the
+        # partitions definition
+        self._key_index = (
+            check.opt_inst_param(key_index, "key_index", PartitionKeyIndex)
+            if key_index is not None
+            else partitions_def.get_partition_key_index()  # type: ignore
+        )
+        self._bitmap = check.inst_param(bitmap, "bitmap", bytes)
+
+    @property
+    def partitions_def(self) -> PartitionsDefinition:
+        return self._partitions_def
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._bitmap
+
+    def _with_bitmap(self, bitmap: int) -> "BitmapPartitionsSubset":
+        return BitmapPartitionsSubset(
+            self._partitions_def, _bitmap_to_bytes(bitmap), key_index=self._key_index
+        )
+
+    def _shares_index(self, other: PartitionsSubset) -> bool:
+        return (
+            isinstance(other, BitmapPartitionsSubset) and other._key_index is self._key_index  # noqa: SLF001
+        )
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        return [
+            partition_key
+            for partition_key in partitions_def.get_partition_keys(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            )
+            if partition_key not in self
+        ]
+
+    def get_partition_keys(self) -> Iterable[str]:
+        return self._key_index.get_partition_keys(self._bitmap)
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        partition_keys = partitions_def.get_partition_keys(
+            current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+        cur_range_start = None
+        cur_range_end = None
+        result = []
+        for partition_key in partition_keys:
+            if partition_key in self:
+                if cur_range_start is None:
+                    cur_range_start = partition_key
+                cur_range_end = partition_key
+            else:
+                if cur_range_start is not None and cur_range_end is not None:
+                    result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+                cur_range_start = cur_range_end = None
+
+        if cur_range_start is not None and cur_range_end is not None:
+            result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+
+        return result
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "BitmapPartitionsSubset":
+        return self._with_bitmap(
+            int.from_bytes(self._bitmap, "little")
+            | int.from_bytes(self._key_index.get_bitmap(partition_keys), "little")
+        )
+
+    def _get_other_bitmap(self, other: PartitionsSubset, register: bool) -> int:
+        if self._shares_index(other):
+            other_bitmap = cast(BitmapPartitionsSubset, other)._bitmap  # noqa: SLF001
+        else:
+            other_bitmap = self._key_index.get_bitmap(other.get_partition_keys(), register=register)
+        return int.from_bytes(other_bitmap, "little")
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other or other.is_empty:
+            return self
+        # Anything | AllPartitionsSubset = AllPartitionsSubset
+        if isinstance(other, AllPartitionsSubset):
+            return other
+        return self._with_bitmap(
+            int.from_bytes(self._bitmap, "little") | self._get_other_bitmap(other, register=True)
+        )
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self.empty_subset(self._partitions_def)
+        if other.is_empty:
+            return self
+        # Anything - AllPartitionsSubset = Empty
+        if isinstance(other, AllPartitionsSubset):
+            return self.empty_subset(self._partitions_def)
+        return self._with_bitmap(
+            int.from_bytes(self._bitmap, "little") & ~self._get_other_bitmap(other, register=False)
+        )
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self
+        if other.is_empty:
+            return other
+        # Anything & AllPartitionsSubset = Anything
+        if isinstance(other, AllPartitionsSubset):
+            return self
+        return self._with_bitmap(
+            int.from_bytes(self._bitmap, "little") & self._get_other_bitmap(other, register=False)
+        )
+
+    def serialize(self) -> str:
+        # Serialize version number, so attempting to deserialize old versions can be handled gracefully.
+        # Any time the serialization format changes, we should increment the version number.
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                # sort to ensure that equivalent partition subsets have identical serialized forms
+                "compressed_subset": base64.b64encode(
+                    zlib.compress(
+                        json.dumps(sorted(self.get_partition_keys()), separators=(",", ":")).encode(
+                            "utf-8"
+                        )
+                    )
+                ).decode("ascii"),
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "PartitionsSubset":
+        return cls.empty_subset(partitions_def).with_partition_keys(
+            _deserialize_partition_keys(
+                serialized,
+                [DefaultPartitionsSubset.SERIALIZATION_VERSION, cls.SERIALIZATION_VERSION],
+            )
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        return _can_deserialize_partition_keys(
+            partitions_def,
+            serialized,
+            serialized_partitions_def_class_name,
+            [DefaultPartitionsSubset.SERIALIZATION_VERSION, cls.SERIALIZATION_VERSION],
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitmapPartitionsSubset):
+            return False
+        if self._shares_index(other):
+            return self._bitmap == other._bitmap
+        return set(self.get_partition_keys()) == set(other.get_partition_keys())
+
+    def __len__(self) -> int:
+        return bin(int.from_bytes(self._bitmap, "little")).count("1")
+
+    def __contains__(self, value) -> bool:
+        position = self._key_index.get_position(value)
+        if position is None or (position >> 3) >= len(self._bitmap):
+            return False
+        return bool(self._bitmap[position >> 3] & (1 << (position & 7)))
+
+    def __repr__(self) -> str:
+        return f"BitmapPartitionsSubset(num_partitions={len(self)})"
+
+    @classmethod
+    def empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "BitmapPartitionsSubset":
+        if partitions_def is None:
+            check.failed("Must provide a partitions definition to create a BitmapPartitionsSubset")
+        return cls(partitions_def)
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        return DefaultPartitionsSubset(set(self.get_partition_keys()))
+
+
 class AllPartitionsSubset(
     NamedTuple(
         "_AllPartitionsSubset",
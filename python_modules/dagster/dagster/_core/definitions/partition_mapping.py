@@ -24,6 +24,7 @@
 from dagster._core.definitions.multi_dimensional_partitions import (
     MultiPartitionKey,
     MultiPartitionsDefinition,
+    MultiPartitionsSubset,
 )
 from dagster._core.definitions.partition import (
     AllPartitionsSubset,
@@ -376,7 +377,18 @@ def _get_dependency_partitions_subset(
         dependencies of the partition keys in a_partition_keys.
         """
         a_partition_keys_by_dimension = defaultdict(set)
-        if isinstance(a_partitions_def, MultiPartitionsDefinition):
+        if (
+            isinstance(a_partitions_subset, MultiPartitionsSubset)
+            and a_partitions_subset.partitions_def == a_partitions_def
+        ):
+            # project the subset onto each dimension, without parsing every partition key
+            for dimension in a_partitions_subset.partitions_def.partitions_defs:
+                dimension_keys = set(
+                    a_partitions_subset.get_dimension_subset(dimension.name).get_partition_keys()
+                )
+                if dimension_keys:
+                    a_partition_keys_by_dimension[dimension.name] = dimension_keys
+        elif isinstance(a_partitions_def, MultiPartitionsDefinition):
             for partition_key in a_partitions_subset.get_partition_keys():
                 key = a_partitions_def.get_partition_key_from_str(partition_key)
                 for dimension_name, key in key.keys_by_dimension.items():
@@ -1,6 +1,7 @@
 import functools
 import hashlib
 import json
+import math
 import re
 from abc import abstractmethod, abstractproperty
 from datetime import date, datetime, timedelta
@@ -379,6 +380,11 @@ def _get_current_timestamp(self, current_time: Optional[datetime]) -> float:
         return current_time.timestamp()
 
     def get_num_partitions_in_window(self, time_window: TimeWindow) -> int:
+        if self._fixed_period_seconds:
+            return self._get_start_index_with_fixed_period(
+                time_window.end.timestamp()
+            ) - self._get_start_index_with_fixed_period(time_window.start.timestamp())
+
         if self.is_basic_daily:
             return (
                 date(
@@ -424,6 +430,12 @@ def get_partition_keys_between_indexes(
         # partition keys included within the indices.
         current_timestamp = self._get_current_timestamp(current_time=current_time)
 
+        if self._fixed_period_seconds:
+            num_partitions = self._get_num_partitions_with_fixed_period(current_timestamp)
+            return self._get_partition_keys_with_fixed_period(
+                max(start_idx, 0), min(end_idx, num_partitions)
+            )
+
         partitions_past_current_time = 0
         partition_keys = []
         reached_end = False
@@ -462,6 +474,11 @@ def get_partition_keys(
     ) -> Sequence[str]:
         current_timestamp = self._get_current_timestamp(current_time=current_time)
 
+        if self._fixed_period_seconds:
+            return self._get_partition_keys_with_fixed_period(
+                0, self._get_num_partitions_with_fixed_period(current_timestamp)
+            )
+
         partitions_past_current_time = 0
         partition_keys: List[str] = []
         for time_window in self._iterate_time_windows(self.start.timestamp()):
@@ -516,6 +533,10 @@ def __hash__(self):
     @functools.lru_cache(maxsize=100)
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
         partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
+        if self._fixed_period_seconds:
+            return self._get_time_window_with_fixed_period(
+                self._get_start_index_with_fixed_period(partition_key_dt.timestamp())
+            )
         return next(iter(self._iterate_time_windows(partition_key_dt.timestamp())))
 
     @functools.lru_cache(maxsize=5)
@@ -527,30 +548,44 @@ def time_windows_for_partition_keys(
         if len(partition_keys) == 0:
             return []
 
-        sorted_pks = sorted(
-            partition_keys,
-            key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
-        )
-        cur_windows_iterator = iter(
-            self._iterate_time_windows(
-                dst_safe_strptime(sorted_pks[0], self.timezone, self.fmt).timestamp()
-            )
-        )
         partition_key_time_windows: List[TimeWindow] = []
-        for partition_key in sorted_pks:
-            next_window = next(cur_windows_iterator)
-            if (
-                dst_safe_strftime(next_window.start, self.timezone, self.fmt, self.cron_schedule)
-                == partition_key
-            ):
-                partition_key_time_windows.append(next_window)
-            else:
-                cur_windows_iterator = iter(
-                    self._iterate_time_windows(
-                        dst_safe_strptime(partition_key, self.timezone, self.fmt).timestamp()
-                    )
+        if self._fixed_period_seconds:
+            start_indexes = sorted(
+                self._get_start_index_with_fixed_period(
+                    dst_safe_strptime(pk, self.timezone, self.fmt).timestamp()
+                )
+                for pk in partition_keys
+            )
+            partition_key_time_windows = [
+                self._get_time_window_with_fixed_period(start_index)
+                for start_index in start_indexes
+            ]
+        else:
+            sorted_pks = sorted(
+                partition_keys,
+                key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
+            )
+            cur_windows_iterator = iter(
+                self._iterate_time_windows(
+                    dst_safe_strptime(sorted_pks[0], self.timezone, self.fmt).timestamp()
                 )
-                partition_key_time_windows.append(next(cur_windows_iterator))
+            )
+            for partition_key in sorted_pks:
+                next_window = next(cur_windows_iterator)
+                if (
+                    dst_safe_strftime(
+                        next_window.start, self.timezone, self.fmt, self.cron_schedule
+                    )
+                    == partition_key
+                ):
+                    partition_key_time_windows.append(next_window)
+                else:
+                    cur_windows_iterator = iter(
+                        self._iterate_time_windows(
+                            dst_safe_strptime(partition_key, self.timezone, self.fmt).timestamp()
+                        )
+                    )
+                    partition_key_time_windows.append(next(cur_windows_iterator))
 
         if validate:
             start_time_window = self.get_first_partition_window()
@@ -573,6 +608,10 @@ def start_time_for_partition_key(self, partition_key: str) -> datetime:
         partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
         if self.is_basic_hourly or self.is_basic_daily:
             return partition_key_dt
+        if self._fixed_period_seconds:
+            return self._get_time_window_with_fixed_period(
+                self._get_start_index_with_fixed_period(partition_key_dt.timestamp())
+            ).start
         # the datetime format might not include granular components, so we need to recover them,
         # e.g. if cron_schedule="0 7 * * *" and fmt="%Y-%m-%d".
         # we make the assumption that the parsed partition key is <= the start datetime.
@@ -627,6 +666,20 @@ def get_prev_partition_window(
 
     @functools.lru_cache(maxsize=256)
     def _get_first_partition_window(self, *, current_timestamp: float) -> Optional[TimeWindow]:
+        if self._fixed_period_seconds:
+            if self.end_offset > 0:
+                # the first partition must end before the start of the end_offset-th partition
+                # after the current time
+                num_ticks = self._get_start_index_with_fixed_period(current_timestamp)
+            else:
+                # the first partition must end before the current time, less end_offset partitions
+                num_ticks = math.floor(
+                    (current_timestamp - self._first_tick_timestamp) / self._fixed_period_seconds
+                )
+            if num_ticks + self.end_offset < 1:
+                return None
+            return self._get_time_window_with_fixed_period(0)
+
         time_window = next(iter(self._iterate_time_windows(self.start.timestamp())))
 
         if self.end_offset == 0:
@@ -667,6 +720,12 @@ def _get_last_partition_window(self, *, current_timestamp: float) -> Optional[Ti
         if self._get_first_partition_window(current_timestamp=current_timestamp) is None:
             return None
 
+        if self._fixed_period_seconds:
+            num_partitions = self._get_num_partitions_with_fixed_period(current_timestamp)
+            if num_partitions == 0:
+                return None
+            return self._get_time_window_with_fixed_period(num_partitions - 1)
+
         if self.end and self.end.timestamp() < current_timestamp:
             current_timestamp = self.end.timestamp()
 
@@ -716,6 +775,12 @@ def end_time_for_partition_key(self, partition_key: str) -> datetime:
 
     @functools.lru_cache(maxsize=5)
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
+        if self._fixed_period_seconds:
+            return self._get_partition_keys_with_fixed_period(
+                self._get_start_index_with_fixed_period(time_window.start.timestamp()),
+                self._get_start_index_with_fixed_period(time_window.end.timestamp()),
+            )
+
         result: List[str] = []
         time_window_end_timestamp = time_window.end.timestamp()
         for partition_time_window in self._iterate_time_windows(time_window.start.timestamp()):
@@ -932,11 +997,103 @@ def _reverse_iterate_time_windows(self, end_timestamp: float) -> Iterable[TimeWi
             yield TimeWindow(next_time, prev_time)
             prev_time = next_time
 
+    @cached_property
+    def _fixed_period_seconds(self) -> Optional[int]:
+        """If consecutive ticks of the cron schedule are always the same number of seconds apart,
+        returns that number. Partition keys, time windows and indexes can then be converted into
+        one another with arithmetic, instead of by iterating over the cron schedule.
+        """
+        fixed_minute_interval = get_fixed_minute_interval(self.cron_schedule)
+        if self.timezone.upper() == "UTC":
+            if fixed_minute_interval:
+                return fixed_minute_interval * 60
+
+            schedule_type = self.schedule_type
+            if schedule_type == ScheduleType.HOURLY:
+                return 60 * 60
+            elif schedule_type == ScheduleType.DAILY:
+                return 24 * 60 * 60
+            return None
+
+        # DST transitions shift local time relative to absolute time, but every UTC offset in use
+        # is a whole number of quarter hours, so a schedule that ticks every N minutes for N
+        # dividing 15 keeps ticking at fixed intervals across transitions. Offsets from before the
+        # adoption of standard time are not, so the offset at the start must be aligned too.
+        if fixed_minute_interval and 15 % fixed_minute_interval == 0:
+            utc_offset = check.not_none(self.start.utcoffset())
+            if utc_offset.total_seconds() % (fixed_minute_interval * 60) == 0:
+                return fixed_minute_interval * 60
+
+        return None
+
+    @cached_property
+    def _first_tick_timestamp(self) -> float:
+        return next(iter(self._iterate_time_windows(self.start.timestamp()))).start.timestamp()
+
+    def _get_start_timestamp_with_fixed_period(self, index: int) -> float:
+        return self._first_tick_timestamp + index * check.not_none(self._fixed_period_seconds)
+
+    def _get_start_index_with_fixed_period(self, timestamp: float) -> int:
+        """Returns the index of the first partition that starts at or after the given timestamp."""
+        return math.ceil(
+            (timestamp - self._first_tick_timestamp) / check.not_none(self._fixed_period_seconds)
+        )
+
+    def _get_time_window_with_fixed_period(self, index: int) -> TimeWindow:
+        tz = get_timezone(self.timezone)
+        return TimeWindow(
+            datetime.fromtimestamp(self._get_start_timestamp_with_fixed_period(index), tz=tz),
+            datetime.fromtimestamp(self._get_start_timestamp_with_fixed_period(index + 1), tz=tz),
+        )
+
+    def _get_num_partitions_with_fixed_period(self, current_timestamp: float) -> int:
+        period = check.not_none(self._fixed_period_seconds)
+        # partitions that end at or before the current time
+        num_partitions = max(
+            0, math.floor((current_timestamp - self._first_tick_timestamp) / period)
+        )
+        if self.end_offset > 0:
+            num_partitions += self.end_offset
+        if self.end:
+            num_partitions = min(
+                num_partitions,
+                max(0, math.floor((self.end.timestamp() - self._first_tick_timestamp) / period)),
+            )
+        if self.end_offset < 0:
+            num_partitions += self.end_offset
+        return max(0, num_partitions)
+
+    def _get_partition_keys_with_fixed_period(self, start_index: int, end_index: int) -> List[str]:
+        tz = get_timezone(self.timezone)
+        start_datetimes = (
+            datetime.fromtimestamp(self._get_start_timestamp_with_fixed_period(index), tz=tz)
+            for index in range(start_index, end_index)
+        )
+        if (
+            self.timezone.upper() == "UTC"
+            or "%z" in self.fmt
+            or not cron_string_repeats_every_hour(self.cron_schedule)
+        ):
+            # none of the keys can be ambiguous, so skip the per-key checks in dst_safe_strftime
+            return [start_datetime.strftime(self.fmt) for start_datetime in start_datetimes]
+        return [
+            dst_safe_strftime(start_datetime, self.timezone, self.fmt, self.cron_schedule)
+            for start_datetime in start_datetimes
+        ]
+
     def get_partition_key_for_timestamp(self, timestamp: float, end_closed: bool = False) -> str:
         """Args:
         timestamp (float): Timestamp from the unix epoch, UTC.
         end_closed (bool): Whether the interval is closed at the end or at the beginning.
         """
+        if self._fixed_period_seconds:
+            index = self._get_start_index_with_fixed_period(timestamp)
+            # the partition that the timestamp falls in starts at the last tick before it, or at
+            # the timestamp itself if it is a tick and the interval is not closed at the end
+            if end_closed or self._get_start_timestamp_with_fixed_period(index) > timestamp:
+                index -= 1
+            return self._get_partition_keys_with_fixed_period(index, index + 1)[0]
+
         iterator = cron_string_iterator(
             timestamp, self.cron_schedule, self.timezone, start_offset=-1
         )
@@ -1820,6 +1977,44 @@ def get_partition_key_ranges(
             for window in self.included_time_windows
         ]
 
+    def _coalesce_time_windows(
+        self, time_windows: Sequence[TimeWindow]
+    ) -> Tuple[Sequence[PersistedTimeWindow], int]:
+        """Merges a set of partition time windows into the minimal set of time windows covering
+        them, returning those time windows and the number of distinct partitions.
+        """
+        timezone = self.partitions_def.timezone
+        result_windows = []
+        num_partitions = 0
+        range_start = range_end = None
+        for start, end in sorted(
+            (window.start.timestamp(), window.end.timestamp()) for window in time_windows
+        ):
+            if range_end is not None and start < range_end:
+                # duplicate
+                continue
+            num_partitions += 1
+            if range_end is not None and start == range_end:
+                range_end = end
+                continue
+            if range_start is not None and range_end is not None:
+                result_windows.append(
+                    PersistedTimeWindow(
+                        TimestampWithTimezone(range_start, timezone),
+                        TimestampWithTimezone(range_end, timezone),
+                    )
+                )
+            range_start, range_end = start, end
+
+        if range_start is not None and range_end is not None:
+            result_windows.append(
+                PersistedTimeWindow(
+                    TimestampWithTimezone(range_start, timezone),
+                    TimestampWithTimezone(range_end, timezone),
+                )
+            )
+        return result_windows, num_partitions
+
     def _add_partitions_to_time_windows(
         self,
         initial_windows: Sequence[PersistedTimeWindow],
@@ -1834,6 +2029,10 @@ def _add_partitions_to_time_windows(
             TimeWindowPartitionsDefinition, self.partitions_def
         ).time_windows_for_partition_keys(frozenset(partition_keys), validate=validate)
 
+        if not result_windows:
+            # nothing to merge into, so just coalesce adjacent windows
+            return self._coalesce_time_windows(time_windows)
+
         num_added_partitions = 0
         for window in sorted(time_windows, key=lambda tw: tw.start.timestamp()):
             window_start_timestamp = window.start.timestamp()
@@ -38,6 +38,7 @@
 from dagster._core.execution.retries import RetryMode
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.selector import parse_step_selection
+from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
 from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus
 from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._core.telemetry import log_dagster_event, log_repo_stats, telemetry_wrapper
@@ -688,7 +689,14 @@ def create_execution_plan(
     instance_ref: Optional[InstanceRef] = None,
     tags: Optional[Mapping[str, str]] = None,
     repository_load_data: Optional[RepositoryLoadData] = None,
+    execution_plan_snapshot: Optional[ExecutionPlanSnapshot] = None,
 ) -> ExecutionPlan:
+    """Build the execution plan for a job.
+
+    If an ``execution_plan_snapshot`` of a plan for the job is provided, the plan is rehydrated
+    from it rather than built from the job definition. The snapshot must contain every step in
+    ``step_keys_to_execute``, along with the steps that they depend on.
+    """
     if isinstance(job, IJob):
         # If you have repository_load_data, make sure to use it when building plan
         if isinstance(job, ReconstructableJob) and repository_load_data is not None:
@@ -710,6 +718,21 @@ def create_execution_plan(
     repository_load_data = check.opt_inst_param(
         repository_load_data, "repository_load_data", RepositoryLoadData
     )
+    check.opt_inst_param(execution_plan_snapshot, "execution_plan_snapshot", ExecutionPlanSnapshot)
+
+    if execution_plan_snapshot is not None and execution_plan_snapshot.can_reconstruct_plan:
+        execution_plan = ExecutionPlan.rebuild_from_snapshot(
+            job_def.name, execution_plan_snapshot, known_state=known_state
+        )
+        if (
+            step_keys_to_execute is None
+            or step_keys_to_execute == execution_plan.step_keys_to_execute
+        ):
+            return execution_plan
+
+        return execution_plan.build_subset_plan(
+            step_keys_to_execute, job_def, ResolvedRunConfig.build(job_def, run_config)
+        )
 
     resolved_run_config = ResolvedRunConfig.build(job_def, run_config)
 
@@ -36,6 +36,7 @@
 from dagster._core.execution.plan.step import ExecutionStep
 from dagster._core.execution.retries import RetryMode, RetryState
 from dagster._core.storage.tags import GLOBAL_CONCURRENCY_TAG, PRIORITY_TAG
+from dagster._utils.concurrency import ConcurrencySlotClaim
 from dagster._utils.interrupts import pop_captured_interrupt
 from dagster._utils.tags import TagConcurrencyLimitsCounter
 
@@ -331,17 +332,31 @@ def get_steps_to_execute(
                 in_flight_steps,
             )
 
-        batch: List[ExecutionStep] = []
-
-        for step in steps:
-            if limit is not None and len(batch) >= limit:
-                break
-
+        def _has_capacity(num_steps: int) -> bool:
+            if limit is not None and num_steps >= limit:
+                return False
             if (
                 self._max_concurrent is not None
-                and len(batch) + len(self._in_flight) >= self._max_concurrent
+                and num_steps + len(self._in_flight) >= self._max_concurrent
             ):
-                break
+                return False
+            return True
+
+        batch: List[ExecutionStep] = []
+        # Steps that are tentatively part of the batch, some of which are waiting on global
+        # concurrency slot claims. The claims are made together once the tentative steps would fill
+        # the batch. Steps that fail to claim a slot are dropped, and the remaining capacity is
+        # filled from the steps that follow, which selects the same steps as claiming slots one
+        # step at a time.
+        tentative: List[ExecutionStep] = []
+        step_claims: List[ConcurrencySlotClaim] = []
+
+        for step in steps:
+            if not _has_capacity(len(batch) + len(tentative)):
+                batch.extend(self._claim_concurrency_slots(tentative, step_claims))
+                tentative, step_claims = [], []
+                if not _has_capacity(len(batch)):
+                    break
 
             if run_scoped_concurrency_limits_counter:
                 if run_scoped_concurrency_limits_counter.is_blocked(step):
@@ -357,12 +372,17 @@ def get_steps_to_execute(
                 except ValueError:
                     step_priority = 0
 
-                if not self._instance_concurrency_context.claim(
-                    step_concurrency_key, step.key, step_priority
-                ):
-                    continue
+                step_claims.append(
+                    ConcurrencySlotClaim(
+                        concurrency_key=step_concurrency_key,
+                        step_key=step.key,
+                        priority=step_priority,
+                    )
+                )
 
-            batch.append(step)
+            tentative.append(step)
+
+        batch.extend(self._claim_concurrency_slots(tentative, step_claims))
 
         for step in batch:
             self._in_flight.add(step.key)
@@ -371,6 +391,23 @@ def get_steps_to_execute(
 
         return batch
 
+    def _claim_concurrency_slots(
+        self, steps: Sequence[ExecutionStep], step_claims: Sequence[ConcurrencySlotClaim]
+    ) -> Sequence[ExecutionStep]:
+        """Claims the global concurrency slots for the given steps, returning the steps that either
+        claimed their slot or did not need one.
+        """
+        if not step_claims or not self._instance_concurrency_context:
+            return steps
+
+        claimed_step_keys = self._instance_concurrency_context.claim_steps(step_claims)
+        blocked_step_keys = {
+            step_claim.step_key
+            for step_claim in step_claims
+            if step_claim.step_key not in claimed_step_keys
+        }
+        return [step for step in steps if step.key not in blocked_step_keys]
+
     def get_steps_to_skip(self) -> Sequence[ExecutionStep]:
         self._update()
 
@@ -1,6 +1,21 @@
 import asyncio
+import concurrent.futures
 import inspect
-from typing import Any, AsyncIterator, Iterator, List, Mapping, Sequence, Set, TypeVar, Union
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+    Union,
+)
 
 from typing_extensions import TypeAlias
 
@@ -20,7 +35,11 @@
 from dagster._core.definitions.asset_layer import AssetLayer
 from dagster._core.definitions.op_definition import OpComputeFunction
 from dagster._core.definitions.result import AssetResult, MaterializeResult, ObserveResult
-from dagster._core.errors import DagsterExecutionStepExecutionError, DagsterInvariantViolationError
+from dagster._core.errors import (
+    DagsterExecutionInterruptedError,
+    DagsterExecutionStepExecutionError,
+    DagsterInvariantViolationError,
+)
 from dagster._core.events import DagsterEvent
 from dagster._core.execution.context.compute import (
     AssetCheckExecutionContext,
@@ -124,7 +143,130 @@ def _validate_event(event: Any, step_context: StepExecutionContext) -> OpOutputU
     return event
 
 
+_async_compute_loop: ContextVar[Optional[asyncio.AbstractEventLoop]] = ContextVar(
+    "async_compute_loop", default=None
+)
+
+_yield_async_compute: ContextVar[bool] = ContextVar("yield_async_compute", default=False)
+
+
+class AsyncComputeRequest:
+    """Stands in for an event in the event sequence of a step executed within
+    `yield_async_compute`, when the step needs the next result of its async compute. Whatever
+    drives the event sequence must await `awaitable` and record its outcome with `set_result` or
+    `set_exception` before asking for the next event, which the step then resumes with.
+    """
+
+    def __init__(self, awaitable: Awaitable[Any]):
+        self.awaitable = awaitable
+        self._result: Any = None
+        self._exception: Optional[BaseException] = None
+
+    def set_result(self, result: Any) -> None:
+        self._result = result
+
+    def set_exception(self, exception: BaseException) -> None:
+        self._exception = exception
+
+    def result(self) -> Any:
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+
+@contextmanager
+def async_compute_on_loop(loop: asyncio.AbstractEventLoop) -> Iterator[None]:
+    """Run the async compute functions of steps executed within this context on the given event
+    loop, which must be running in another thread. This allows the async compute of steps that are
+    executing concurrently in different threads to share a single event loop.
+    """
+    token = _async_compute_loop.set(loop)
+    try:
+        yield
+    finally:
+        _async_compute_loop.reset(token)
+
+
+_ASYNC_GEN_EXHAUSTED = object()
+
+
+async def _anext_or_exhausted(async_gen: AsyncIterator[T]) -> Any:
+    try:
+        return await async_gen.__anext__()
+    except StopAsyncIteration:
+        return _ASYNC_GEN_EXHAUSTED
+
+
+async def _aclose(async_gen: AsyncIterator[T]) -> None:
+    await async_gen.aclose()  # type: ignore  # (async generators have aclose)
+
+
+@contextmanager
+def yield_async_compute() -> Iterator[None]:
+    """Rather than blocking on the async compute functions of steps executed within this context,
+    yield an `AsyncComputeRequest` through the event sequence of the step each time one of them
+    needs to be awaited. This allows the steps to be driven by coroutines on a single event loop,
+    without a thread for each step.
+    """
+    token = _yield_async_compute.set(True)
+    try:
+        yield
+    finally:
+        _yield_async_compute.reset(token)
+
+
+def _gen_from_async_gen_on_loop(
+    async_gen: AsyncIterator[T], loop: asyncio.AbstractEventLoop
+) -> Iterator[T]:
+    try:
+        while True:
+            future = asyncio.run_coroutine_threadsafe(_anext_or_exhausted(async_gen), loop)
+            try:
+                result = future.result()
+            except concurrent.futures.CancelledError:
+                # the executor cancels in-flight async compute when the run is interrupted
+                raise DagsterExecutionInterruptedError("Execution of async compute was cancelled.")
+            if result is _ASYNC_GEN_EXHAUSTED:
+                return
+            yield result
+    finally:
+        asyncio.run_coroutine_threadsafe(_aclose(async_gen), loop).result()
+
+
+# keeps the tasks closing abandoned async compute alive until they are done
+_closing_async_gens: Set["asyncio.Future[None]"] = set()
+
+
+def _gen_from_async_gen_with_requests(async_gen: AsyncIterator[T]) -> Iterator[Any]:
+    exhausted = False
+    try:
+        while True:
+            request = AsyncComputeRequest(_anext_or_exhausted(async_gen))
+            yield request
+            result = request.result()
+            if result is _ASYNC_GEN_EXHAUSTED:
+                exhausted = True
+                return
+            yield result
+    finally:
+        if not exhausted:
+            # the step is driven from the event loop, so the generator cannot be closed by waiting
+            # on it here
+            task = asyncio.ensure_future(_aclose(async_gen))
+            _closing_async_gens.add(task)
+            task.add_done_callback(_closing_async_gens.discard)
+
+
 def gen_from_async_gen(async_gen: AsyncIterator[T]) -> Iterator[T]:
+    if _yield_async_compute.get():
+        yield from _gen_from_async_gen_with_requests(async_gen)
+        return
+
+    loop = _async_compute_loop.get()
+    if loop is not None:
+        yield from _gen_from_async_gen_on_loop(async_gen, loop)
+        return
+
     # prime use for asyncio.Runner, but new in 3.11 and did not find appealing backport
     loop = asyncio.new_event_loop()
     try:
@@ -174,6 +316,9 @@ def _yield_compute_results(
         ),
         user_event_generator,
     ):
+        if isinstance(event, AsyncComputeRequest):
+            yield event
+            continue
         if compute_context.op_execution_context.has_events():
             yield from compute_context.op_execution_context.consume_events()
         yield _validate_event(event, step_context)
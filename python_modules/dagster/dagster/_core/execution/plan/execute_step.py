@@ -51,7 +51,11 @@
 from dagster._core.execution.context.compute import enter_execution_context
 from dagster._core.execution.context.output import OutputContext
 from dagster._core.execution.context.system import StepExecutionContext, TypeCheckContext
-from dagster._core.execution.plan.compute import OpOutputUnion, execute_core_compute
+from dagster._core.execution.plan.compute import (
+    AsyncComputeRequest,
+    OpOutputUnion,
+    execute_core_compute,
+)
 from dagster._core.execution.plan.compute_generator import create_op_compute_wrapper
 from dagster._core.execution.plan.inputs import StepInputData
 from dagster._core.execution.plan.objects import StepSuccessData, TypeCheckData
@@ -515,6 +519,9 @@ def core_dagster_event_sequence_for_step(
                 yield DagsterEvent.asset_check_evaluation(step_context, user_event)
             elif isinstance(user_event, ExpectationResult):
                 yield DagsterEvent.step_expectation_result(step_context, user_event)
+            elif isinstance(user_event, AsyncComputeRequest):
+                # handed to whatever drives the step, see yield_async_compute
+                yield user_event  # type: ignore
             else:
                 check.failed(f"Unexpected event {user_event}, should have been caught earlier")
 
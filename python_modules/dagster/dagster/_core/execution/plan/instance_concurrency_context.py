@@ -1,13 +1,14 @@
 import time
 from collections import defaultdict
 from types import TracebackType
-from typing import List, Optional, Set, Type
+from typing import List, Optional, Sequence, Set, Type
 
 from typing_extensions import Self
 
 from dagster._core.instance import DagsterInstance
 from dagster._core.storage.dagster_run import DagsterRun
 from dagster._core.storage.tags import PRIORITY_TAG
+from dagster._utils.concurrency import ConcurrencySlotClaim
 
 INITIAL_INTERVAL_VALUE = 1
 STEP_UP_BASE = 1.1
@@ -81,47 +82,80 @@ def _sync_global_concurrency_keys(self) -> None:
         self._global_concurrency_keys = self._instance.event_log_storage.get_concurrency_keys()
 
     def claim(self, concurrency_key: str, step_key: str, step_priority: int = 0):
+        return step_key in self.claim_steps(
+            [
+                ConcurrencySlotClaim(
+                    concurrency_key=concurrency_key, step_key=step_key, priority=step_priority
+                )
+            ]
+        )
+
+    def claim_steps(self, step_claims: Sequence[ConcurrencySlotClaim]) -> Set[str]:
+        """Attempts to claim concurrency slots for a batch of steps, with a single storage call for
+        all the steps whose claims are due to be checked. The priority of each claim is the step
+        priority, which is added to the run priority.
+
+        Returns the keys of the steps that may execute.
+        """
         if not self._instance.event_log_storage.supports_global_concurrency_limits:
-            return True
-
-        if concurrency_key not in self.global_concurrency_keys:
-            # The initialization call will be a no-op if the limit is set by another process,
-            # mitigating any race condition concerns
-            if not self._instance.event_log_storage.initialize_concurrency_limit_to_default(
-                concurrency_key
-            ):
-                # still default open if the limit table has not been initialized
-                return True
+            return {step_claim.step_key for step_claim in step_claims}
+
+        can_execute = set()
+        to_claim: List[ConcurrencySlotClaim] = []
+        for step_claim in step_claims:
+            concurrency_key, step_key = step_claim.concurrency_key, step_claim.step_key
+            if concurrency_key not in self.global_concurrency_keys:
+                # The initialization call will be a no-op if the limit is set by another process,
+                # mitigating any race condition concerns
+                if not self._instance.event_log_storage.initialize_concurrency_limit_to_default(
+                    concurrency_key
+                ):
+                    # still default open if the limit table has not been initialized
+                    can_execute.add(step_key)
+                    continue
+                else:
+                    # sync the global concurrency keys to ensure we have the latest
+                    self._sync_global_concurrency_keys()
+
+            if step_key in self._pending_claims:
+                if time.time() > self._pending_timeouts[step_key]:
+                    del self._pending_timeouts[step_key]
+                else:
+                    continue
             else:
-                # sync the global concurrency keys to ensure we have the latest
-                self._sync_global_concurrency_keys()
+                self._pending_claims.add(step_key)
 
-        if step_key in self._pending_claims:
-            if time.time() > self._pending_timeouts[step_key]:
-                del self._pending_timeouts[step_key]
-            else:
-                return False
-        else:
-            self._pending_claims.add(step_key)
+            to_claim.append(
+                ConcurrencySlotClaim(
+                    concurrency_key=concurrency_key,
+                    step_key=step_key,
+                    priority=self._run_priority + (step_claim.priority or 0),
+                )
+            )
+
+        if not to_claim:
+            return can_execute
 
-        priority = self._run_priority + step_priority
-        claim_status = self._instance.event_log_storage.claim_concurrency_slot(
-            concurrency_key, self._run_id, step_key, priority
+        claim_statuses = self._instance.event_log_storage.claim_concurrency_slots(
+            self._run_id, to_claim
         )
+        for step_claim, claim_status in zip(to_claim, claim_statuses):
+            step_key = step_claim.step_key
+            if not claim_status.is_claimed:
+                interval = _calculate_timeout_interval(
+                    claim_status.sleep_interval, self._pending_claim_counts[step_key]
+                )
+                self._pending_timeouts[step_key] = time.time() + interval
+                self._pending_claim_counts[step_key] += 1
+                continue
 
-        if not claim_status.is_claimed:
-            interval = _calculate_timeout_interval(
-                claim_status.sleep_interval, self._pending_claim_counts[step_key]
-            )
-            self._pending_timeouts[step_key] = time.time() + interval
-            self._pending_claim_counts[step_key] += 1
-            return False
+            if step_key in self._pending_claims:
+                self._pending_claims.remove(step_key)
 
-        if step_key in self._pending_claims:
-            self._pending_claims.remove(step_key)
+            self._claims.add(step_key)
+            can_execute.add(step_key)
 
-        self._claims.add(step_key)
-        return True
+        return can_execute
 
     def interval_to_next_pending_claim_check(self) -> float:
         if not self._pending_claims:
@@ -209,7 +209,6 @@ def build(self) -> "ExecutionPlan":
                 step_dict_by_key,
                 step_handles_to_execute,
                 self.job_def,
-                self.resolved_run_config,
                 executable_map,
             ),
             executor_name=executor_name,
@@ -877,13 +876,68 @@ def build_subset_plan(
                 self.step_dict_by_key,
                 step_handles_to_execute,
                 job_def,
-                resolved_run_config,
                 executable_map,
             ),
             executor_name=self.executor_name,
             repository_load_data=self.repository_load_data,
         )
 
+    def build_isolated_subset_plan(
+        self,
+        step_keys_to_execute: Sequence[str],
+        job_def: JobDefinition,
+    ) -> "ExecutionPlan":
+        """Build a subset plan that only contains the given executable steps and the steps whose
+        outputs they depend on.
+
+        Unlike build_subset_plan, the cost of this is proportional to the size of the subset
+        rather than the size of the whole plan, and its snapshot is small enough to send to the
+        worker that executes the steps, which can then rehydrate it instead of building its own
+        plan from the job definition.
+        """
+        check.sequence_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+
+        step_dict: Dict[StepHandleUnion, IExecutionStep] = {}
+        step_handles_to_execute: List[StepHandleUnion] = []
+        for key in step_keys_to_execute:
+            step = self.get_executable_step_by_key(key)
+            if step.handle not in step_dict:
+                step_dict[step.handle] = step
+                step_handles_to_execute.append(step.handle)
+
+        for handle in step_handles_to_execute:
+            step = cast(ExecutionStep, step_dict[handle])
+            for upstream_key in step.get_execution_dependency_keys():
+                upstream_step = self.get_step_by_key(upstream_key)
+                step_dict.setdefault(upstream_step.handle, upstream_step)
+
+        step_dict_by_key = {step.key: step for step in step_dict.values()}
+
+        executable_map, resolvable_map = _compute_step_maps(
+            step_dict,
+            step_dict_by_key,
+            step_handles_to_execute,
+            self.known_state,
+        )
+
+        return ExecutionPlan(
+            step_dict,
+            executable_map,
+            resolvable_map,
+            step_handles_to_execute,
+            self.known_state,
+            _compute_artifacts_persisted(
+                step_dict,
+                step_dict_by_key,
+                step_handles_to_execute,
+                job_def,
+                executable_map,
+            ),
+            step_dict_by_key=step_dict_by_key,
+            executor_name=self.executor_name,
+            repository_load_data=self.repository_load_data,
+        )
+
     def get_version_for_step_output_handle(
         self, step_output_handle: StepOutputHandle
     ) -> Optional[str]:
@@ -990,6 +1044,7 @@ def rebuild_step_input(
     def rebuild_from_snapshot(
         job_name: str,
         execution_plan_snapshot: "ExecutionPlanSnapshot",
+        known_state: Optional[KnownExecutionState] = None,
     ) -> "ExecutionPlan":
         if not execution_plan_snapshot.can_reconstruct_plan:
             raise DagsterInvariantViolationError(
@@ -1058,11 +1113,15 @@ def rebuild_from_snapshot(
             StepHandle.parse_from_key(key) for key in execution_plan_snapshot.step_keys_to_execute
         ]
 
+        # the known state of the execution may have moved on since the snapshot was taken
+        if known_state is None:
+            known_state = execution_plan_snapshot.initial_known_state
+
         executable_map, resolvable_map = _compute_step_maps(
             step_dict,
             step_dict_by_key,
             step_handles_to_execute,
-            execution_plan_snapshot.initial_known_state,
+            known_state,
         )
 
         return ExecutionPlan(
@@ -1071,8 +1130,9 @@ def rebuild_from_snapshot(
             resolvable_map,
             step_handles_to_execute,
             # default to empty known execution state if initial was not persisted
-            execution_plan_snapshot.initial_known_state or KnownExecutionState(),
+            known_state or KnownExecutionState(),
             execution_plan_snapshot.artifacts_persisted,
+            step_dict_by_key=step_dict_by_key,
             executor_name=execution_plan_snapshot.executor_name,
             repository_load_data=execution_plan_snapshot.repository_load_data,
         )
@@ -1088,6 +1148,7 @@ def _update_from_resolved_dynamic_outputs(
 ) -> None:
     resolved_steps: List[ExecutionStep] = []
     key_sets_to_clear: List[FrozenSet[str]] = []
+    step_handles_to_execute_set = set(step_handles_to_execute)
 
     # find entries in the resolvable map whose requirements are now all ready
     for required_keys, unresolved_step_handles in resolvable_map.items():
@@ -1098,7 +1159,7 @@ def _update_from_resolved_dynamic_outputs(
 
         for unresolved_step_handle in unresolved_step_handles:
             # don't resolve steps we are not executing
-            if unresolved_step_handle not in step_handles_to_execute:
+            if unresolved_step_handle not in step_handles_to_execute_set:
                 continue
 
             resolvable_step = step_dict[unresolved_step_handle]
@@ -1216,7 +1277,6 @@ def _compute_artifacts_persisted(
     step_dict_by_key: Dict[str, IExecutionStep],
     step_handles_to_execute: Sequence[StepHandleUnion],
     job_def: JobDefinition,
-    resolved_run_config: ResolvedRunConfig,
     executable_map: Mapping[str, Union[StepHandle, ResolvedFromDynamicStepHandle]],
 ) -> bool:
     """Check if all the border steps of the current run have non-in-memory IO managers for reexecution.
@@ -1277,7 +1337,7 @@ def _get_executable_step_deps(
     # for things transitively downstream of unresolved collect steps
     unresolved_set = set()
 
-    step_keys_to_execute = [handle.to_key() for handle in step_handles_to_execute]
+    step_keys_to_execute = {handle.to_key() for handle in step_handles_to_execute}
 
     for key, handle in executable_map.items():
         step = cast(ExecutionStep, step_dict[handle])
@@ -1347,7 +1407,7 @@ def _compute_step_maps(
             step_keys=missing_steps,
         )
 
-    step_keys_to_execute = [step_handle.to_key() for step_handle in step_handles_to_execute]
+    step_keys_to_execute = {step_handle.to_key() for step_handle in step_handles_to_execute}
     past_mappings = known_state.dynamic_mappings if known_state else {}
 
     executable_map: Dict[str, Union[StepHandle, ResolvedFromDynamicStepHandle]] = {}
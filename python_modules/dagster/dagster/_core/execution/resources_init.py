@@ -357,8 +357,9 @@ def get_required_resource_keys_to_init(
 ) -> AbstractSet[str]:
     resource_keys: Set[str] = set()
 
+    step_handles_to_execute = set(execution_plan.step_handles_to_execute)
     for step_handle, step in execution_plan.step_dict.items():
-        if step_handle not in execution_plan.step_handles_to_execute:
+        if step_handle not in step_handles_to_execute:
             continue
 
         hook_defs = job_def.get_all_hooks_for_handle(step.node_handle)
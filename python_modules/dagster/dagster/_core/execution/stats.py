@@ -1,6 +1,6 @@
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, Iterable, NamedTuple, Optional, Sequence, cast
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, cast
 
 import dagster._check as check
 from dagster._core.definitions import ExpectationResult
@@ -77,103 +77,163 @@ class StepEventStatus(Enum):
     IN_PROGRESS = "IN_PROGRESS"
 
 
+# Events which determine the status, timing and attempts of a step
+STEP_LIFECYCLE_EVENTS = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+}
+
+# Steps are only reported in the step stats of a run once one of these events has been stored
+STEP_STATS_REPORTED_EVENTS = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+}
+
+STEP_END_STATUSES = {
+    DagsterEventType.STEP_SUCCESS: StepEventStatus.SUCCESS,
+    DagsterEventType.STEP_FAILURE: StepEventStatus.FAILURE,
+    DagsterEventType.STEP_SKIPPED: StepEventStatus.SKIPPED,
+}
+
+
+class StepStatsEvent(NamedTuple):
+    """The parts of a step event that the step's stats are built from, other than the contents of
+    its materializations and expectation results.
+    """
+
+    event_type: DagsterEventType
+    timestamp: float
+    marker_start: Optional[str] = None
+    marker_end: Optional[str] = None
+
+
+def step_stats_event_from_entry(event: EventLogEntry) -> Optional[StepStatsEvent]:
+    """Returns the stats event for a step lifecycle, marker, materialization or expectation result
+    event, or None for any other event.
+    """
+    if not event.is_dagster_event:
+        return None
+    dagster_event = event.get_dagster_event()
+    if not dagster_event.step_key:
+        return None
+
+    if dagster_event.event_type in STEP_LIFECYCLE_EVENTS or dagster_event.event_type in (
+        DagsterEventType.ASSET_MATERIALIZATION,
+        DagsterEventType.STEP_EXPECTATION_RESULT,
+    ):
+        return StepStatsEvent(dagster_event.event_type, event.timestamp)
+
+    if dagster_event.event_type in MARKER_EVENTS:
+        marker_start = dagster_event.engine_event_data.marker_start
+        marker_end = dagster_event.engine_event_data.marker_end
+        if marker_start or marker_end:
+            return StepStatsEvent(
+                dagster_event.event_type, event.timestamp, marker_start, marker_end
+            )
+
+    return None
+
+
 def build_run_step_stats_from_events(
     run_id: str, records: Iterable[EventLogEntry]
 ) -> Sequence["RunStepKeyStatsSnapshot"]:
-    by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
-    attempts = defaultdict(list)
-    attempt_events = defaultdict(list)
-    markers: Dict[str, Dict[str, Any]] = defaultdict(dict)
+    stats_events: Dict[str, List[StepStatsEvent]] = defaultdict(list)
+    materialization_events: Dict[str, List[EventLogEntry]] = defaultdict(list)
+    expectation_results: Dict[str, List[ExpectationResult]] = defaultdict(list)
+    reported_step_keys: Dict[str, None] = {}
     for event in records:
-        if not event.is_dagster_event:
+        stats_event = step_stats_event_from_entry(event)
+        if not stats_event:
             continue
         dagster_event = event.get_dagster_event()
+        step_key = check.not_none(dagster_event.step_key)
 
-        step_key = dagster_event.step_key
-        if not step_key:
-            continue
-
-        if dagster_event.event_type == DagsterEventType.STEP_START:
-            by_step_key[step_key]["start_time"] = event.timestamp
-            by_step_key[step_key]["attempts"] = 1
-        if dagster_event.event_type == DagsterEventType.STEP_FAILURE:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.FAILURE
-        if dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-            by_step_key[step_key]["attempts"] = int(by_step_key[step_key].get("attempts") or 0) + 1
-        if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
-        if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
+        stats_events[step_key].append(stats_event)
+        if stats_event.event_type in STEP_STATS_REPORTED_EVENTS:
+            reported_step_keys[step_key] = None
         if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
-            materialization_events = by_step_key[step_key].get("materialization_events", [])
-            materialization_events.append(event)
-            by_step_key[step_key]["materialization_events"] = materialization_events
+            materialization_events[step_key].append(event)
         if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
             expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
-            expectation_result = expectation_data.expectation_result
-            step_expectation_results = by_step_key[step_key].get("expectation_results", [])
-            step_expectation_results.append(expectation_result)
-            by_step_key[step_key]["expectation_results"] = step_expectation_results
-        if dagster_event.event_type in (
-            DagsterEventType.STEP_UP_FOR_RETRY,
-            DagsterEventType.STEP_RESTARTED,
-        ):
-            attempt_events[step_key].append(event)
-        if dagster_event.event_type in MARKER_EVENTS:
-            if dagster_event.engine_event_data.marker_start:
-                key = dagster_event.engine_event_data.marker_start
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "start": event.timestamp}
-                else:
-                    markers[step_key][key]["start"] = event.timestamp
-
-            if dagster_event.engine_event_data.marker_end:
-                key = dagster_event.engine_event_data.marker_end
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "end": event.timestamp}
-                else:
-                    markers[step_key][key]["end"] = event.timestamp
-
-    for step_key, step_stats in by_step_key.items():
-        events = attempt_events[step_key]
-        step_attempts = []
-        attempt_start = step_stats.get("start_time")
-
-        for event in events:
-            if not event.dagster_event:
-                continue
-            if event.dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
-                step_attempts.append(
-                    RunStepMarker(start_time=attempt_start, end_time=event.timestamp)
-                )
-            elif event.dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-                attempt_start = event.timestamp
-        if step_stats.get("end_time"):
-            step_attempts.append(
-                RunStepMarker(start_time=attempt_start, end_time=step_stats["end_time"])
-            )
-        else:
-            by_step_key[step_key]["status"] = StepEventStatus.IN_PROGRESS
-        attempts[step_key] = step_attempts
+            expectation_results[step_key].append(expectation_data.expectation_result)
 
     return [
-        RunStepKeyStatsSnapshot(
-            run_id=run_id,
-            step_key=step_key,
-            attempts_list=attempts[step_key],
-            markers=[
-                RunStepMarker(start_time=marker.get("start"), end_time=marker.get("end"))
-                for marker in markers[step_key].values()
-            ],
-            **value,
+        build_run_step_stats_snapshot(
+            run_id,
+            step_key,
+            stats_events[step_key],
+            materialization_events[step_key],
+            expectation_results[step_key],
         )
-        for step_key, value in by_step_key.items()
+        for step_key in reported_step_keys
     ]
 
 
+def build_run_step_stats_snapshot(
+    run_id: str,
+    step_key: str,
+    stats_events: Sequence[StepStatsEvent],
+    materialization_events: Sequence[EventLogEntry],
+    expectation_results: Sequence[ExpectationResult],
+) -> "RunStepKeyStatsSnapshot":
+    """Builds the stats of a step from its stats events, in the order they were stored."""
+    start_time = None
+    end_time = None
+    status = None
+    attempts = None
+    markers: Dict[str, Dict[str, float]] = {}
+    for event in stats_events:
+        if event.event_type == DagsterEventType.STEP_START:
+            start_time = event.timestamp
+            attempts = 1
+        if event.event_type == DagsterEventType.STEP_RESTARTED:
+            attempts = (attempts or 0) + 1
+        if event.event_type in STEP_END_STATUSES:
+            end_time = event.timestamp
+            status = STEP_END_STATUSES[event.event_type]
+        if event.marker_start:
+            markers.setdefault(event.marker_start, {})["start"] = event.timestamp
+        if event.marker_end:
+            markers.setdefault(event.marker_end, {})["end"] = event.timestamp
+
+    attempts_list = []
+    attempt_start = start_time
+    for event in stats_events:
+        if event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+            attempts_list.append(RunStepMarker(start_time=attempt_start, end_time=event.timestamp))
+        elif event.event_type == DagsterEventType.STEP_RESTARTED:
+            attempt_start = event.timestamp
+    if end_time:
+        attempts_list.append(RunStepMarker(start_time=attempt_start, end_time=end_time))
+    else:
+        status = StepEventStatus.IN_PROGRESS
+
+    return RunStepKeyStatsSnapshot(
+        run_id=run_id,
+        step_key=step_key,
+        status=status,
+        start_time=start_time,
+        end_time=end_time,
+        materialization_events=materialization_events,
+        expectation_results=expectation_results,
+        attempts=attempts,
+        attempts_list=attempts_list,
+        markers=[
+            RunStepMarker(start_time=marker.get("start"), end_time=marker.get("end"))
+            for marker in markers.values()
+        ],
+    )
+
+
 @whitelist_for_serdes
 class RunStepMarker(
     NamedTuple(
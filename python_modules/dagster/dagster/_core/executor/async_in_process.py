@@ -0,0 +1,389 @@
+import asyncio
+import inspect
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from typing import Any, Coroutine, Dict, Iterator, List, NamedTuple, Optional, Set, Union, cast
+
+import dagster._check as check
+from dagster._core.definitions.decorators.op_decorator import DecoratedOpFunction
+from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._core.events import DagsterEvent, EngineEventData
+from dagster._core.execution.api import ExecuteRunWithPlanIterable
+from dagster._core.execution.compute_logs import create_compute_log_file_key
+from dagster._core.execution.context.system import (
+    PlanExecutionContext,
+    PlanOrchestrationContext,
+    StepExecutionContext,
+)
+from dagster._core.execution.context_creation_job import PlanExecutionContextManager
+from dagster._core.execution.plan.active import ActiveExecution
+from dagster._core.execution.plan.compute import (
+    AsyncComputeRequest,
+    async_compute_on_loop,
+    yield_async_compute,
+)
+from dagster._core.execution.plan.execute_plan import (
+    _handle_compute_log_setup_error,
+    _handle_compute_log_teardown_error,
+    _trigger_hook,
+    dagster_event_sequence_for_step,
+)
+from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.retries import RetryMode
+from dagster._core.executor.base import Executor
+from dagster._utils.timing import format_duration, time_execution_scope
+
+DEFAULT_MAX_CONCURRENT = 32
+
+POLL_INTERVAL = 0.1
+"""The maximum time to wait for step events before checking for interrupts."""
+
+
+_INTERRUPT_ERRORS = (DagsterExecutionInterruptedError, KeyboardInterrupt)
+
+
+class _StepComplete(NamedTuple):
+    step_key: str
+    error: Optional[BaseException]
+
+
+@contextmanager
+def _event_loop_in_thread() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="dagster-async-compute", daemon=True)
+    thread.start()
+    try:
+        yield loop
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        # finish anything that was abandoned when the executor raised, e.g. steps that were
+        # driven on the loop
+        pending = asyncio.all_tasks(loop)
+        if pending:
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def _is_async_step(step_context: StepExecutionContext) -> bool:
+    if step_context.step_launcher:
+        return False
+    compute_fn = step_context.op_def.compute_fn
+    return isinstance(compute_fn, DecoratedOpFunction) and (
+        inspect.iscoroutinefunction(compute_fn.decorated_fn)
+        or inspect.isasyncgenfunction(compute_fn.decorated_fn)
+    )
+
+
+class _AsyncStepRunner:
+    """Executes the steps of async ops as tasks on an event loop that is running in another
+    thread. The framework code of each step runs on the loop between awaits of its compute
+    function, so no step holds a thread while its compute is waiting on I/O.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        event_queue: "queue.Queue[Union[DagsterEvent, _StepComplete]]",
+    ):
+        self._loop = loop
+        self._event_queue = event_queue
+        # only accessed from the event loop
+        self._step_tasks: Set["asyncio.Task[None]"] = set()
+        self._interrupted = False
+
+    def submit(self, step_context: StepExecutionContext) -> None:
+        self._loop.call_soon_threadsafe(self._start_step, step_context)
+
+    def cancel_async_compute(self) -> None:
+        """Cancels the async compute of all steps, including the steps executing in threads. The
+        steps themselves keep running, so that each of them reports its interruption.
+        """
+        self._loop.call_soon_threadsafe(self._cancel_async_compute)
+
+    def _start_step(self, step_context: StepExecutionContext) -> None:
+        task = self._loop.create_task(self._execute_step(step_context))
+        self._step_tasks.add(task)
+        task.add_done_callback(self._step_tasks.discard)
+
+    def _cancel_async_compute(self) -> None:
+        self._interrupted = True
+        for task in asyncio.all_tasks(self._loop):
+            if task not in self._step_tasks:
+                task.cancel()
+
+    async def _execute_step(self, step_context: StepExecutionContext) -> None:
+        error = None
+        try:
+            with yield_async_compute():
+                for step_event in dagster_event_sequence_for_step(step_context):
+                    if isinstance(step_event, AsyncComputeRequest):
+                        await self._resolve(step_event)
+                    else:
+                        self._event_queue.put(check.inst(step_event, DagsterEvent))
+        except BaseException as e:
+            error = e
+        finally:
+            self._event_queue.put(_StepComplete(step_context.step.key, error))
+
+    async def _resolve(self, request: AsyncComputeRequest) -> None:
+        if self._interrupted:
+            cast(Coroutine, request.awaitable).close()
+            request.set_exception(
+                DagsterExecutionInterruptedError("Execution of async compute was cancelled.")
+            )
+            return
+
+        # awaited as a task of its own, so that it can be cancelled without cancelling the step
+        compute_task = asyncio.ensure_future(request.awaitable)
+        try:
+            request.set_result(await compute_task)
+        except asyncio.CancelledError:
+            request.set_exception(
+                DagsterExecutionInterruptedError("Execution of async compute was cancelled.")
+            )
+        except Exception as e:
+            request.set_exception(e)
+
+
+def _execute_step_in_thread(
+    step_context: StepExecutionContext,
+    loop: asyncio.AbstractEventLoop,
+    event_queue: "queue.Queue[Union[DagsterEvent, _StepComplete]]",
+) -> None:
+    error = None
+    try:
+        with async_compute_on_loop(loop):
+            for step_event in check.generator(dagster_event_sequence_for_step(step_context)):
+                event_queue.put(check.inst(step_event, DagsterEvent))
+    except BaseException as e:
+        error = e
+    finally:
+        event_queue.put(_StepComplete(step_context.step.key, error))
+
+
+def _execute_steps_concurrently(
+    job_context: PlanExecutionContext,
+    active_execution: ActiveExecution,
+    max_sync_step_threads: Optional[int],
+) -> Iterator[DagsterEvent]:
+    # the thread pool is shut down before the event loop is stopped, so that no step is left
+    # waiting on async compute that will never complete
+    with _event_loop_in_thread() as loop:
+        with ThreadPoolExecutor(
+            max_workers=max_sync_step_threads, thread_name_prefix="dagster-step"
+        ) as thread_pool:
+            event_queue: "queue.Queue[Union[DagsterEvent, _StepComplete]]" = queue.Queue()
+            async_step_runner = _AsyncStepRunner(loop, event_queue)
+            running: Dict[str, StepExecutionContext] = {}
+            step_events: Dict[str, List[DagsterEvent]] = {}
+            stopping = False
+
+            try:
+                while (not stopping and not active_execution.is_complete) or running:
+                    if active_execution.check_for_interrupts():
+                        yield DagsterEvent.engine_event(
+                            job_context,
+                            "Async in-process executor: received termination signal - "
+                            "cancelling async compute of active steps",
+                            EngineEventData.interrupted(list(running.keys())),
+                        )
+                        stopping = True
+                        active_execution.mark_interrupted()
+                        async_step_runner.cancel_async_compute()
+
+                    if not stopping:
+                        steps = active_execution.get_steps_to_execute()
+
+                        yield from active_execution.concurrency_event_iterator(job_context)
+
+                        for step in steps:
+                            step_context = cast(
+                                StepExecutionContext,
+                                job_context.for_step(step, active_execution.get_known_state()),
+                            )
+                            running[step.key] = step_context
+                            step_events[step.key] = []
+                            if _is_async_step(step_context):
+                                async_step_runner.submit(step_context)
+                            else:
+                                thread_pool.submit(
+                                    _execute_step_in_thread, step_context, loop, event_queue
+                                )
+
+                    if not running:
+                        if not stopping and not active_execution.is_complete:
+                            active_execution.sleep_til_ready()
+                        continue
+
+                    try:
+                        item = event_queue.get(timeout=POLL_INTERVAL)
+                    except queue.Empty:
+                        continue
+
+                    while True:
+                        if isinstance(item, DagsterEvent):
+                            step_events[cast(str, item.step_key)].append(item)
+                            yield item
+                            active_execution.handle_event(item)
+                        else:
+                            step_context = running.pop(item.step_key)
+                            # steps raise after yielding their failure event when interrupted,
+                            # or when errors are configured to be raised
+                            if item.error is not None and not (
+                                stopping and isinstance(item.error, _INTERRUPT_ERRORS)
+                            ):
+                                raise item.error
+
+                            active_execution.verify_complete(job_context, item.step_key)
+
+                            # process skips from failures or uncovered inputs
+                            for event in active_execution.plan_events_iterator(job_context):
+                                step_events[item.step_key].append(event)
+                                yield event
+
+                            # pass a list of step events to hooks
+                            yield from _trigger_hook(step_context, step_events.pop(item.step_key))
+
+                        try:
+                            item = event_queue.get_nowait()
+                        except queue.Empty:
+                            break
+            except BaseException:
+                # let steps that are waiting on async compute finish so that the thread pool can
+                # shut down
+                async_step_runner.cancel_async_compute()
+                raise
+
+
+def async_inprocess_execution_iterator(
+    job_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    max_concurrent: int,
+    tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
+    max_sync_step_threads: Optional[int] = None,
+) -> Iterator[DagsterEvent]:
+    """Executes the steps of the plan concurrently within the current process.
+
+    Up to ``max_concurrent`` steps execute at once. Steps of async ops run as coroutines on a
+    single event loop, so that steps that are waiting on I/O neither block each other nor hold a
+    thread. Steps of sync ops run in a separate pool of ``max_sync_step_threads`` threads (by
+    default, the default size of a ``ThreadPoolExecutor``). Step events are yielded and handled
+    by the calling thread as they are produced.
+    """
+    check.inst_param(job_context, "job_context", PlanExecutionContext)
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.int_param(max_concurrent, "max_concurrent")
+    check.opt_int_param(max_sync_step_threads, "max_sync_step_threads")
+
+    compute_log_manager = job_context.instance.compute_log_manager
+    step_keys = [step.key for step in execution_plan.get_steps_to_execute_in_topo_order()]
+
+    with InstanceConcurrencyContext(
+        job_context.instance, job_context.dagster_run
+    ) as instance_concurrency_context, execution_plan.start(
+        retry_mode=job_context.retry_mode,
+        max_concurrent=max_concurrent,
+        tag_concurrency_limits=tag_concurrency_limits,
+        instance_concurrency_context=instance_concurrency_context,
+    ) as active_execution:
+        with ExitStack() as capture_stack:
+            # begin capturing logs for the whole process
+            file_key = create_compute_log_file_key()
+            log_key = compute_log_manager.build_log_key_for_run(job_context.run_id, file_key)
+            try:
+                log_context = capture_stack.enter_context(compute_log_manager.capture_logs(log_key))
+                yield DagsterEvent.capture_logs(job_context, step_keys, log_key, log_context)
+            except Exception:
+                yield from _handle_compute_log_setup_error(job_context, sys.exc_info())
+
+            yield from _execute_steps_concurrently(
+                job_context, active_execution, max_sync_step_threads
+            )
+
+            try:
+                capture_stack.close()
+            except Exception:
+                yield from _handle_compute_log_teardown_error(job_context, sys.exc_info())
+
+
+class AsyncInProcessExecutor(Executor):
+    def __init__(
+        self,
+        retries: RetryMode,
+        max_concurrent: Optional[int] = None,
+        tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
+        max_sync_step_threads: Optional[int] = None,
+    ):
+        self._retries = check.inst_param(retries, "retries", RetryMode)
+        self._max_concurrent = check.opt_int_param(
+            max_concurrent, "max_concurrent", DEFAULT_MAX_CONCURRENT
+        )
+        check.invariant(self._max_concurrent > 0, "max_concurrent must be a positive integer")
+        self._tag_concurrency_limits = check.opt_list_param(
+            tag_concurrency_limits, "tag_concurrency_limits"
+        )
+        self._max_sync_step_threads = check.opt_int_param(
+            max_sync_step_threads, "max_sync_step_threads"
+        )
+        check.invariant(
+            self._max_sync_step_threads is None or self._max_sync_step_threads > 0,
+            "max_sync_step_threads must be a positive integer",
+        )
+
+    @property
+    def retries(self) -> RetryMode:
+        return self._retries
+
+    def execute(
+        self, plan_context: PlanOrchestrationContext, execution_plan: ExecutionPlan
+    ) -> Iterator[DagsterEvent]:
+        check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
+        check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+
+        step_keys_to_execute = execution_plan.step_keys_to_execute
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            f"Executing steps concurrently in process (pid: {os.getpid()})",
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
+
+        with time_execution_scope() as timer_result:
+            yield from iter(
+                ExecuteRunWithPlanIterable(
+                    execution_plan=plan_context.execution_plan,
+                    iterator=partial(
+                        async_inprocess_execution_iterator,
+                        max_concurrent=self._max_concurrent,
+                        tag_concurrency_limits=self._tag_concurrency_limits,
+                        max_sync_step_threads=self._max_sync_step_threads,
+                    ),
+                    execution_context_manager=PlanExecutionContextManager(
+                        job=plan_context.job,
+                        retry_mode=plan_context.retry_mode,
+                        execution_plan=plan_context.execution_plan,
+                        run_config=plan_context.run_config,
+                        dagster_run=plan_context.dagster_run,
+                        instance=plan_context.instance,
+                        raise_on_error=plan_context.raise_on_error,
+                        output_capture=plan_context.output_capture,
+                    ),
+                )
+            )
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            f"Finished steps concurrently in process (pid: {os.getpid()}) in"
+            f" {format_duration(timer_result.millis)}",
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
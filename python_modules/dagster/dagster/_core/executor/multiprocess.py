@@ -34,7 +34,16 @@
     ChildProcessSystemErrorEvent,
     execute_child_process_command,
 )
+from dagster._core.executor.multiprocess_worker_pool import (
+    MultiprocessWorkerPool,
+    WorkerProcess,
+    WorkerProcessRecycleEvent,
+)
 from dagster._core.instance import DagsterInstance
+from dagster._core.snap.execution_plan_snapshot import (
+    ExecutionPlanSnapshot,
+    snapshot_from_execution_plan,
+)
 from dagster._utils import get_run_crash_explanation, start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.timing import TimerResult, format_duration, time_execution_scope
@@ -58,6 +67,7 @@ def __init__(
         retry_mode: RetryMode,
         known_state: Optional[KnownExecutionState],
         repository_load_data: Optional[RepositoryLoadData],
+        execution_plan_snapshot: Optional[ExecutionPlanSnapshot] = None,
     ):
         self.run_config = run_config
         self.dagster_run = dagster_run
@@ -68,6 +78,7 @@ def __init__(
         self.retry_mode = retry_mode
         self.known_state = known_state
         self.repository_load_data = repository_load_data
+        self.execution_plan_snapshot = execution_plan_snapshot
 
     def execute(self) -> Iterator[DagsterEvent]:
         recon_job = self.recon_pipeline
@@ -92,6 +103,7 @@ def execute(self) -> Iterator[DagsterEvent]:
                     step_keys_to_execute=[self.step_key],
                     known_state=self.known_state,
                     repository_load_data=self.repository_load_data,
+                    execution_plan_snapshot=self.execution_plan_snapshot,
                 )
                 yield from execute_plan_iterator(
                     execution_plan,
@@ -115,6 +127,10 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        use_worker_pool: bool = False,
+        max_steps_per_worker: Optional[int] = None,
+        max_worker_memory_mb: Optional[int] = None,
+        send_execution_plan_snapshot: bool = False,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -140,6 +156,16 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker"
+        )
+        self._max_worker_memory_mb = check.opt_int_param(
+            max_worker_memory_mb, "max_worker_memory_mb"
+        )
+        self._send_execution_plan_snapshot = check.bool_param(
+            send_execution_plan_snapshot, "send_execution_plan_snapshot"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -202,6 +228,17 @@ def execute(
                     instance_concurrency_context=instance_concurrency_context,
                 )
             )
+            worker_pool = (
+                stack.enter_context(
+                    MultiprocessWorkerPool(
+                        multiproc_ctx,
+                        max_steps_per_worker=self._max_steps_per_worker,
+                        max_worker_memory_mb=self._max_worker_memory_mb,
+                    )
+                )
+                if self._use_worker_pool
+                else None
+            )
             active_iters: Dict[str, Iterator[Optional[DagsterEvent]]] = {}
             errors: Dict[int, SerializableErrorInfo] = {}
             processes: Dict[str, BaseProcess] = {}
@@ -235,19 +272,42 @@ def execute(
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
-                            term_events[step.key] = multiproc_ctx.Event()
-                            active_iters[step.key] = execute_step_out_of_process(
-                                multiproc_ctx,
-                                job,
-                                step_context,
-                                step,
-                                errors,
-                                processes,
-                                term_events,
-                                self.retries,
-                                active_execution.get_known_state(),
-                                execution_plan.repository_load_data,
+                            step_plan_snapshot = (
+                                _get_step_execution_plan_snapshot(
+                                    job, execution_plan, step, plan_context.dagster_run
+                                )
+                                if self._send_execution_plan_snapshot
+                                else None
                             )
+                            if worker_pool:
+                                active_iters[step.key] = execute_step_in_worker_pool(
+                                    worker_pool,
+                                    job,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    processes,
+                                    term_events,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                    step_plan_snapshot,
+                                )
+                            else:
+                                term_events[step.key] = multiproc_ctx.Event()
+                                active_iters[step.key] = execute_step_out_of_process(
+                                    multiproc_ctx,
+                                    job,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    processes,
+                                    term_events,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                    step_plan_snapshot,
+                                )
 
                     # process active iterators
                     empty_iters = []
@@ -289,7 +349,9 @@ def execute(
                     # clear and mark complete finished iterators
                     for key in empty_iters:
                         del active_iters[key]
-                        del term_events[key]
+                        # steps executing in a worker pool share the termination event of
+                        # their worker, which is only known once the step has been dispatched
+                        term_events.pop(key, None)
                         active_execution.verify_complete(plan_context, key)
 
                     # process skipped and abandoned steps
@@ -355,6 +417,23 @@ def execute(
             )
 
 
+def _get_step_execution_plan_snapshot(
+    recon_job: ReconstructableJob,
+    execution_plan: ExecutionPlan,
+    step: ExecutionStep,
+    dagster_run: "DagsterRun",
+) -> Optional[ExecutionPlanSnapshot]:
+    # Send the child process a snapshot of just the parts of the plan that the step needs, so
+    # that it can rehydrate its plan rather than build the plan for the whole job again
+    if dagster_run.job_snapshot_id is None:
+        return None
+
+    return snapshot_from_execution_plan(
+        execution_plan.build_isolated_subset_plan([step.key], recon_job.get_definition()),
+        dagster_run.job_snapshot_id,
+    )
+
+
 def execute_step_out_of_process(
     multiproc_ctx: MultiprocessingBaseContext,
     recon_job: ReconstructableJob,
@@ -366,6 +445,7 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    execution_plan_snapshot: Optional[ExecutionPlanSnapshot] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
@@ -377,6 +457,7 @@ def execute_step_out_of_process(
         retry_mode=retries,
         known_state=known_state,
         repository_load_data=repository_load_data,
+        execution_plan_snapshot=execution_plan_snapshot,
     )
 
     yield DagsterEvent.step_worker_starting(
@@ -395,3 +476,56 @@ def execute_step_out_of_process(
             processes[step.key] = ret
         else:
             check.failed(f"Unexpected return value from child process {type(ret)}")
+
+
+def execute_step_in_worker_pool(
+    worker_pool: MultiprocessWorkerPool,
+    recon_job: ReconstructableJob,
+    step_context: IStepContext,
+    step: ExecutionStep,
+    errors: Dict[int, SerializableErrorInfo],
+    processes: Dict[str, BaseProcess],
+    term_events: Dict[str, Any],
+    retries: RetryMode,
+    known_state: KnownExecutionState,
+    repository_load_data: Optional[RepositoryLoadData],
+    execution_plan_snapshot: Optional[ExecutionPlanSnapshot] = None,
+) -> Iterator[Optional[DagsterEvent]]:
+    command = MultiprocessExecutorChildProcessCommand(
+        run_config=step_context.run_config,
+        dagster_run=step_context.dagster_run,
+        step_key=step.key,
+        instance_ref=step_context.instance.get_ref(),
+        # set by the worker process that the command is sent to
+        term_event=None,
+        recon_pipeline=recon_job,
+        retry_mode=retries,
+        known_state=known_state,
+        repository_load_data=repository_load_data,
+        execution_plan_snapshot=execution_plan_snapshot,
+    )
+
+    yield DagsterEvent.step_worker_starting(
+        step_context,
+        f'Sending "{step.key}" to a worker process.',
+        metadata={},
+    )
+
+    for ret in worker_pool.execute_command(command):
+        if ret is None or isinstance(ret, DagsterEvent):
+            yield ret
+        elif isinstance(ret, WorkerProcessRecycleEvent):
+            yield DagsterEvent.engine_event(
+                step_context,
+                f"Multiprocess executor: stopping worker process (pid: {ret.pid}) after"
+                f" {ret.reason}.",
+                EngineEventData.multiprocess(ret.pid),
+            )
+        elif isinstance(ret, ChildProcessEvent):
+            if isinstance(ret, ChildProcessSystemErrorEvent):
+                errors[ret.pid] = ret.error_info
+        elif isinstance(ret, WorkerProcess):
+            processes[step.key] = ret.process
+            term_events[step.key] = ret.term_event
+        else:
+            check.failed(f"Unexpected return value from worker process {type(ret)}")
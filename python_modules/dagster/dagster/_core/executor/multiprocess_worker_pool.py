@@ -0,0 +1,263 @@
+"""A pool of long-lived worker processes for the multiprocess executor.
+
+Each worker process executes many steps in sequence, so the cost of starting a process and
+importing user code is paid once per worker rather than once per step. Resources are still
+initialized and torn down for every step, since each step runs in its own call to
+``execute_plan_iterator``.
+"""
+
+import os
+import sys
+from multiprocessing import Queue
+from multiprocessing.context import BaseContext as MultiprocessingBaseContext
+from multiprocessing.process import BaseProcess
+from typing import TYPE_CHECKING, Any, Iterator, List, NamedTuple, Optional, Union
+
+import dagster._check as check
+from dagster._core.executor.child_process_executor import (
+    PROCESS_DEAD_AND_QUEUE_EMPTY,
+    ChildProcessCrashException,
+    ChildProcessDoneEvent,
+    ChildProcessEvent,
+    ChildProcessSystemErrorEvent,
+    _execute_command_in_child_process,
+    _poll_for_event,
+)
+from dagster._utils.interrupts import capture_interrupts
+
+if TYPE_CHECKING:
+    from dagster._core.events import DagsterEvent
+    from dagster._core.executor.multiprocess import MultiprocessExecutorChildProcessCommand
+
+
+class WorkerProcessReadyEvent(
+    NamedTuple("WorkerProcessReadyEvent", [("pid", int)]), ChildProcessEvent
+):
+    """Sent by a worker process after it has finished a step and can accept another one."""
+
+
+class WorkerProcessRecycleEvent(
+    NamedTuple("WorkerProcessRecycleEvent", [("pid", int), ("reason", str)]), ChildProcessEvent
+):
+    """Sent by a worker process after it has finished a step if it is about to exit."""
+
+
+def get_peak_memory_mb() -> Optional[float]:
+    """Returns the peak resident memory of the current process in megabytes, or None if it
+    cannot be determined on this platform.
+    """
+    try:
+        import resource
+    except ImportError:
+        # not available on Windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == "darwin":
+        return max_rss / (1024 * 1024)
+    return max_rss / 1024
+
+
+def _get_recycle_reason(
+    steps_executed: int,
+    max_steps_per_worker: Optional[int],
+    max_worker_memory_mb: Optional[int],
+) -> Optional[str]:
+    if max_steps_per_worker is not None and steps_executed >= max_steps_per_worker:
+        return f"executing {steps_executed} steps"
+
+    if max_worker_memory_mb is not None:
+        peak_memory_mb = get_peak_memory_mb()
+        if peak_memory_mb is not None and peak_memory_mb >= max_worker_memory_mb:
+            return f"reaching {peak_memory_mb:.0f} MB of peak memory usage"
+
+    return None
+
+
+def _execute_commands_in_worker_process(
+    command_queue: Queue,
+    event_queue: Queue,
+    term_event: Any,
+    max_steps_per_worker: Optional[int],
+    max_worker_memory_mb: Optional[int],
+) -> None:
+    """Target of each worker process. Executes commands from the command queue one at a time
+    until it receives None or reaches one of its recycling limits.
+    """
+    with capture_interrupts():
+        pid = os.getpid()
+        steps_executed = 0
+        while True:
+            command = command_queue.get()
+            if command is None:
+                return
+
+            # the termination event can only be shared with the worker process when it is
+            # started, so it is attached to each command as it is received. It is left set after
+            # the command finishes, and is only cleared by the pool before it sends the next command
+            command.term_event = term_event
+            _execute_command_in_child_process(event_queue, command)
+            steps_executed += 1
+
+            recycle_reason = _get_recycle_reason(
+                steps_executed, max_steps_per_worker, max_worker_memory_mb
+            )
+            if recycle_reason:
+                event_queue.put(WorkerProcessRecycleEvent(pid=pid, reason=recycle_reason))
+                return
+
+            event_queue.put(WorkerProcessReadyEvent(pid=pid))
+
+
+class WorkerProcess(
+    NamedTuple(
+        "_WorkerProcess",
+        [
+            ("process", BaseProcess),
+            ("command_queue", Queue),
+            ("event_queue", Queue),
+            ("term_event", Any),
+        ],
+    )
+):
+    """A long-lived worker process and the queues used to communicate with it."""
+
+
+class MultiprocessWorkerPool:
+    """A pool of worker processes that each execute many steps in sequence.
+
+    Worker processes are started on demand, so the pool never holds more workers than the
+    number of steps that have been executing concurrently. A worker is replaced after it has
+    executed ``max_steps_per_worker`` steps, once its peak memory usage reaches
+    ``max_worker_memory_mb``, or if a step fails with a system error.
+
+    Args:
+        multiprocessing_ctx: The multiprocessing context to start worker processes in.
+        max_steps_per_worker (Optional[int]): The number of steps after which a worker process is
+            replaced. By default, workers are reused until the pool is shut down.
+        max_worker_memory_mb (Optional[int]): The peak memory usage in megabytes after which a
+            worker process is replaced. Not supported on Windows.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_steps_per_worker: Optional[int] = None,
+        max_worker_memory_mb: Optional[int] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker"
+        )
+        self._max_worker_memory_mb = check.opt_int_param(
+            max_worker_memory_mb, "max_worker_memory_mb"
+        )
+        self._workers: List[WorkerProcess] = []
+        self._idle_workers: List[WorkerProcess] = []
+
+    def __enter__(self) -> "MultiprocessWorkerPool":
+        return self
+
+    def __exit__(self, _exception_type, _exception_value, _traceback) -> None:
+        self.shutdown()
+
+    @property
+    def num_workers(self) -> int:
+        return len(self._workers)
+
+    def _start_worker(self) -> WorkerProcess:
+        command_queue = self._multiprocessing_ctx.Queue()
+        event_queue = self._multiprocessing_ctx.Queue()
+        term_event = self._multiprocessing_ctx.Event()
+        process = self._multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_commands_in_worker_process,
+            args=(
+                command_queue,
+                event_queue,
+                term_event,
+                self._max_steps_per_worker,
+                self._max_worker_memory_mb,
+            ),
+        )
+        process.start()
+        worker = WorkerProcess(process, command_queue, event_queue, term_event)
+        self._workers.append(worker)
+        return worker
+
+    def _stop_worker(self, worker: WorkerProcess) -> None:
+        if worker in self._workers:
+            self._workers.remove(worker)
+
+        if worker.process.is_alive():
+            worker.command_queue.put(None)
+        worker.process.join()
+        worker.command_queue.close()
+        worker.event_queue.close()
+
+    def execute_command(
+        self, command: "MultiprocessExecutorChildProcessCommand"
+    ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, WorkerProcess]]]:
+        """Execute a command in an idle worker process, starting a new worker if none are idle.
+
+        Yields the same sequence of objects as ``execute_child_process_command``, except that the
+        ``WorkerProcess`` that the command was sent to is yielded in place of the process object.
+        A ``WorkerProcessRecycleEvent`` is also yielded if the worker exits after the command.
+        """
+        worker = self._idle_workers.pop() if self._idle_workers else self._start_worker()
+        # the termination event is set when each command finishes, and may also have been set to
+        # interrupt the previous command after it had already finished. It is cleared here, rather
+        # than in the worker, so that an interrupt is never dropped while its command is running.
+        worker.term_event.clear()
+        worker.command_queue.put(command)
+        yield worker
+
+        completed_properly = False
+        system_error = False
+        while not completed_properly:
+            event = _poll_for_event(worker.process, worker.event_queue)
+
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                break
+
+            yield event
+
+            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                completed_properly = True
+                system_error = isinstance(event, ChildProcessSystemErrorEvent)
+
+        if not completed_properly:
+            self._stop_worker(worker)
+            raise ChildProcessCrashException(
+                pid=worker.process.pid, exit_code=worker.process.exitcode
+            )
+
+        # the command is complete, wait for the worker to report whether it can be reused
+        while True:
+            event = _poll_for_event(worker.process, worker.event_queue)
+
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                self._stop_worker(worker)
+                return
+
+            if isinstance(event, WorkerProcessRecycleEvent):
+                yield event
+                self._stop_worker(worker)
+                return
+
+            if isinstance(event, WorkerProcessReadyEvent):
+                break
+
+            yield None
+
+        if system_error:
+            # the step failed outside of user code, so the worker may be in a bad state
+            self._stop_worker(worker)
+        else:
+            self._idle_workers.append(worker)
+
+    def shutdown(self) -> None:
+        """Stop all worker processes, waiting for any in-progress commands to finish."""
+        self._idle_workers = []
+        for worker in list(self._workers):
+            self._stop_worker(worker)
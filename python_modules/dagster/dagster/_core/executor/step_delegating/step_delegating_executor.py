@@ -2,13 +2,15 @@
 import math
 import os
 import sys
-import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, cast
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Set, cast
 
 import dagster._check as check
 from dagster._core.definitions.metadata import MetadataValue
 from dagster._core.event_api import EventLogCursor
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.context.system import PlanOrchestrationContext
 from dagster._core.execution.plan.active import ActiveExecution
 from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
@@ -18,6 +20,10 @@
 from dagster._core.executor.base import Executor
 from dagster._core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
 from dagster._core.instance import DagsterInstance
+from dagster._core.snap.execution_plan_snapshot import (
+    ExecutionPlanSnapshot,
+    snapshot_from_execution_plan,
+)
 from dagster._grpc.types import ExecuteStepArgs
 from dagster._time import get_current_datetime
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
@@ -30,6 +36,28 @@ def _default_sleep_seconds():
     return float(os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_SLEEP_SECONDS", "1.0"))
 
 
+def _default_watch_event_log():
+    return os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_WATCH_EVENT_LOG") == "1"
+
+
+class StepEventWaiter:
+    """Wakes the executor loop as soon as a step event is written to the event log for the run,
+    instead of waiting out the full sleep interval. The events themselves are still read from the
+    event log by the executor loop, so this only affects how quickly the loop notices them.
+    """
+
+    def __init__(self):
+        self._has_new_events = threading.Event()
+
+    def on_event(self, event: EventLogEntry, _cursor: str) -> None:
+        if event.step_key:
+            self._has_new_events.set()
+
+    def wait(self, timeout: float) -> None:
+        self._has_new_events.wait(timeout)
+        self._has_new_events.clear()
+
+
 class StepDelegatingExecutor(Executor):
     """This executor tails the event log for events from the steps that it spins up. It also
     sometimes creates its own events - when it does, that event is automatically written to the
@@ -46,6 +74,8 @@ def __init__(
         max_concurrent: Optional[int] = None,
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         should_verify_step: bool = False,
+        watch_event_log: Optional[bool] = None,
+        send_execution_plan_snapshot: bool = False,
     ):
         self._step_handler = step_handler
         self._retries = retries
@@ -69,6 +99,14 @@ def __init__(
             ),
         )
         self._should_verify_step = should_verify_step
+        self._watch_event_log = check.opt_bool_param(
+            watch_event_log, "watch_event_log", default=_default_watch_event_log()
+        )
+        # send each step worker a snapshot of the plan for its steps, so that it does not need to
+        # build the plan for the whole job again
+        self._send_execution_plan_snapshot = check.bool_param(
+            send_execution_plan_snapshot, "send_execution_plan_snapshot"
+        )
 
         self._event_cursor: Optional[str] = None
 
@@ -137,8 +175,54 @@ def _pop_events(
 
         return dagster_events
 
+    @contextmanager
+    def _step_event_waiter(
+        self, plan_context: PlanOrchestrationContext
+    ) -> Iterator[StepEventWaiter]:
+        waiter = StepEventWaiter()
+        if not self._watch_event_log:
+            yield waiter
+            return
+
+        try:
+            plan_context.instance.watch_event_logs(
+                plan_context.run_id, self._event_cursor, waiter.on_event
+            )
+        except Exception:
+            # fall back to polling the event log every `sleep_seconds`
+            DagsterEvent.engine_event(
+                plan_context,
+                "Unable to watch the event log for step events, falling back to polling every"
+                f" {self._sleep_seconds} seconds.",
+                EngineEventData(error=serializable_error_info_from_exc_info(sys.exc_info())),
+            )
+            yield waiter
+            return
+
+        try:
+            yield waiter
+        finally:
+            plan_context.instance.end_watch_event_logs(plan_context.run_id, waiter.on_event)
+
+    def _get_execution_plan_snapshot(
+        self,
+        plan_context: PlanOrchestrationContext,
+        execution_plan: ExecutionPlan,
+        steps: Sequence["ExecutionStep"],
+    ) -> Optional[ExecutionPlanSnapshot]:
+        job_snapshot_id = plan_context.dagster_run.job_snapshot_id
+        if not self._send_execution_plan_snapshot or job_snapshot_id is None:
+            return None
+
+        return snapshot_from_execution_plan(
+            execution_plan.build_isolated_subset_plan(
+                [step.key for step in steps], plan_context.reconstructable_job.get_definition()
+            ),
+            job_snapshot_id,
+        )
+
     def _get_step_handler_context(
-        self, plan_context, steps, active_execution
+        self, plan_context, steps, active_execution, execution_plan=None
     ) -> StepHandlerContext:
         return StepHandlerContext(
             instance=plan_context.plan_data.instance,
@@ -153,10 +237,65 @@ def _get_step_handler_context(
                 known_state=active_execution.get_known_state(),
                 should_verify_step=self._should_verify_step,
                 print_serialized_events=False,
+                # only needed when launching steps
+                execution_plan_snapshot=(
+                    self._get_execution_plan_snapshot(plan_context, execution_plan, steps)
+                    if execution_plan is not None
+                    else None
+                ),
             ),
             dagster_run=plan_context.dagster_run,
         )
 
+    def _check_steps_health(
+        self,
+        plan_context: PlanOrchestrationContext,
+        active_execution: ActiveExecution,
+        steps: Sequence["ExecutionStep"],
+    ) -> None:
+        step_handler_contexts = [
+            self._get_step_handler_context(plan_context, [step], active_execution) for step in steps
+        ]
+        try:
+            health_check_results = self._step_handler.check_steps_health(step_handler_contexts)
+        except Exception:
+            # check each step individually, so that the error can be attributed to the step that
+            # raised it
+            health_check_results = None
+
+        for i, step in enumerate(steps):
+            step_context = plan_context.for_step(step)
+
+            try:
+                health_check_result = (
+                    health_check_results[i]
+                    if health_check_results is not None
+                    else self._step_handler.check_step_health(step_handler_contexts[i])
+                )
+                if not health_check_result.is_healthy:
+                    health_check_error = SerializableErrorInfo(
+                        message=f"Step {step.key} failed health check: {health_check_result.unhealthy_reason}",
+                        stack=[],
+                        cls_name=None,
+                    )
+
+                    self.get_failure_or_retry_event_after_crash(
+                        step_context,
+                        health_check_error,
+                        active_execution.get_known_state(),
+                    )
+
+            except Exception:
+                serializable_error = serializable_error_info_from_exc_info(sys.exc_info())
+                # Log a step failure event if there was an error during the health check
+                DagsterEvent.step_failure_event(
+                    step_context=step_context,
+                    step_failure_data=StepFailureData(
+                        error=serializable_error,
+                        user_failure_data=None,
+                    ),
+                )
+
     def execute(self, plan_context: PlanOrchestrationContext, execution_plan: ExecutionPlan):
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
@@ -169,7 +308,9 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
         )
         with InstanceConcurrencyContext(
             plan_context.instance, plan_context.dagster_run
-        ) as instance_concurrency_context:
+        ) as instance_concurrency_context, self._step_event_waiter(
+            plan_context
+        ) as step_event_waiter:
             with ActiveExecution(
                 execution_plan,
                 retry_mode=self.retries,
@@ -262,14 +403,16 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                                     "Executor received termination signal, forwarding to steps",
                                     EngineEventData.interrupted(list(running_steps.keys())),
                                 )
-                                for step in running_steps.values():
-                                    list(
-                                        self._step_handler.terminate_step(
+                                list(
+                                    self._step_handler.terminate_steps(
+                                        [
                                             self._get_step_handler_context(
                                                 plan_context, [step], active_execution
                                             )
-                                        )
+                                            for step in running_steps.values()
+                                        ]
                                     )
+                                )
                             else:
                                 DagsterEvent.engine_event(
                                     plan_context,
@@ -325,41 +468,9 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                             curr_time - last_check_step_health_time
                         ).total_seconds() >= self._check_step_health_interval_seconds:
                             last_check_step_health_time = curr_time
-                            for step in running_steps.values():
-                                step_context = plan_context.for_step(step)
-
-                                try:
-                                    health_check_result = self._step_handler.check_step_health(
-                                        self._get_step_handler_context(
-                                            plan_context, [step], active_execution
-                                        )
-                                    )
-                                    if not health_check_result.is_healthy:
-                                        health_check_error = SerializableErrorInfo(
-                                            message=f"Step {step.key} failed health check: {health_check_result.unhealthy_reason}",
-                                            stack=[],
-                                            cls_name=None,
-                                        )
-
-                                        self.get_failure_or_retry_event_after_crash(
-                                            step_context,
-                                            health_check_error,
-                                            active_execution.get_known_state(),
-                                        )
-
-                                except Exception:
-                                    serializable_error = serializable_error_info_from_exc_info(
-                                        sys.exc_info()
-                                    )
-                                    # Log a step failure event if there was an error during the health
-                                    # check
-                                    DagsterEvent.step_failure_event(
-                                        step_context=plan_context.for_step(step),
-                                        step_failure_data=StepFailureData(
-                                            error=serializable_error,
-                                            user_failure_data=None,
-                                        ),
-                                    )
+                            self._check_steps_health(
+                                plan_context, active_execution, list(running_steps.values())
+                            )
 
                         if self._max_concurrent is not None:
                             max_steps_to_run = self._max_concurrent - len(running_steps)
@@ -372,17 +483,23 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         # process events from concurrency blocked steps
                         list(active_execution.concurrency_event_iterator(plan_context))
 
-                        for step in active_execution.get_steps_to_execute(max_steps_to_run):
+                        steps_to_execute = active_execution.get_steps_to_execute(max_steps_to_run)
+                        for step in steps_to_execute:
                             running_steps[step.key] = step
+                        if steps_to_execute:
                             list(
-                                self._step_handler.launch_step(
-                                    self._get_step_handler_context(
-                                        plan_context, [step], active_execution
-                                    )
+                                self._step_handler.launch_steps(
+                                    [
+                                        self._get_step_handler_context(
+                                            plan_context, [step], active_execution, execution_plan
+                                        )
+                                        for step in steps_to_execute
+                                    ]
                                 )
                             )
 
-                        time.sleep(self._sleep_seconds)
+                        # when watching the event log, wakes as soon as a step event is written
+                        step_event_waiter.wait(self._sleep_seconds)
                 except Exception:
                     if not active_execution.is_complete and running_steps:
                         serializable_error = serializable_error_info_from_exc_info(sys.exc_info())
@@ -398,12 +515,14 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                                 error=serializable_error,
                             ),
                         )
-                        for step in running_steps.values():
-                            list(
-                                self._step_handler.terminate_step(
+                        list(
+                            self._step_handler.terminate_steps(
+                                [
                                     self._get_step_handler_context(
                                         plan_context, [step], active_execution
                                     )
-                                )
+                                    for step in running_steps.values()
+                                ]
                             )
+                        )
                     raise
@@ -93,3 +93,33 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckSt
     @abstractmethod
     def terminate_step(self, step_handler_context: StepHandlerContext) -> Iterator[DagsterEvent]:
         pass
+
+    def launch_steps(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> Iterator[DagsterEvent]:
+        """Launches many steps at once, with one step handler context per step. Step handlers that
+        can launch steps more efficiently in bulk may override this.
+        """
+        for step_handler_context in step_handler_contexts:
+            yield from self.launch_step(step_handler_context)
+
+    def check_steps_health(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> Sequence[CheckStepHealthResult]:
+        """Checks the health of many steps at once, with one step handler context per step. Returns
+        the result for each step, in the same order as the given contexts. Step handlers that can
+        check many steps with fewer calls to the underlying compute platform may override this.
+        """
+        return [
+            self.check_step_health(step_handler_context)
+            for step_handler_context in step_handler_contexts
+        ]
+
+    def terminate_steps(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> Iterator[DagsterEvent]:
+        """Terminates many steps at once, with one step handler context per step. Step handlers
+        that can terminate steps more efficiently in bulk may override this.
+        """
+        for step_handler_context in step_handler_contexts:
+            yield from self.terminate_step(step_handler_context)
@@ -2,6 +2,7 @@
 import logging.config
 import os
 import sys
+import threading
 import warnings
 import weakref
 from abc import abstractmethod
@@ -130,6 +131,7 @@
     from dagster._core.execution.plan.plan import ExecutionPlan
     from dagster._core.execution.plan.resume_retry import ReexecutionStrategy
     from dagster._core.execution.stats import RunStepKeyStatsSnapshot
+    from dagster._core.instance.event_write_buffer import EventWriteBuffer
     from dagster._core.launcher import RunLauncher
     from dagster._core.remote_representation import (
         CodeLocation,
@@ -176,6 +178,7 @@
     )
     from dagster._core.storage.root import LocalArtifactStorage
     from dagster._core.storage.runs import RunStorage
+    from dagster._core.storage.runs.base import QueuedRunsResult
     from dagster._core.storage.schedules import ScheduleStorage
     from dagster._core.storage.sql import AlembicVersion
     from dagster._core.workspace.context import BaseWorkspaceRequestContext
@@ -200,6 +203,20 @@ def _is_batch_writing_enabled() -> bool:
     return _get_event_batch_size() > 0
 
 
+# Sets the maximum number of events held in the instance's write-behind buffer before they are
+# written to the event log in a single batch. Defaults to 0, which turns off write-behind buffering
+# and writes every event as soon as it is handled. Events that the engine or daemons depend on
+# (step and run lifecycle events, asset materializations, ...) are never deferred: they flush the
+# buffer and are written before `handle_new_event` returns.
+def _get_event_write_buffer_size() -> int:
+    return int(os.getenv("DAGSTER_EVENT_WRITE_BUFFER_SIZE", "0"))
+
+
+# Sets the maximum number of seconds a bufferable event may wait in the write-behind buffer.
+def _get_event_write_buffer_flush_interval() -> float:
+    return float(os.getenv("DAGSTER_EVENT_WRITE_BUFFER_FLUSH_INTERVAL_SECONDS", "1.0"))
+
+
 def _check_run_equality(
     pipeline_run: DagsterRun, candidate_run: DagsterRun
 ) -> Mapping[str, Tuple[Any, Any]]:
@@ -422,6 +439,9 @@ def __init__(
         self._local_artifact_storage = check.inst_param(
             local_artifact_storage, "local_artifact_storage", LocalArtifactStorage
         )
+        # Used for write-behind event handling, created on first use
+        self._event_write_buffer: Optional["EventWriteBuffer"] = None
+        self._event_write_buffer_lock = threading.Lock()
         self._event_storage = check.inst_param(event_storage, "event_storage", EventLogStorage)
         self._event_storage.register_instance(self)
 
@@ -958,6 +978,20 @@ def auto_materialize_max_tick_retries(self) -> int:
     def auto_materialize_use_sensors(self) -> int:
         return self.get_settings("auto_materialize").get("use_sensors", True)
 
+    @property
+    def auto_materialize_evaluation_num_workers(self) -> Optional[int]:
+        return self.get_settings("auto_materialize").get("evaluation_num_workers")
+
+    @property
+    def auto_materialize_incremental_evaluation(self) -> bool:
+        return self.get_settings("auto_materialize").get("incremental_evaluation", False)
+
+    @property
+    def auto_materialize_incremental_evaluation_max_skip_seconds(self) -> int:
+        return self.get_settings("auto_materialize").get(
+            "incremental_evaluation_max_skip_seconds", 3600
+        )
+
     @property
     def global_op_concurrency_default_limit(self) -> Optional[int]:
         return self.get_settings("concurrency").get("default_op_concurrency_limit")
@@ -1015,6 +1049,9 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        if self._event_write_buffer:
+            self._event_write_buffer.dispose()
+            self._event_write_buffer = None
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         if self._run_coordinator:
@@ -1101,12 +1138,14 @@ def get_execution_plan_snapshot(self, snapshot_id: str) -> "ExecutionPlanSnapsho
 
     @traced
     def get_run_stats(self, run_id: str) -> DagsterRunStatsSnapshot:
+        self.flush_buffered_events()
         return self._event_storage.get_stats_for_run(run_id)
 
     @traced
     def get_run_step_stats(
         self, run_id: str, step_keys: Optional[Sequence[str]] = None
     ) -> Sequence["RunStepKeyStatsSnapshot"]:
+        self.flush_buffered_events()
         return self._event_storage.get_step_stats_for_run(run_id, step_keys)
 
     @traced
@@ -1310,7 +1349,9 @@ def _ensure_persisted_job_snapshot(
 
         job_snapshot_id = create_job_snapshot_id(job_snapshot)
         if not self._run_storage.has_job_snapshot(job_snapshot_id):
-            returned_job_snapshot_id = self._run_storage.add_job_snapshot(job_snapshot)
+            returned_job_snapshot_id = self._run_storage.add_job_snapshot(
+                job_snapshot, job_snapshot_id
+            )
             check.invariant(job_snapshot_id == returned_job_snapshot_id)
 
         return job_snapshot_id
@@ -1341,7 +1382,7 @@ def _ensure_persisted_execution_plan_snapshot(
 
         if not self._run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id):
             returned_execution_plan_snapshot_id = self._run_storage.add_execution_plan_snapshot(
-                execution_plan_snapshot
+                execution_plan_snapshot, execution_plan_snapshot_id
             )
 
             check.invariant(execution_plan_snapshot_id == returned_execution_plan_snapshot_id)
@@ -1820,6 +1861,20 @@ def get_run_ids(
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         return self._run_storage.get_runs_count(filters)
 
+    @property
+    def supports_queued_run_index(self) -> bool:
+        return self._run_storage.supports_queued_run_index
+
+    @traced
+    def get_queued_runs(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> "QueuedRunsResult":
+        return self._run_storage.get_queued_runs(cursor=cursor, limit=limit)
+
+    @traced
+    def reconcile_queued_runs(self) -> Sequence[str]:
+        return self._run_storage.reconcile_queued_runs()
+
     @public
     @traced
     def get_run_records(
@@ -1876,6 +1931,7 @@ def logs_after(
         of_type: Optional["DagsterEventType"] = None,
         limit: Optional[int] = None,
     ) -> Sequence["EventLogEntry"]:
+        self.flush_buffered_events()
         return self._event_storage.get_logs_for_run(
             run_id,
             cursor=cursor,
@@ -1889,6 +1945,7 @@ def all_logs(
         run_id: str,
         of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
     ) -> Sequence["EventLogEntry"]:
+        self.flush_buffered_events()
         return self._event_storage.get_logs_for_run(run_id, of_type=of_type)
 
     @traced
@@ -1900,6 +1957,7 @@ def get_records_for_run(
         limit: Optional[int] = None,
         ascending: bool = True,
     ) -> "EventLogConnection":
+        self.flush_buffered_events()
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit, ascending)
 
     def watch_event_logs(self, run_id: str, cursor: Optional[str], cb: "EventHandlerFn") -> None:
@@ -2019,6 +2077,7 @@ def get_event_records(
                 "returned when the event records filter contains the asset_partitions argument"
             )
 
+        self.flush_buffered_events()
         return self._event_storage.get_event_records(event_records_filter, limit, ascending)
 
     @public
@@ -2401,11 +2460,21 @@ def handle_new_event(
         to the storage layer in a single batch. If an error occurrs during batch writing, then we
         fall back to iterative individual event writes.
 
+        If write-behind buffering is enabled (`DAGSTER_EVENT_WRITE_BUFFER_SIZE` > 0), all other
+        events go through a write-behind buffer that is flushed by size, by time, and whenever an
+        event that the engine depends on (e.g. a step success or an asset materialization) is
+        handled. Such events, and everything buffered before them, are stored before this method
+        returns.
+
         Args:
             event (EventLogEntry): The event to handle.
             batch_metadata (Optional[DagsterEventBatchMetadata]): Metadata for batch writing.
         """
         if batch_metadata is None or not _is_batch_writing_enabled():
+            event_write_buffer = self._get_event_write_buffer()
+            if event_write_buffer:
+                event_write_buffer.add(event)
+                return
             events = [event]
         else:
             batch_id, is_batch_end = batch_metadata.id, batch_metadata.is_end
@@ -2415,7 +2484,48 @@ def handle_new_event(
                 del self._event_buffer[batch_id]
             else:
                 return
+            # keep explicitly batched events ordered after anything already buffered
+            self.flush_buffered_events()
+
+        self._store_and_notify_events(events)
+
+    def _get_event_write_buffer(self) -> Optional["EventWriteBuffer"]:
+        from dagster._core.instance.event_write_buffer import EventWriteBuffer
 
+        max_size = _get_event_write_buffer_size()
+        if max_size <= 0:
+            # buffering was turned off since the buffer was created
+            self.flush_buffered_events()
+            return None
+
+        event_write_buffer = self._event_write_buffer
+        if event_write_buffer is not None and event_write_buffer.max_size == max_size:
+            return event_write_buffer
+
+        # events can be handled from several threads at once, make sure they all end up in the
+        # same buffer
+        with self._event_write_buffer_lock:
+            if self._event_write_buffer is None or self._event_write_buffer.max_size != max_size:
+                if self._event_write_buffer:
+                    self._event_write_buffer.dispose()
+                self._event_write_buffer = EventWriteBuffer(
+                    self._store_events,
+                    self._notify_event_subscribers,
+                    max_size=max_size,
+                    flush_interval_seconds=_get_event_write_buffer_flush_interval(),
+                )
+            return self._event_write_buffer
+
+    def flush_buffered_events(self) -> None:
+        """Write any events held in the write-behind buffer to the event log storage."""
+        if self._event_write_buffer:
+            self._event_write_buffer.flush()
+
+    def _store_and_notify_events(self, events: Sequence["EventLogEntry"]) -> None:
+        self._store_events(events)
+        self._notify_event_subscribers(events)
+
+    def _store_events(self, events: Sequence["EventLogEntry"]) -> None:
         if len(events) == 1:
             self._event_storage.store_event(events[0])
         else:
@@ -2443,7 +2553,9 @@ def handle_new_event(
             ):
                 self._run_storage.handle_run_event(run_id, event.get_dagster_event())
 
-            for sub in self._subscribers[run_id]:
+    def _notify_event_subscribers(self, events: Sequence["EventLogEntry"]) -> None:
+        for event in events:
+            for sub in self._subscribers[event.run_id]:
                 sub(event)
 
     def add_event_listener(self, run_id: str, cb) -> None:
@@ -287,6 +287,24 @@ def sensors_daemon_config() -> Field:
                     " tick."
                 ),
             ),
+            "use_asyncio": Field(
+                Bool,
+                is_required=False,
+                default_value=False,
+                description=(
+                    "Whether to evaluate sensors on an asyncio event loop, rather than blocking a"
+                    " thread on each evaluation. Allows many more sensor evaluations to be in"
+                    " flight at once."
+                ),
+            ),
+            "max_concurrent_evaluations_per_code_location": Field(
+                int,
+                is_required=False,
+                description=(
+                    "When use_asyncio is set, the maximum number of sensor evaluations that may be"
+                    " in flight against a single code location at once."
+                ),
+            ),
         },
         is_required=False,
     )
@@ -414,6 +432,56 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                         "How many threads to use to process ticks from multiple automation policy sensors in parallel"
                     ),
                 ),
+                "num_shards": Field(
+                    IntSource,
+                    is_required=False,
+                    description=(
+                        "How many asset daemon processes split the automation condition sensors"
+                        " between them. Each process must be configured with a distinct shard_index"
+                    ),
+                ),
+                "shard_index": Field(
+                    IntSource,
+                    is_required=False,
+                    description=(
+                        "Which shard of the automation condition sensors this asset daemon process"
+                        " evaluates, from 0 to num_shards - 1. Typically set from an environment"
+                        " variable"
+                    ),
+                ),
+                "sensor_lease_seconds": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "When num_shards is set, how long an asset daemon process retains ownership"
+                        " of a sensor after its most recent tick"
+                    ),
+                ),
+                "evaluation_num_workers": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many threads to use to evaluate the conditions of independent assets"
+                        " within a single tick in parallel"
+                    ),
+                ),
+                "incremental_evaluation": Field(
+                    Bool,
+                    is_required=False,
+                    default_value=False,
+                    description=(
+                        "Only re-evaluate the conditions of assets whose inputs may have changed since"
+                        " their previous evaluation, reusing the previous results for all other assets"
+                    ),
+                ),
+                "incremental_evaluation_max_skip_seconds": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "When incremental_evaluation is enabled, the maximum number of seconds that the"
+                        " condition of an asset may go without being re-evaluated"
+                    ),
+                ),
             }
         ),
         "concurrency": Field(
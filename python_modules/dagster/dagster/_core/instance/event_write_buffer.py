@@ -0,0 +1,162 @@
+import sys
+import threading
+import time
+from typing import Callable, List, Optional, Sequence
+
+from dagster._core.events import DagsterEventType
+from dagster._core.events.log import EventLogEntry
+
+# Event types whose writes can be deferred. Nothing in the engine, the run coordinator or the
+# daemons makes decisions based on these events while a run is in flight, so they may reach the
+# event log storage slightly after they were emitted. Every other dagster event (step and run
+# lifecycle events, asset materializations, observations, check evaluations, failures, ...) acts as
+# a barrier: it flushes everything buffered ahead of it and is written synchronously. Plain user
+# log messages (non-dagster events) are always bufferable.
+BUFFERABLE_DAGSTER_EVENT_TYPES = frozenset(
+    {
+        DagsterEventType.STEP_INPUT,
+        DagsterEventType.STEP_OUTPUT,
+        DagsterEventType.STEP_EXPECTATION_RESULT,
+        DagsterEventType.STEP_WORKER_STARTING,
+        DagsterEventType.STEP_WORKER_STARTED,
+        DagsterEventType.RESOURCE_INIT_STARTED,
+        DagsterEventType.RESOURCE_INIT_SUCCESS,
+        DagsterEventType.OBJECT_STORE_OPERATION,
+        DagsterEventType.ASSET_STORE_OPERATION,
+        DagsterEventType.LOADED_INPUT,
+        DagsterEventType.HANDLED_OUTPUT,
+        DagsterEventType.ENGINE_EVENT,
+        DagsterEventType.HOOK_COMPLETED,
+        DagsterEventType.HOOK_SKIPPED,
+        DagsterEventType.LOGS_CAPTURED,
+    }
+)
+
+
+def is_bufferable_event(event: EventLogEntry) -> bool:
+    if not event.is_dagster_event:
+        return True
+    return event.get_dagster_event().event_type in BUFFERABLE_DAGSTER_EVENT_TYPES
+
+
+class EventWriteBuffer:
+    """Write-behind buffer for the events handled by a DagsterInstance.
+
+    Bufferable events are held in memory and handed to `write_events` in the order they were
+    received, in a single call, once any of the following happens:
+
+    * the buffer holds `max_size` events
+    * the oldest buffered event has been waiting for `flush_interval_seconds` (checked by a
+      background thread)
+    * a non-bufferable event is added, in which case it is written together with the buffered
+      events before `add` returns
+    * `flush` or `dispose` is called
+
+    Written events are handed to `notify_events` on the thread that called `add`, `flush` or
+    `dispose`, never on the background thread. Events written by the background thread are
+    delivered by the next of those calls, ahead of any newer events.
+
+    A single lock serializes all writes and notifications, so the events of a run always reach
+    storage (and subscribers) in the order they were emitted. Events stay in the buffer until they
+    have been written: a write that fails on the background thread is retried, and a write that
+    fails in `add`, `flush` or `dispose` raises to the caller.
+    """
+
+    def __init__(
+        self,
+        write_events: Callable[[Sequence[EventLogEntry]], None],
+        notify_events: Callable[[Sequence[EventLogEntry]], None],
+        max_size: int,
+        flush_interval_seconds: float,
+    ):
+        self._write_events = write_events
+        self._notify_events = notify_events
+        self._max_size = max_size
+        self._flush_interval_seconds = flush_interval_seconds
+
+        self._lock = threading.RLock()
+        self._events: List[EventLogEntry] = []
+        self._oldest_event_time: Optional[float] = None
+        # events written by the background thread whose subscribers have not been notified yet
+        self._unnotified_events: List[EventLogEntry] = []
+
+        self._shutdown_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def add(self, event: EventLogEntry) -> None:
+        with self._lock:
+            self._events.append(event)
+            if not is_bufferable_event(event) or len(self._events) >= self._max_size:
+                self._flush()
+                return
+
+            if self._oldest_event_time is None:
+                self._oldest_event_time = time.monotonic()
+            self._ensure_flush_thread()
+            self._notify_unnotified()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def dispose(self) -> None:
+        self._shutdown_event.set()
+        if self._flush_thread:
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.flush()
+
+    def _flush(self) -> None:
+        self._write()
+        self._notify_unnotified()
+
+    def _write(self) -> None:
+        if not self._events:
+            return
+        # the lock is held, so nothing can be added while the write is in progress. The events
+        # are only dropped from the buffer once they were written: if the write fails they are
+        # retried by the next flush, and the error surfaces from the next `add` or `flush` that
+        # fails to write them
+        events = list(self._events)
+        self._write_events(events)
+        self._events = []
+        self._oldest_event_time = None
+        self._unnotified_events.extend(events)
+
+    def _notify_unnotified(self) -> None:
+        if not self._unnotified_events:
+            return
+        events = self._unnotified_events
+        self._unnotified_events = []
+        self._notify_events(events)
+
+    def _ensure_flush_thread(self) -> None:
+        if self._flush_thread is not None or self._shutdown_event.is_set():
+            return
+        self._flush_thread = threading.Thread(
+            target=self._run_flush_thread,
+            name="dagster-event-write-buffer",
+            daemon=True,
+        )
+        self._flush_thread.start()
+
+    def _run_flush_thread(self) -> None:
+        # wake up often enough that no event waits much longer than the flush interval
+        while not self._shutdown_event.wait(self._flush_interval_seconds / 2):
+            with self._lock:
+                if (
+                    self._oldest_event_time is None
+                    or time.monotonic() - self._oldest_event_time < self._flush_interval_seconds
+                ):
+                    continue
+                try:
+                    # only write here: subscribers are notified on the caller's thread
+                    self._write()
+                except Exception as e:
+                    # there is no caller to raise to on this thread. The events stay buffered, so
+                    # report and retry on the next interval, or on the next `add` or `flush`
+                    sys.stderr.write(f"Exception while flushing buffered events, will retry: {e}\n")
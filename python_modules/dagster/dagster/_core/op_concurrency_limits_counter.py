@@ -76,12 +76,18 @@ def _fetch_concurrency_info(self, instance: DagsterInstance, queued_runs: Sequen
                 all_concurrency_keys.update(run.run_op_concurrency.root_key_counts.keys())
 
         for key in all_concurrency_keys:
-            if key is None:
+            if key is None or key in self._concurrency_info_by_key:
                 continue
             self._concurrency_info_by_key[key] = instance.event_log_storage.get_concurrency_info(
                 key
             )
 
+    def add_queued_runs(self, instance: DagsterInstance, runs: Sequence[DagsterRun]):
+        """Fetches the concurrency info for any concurrency keys of the given runs that have not yet
+        been fetched, so that runs can be checked page by page as they are read from the queue.
+        """
+        self._fetch_concurrency_info(instance, runs)
+
     def _should_allocate_slots_for_root_concurrency_keys(self, record: RunRecord):
         status = record.dagster_run.status
         if status == DagsterRunStatus.STARTING:
@@ -1,3 +1,5 @@
+import asyncio
+import functools
 import sys
 import threading
 from abc import abstractmethod
@@ -305,6 +307,35 @@ def get_sensor_execution_data(
     ) -> "SensorExecutionData":
         pass
 
+    async def gen_sensor_execution_data(
+        self,
+        instance: DagsterInstance,
+        repository_handle: RepositoryHandle,
+        name: str,
+        last_tick_completion_time: Optional[float],
+        last_run_key: Optional[str],
+        cursor: Optional[str],
+        log_key: Optional[Sequence[str]],
+        last_sensor_start_time: Optional[float],
+    ) -> "SensorExecutionData":
+        """Async variant of get_sensor_execution_data. By default, the evaluation is performed
+        synchronously on the event loop's default executor so that it does not block the loop.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                self.get_sensor_execution_data,
+                instance,
+                repository_handle,
+                name,
+                last_tick_completion_time,
+                last_run_key,
+                cursor,
+                log_key,
+                last_sensor_start_time,
+            ),
+        )
+
     @abstractmethod
     def get_notebook_data(self, notebook_path: str) -> bytes:
         pass
@@ -973,6 +1004,31 @@ def get_sensor_execution_data(
             last_sensor_start_time,
         )
 
+    async def gen_sensor_execution_data(
+        self,
+        instance: DagsterInstance,
+        repository_handle: RepositoryHandle,
+        name: str,
+        last_tick_completion_time: Optional[float],
+        last_run_key: Optional[str],
+        cursor: Optional[str],
+        log_key: Optional[Sequence[str]],
+        last_sensor_start_time: Optional[float],
+    ) -> "SensorExecutionData":
+        from dagster._api.snapshot_sensor import gen_external_sensor_execution_data_grpc
+
+        return await gen_external_sensor_execution_data_grpc(
+            self.client,
+            instance,
+            repository_handle,
+            name,
+            last_tick_completion_time,
+            last_run_key,
+            cursor,
+            log_key,
+            last_sensor_start_time,
+        )
+
     def get_partition_set_execution_params(
         self,
         repository_handle: RepositoryHandle,
@@ -1,6 +1,8 @@
+import itertools
 import re
 import sys
 from collections import defaultdict, deque
+from functools import cached_property
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
@@ -244,6 +246,270 @@ def has_upstream_within_selection(node: T_Hashable) -> bool:
     return {node for node in within_selection if not has_upstream_within_selection(node)}
 
 
+# maps the characters of a binary string to bytes that are falsey for "0" and truthy for "1"
+_BITS_TO_BYTES = bytes.maketrans(b"01", b"\x00\x01")
+
+
+class ReachabilityIndex(Generic[T_Hashable]):
+    """Precomputed reachability information for a DependencyGraph, for graphs that are traversed
+    repeatedly (e.g. the asset graph, which is queried throughout selection resolution and the
+    evaluation of automation conditions).
+
+    Each item is assigned a position, and the ancestors and descendants of each item are stored as
+    bitsets (ints) over those positions, so that "is X upstream of Y" is a single bit test and the
+    closure of a set of items is a union of bitsets. Each part of the index is built the first time
+    it is needed. Self-dependencies are ignored. Items in a dependency cycle are ancestors and
+    descendants of each other, including of themselves.
+    """
+
+    def __init__(self, graph: DependencyGraph[T_Hashable]):
+        upstream = graph["upstream"]
+        items: Dict[T_Hashable, None] = dict.fromkeys(upstream)
+        for parents in upstream.values():
+            items.update(dict.fromkeys(parents))
+        for item, children in graph["downstream"].items():
+            items[item] = None
+            items.update(dict.fromkeys(children))
+
+        self._items: List[T_Hashable] = list(items)
+        self._positions: Dict[T_Hashable, int] = {item: i for i, item in enumerate(self._items)}
+
+        parent_sets: List[Set[int]] = [set() for _ in self._items]
+        for item, parents in upstream.items():
+            parent_sets[self._positions[item]].update(self._positions[parent] for parent in parents)
+        for item, children in graph["downstream"].items():
+            position = self._positions[item]
+            for child in children:
+                parent_sets[self._positions[child]].add(position)
+
+        self._parents: List[Sequence[int]] = []
+        self._children: List[List[int]] = [[] for _ in self._items]
+        for position, parents in enumerate(parent_sets):
+            parents.discard(position)
+            self._parents.append(sorted(parents))
+            for parent in parents:
+                self._children[parent].append(position)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: T_Hashable) -> bool:
+        return item in self._positions
+
+    @cached_property
+    def _components_in_topological_order(self) -> Sequence[Sequence[int]]:
+        """The strongly connected components of the graph (i.e. single items, unless there are
+        cycles), ordered so that every component comes after all of its ancestors.
+        """
+        # iterative version of Tarjan's algorithm, following edges from children to parents, so
+        # that each component is emitted after all of the components upstream of it
+        parents = self._parents
+        index_by_position: Dict[int, int] = {}
+        lowlink: Dict[int, int] = {}
+        on_stack: Set[int] = set()
+        stack: List[int] = []
+        components: List[Sequence[int]] = []
+
+        for root in range(len(self._items)):
+            if root in index_by_position:
+                continue
+            work = [(root, 0)]
+            while work:
+                position, parent_index = work[-1]
+                if parent_index == 0:
+                    index_by_position[position] = lowlink[position] = len(index_by_position)
+                    stack.append(position)
+                    on_stack.add(position)
+                if parent_index < len(parents[position]):
+                    work[-1] = (position, parent_index + 1)
+                    parent = parents[position][parent_index]
+                    if parent not in index_by_position:
+                        work.append((parent, 0))
+                    elif parent in on_stack:
+                        lowlink[position] = min(lowlink[position], index_by_position[parent])
+                    continue
+
+                work.pop()
+                if work:
+                    child = work[-1][0]
+                    lowlink[child] = min(lowlink[child], lowlink[position])
+                if lowlink[position] == index_by_position[position]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == position:
+                            break
+                    components.append(component)
+
+        return components
+
+    def _get_closures(self, components: Sequence[Sequence[int]], edges: Sequence[Sequence[int]]):
+        # components are ordered such that the items along `edges` have already been visited
+        closures = [0] * len(self._items)
+        for component in components:
+            component_bits = 0
+            for position in component:
+                component_bits |= 1 << position
+            closure = 0
+            for position in component:
+                for neighbor in edges[position]:
+                    closure |= closures[neighbor] | (1 << neighbor)
+            if len(component) > 1:
+                closure |= component_bits
+            for position in component:
+                closures[position] = closure
+        return closures
+
+    @cached_property
+    def _ancestor_bits(self) -> Sequence[int]:
+        return self._get_closures(self._components_in_topological_order, self._parents)
+
+    @cached_property
+    def _descendant_bits(self) -> Sequence[int]:
+        return self._get_closures(
+            list(reversed(self._components_in_topological_order)), self._children
+        )
+
+    @cached_property
+    def _levels(self) -> Sequence[int]:
+        levels = [0] * len(self._items)
+        for component in self._components_in_topological_order:
+            members = set(component)
+            level = max(
+                (
+                    levels[parent] + 1
+                    for position in component
+                    for parent in self._parents[position]
+                    if parent not in members
+                ),
+                default=0,
+            )
+            for position in component:
+                levels[position] = level
+        return levels
+
+    @cached_property
+    def _connected_component_ids(self) -> Sequence[int]:
+        component_ids = [-1] * len(self._items)
+        for root in range(len(self._items)):
+            if component_ids[root] != -1:
+                continue
+            component_ids[root] = root
+            queue = deque([root])
+            while queue:
+                position = queue.popleft()
+                for neighbor in (*self._parents[position], *self._children[position]):
+                    if component_ids[neighbor] == -1:
+                        component_ids[neighbor] = root
+                        queue.append(neighbor)
+        return component_ids
+
+    def _to_bits(self, items: Iterable[T_Hashable]) -> int:
+        bits = 0
+        for item in items:
+            position = self._positions.get(item)
+            if position is not None:
+                bits |= 1 << position
+        return bits
+
+    def _from_bits(self, bits: int) -> Set[T_Hashable]:
+        # bit i of the int is character i of the reversed binary string
+        bit_str = bin(bits)[:1:-1]
+        if bit_str.count("1") * 32 < len(bit_str):
+            # sparse, so jump between set bits
+            result = set()
+            position = bit_str.find("1")
+            while position != -1:
+                result.add(self._items[position])
+                position = bit_str.find("1", position + 1)
+            return result
+        return set(itertools.compress(self._items, bit_str.encode().translate(_BITS_TO_BYTES)))
+
+    def get_ancestors(self, item: T_Hashable) -> AbstractSet[T_Hashable]:
+        position = self._positions.get(item)
+        return set() if position is None else self._from_bits(self._ancestor_bits[position])
+
+    def get_descendants(self, item: T_Hashable) -> AbstractSet[T_Hashable]:
+        position = self._positions.get(item)
+        return set() if position is None else self._from_bits(self._descendant_bits[position])
+
+    def get_ancestors_of_items(self, items: Iterable[T_Hashable]) -> AbstractSet[T_Hashable]:
+        """Returns the union of the ancestors of the given items."""
+        ancestor_bits = self._ancestor_bits
+        bits = 0
+        for item in items:
+            position = self._positions.get(item)
+            if position is not None:
+                bits |= ancestor_bits[position]
+        return self._from_bits(bits)
+
+    def get_descendants_of_items(self, items: Iterable[T_Hashable]) -> AbstractSet[T_Hashable]:
+        """Returns the union of the descendants of the given items."""
+        descendant_bits = self._descendant_bits
+        bits = 0
+        for item in items:
+            position = self._positions.get(item)
+            if position is not None:
+                bits |= descendant_bits[position]
+        return self._from_bits(bits)
+
+    def is_ancestor(self, item: T_Hashable, of_item: T_Hashable) -> bool:
+        """Returns True if `item` is upstream of `of_item`."""
+        position = self._positions.get(item)
+        of_position = self._positions.get(of_item)
+        if position is None or of_position is None:
+            return False
+        return bool(self._ancestor_bits[of_position] >> position & 1)
+
+    def get_level(self, item: T_Hashable) -> int:
+        """Returns the length of the longest path from a root of the graph to the item, i.e. its
+        topological level.
+        """
+        return self._levels[self._positions[item]]
+
+    def get_connected_component(self, item: T_Hashable) -> AbstractSet[T_Hashable]:
+        """Returns all items that are connected to the given item, in either direction."""
+        component_ids = self._connected_component_ids
+        component_id = component_ids[self._positions[item]]
+        return {
+            self._items[position]
+            for position, other_id in enumerate(component_ids)
+            if other_id == component_id
+        }
+
+    def get_sinks(self, within_selection: AbstractSet[T_Hashable]) -> AbstractSet[T_Hashable]:
+        """Equivalent to fetch_sinks on the indexed graph. An item in a dependency cycle is not its
+        own descendant for this purpose.
+        """
+        selection_bits = self._to_bits(within_selection)
+        descendant_bits = self._descendant_bits
+        return {
+            item
+            for item in within_selection
+            if item not in self._positions
+            or not descendant_bits[self._positions[item]]
+            & selection_bits
+            & ~(1 << self._positions[item])
+        }
+
+    def get_sources(self, within_selection: AbstractSet[T_Hashable]) -> AbstractSet[T_Hashable]:
+        """Equivalent to fetch_sources on the indexed graph. As with get_sinks, an item in a
+        dependency cycle is not its own ancestor for this purpose.
+        """
+        selection_bits = self._to_bits(within_selection)
+        ancestor_bits = self._ancestor_bits
+        return {
+            item
+            for item in within_selection
+            if item not in self._positions
+            or not ancestor_bits[self._positions[item]]
+            & selection_bits
+            & ~(1 << self._positions[item])
+        }
+
+
 def fetch_connected_assets_definitions(
     asset: "AssetsDefinition",
     graph: DependencyGraph[str],
@@ -21,6 +21,7 @@
     UnresolvedMappedExecutionStep,
 )
 from dagster._serdes import create_snapshot_id, whitelist_for_serdes
+from dagster._utils.cached_method import cached_method
 from dagster._utils.error import SerializableErrorInfo
 
 # Can be incremented on breaking changes to the snapshot (since it is used to reconstruct
@@ -31,7 +32,7 @@
 
 def create_execution_plan_snapshot_id(execution_plan_snapshot: "ExecutionPlanSnapshot") -> str:
     check.inst_param(execution_plan_snapshot, "execution_plan_snapshot", ExecutionPlanSnapshot)
-    return create_snapshot_id(execution_plan_snapshot)
+    return execution_plan_snapshot.get_snapshot_id()
 
 
 @whitelist_for_serdes(
@@ -123,6 +124,11 @@ def step_deps(self):
     def can_reconstruct_plan(self):
         return self.snapshot_version and self.snapshot_version > 0
 
+    @cached_method
+    def get_snapshot_id(self) -> str:
+        # memoized since hashing requires serializing the whole snapshot, see JobSnap.get_snapshot_id
+        return create_snapshot_id(self)
+
 
 @whitelist_for_serdes
 class ExecutionPlanSnapshotErrorData(
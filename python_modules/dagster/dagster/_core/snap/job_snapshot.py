@@ -50,11 +50,12 @@
 from dagster._record import IHaveNew, record, record_custom
 from dagster._serdes import create_snapshot_id, deserialize_value, whitelist_for_serdes
 from dagster._serdes.serdes import RecordSerializer
+from dagster._utils.cached_method import cached_method
 
 
 def create_job_snapshot_id(snapshot: "JobSnap") -> str:
     check.inst_param(snapshot, "snapshot", JobSnap)
-    return create_snapshot_id(snapshot)
+    return snapshot.get_snapshot_id()
 
 
 class JobSnapSerializer(RecordSerializer["JobSnap"]):
@@ -157,17 +158,13 @@ def from_job_def(cls, job_def: JobDefinition) -> "JobSnap":
         lineage = None
         if job_def.op_selection_data:
             lineage = JobLineageSnap(
-                parent_snapshot_id=create_job_snapshot_id(
-                    cls.from_job_def(job_def.op_selection_data.parent_job_def)
-                ),
+                parent_snapshot_id=job_def.op_selection_data.parent_job_def.get_job_snapshot_id(),
                 op_selection=sorted(job_def.op_selection_data.op_selection),
                 resolved_op_selection=job_def.op_selection_data.resolved_op_selection,
             )
         if job_def.asset_selection_data:
             lineage = JobLineageSnap(
-                parent_snapshot_id=create_job_snapshot_id(
-                    cls.from_job_def(job_def.asset_selection_data.parent_job_def)
-                ),
+                parent_snapshot_id=job_def.asset_selection_data.parent_job_def.get_job_snapshot_id(),
                 asset_selection=job_def.asset_selection_data.asset_selection,
                 asset_check_selection=job_def.asset_selection_data.asset_check_selection,
             )
@@ -187,6 +184,12 @@ def from_job_def(cls, job_def: JobDefinition) -> "JobSnap":
             graph_def_name=job_def.graph.name,
         )
 
+    @cached_method
+    def get_snapshot_id(self) -> str:
+        # Snapshots are immutable, so the hash of the serialized snapshot is computed at most once
+        # per snapshot object, no matter how many times the snapshot is persisted or looked up.
+        return create_snapshot_id(self)
+
     def get_node_def_snap(self, node_def_name: str) -> Union[OpDefSnap, GraphDefSnap]:
         check.str_param(node_def_name, "node_def_name")
         for node_def_snap in self.node_defs_snapshot.op_def_snaps:
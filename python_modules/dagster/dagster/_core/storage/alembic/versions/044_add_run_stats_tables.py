@@ -0,0 +1,94 @@
+"""add run_stats and run_step_stats tables
+
+Revision ID: 9a8b6e5c1f2d
+Revises: 284a732df317
+Create Date: 2024-08-05 11:02:31.518307
+
+"""
+
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from dagster._core.storage.sql import MySQLCompatabilityTypes
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "9a8b6e5c1f2d"
+down_revision = "284a732df317"
+branch_labels = None
+depends_on = None
+
+RUN_STATS_TABLE = "run_stats"
+RUN_STATS_INDEX = "idx_run_stats"
+RUN_STEP_STATS_TABLE = "run_step_stats"
+RUN_STEP_STATS_INDEX = "idx_run_step_stats"
+
+
+def upgrade():
+    # only applies to the event log storage
+    if not has_table("event_logs"):
+        return
+
+    if not has_table(RUN_STATS_TABLE):
+        op.create_table(
+            RUN_STATS_TABLE,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+            db.Column("steps_failed", db.Integer, nullable=False, default=0),
+            db.Column("materializations", db.Integer, nullable=False, default=0),
+            db.Column("expectations", db.Integer, nullable=False, default=0),
+            db.Column("enqueued_time", db.DateTime),
+            db.Column("launch_time", db.DateTime),
+            db.Column("start_time", db.DateTime),
+            db.Column("end_time", db.DateTime),
+        )
+
+    if not has_index(RUN_STATS_TABLE, RUN_STATS_INDEX):
+        op.create_index(
+            RUN_STATS_INDEX,
+            RUN_STATS_TABLE,
+            ["run_id"],
+            unique=True,
+            mysql_length={"run_id": 255},
+        )
+
+    if not has_table(RUN_STEP_STATS_TABLE):
+        op.create_table(
+            RUN_STEP_STATS_TABLE,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("step_key", db.Text, nullable=False),
+            db.Column("stats_events", MySQLCompatabilityTypes.LongText, nullable=False),
+        )
+
+    if not has_index(RUN_STEP_STATS_TABLE, RUN_STEP_STATS_INDEX):
+        op.create_index(
+            RUN_STEP_STATS_INDEX,
+            RUN_STEP_STATS_TABLE,
+            ["run_id", "step_key"],
+            unique=True,
+            mysql_length={"run_id": 255, "step_key": 255},
+        )
+
+
+def downgrade():
+    if has_table(RUN_STEP_STATS_TABLE):
+        if has_index(RUN_STEP_STATS_TABLE, RUN_STEP_STATS_INDEX):
+            op.drop_index(RUN_STEP_STATS_INDEX, RUN_STEP_STATS_TABLE)
+        op.drop_table(RUN_STEP_STATS_TABLE)
+
+    if has_table(RUN_STATS_TABLE):
+        if has_index(RUN_STATS_TABLE, RUN_STATS_INDEX):
+            op.drop_index(RUN_STATS_INDEX, RUN_STATS_TABLE)
+        op.drop_table(RUN_STATS_TABLE)
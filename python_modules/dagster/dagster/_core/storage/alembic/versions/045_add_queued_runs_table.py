@@ -0,0 +1,55 @@
+"""add queued_runs table
+
+Revision ID: 6c4f2b1d8e3a
+Revises: 9a8b6e5c1f2d
+Create Date: 2024-08-12 10:14:52.204118
+
+"""
+
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "6c4f2b1d8e3a"
+down_revision = "9a8b6e5c1f2d"
+branch_labels = None
+depends_on = None
+
+QUEUED_RUNS_TABLE = "queued_runs"
+QUEUED_RUNS_PRIORITY_INDEX = "idx_queued_runs_priority"
+
+
+def upgrade():
+    # only applies to the run storage
+    if not has_table("runs"):
+        return
+
+    if not has_table(QUEUED_RUNS_TABLE):
+        op.create_table(
+            QUEUED_RUNS_TABLE,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), unique=True, nullable=False),
+            db.Column("priority", db.Integer, nullable=False, default=0),
+        )
+
+    if not has_index(QUEUED_RUNS_TABLE, QUEUED_RUNS_PRIORITY_INDEX):
+        op.create_index(
+            QUEUED_RUNS_PRIORITY_INDEX,
+            QUEUED_RUNS_TABLE,
+            ["priority", "id"],
+            unique=False,
+        )
+
+
+def downgrade():
+    if has_table(QUEUED_RUNS_TABLE):
+        if has_index(QUEUED_RUNS_TABLE, QUEUED_RUNS_PRIORITY_INDEX):
+            op.drop_index(QUEUED_RUNS_PRIORITY_INDEX, QUEUED_RUNS_TABLE)
+        op.drop_table(QUEUED_RUNS_TABLE)
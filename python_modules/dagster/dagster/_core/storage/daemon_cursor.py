@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Mapping, Set
+from typing import Mapping, Optional, Set
 
 
 class DaemonCursorStorage:
@@ -10,3 +10,18 @@ def get_cursor_values(self, keys: Set[str]) -> Mapping[str, str]:
     @abstractmethod
     def set_cursor_values(self, pairs: Mapping[str, str]) -> None:
         """Set the value for a given key in the current deployment."""
+
+    def compare_and_set_cursor_value(
+        self, key: str, expected_value: Optional[str], value: str
+    ) -> bool:
+        """Set the value for a given key in the current deployment, but only if its current value
+        is `expected_value`, or if the key has no value when `expected_value` is None. Returns
+        whether the value was set.
+
+        Storages should override this with an atomic implementation. This default is only a
+        best-effort check followed by a write.
+        """
+        if self.get_cursor_values({key}).get(key) != expected_value:
+            return False
+        self.set_cursor_values({key: value})
+        return True
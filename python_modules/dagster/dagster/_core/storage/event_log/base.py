@@ -40,7 +40,11 @@
 from dagster._core.storage.sql import AlembicVersion
 from dagster._core.storage.tags import MULTIDIMENSIONAL_PARTITION_PREFIX
 from dagster._utils import PrintFn
-from dagster._utils.concurrency import ConcurrencyClaimStatus, ConcurrencyKeyInfo
+from dagster._utils.concurrency import (
+    ConcurrencyClaimStatus,
+    ConcurrencyKeyInfo,
+    ConcurrencySlotClaim,
+)
 from dagster._utils.warnings import deprecation_warning
 
 if TYPE_CHECKING:
@@ -550,6 +554,20 @@ def check_concurrency_claim(
         """Claim concurrency slots for step."""
         raise NotImplementedError()
 
+    def claim_concurrency_slots(
+        self, run_id: str, claims: Sequence[ConcurrencySlotClaim]
+    ) -> Sequence[ConcurrencyClaimStatus]:
+        """Claim concurrency slots for many steps of a run at once. Returns the claim status of each
+        step, in the same order as the given claims. Storages may override this to claim the slots
+        in fewer round trips than claiming each slot individually.
+        """
+        return [
+            self.claim_concurrency_slot(
+                claim.concurrency_key, run_id, claim.step_key, claim.priority
+            )
+            for claim in claims
+        ]
+
     @abstractmethod
     def get_concurrency_run_ids(self) -> Set[str]:
         """Get a list of run_ids that are occupying or waiting for a concurrency key slot."""
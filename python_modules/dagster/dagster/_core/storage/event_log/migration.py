@@ -11,9 +11,11 @@
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+RUN_STATS_TABLES = "run_stats_tables"  # builds the run stats tables from the event log
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
+    RUN_STATS_TABLES: lambda: migrate_run_stats_data,
 }
 ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
 
@@ -72,6 +74,39 @@ def migrate_asset_key_data(event_log_storage, print_fn=None):
                 pass
 
 
+def migrate_run_stats_data(event_log_storage, print_fn=None):
+    """Utility method to build the run stats tables from the data in existing event log records.
+    Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    if not event_log_storage.has_run_stats_tables or event_log_storage.is_run_sharded:
+        # run-sharded storage builds the tables of each run shard as it is first connected to
+        return
+
+    with event_log_storage.index_connection() as conn:
+        if print_fn:
+            print_fn("Querying event logs.")
+        run_ids = [
+            run_id
+            for (run_id,) in conn.execute(
+                db_select([SqlEventLogStorageTable.c.run_id]).distinct()
+            ).fetchall()
+            if run_id
+        ]
+
+    if print_fn:
+        print_fn(f"Found {len(run_ids)} runs to index")
+        run_ids = tqdm(run_ids)
+
+    for run_id in run_ids:
+        event_log_storage.rebuild_run_stats(run_id)
+
+
 def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
     from dagster._core.definitions.events import AssetKey
     from dagster._core.storage.event_log.schema import AssetKeyTable, SqlEventLogStorageTable
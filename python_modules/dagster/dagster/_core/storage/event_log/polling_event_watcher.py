@@ -1,10 +1,11 @@
 import os
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, cast
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventLogStorage
+from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 
 INIT_POLL_PERIOD = 0.250  # 250ms
 MAX_POLL_PERIOD = 16.0  # 16s
@@ -23,13 +24,13 @@ class CallbackAfterCursor(NamedTuple):
 
 
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that uses a polling approach to retrieving new events for run_ids.
+    This class' job is to manage a single thread (SqlPollingEventWatcherThread) that polls the event
+    log for all watched run_ids and fans the new events out to the callbacks registered for each run.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        ORDER: _thread_lock -> watcher_thread._callbacks_lock
+        INVARIANTS: _thread_lock protects _watcher_thread
     """
 
     def __init__(self, event_log_storage: EventLogStorage):
@@ -37,15 +38,17 @@ def __init__(self, event_log_storage: EventLogStorage):
             event_log_storage, "event_log_storage", EventLogStorage
         )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
-        self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        # INVARIANT: _thread_lock protects _watcher_thread
+        self._thread_lock: threading.Lock = threading.Lock()
+        self._watcher_thread: Optional[SqlPollingEventWatcherThread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
-        with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+        with self._thread_lock:
+            _has_run_id = self._watcher_thread is not None and self._watcher_thread.has_run_id(
+                run_id
+            )
         return _has_run_id
 
     def watch_run(
@@ -59,14 +62,12 @@ def watch_run(
         callback = check.callable_param(callback, "callback")
         check.invariant(not self._disposed, "Attempted to watch_run after close")
 
-        with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
-                )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+        with self._thread_lock:
+            if self._watcher_thread is None:
+                self._watcher_thread = SqlPollingEventWatcherThread(self._event_log_storage)
+                self._watcher_thread.daemon = True
+                self._watcher_thread.start()
+            self._watcher_thread.add_callback(run_id, cursor, callback)
 
     def unwatch_run(
         self,
@@ -75,113 +76,200 @@ def unwatch_run(
     ) -> None:
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
-        with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+        with self._thread_lock:
+            if self._watcher_thread is not None:
+                self._watcher_thread.remove_callback(run_id, handler)
 
     def close(self) -> None:
         if not self._disposed:
             self._disposed = True
-            with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                self._run_id_to_watcher_dict = {}
+            with self._thread_lock:
+                if self._watcher_thread is not None:
+                    self._watcher_thread.stop()
+                    self._watcher_thread.join()
+                    self._watcher_thread = None
 
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
+class SqlPollingEventWatcherThread(threading.Thread):
+    """subclass of Thread that watches a set of run_ids for new Events, polling with a backoff from
+    INIT_POLL_PERIOD up to MAX_POLL_PERIOD while no new events are found.
 
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
+    Holds a list of callbacks per run_id (_callbacks), each passed in by an `Observer`. Note that
         the callbacks have a cursor associated; this means that the callbacks should be
         only executed on EventLogEntrys with an associated id >= callback.cursor
+
+    When the storage is not run-sharded, each poll issues a single query for all of the watched
+    runs. Every run keeps its own cursor in that query, so an event that commits after events of
+    other runs with higher storage ids is still picked up. For run-sharded storage, each run is
+    polled with a query of its own.
+
     Exits when `self.should_thread_exit` is set.
 
     LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
-
+        INVARIANTS: _callbacks_lock protects _callbacks and _run_cursors
     """
 
-    def __init__(self, event_log_storage: EventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
+    def __init__(self, event_log_storage: EventLogStorage):
+        super(SqlPollingEventWatcherThread, self).__init__()
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", EventLogStorage
         )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
+        self._multiplexed = (
+            isinstance(event_log_storage, SqlEventLogStorage)
+            and not event_log_storage.is_run_sharded
+        )
+        self._callbacks_lock: threading.Lock = threading.Lock()
+        self._callbacks: Dict[str, List[CallbackAfterCursor]] = {}
+        # storage id of the last event handled for each watched run
+        self._run_cursors: Dict[str, Optional[int]] = {}
         self._should_thread_exit = threading.Event()
-        self.name = f"sql-event-watch-run-id-{self._run_id}"
+        self._wake_up = threading.Event()
+        self.name = "sql-event-watch"
 
     @property
     def should_thread_exit(self) -> threading.Event:
         return self._should_thread_exit
 
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
-        """Observer has started watching this run.
-            Add a callback to execute on new EventLogEntrys after the given cursor.
+    def has_run_id(self, run_id: str) -> bool:
+        with self._callbacks_lock:
+            return run_id in self._callbacks
+
+    def add_callback(
+        self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
+    ):
+        """Observer has started watching a run.
+            Add a callback to execute on new EventLogEntrys for the run after the given cursor.
 
         Args:
+            run_id (str): the run to watch
             cursor (Optional[str]): event log cursor for the callback to execute
             callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
         """
+        run_id = check.str_param(run_id, "run_id")
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
+        storage_id = EventLogCursor.parse(cursor).storage_id() if cursor else None
+        with self._callbacks_lock:
+            if run_id not in self._callbacks:
+                self._callbacks[run_id] = []
+                self._run_cursors[run_id] = storage_id
+            self._callbacks[run_id].append(CallbackAfterCursor(cursor, callback))
 
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
-        """Observer has stopped watching this run;
+        # poll soon so that the new observer does not wait out a long backoff
+        self._wake_up.set()
+
+    def remove_callback(self, run_id: str, callback: Callable[[EventLogEntry, str], None]):
+        """Observer has stopped watching a run;
             Remove a callback from the list of callbacks to execute on new EventLogEntrys.
 
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
+            Also stop polling the run if no callbacks remaining (i.e. no Observers are watching this
+            run_id)
 
         Args:
+            run_id (str): the watched run
             callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
         """
         callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
+        with self._callbacks_lock:
+            if run_id not in self._callbacks:
+                return
+            self._callbacks[run_id] = [
                 callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
+                for callback_with_cursor in self._callbacks[run_id]
                 if callback_with_cursor.callback != callback
             ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
+            if not self._callbacks[run_id]:
+                del self._callbacks[run_id]
+                del self._run_cursors[run_id]
+
+    def stop(self) -> None:
+        self._should_thread_exit.set()
+        self._wake_up.set()
 
     def run(self) -> None:
         """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
+        Wakes every POLLING_CADENCE (or as soon as a run starts being watched) &
+            1. executes SELECT queries to get new EventLogEntrys for the watched runs
             2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
+        Tracks the storage id of the last handled event for each run so that events are never
+        delivered twice.
         """
-        cursor = None
         wait_time = INIT_POLL_PERIOD
 
         chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
 
-        while not self._should_thread_exit.wait(wait_time):
+        while True:
+            woken_up = self._wake_up.wait(wait_time)
+            if self._should_thread_exit.is_set():
+                break
+            self._wake_up.clear()
+
+            if self._multiplexed:
+                found_events = self._poll_multiplexed(chunk_limit)
+            else:
+                found_events = self._poll_per_run(chunk_limit)
+
+            wait_time = (
+                INIT_POLL_PERIOD
+                if found_events or woken_up
+                else min(wait_time * 2, MAX_POLL_PERIOD)
+            )
+
+    def _poll_multiplexed(self, chunk_limit: int) -> bool:
+        with self._callbacks_lock:
+            run_cursors = {
+                run_id: EventLogCursor.from_storage_id(run_cursor).to_string()
+                if run_cursor
+                else None
+                for run_id, run_cursor in self._run_cursors.items()
+            }
+
+        if not run_cursors:
+            return False
+
+        records = cast(SqlEventLogStorage, self._event_log_storage).get_records_for_runs(
+            run_cursors, limit=chunk_limit
+        )
+        for event_record in records:
+            self._handle_records(event_record.event_log_entry.run_id, [event_record])
+        return bool(records)
+
+    def _poll_per_run(self, chunk_limit: int) -> bool:
+        # storage ids of run-sharded storage are only comparable within a run
+        with self._callbacks_lock:
+            run_cursors = dict(self._run_cursors)
+
+        found_events = False
+        for run_id, run_cursor in run_cursors.items():
             conn = self._event_log_storage.get_records_for_run(
-                self._run_id,
-                cursor=cursor,
+                run_id,
+                cursor=EventLogCursor.from_storage_id(run_cursor).to_string()
+                if run_cursor
+                else None,
                 limit=chunk_limit,
             )
-            cursor = conn.cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
-            wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+            self._handle_records(run_id, conn.records)
+            found_events = found_events or bool(conn.records)
+        return found_events
+
+    def _handle_records(self, run_id: str, event_records: Sequence[EventLogRecord]) -> None:
+        with self._callbacks_lock:
+            if run_id not in self._callbacks:
+                return
+            run_cursor = self._run_cursors[run_id]
+            for event_record in event_records:
+                # skip events that were already handled
+                if run_cursor is not None and event_record.storage_id <= run_cursor:
+                    continue
+                run_cursor = event_record.storage_id
+                for callback_with_cursor in self._callbacks[run_id]:
+                    if (
+                        callback_with_cursor.cursor is None
+                        or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+                        < event_record.storage_id
+                    ):
+                        callback_with_cursor.callback(
+                            event_record.event_log_entry,
+                            str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                        )
+            self._run_cursors[run_id] = run_cursor
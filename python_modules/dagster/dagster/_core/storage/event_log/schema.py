@@ -180,6 +180,44 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
 )
 
+# Run-level stats, updated as events are stored so that they can be read without scanning the
+# event log of the run
+RunStatsTable = db.Table(
+    "run_stats",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+    db.Column("steps_failed", db.Integer, nullable=False, default=0),
+    db.Column("materializations", db.Integer, nullable=False, default=0),
+    db.Column("expectations", db.Integer, nullable=False, default=0),
+    db.Column("enqueued_time", db.DateTime),
+    db.Column("launch_time", db.DateTime),
+    db.Column("start_time", db.DateTime),
+    db.Column("end_time", db.DateTime),
+)
+
+# Per-step stats, holding the stats events of the step (a handful per step attempt) as lines that
+# are appended to as events are stored
+RunStepStatsTable = db.Table(
+    "run_step_stats",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.Text, nullable=False),
+    db.Column("stats_events", MySQLCompatabilityTypes.LongText, nullable=False),
+)
+
 db.Index(
     "idx_asset_check_executions",
     AssetCheckExecutionsTable.c.asset_key,
@@ -270,3 +308,16 @@
     mysql_length={"concurrency_key": 255, "run_id": 255, "step_key": 32},
     unique=True,
 )
+db.Index(
+    "idx_run_stats",
+    RunStatsTable.c.run_id,
+    mysql_length={"run_id": 255},
+    unique=True,
+)
+db.Index(
+    "idx_run_step_stats",
+    RunStepStatsTable.c.run_id,
+    RunStepStatsTable.c.step_key,
+    mysql_length={"run_id": 255, "step_key": 255},
+    unique=True,
+)
@@ -1,7 +1,7 @@
 import logging
 import os
 from abc import abstractmethod
-from collections import OrderedDict, defaultdict
+from collections import Counter, OrderedDict, defaultdict
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from functools import cached_property
@@ -37,7 +37,7 @@
 )
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
 from dagster._core.definitions.data_version import DATA_VERSION_TAG
-from dagster._core.definitions.events import AssetKey, AssetMaterialization
+from dagster._core.definitions.events import AssetKey, AssetMaterialization, ExpectationResult
 from dagster._core.errors import (
     DagsterEventLogInvalidForRun,
     DagsterInvalidInvocationError,
@@ -56,7 +56,15 @@
     DagsterEventType,
 )
 from dagster._core.events.log import EventLogEntry
-from dagster._core.execution.stats import RunStepKeyStatsSnapshot, build_run_step_stats_from_events
+from dagster._core.execution.stats import (
+    STEP_LIFECYCLE_EVENTS,
+    STEP_STATS_REPORTED_EVENTS,
+    RunStepKeyStatsSnapshot,
+    StepStatsEvent,
+    build_run_step_stats_from_events,
+    build_run_step_stats_snapshot,
+    step_stats_event_from_entry,
+)
 from dagster._core.storage.asset_check_execution_record import (
     AssetCheckExecutionRecord,
     AssetCheckExecutionRecordStatus,
@@ -78,6 +86,7 @@
     ASSET_DATA_MIGRATIONS,
     ASSET_KEY_INDEX_COLS,
     EVENT_LOG_DATA_MIGRATIONS,
+    RUN_STATS_TABLES,
 )
 from dagster._core.storage.event_log.schema import (
     AssetCheckExecutionsTable,
@@ -87,6 +96,8 @@
     ConcurrencySlotsTable,
     DynamicPartitionsTable,
     PendingStepsTable,
+    RunStatsTable,
+    RunStepStatsTable,
     SecondaryIndexMigrationTable,
     SqlEventLogStorageTable,
 )
@@ -106,6 +117,7 @@
     ClaimedSlotInfo,
     ConcurrencyClaimStatus,
     ConcurrencyKeyInfo,
+    ConcurrencySlotClaim,
     ConcurrencySlotStatus,
     PendingStepInfo,
     get_max_concurrency_limit_value,
@@ -116,8 +128,28 @@
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
 MIN_ASSET_ROWS = 25
+
+# columns of the run stats table counting the events of a given type
+RUN_STATS_COUNT_COLUMNS = {
+    DagsterEventType.STEP_SUCCESS: "steps_succeeded",
+    DagsterEventType.STEP_FAILURE: "steps_failed",
+    DagsterEventType.ASSET_MATERIALIZATION: "materializations",
+    DagsterEventType.STEP_EXPECTATION_RESULT: "expectations",
+}
+# columns of the run stats table holding the timestamp of the latest event of a given type
+RUN_STATS_TIME_COLUMNS = {
+    DagsterEventType.RUN_ENQUEUED: "enqueued_time",
+    DagsterEventType.RUN_STARTING: "launch_time",
+    DagsterEventType.RUN_START: "start_time",
+    DagsterEventType.RUN_SUCCESS: "end_time",
+    DagsterEventType.RUN_FAILURE: "end_time",
+    DagsterEventType.RUN_CANCELED: "end_time",
+}
 DEFAULT_MAX_LIMIT_EVENT_RECORDS = 10000
 
+# maximum number of steps whose concurrency slots are claimed in a single set of queries
+CONCURRENCY_CLAIM_BATCH_SIZE = 500
+
 
 def get_max_event_records_limit() -> int:
     max_value = os.getenv("MAX_LIMIT_GET_EVENT_RECORDS")
@@ -137,6 +169,26 @@ def enforce_max_records_limit(limit: int):
         )
 
 
+def _serialize_step_stats_event(event: StepStatsEvent) -> str:
+    # one line per event, so that the events of a step can be appended to its row in SQL
+    return (
+        seven.json.dumps(
+            [event.event_type.value, event.timestamp, event.marker_start, event.marker_end]
+        )
+        + "\n"
+    )
+
+
+def _deserialize_step_stats_events(stats_events: str) -> Sequence[StepStatsEvent]:
+    events = []
+    for line in stats_events.splitlines():
+        event_type, timestamp, marker_start, marker_end = seven.json.loads(line)
+        events.append(
+            StepStatsEvent(DagsterEventType(event_type), timestamp, marker_start, marker_end)
+        )
+    return events
+
+
 # We are using third-party library objects for DB connections-- at this time, these libraries are
 # untyped. When/if we upgrade to typed variants, the `Any` here can be replaced or the alias as a
 # whole can be dropped.
@@ -173,6 +225,18 @@ def index_transaction(self) -> Iterator[Connection]:
                 with conn.begin():
                     yield conn
 
+    @contextmanager
+    def run_transaction(self, run_id: Optional[str]) -> Iterator[Connection]:
+        """Context manager yielding a connection to access the event logs for a specific run that
+        has begun a transaction.
+        """
+        with self.run_connection(run_id) as conn:
+            if conn.in_transaction():
+                yield conn
+            else:
+                with conn.begin():
+                    yield conn
+
     @abstractmethod
     def upgrade(self) -> None:
         """This method should perform any schema migrations necessary to bring an
@@ -444,9 +508,17 @@ def store_event(self, event: EventLogEntry) -> None:
 
         event_id = None
 
-        with self.run_connection(run_id) as conn:
-            result = conn.execute(insert_event_statement)
-            event_id = result.inserted_primary_key[0]
+        def _insert_event() -> Any:
+            with self.run_transaction(run_id) as conn:
+                result = conn.execute(insert_event_statement)
+                self.update_run_stats(conn, [event])
+                return result.inserted_primary_key[0]
+
+        try:
+            event_id = _insert_event()
+        except db_exc.IntegrityError:
+            # a run stats row was inserted concurrently, and is updated on the second attempt
+            event_id = _insert_event()
 
         if (
             event.is_dagster_event
@@ -558,9 +630,135 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def get_records_for_runs(
+        self,
+        run_cursors: Mapping[str, Optional[str]],
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Get the logs for several runs in a single query, in ascending storage id order. Only
+        supported for non run-sharded storage.
+
+        Args:
+            run_cursors (Mapping[str, Optional[str]]): The ids of the runs for which to fetch logs,
+                each mapped to a storage id cursor. Only logs of a run with a storage id greater
+                than its cursor will be returned.
+            limit (Optional[int]): the maximum number of events to fetch
+        """
+        check.mapping_param(run_cursors, "run_cursors", key_type=str)
+        check.invariant(
+            not self.is_run_sharded, "Cannot fetch logs across runs from run-sharded storage"
+        )
+
+        run_ids_without_cursor = []
+        run_conditions = []
+        for run_id, cursor in run_cursors.items():
+            if cursor is None:
+                run_ids_without_cursor.append(run_id)
+                continue
+            cursor_obj = EventLogCursor.parse(cursor)
+            check.invariant(cursor_obj.is_id_cursor(), "Expected a storage id cursor")
+            run_conditions.append(
+                db.and_(
+                    SqlEventLogStorageTable.c.run_id == run_id,
+                    SqlEventLogStorageTable.c.id > cursor_obj.storage_id(),
+                )
+            )
+        if run_ids_without_cursor:
+            run_conditions.append(SqlEventLogStorageTable.c.run_id.in_(run_ids_without_cursor))
+        if not run_conditions:
+            return []
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(db.or_(*run_conditions))
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if limit:
+            query = query.limit(limit)
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        for record_id, run_id, json_str in results:
+            try:
+                event_log_entry = deserialize_value(json_str, EventLogEntry)
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+            records.append(EventLogRecord(storage_id=record_id, event_log_entry=event_log_entry))
+        return records
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
+        if self._can_read_run_stats_tables():
+            return self._get_stats_for_run_from_stats_table(run_id)
+        with self.run_connection(run_id) as conn:
+            return self._get_stats_for_run_from_event_log(conn, run_id)
+
+    def _get_stats_for_run_from_stats_table(self, run_id: str) -> DagsterRunStatsSnapshot:
+        query = db_select(
+            [
+                RunStatsTable.c.steps_succeeded,
+                RunStatsTable.c.steps_failed,
+                RunStatsTable.c.materializations,
+                RunStatsTable.c.expectations,
+                RunStatsTable.c.enqueued_time,
+                RunStatsTable.c.launch_time,
+                RunStatsTable.c.start_time,
+                RunStatsTable.c.end_time,
+            ]
+        ).where(RunStatsTable.c.run_id == run_id)
+
+        with self.run_connection(run_id) as conn:
+            row = conn.execute(query).fetchone()
+
+        if not row:
+            return DagsterRunStatsSnapshot(
+                run_id=run_id,
+                steps_succeeded=0,
+                steps_failed=0,
+                materializations=0,
+                expectations=0,
+                enqueued_time=None,
+                launch_time=None,
+                start_time=None,
+                end_time=None,
+            )
+
+        (
+            steps_succeeded,
+            steps_failed,
+            materializations,
+            expectations,
+            enqueued_time,
+            launch_time,
+            start_time,
+            end_time,
+        ) = row
+        return DagsterRunStatsSnapshot(
+            run_id=run_id,
+            steps_succeeded=steps_succeeded,
+            steps_failed=steps_failed,
+            materializations=materializations,
+            expectations=expectations,
+            enqueued_time=(
+                utc_datetime_from_naive(enqueued_time).timestamp() if enqueued_time else None
+            ),
+            launch_time=utc_datetime_from_naive(launch_time).timestamp() if launch_time else None,
+            start_time=utc_datetime_from_naive(start_time).timestamp() if start_time else None,
+            end_time=utc_datetime_from_naive(end_time).timestamp() if end_time else None,
+        )
+
+    def _get_stats_for_run_from_event_log(
+        self, conn: Connection, run_id: str
+    ) -> DagsterRunStatsSnapshot:
         query = (
             db_select(
                 [
@@ -578,8 +776,7 @@ def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
             .group_by("dagster_event_type")
         )
 
-        with self.run_connection(run_id) as conn:
-            results = conn.execute(query).fetchall()
+        results = conn.execute(query).fetchall()
 
         try:
             counts = {}
@@ -627,6 +824,9 @@ def get_step_stats_for_run(
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
+        if self._can_read_run_stats_tables():
+            return self._get_step_stats_for_run_from_stats_table(run_id, step_keys)
+
         # Originally, this was two different queries:
         # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
         #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
@@ -639,42 +839,282 @@ def get_step_stats_for_run(
         # being able to share code with the in-memory event log storage implementation.  We may
         # choose to revisit this in the future, especially if we are able to do JSON-column queries
         # in SQL as a way of bypassing the serdes layer in all cases.
-        raw_event_query = (
+        raw_event_query = self._step_stats_events_query(run_id, step_keys)
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(raw_event_query).fetchall()
+
+        try:
+            records = deserialize_values((json_str for (json_str,) in results), EventLogEntry)
+            return build_run_step_stats_from_events(run_id, records)
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+    def _step_stats_events_query(
+        self, run_id: str, step_keys: Optional[Sequence[str]]
+    ) -> SqlAlchemyQuery:
+        query = (
             db_select([SqlEventLogStorageTable.c.event])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
             .where(
                 SqlEventLogStorageTable.c.dagster_event_type.in_(
                     [
-                        DagsterEventType.STEP_START.value,
-                        DagsterEventType.STEP_SUCCESS.value,
-                        DagsterEventType.STEP_SKIPPED.value,
-                        DagsterEventType.STEP_FAILURE.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.ASSET_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.STEP_UP_FOR_RETRY.value,
+                        event_type.value
+                        for event_type in STEP_LIFECYCLE_EVENTS
+                        | MARKER_EVENTS
+                        | {
+                            DagsterEventType.ASSET_MATERIALIZATION,
+                            DagsterEventType.STEP_EXPECTATION_RESULT,
+                        }
                     ]
-                    + [marker_event.value for marker_event in MARKER_EVENTS]
                 )
             )
             .order_by(SqlEventLogStorageTable.c.id.asc())
         )
         if step_keys:
-            raw_event_query = raw_event_query.where(
-                SqlEventLogStorageTable.c.step_key.in_(step_keys)
-            )
+            query = query.where(SqlEventLogStorageTable.c.step_key.in_(step_keys))
+        return query
+
+    def _get_step_stats_for_run_from_stats_table(
+        self, run_id: str, step_keys: Optional[Sequence[str]]
+    ) -> Sequence[RunStepKeyStatsSnapshot]:
+        step_stats_query = (
+            db_select([RunStepStatsTable.c.step_key, RunStepStatsTable.c.stats_events])
+            .where(RunStepStatsTable.c.run_id == run_id)
+            .order_by(RunStepStatsTable.c.id.asc())
+        )
+        if step_keys:
+            step_stats_query = step_stats_query.where(RunStepStatsTable.c.step_key.in_(step_keys))
 
         with self.run_connection(run_id) as conn:
-            results = conn.execute(raw_event_query).fetchall()
+            stats_events_by_step_key = {
+                step_key: _deserialize_step_stats_events(stats_events)
+                for step_key, stats_events in conn.execute(step_stats_query).fetchall()
+            }
+            reported_step_keys = [
+                step_key
+                for step_key, stats_events in stats_events_by_step_key.items()
+                if any(event.event_type in STEP_STATS_REPORTED_EVENTS for event in stats_events)
+            ]
 
+            # the stats table only records when materializations and expectation results happened,
+            # so their contents, which are part of the returned stats, are read from the event log
+            step_keys_with_results = [
+                step_key
+                for step_key in reported_step_keys
+                if any(
+                    event.event_type
+                    in (
+                        DagsterEventType.ASSET_MATERIALIZATION,
+                        DagsterEventType.STEP_EXPECTATION_RESULT,
+                    )
+                    for event in stats_events_by_step_key[step_key]
+                )
+            ]
+            results = []
+            if step_keys_with_results:
+                raw_event_query = (
+                    db_select([SqlEventLogStorageTable.c.event])
+                    .where(SqlEventLogStorageTable.c.run_id == run_id)
+                    .where(SqlEventLogStorageTable.c.step_key.in_(step_keys_with_results))
+                    .where(
+                        SqlEventLogStorageTable.c.dagster_event_type.in_(
+                            [
+                                DagsterEventType.ASSET_MATERIALIZATION.value,
+                                DagsterEventType.STEP_EXPECTATION_RESULT.value,
+                            ]
+                        )
+                    )
+                    .order_by(SqlEventLogStorageTable.c.id.asc())
+                )
+                results = conn.execute(raw_event_query).fetchall()
+
+        materialization_events: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        expectation_results: Dict[str, List[ExpectationResult]] = defaultdict(list)
         try:
-            records = deserialize_values((json_str for (json_str,) in results), EventLogEntry)
-            return build_run_step_stats_from_events(run_id, records)
+            for event in deserialize_values((json_str for (json_str,) in results), EventLogEntry):
+                dagster_event = event.get_dagster_event()
+                step_key = check.not_none(dagster_event.step_key)
+                if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+                    materialization_events[step_key].append(event)
+                else:
+                    expectation_results[step_key].append(
+                        dagster_event.step_expectation_result_data.expectation_result
+                    )
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+        return [
+            build_run_step_stats_snapshot(
+                run_id,
+                step_key,
+                stats_events_by_step_key[step_key],
+                materialization_events[step_key],
+                expectation_results[step_key],
+            )
+            for step_key in reported_step_keys
+        ]
+
+    @cached_property
+    def has_run_stats_tables(self) -> bool:
+        # These tables were added later and are optional
+        return self.has_table(RunStatsTable.name) and self.has_table(RunStepStatsTable.name)
+
+    def _can_read_run_stats_tables(self) -> bool:
+        if self.is_run_sharded:
+            # each run shard builds its tables from its own events as it is first connected to
+            return self.has_run_stats_tables
+        # the tables are only complete once the stats of existing runs have been backfilled
+        return self.has_run_stats_tables and self.has_secondary_index(RUN_STATS_TABLES)
+
+    def update_run_stats(self, conn: Connection, events: Sequence[EventLogEntry]) -> None:
+        """Update the run stats tables, if they exist, with newly stored events.
+
+        Must be called in the transaction that stores the events, so that a concurrent rebuild of
+        the stats of their run either counts the events or is followed by these updates. Raises an
+        IntegrityError if a row was inserted concurrently, in which case the transaction can be
+        retried.
+        """
+        if not self.has_run_stats_tables:
+            return
+
+        # fold the events into a single update per run and per step
+        counts_by_run_id: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        times_by_run_id: Dict[str, Dict[str, datetime]] = defaultdict(dict)
+        stats_events_by_step: Dict[Tuple[str, str], str] = defaultdict(str)
+        for event in events:
+            # runless events have no run to attribute stats to
+            if not event.is_dagster_event or not event.run_id:
+                continue
+            dagster_event_type = event.get_dagster_event().event_type
+            count_column = RUN_STATS_COUNT_COLUMNS.get(dagster_event_type)
+            if count_column:
+                counts_by_run_id[event.run_id][count_column] += 1
+            time_column = RUN_STATS_TIME_COLUMNS.get(dagster_event_type)
+            if time_column:
+                times_by_run_id[event.run_id][time_column] = self._event_insert_timestamp(event)
+            stats_event = step_stats_event_from_entry(event)
+            if stats_event:
+                step_key = check.not_none(event.step_key)
+                stats_events_by_step[(event.run_id, step_key)] += _serialize_step_stats_event(
+                    stats_event
+                )
+
+        # the run's row is updated first, which serializes these updates with a rebuild of the
+        # run's stats
+        for run_id in {*counts_by_run_id.keys(), *times_by_run_id.keys()}:
+            counts = counts_by_run_id.get(run_id, {})
+            times = times_by_run_id.get(run_id, {})
+            self._upsert_stats_row(
+                conn,
+                RunStatsTable,
+                RunStatsTable.c.run_id == run_id,
+                update_values={
+                    **{column: RunStatsTable.c[column] + count for column, count in counts.items()},
+                    **times,
+                },
+                insert_values={"run_id": run_id, **counts, **times},
+            )
+
+        for (run_id, step_key), stats_events in stats_events_by_step.items():
+            # appended in SQL, since events of a step may be stored concurrently by several
+            # processes
+            self._upsert_stats_row(
+                conn,
+                RunStepStatsTable,
+                db.and_(
+                    RunStepStatsTable.c.run_id == run_id,
+                    RunStepStatsTable.c.step_key == step_key,
+                ),
+                update_values={"stats_events": RunStepStatsTable.c.stats_events + stats_events},
+                insert_values={
+                    "run_id": run_id,
+                    "step_key": step_key,
+                    "stats_events": stats_events,
+                },
+            )
+
+    def _upsert_stats_row(
+        self,
+        conn: Connection,
+        table: db.Table,
+        row_filter: Any,
+        update_values: Mapping[str, Any],
+        insert_values: Mapping[str, Any],
+    ) -> None:
+        if conn.execute(table.update().where(row_filter).values(update_values)).rowcount:
+            return
+        conn.execute(table.insert().values(insert_values))
+
+    def rebuild_run_stats(self, run_id: str) -> None:
+        """Recompute the run stats tables rows for a run from its event log."""
+        check.str_param(run_id, "run_id")
+        check.invariant(self.has_run_stats_tables, "Run stats tables do not exist")
+
+        try:
+            with self.run_transaction(run_id) as conn:
+                self._rebuild_run_stats(conn, run_id)
+        except db_exc.IntegrityError:
+            # the run's row was inserted concurrently, and is updated on the second attempt
+            with self.run_transaction(run_id) as conn:
+                self._rebuild_run_stats(conn, run_id)
+
+    def _rebuild_run_stats(self, conn: Connection, run_id: str) -> None:
+        # Lock the run's row before reading the event log. Events are stored in the same
+        # transaction as their stats updates, so those stored before the row is locked are read
+        # below, and those stored after wait to update the rebuilt rows.
+        lock_statement = (
+            RunStatsTable.update()
+            .where(RunStatsTable.c.run_id == run_id)
+            .values(steps_succeeded=RunStatsTable.c.steps_succeeded)
+        )
+        if not conn.execute(lock_statement).rowcount:
+            conn.execute(RunStatsTable.insert().values(run_id=run_id))
+
+        run_stats = self._get_stats_for_run_from_event_log(conn, run_id)
+        conn.execute(
+            RunStatsTable.update()
+            .where(RunStatsTable.c.run_id == run_id)
+            .values(
+                steps_succeeded=run_stats.steps_succeeded,
+                steps_failed=run_stats.steps_failed,
+                materializations=run_stats.materializations,
+                expectations=run_stats.expectations,
+                **{
+                    column: (
+                        datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+                        if timestamp is not None
+                        else None
+                    )
+                    for column, timestamp in [
+                        ("enqueued_time", run_stats.enqueued_time),
+                        ("launch_time", run_stats.launch_time),
+                        ("start_time", run_stats.start_time),
+                        ("end_time", run_stats.end_time),
+                    ]
+                },
+            )
+        )
+
+        conn.execute(RunStepStatsTable.delete().where(RunStepStatsTable.c.run_id == run_id))
+        results = conn.execute(self._step_stats_events_query(run_id, None)).fetchall()
+        stats_events_by_step_key: Dict[str, str] = defaultdict(str)
+        for event in deserialize_values((json_str for (json_str,) in results), EventLogEntry):
+            stats_event = step_stats_event_from_entry(event)
+            if stats_event:
+                stats_events_by_step_key[check.not_none(event.step_key)] += (
+                    _serialize_step_stats_event(stats_event)
+                )
+        if stats_events_by_step_key:
+            conn.execute(
+                RunStepStatsTable.insert(),
+                [
+                    dict(run_id=run_id, step_key=step_key, stats_events=stats_events)
+                    for step_key, stats_events in stats_events_by_step_key.items()
+                ],
+            )
+
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
             if not force:
@@ -691,6 +1131,13 @@ def _apply_migration(self, migration_name, migration_fn, print_fn, force):
     def reindex_events(self, print_fn: Optional[PrintFn] = None, force: bool = False) -> None:
         """Call this method to run any data migrations across the event_log table."""
         for migration_name, migration_fn in EVENT_LOG_DATA_MIGRATIONS.items():
+            if (
+                migration_name == RUN_STATS_TABLES
+                and not self.is_run_sharded
+                and not self.has_run_stats_tables
+            ):
+                # leave the backfill unapplied until `dagster instance migrate` creates the tables
+                continue
             self._apply_migration(migration_name, migration_fn, print_fn, force)
 
     def reindex_assets(self, print_fn: Optional[PrintFn] = None, force: bool = False) -> None:
@@ -726,6 +1173,10 @@ def wipe(self) -> None:
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self.has_run_stats_tables:
+                conn.execute(RunStatsTable.delete())
+                conn.execute(RunStepStatsTable.delete())
+
         self._wipe_index()
 
     def _wipe_index(self):
@@ -781,6 +1232,9 @@ def delete_events_for_run(self, conn: Connection, run_id: str) -> None:
                     AssetEventTagsTable.c.event_id.in_(asset_event_ids)
                 )
             )
+        if self.has_run_stats_tables:
+            conn.execute(RunStatsTable.delete().where(RunStatsTable.c.run_id == run_id))
+            conn.execute(RunStepStatsTable.delete().where(RunStepStatsTable.c.run_id == run_id))
 
     @property
     def is_persistent(self) -> bool:
@@ -2388,26 +2842,9 @@ def check_concurrency_claim(
                 )
             ).fetchone()
 
-            if not pending_row:
-                # no pending step pending_row exists, the slot is blocked and the enqueued timestamp is None
-                return ConcurrencyClaimStatus(
-                    concurrency_key=concurrency_key,
-                    slot_status=ConcurrencySlotStatus.BLOCKED,
-                    priority=None,
-                    assigned_timestamp=None,
-                    enqueued_timestamp=None,
-                )
-
-            priority = cast(int, pending_row[1]) if pending_row[1] else None
-            assigned_timestamp = cast(datetime, pending_row[0]) if pending_row[0] else None
-            create_timestamp = cast(datetime, pending_row[2]) if pending_row[2] else None
-            if assigned_timestamp is None:
-                return ConcurrencyClaimStatus(
-                    concurrency_key=concurrency_key,
-                    slot_status=ConcurrencySlotStatus.BLOCKED,
-                    priority=priority,
-                    assigned_timestamp=None,
-                    enqueued_timestamp=create_timestamp,
+            if not pending_row or not pending_row[0]:
+                return self._build_concurrency_claim_status(
+                    concurrency_key, pending_row, has_claimed_slot=False
                 )
 
             # pending step is assigned, check to see if it's been claimed
@@ -2421,17 +2858,40 @@ def check_concurrency_claim(
                 )
             ).fetchone()
 
+            return self._build_concurrency_claim_status(
+                concurrency_key, pending_row, has_claimed_slot=bool(slot_row and slot_row[0])
+            )
+
+    def _build_concurrency_claim_status(
+        self, concurrency_key: str, pending_row: Optional[Any], has_claimed_slot: bool
+    ) -> ConcurrencyClaimStatus:
+        """Builds the claim status of a step from its row in the pending steps table, which is
+        selected as (assigned_timestamp, priority, create_timestamp).
+        """
+        if not pending_row:
+            # no pending step pending_row exists, the slot is blocked and the enqueued timestamp is None
             return ConcurrencyClaimStatus(
                 concurrency_key=concurrency_key,
-                slot_status=(
-                    ConcurrencySlotStatus.CLAIMED
-                    if slot_row and slot_row[0]
-                    else ConcurrencySlotStatus.BLOCKED
-                ),
-                priority=priority,
-                assigned_timestamp=assigned_timestamp,
-                enqueued_timestamp=create_timestamp,
-            )
+                slot_status=ConcurrencySlotStatus.BLOCKED,
+                priority=None,
+                assigned_timestamp=None,
+                enqueued_timestamp=None,
+            )
+
+        priority = cast(int, pending_row[1]) if pending_row[1] else None
+        assigned_timestamp = cast(datetime, pending_row[0]) if pending_row[0] else None
+        create_timestamp = cast(datetime, pending_row[2]) if pending_row[2] else None
+        return ConcurrencyClaimStatus(
+            concurrency_key=concurrency_key,
+            slot_status=(
+                ConcurrencySlotStatus.CLAIMED
+                if assigned_timestamp is not None and has_claimed_slot
+                else ConcurrencySlotStatus.BLOCKED
+            ),
+            priority=priority,
+            assigned_timestamp=assigned_timestamp,
+            enqueued_timestamp=create_timestamp,
+        )
 
     def can_claim_from_pending(self, concurrency_key: str, run_id: str, step_key: str):
         with self.index_connection() as conn:
@@ -2466,8 +2926,9 @@ def assign_pending_steps(self, concurrency_keys: Sequence[str]):
             return
 
         with self.index_connection() as conn:
-            for key in concurrency_keys:
-                row = conn.execute(
+            # assign the highest priority unassigned steps, one per occurrence of the key
+            for key, count in Counter(concurrency_keys).items():
+                rows = conn.execute(
                     db_select([PendingStepsTable.c.id])
                     .where(
                         db.and_(
@@ -2478,13 +2939,14 @@ def assign_pending_steps(self, concurrency_keys: Sequence[str]):
                     .order_by(
                         PendingStepsTable.c.priority.desc(),
                         PendingStepsTable.c.create_timestamp.asc(),
+                        PendingStepsTable.c.id.asc(),
                     )
-                    .limit(1)
-                ).fetchone()
-                if row:
+                    .limit(count)
+                ).fetchall()
+                if rows:
                     conn.execute(
                         PendingStepsTable.update()
-                        .where(PendingStepsTable.c.id == row[0])
+                        .where(PendingStepsTable.c.id.in_([row[0] for row in rows]))
                         .values(assigned_timestamp=db.func.now())
                     )
 
@@ -2599,29 +3061,197 @@ def _claim_concurrency_slot(
             step_key (str): The step key to claim a slot for.
         """
         with self.index_connection() as conn:
-            result = conn.execute(
-                db_select([ConcurrencySlotsTable.c.id])
-                .select_from(ConcurrencySlotsTable)
+            if self._claim_free_concurrency_slot(conn, concurrency_key, run_id, step_key):
+                return ConcurrencySlotStatus.CLAIMED
+            return ConcurrencySlotStatus.BLOCKED
+
+    def _claim_free_concurrency_slot(
+        self, conn: Connection, concurrency_key: str, run_id: str, step_key: str
+    ) -> bool:
+        """Assigns an unclaimed slot for the concurrency key to the step, returning whether a slot
+        was claimed. Storages that can find and claim the slot in a single statement override this.
+        """
+        result = conn.execute(
+            db_select([ConcurrencySlotsTable.c.id])
+            .select_from(ConcurrencySlotsTable)
+            .where(
+                db.and_(
+                    ConcurrencySlotsTable.c.concurrency_key == concurrency_key,
+                    ConcurrencySlotsTable.c.step_key == None,  # noqa: E711
+                    ConcurrencySlotsTable.c.deleted == False,  # noqa: E712
+                )
+            )
+            .with_for_update(skip_locked=True)
+            .limit(1)
+        ).fetchone()
+        if not result or not result[0]:
+            return False
+        return bool(
+            conn.execute(
+                ConcurrencySlotsTable.update()
+                .values(run_id=run_id, step_key=step_key)
+                .where(ConcurrencySlotsTable.c.id == result[0])
+            ).rowcount
+        )
+
+    def claim_concurrency_slots(
+        self, run_id: str, claims: Sequence[ConcurrencySlotClaim]
+    ) -> Sequence[ConcurrencyClaimStatus]:
+        """Claim concurrency slots for many steps of a run at once. Has the same effect as calling
+        `claim_concurrency_slot` for each claim in order, but with a fixed number of queries per
+        batch of steps, plus one statement for each step that is able to claim a slot.
+        """
+        if len(claims) > CONCURRENCY_CLAIM_BATCH_SIZE:
+            return [
+                status
+                for i in range(0, len(claims), CONCURRENCY_CLAIM_BATCH_SIZE)
+                for status in self.claim_concurrency_slots(
+                    run_id, claims[i : i + CONCURRENCY_CLAIM_BATCH_SIZE]
+                )
+            ]
+
+        if not claims:
+            return []
+
+        step_keys = [claim.step_key for claim in claims]
+        pending_rows = self._get_pending_step_rows(run_id, step_keys)
+
+        # register the steps that are not yet in the pending queue
+        new_claims = [
+            claim for claim in claims if (claim.concurrency_key, claim.step_key) not in pending_rows
+        ]
+        if new_claims:
+            self._add_pending_steps(run_id, new_claims)
+            pending_rows = self._get_pending_step_rows(run_id, step_keys)
+
+        with self.index_connection() as conn:
+            claimed_slots = {
+                (cast(str, row[0]), cast(str, row[1]))
+                for row in conn.execute(
+                    db_select(
+                        [ConcurrencySlotsTable.c.concurrency_key, ConcurrencySlotsTable.c.step_key]
+                    ).where(
+                        db.and_(
+                            ConcurrencySlotsTable.c.run_id == run_id,
+                            ConcurrencySlotsTable.c.step_key.in_(step_keys),
+                        )
+                    )
+                ).fetchall()
+            }
+
+            claim_statuses = []
+            for claim in claims:
+                claim_key = (claim.concurrency_key, claim.step_key)
+                claim_status = self._build_concurrency_claim_status(
+                    claim.concurrency_key,
+                    pending_rows.get(claim_key),
+                    has_claimed_slot=claim_key in claimed_slots,
+                )
+                if claim_status.is_assigned and not claim_status.is_claimed:
+                    # the step has been popped off the queue, so attempt to claim a slot
+                    claim_status = claim_status.with_slot_status(
+                        ConcurrencySlotStatus.CLAIMED
+                        if self._claim_free_concurrency_slot(
+                            conn, claim.concurrency_key, run_id, claim.step_key
+                        )
+                        else ConcurrencySlotStatus.BLOCKED
+                    )
+                claim_statuses.append(claim_status)
+
+        return claim_statuses
+
+    def _get_pending_step_rows(
+        self, run_id: str, step_keys: Sequence[str]
+    ) -> Mapping[Tuple[str, str], Any]:
+        with self.index_connection() as conn:
+            rows = conn.execute(
+                db_select(
+                    [
+                        PendingStepsTable.c.concurrency_key,
+                        PendingStepsTable.c.step_key,
+                        PendingStepsTable.c.assigned_timestamp,
+                        PendingStepsTable.c.priority,
+                        PendingStepsTable.c.create_timestamp,
+                    ]
+                ).where(
+                    db.and_(
+                        PendingStepsTable.c.run_id == run_id,
+                        PendingStepsTable.c.step_key.in_(step_keys),
+                    )
+                )
+            ).fetchall()
+        return {(cast(str, row[0]), cast(str, row[1])): row[2:] for row in rows}
+
+    def _add_pending_steps(self, run_id: str, claims: Sequence[ConcurrencySlotClaim]) -> None:
+        """Adds the steps to the pending queue, assigning each one a slot if its concurrency key has
+        unassigned slots at the time that it is added, in the order of the given claims.
+        """
+        concurrency_keys = {claim.concurrency_key for claim in claims}
+        with self.index_connection() as conn:
+            slot_counts = conn.execute(
+                db_select([ConcurrencySlotsTable.c.concurrency_key, db.func.count()])
                 .where(
                     db.and_(
-                        ConcurrencySlotsTable.c.concurrency_key == concurrency_key,
-                        ConcurrencySlotsTable.c.step_key == None,  # noqa: E711
+                        ConcurrencySlotsTable.c.concurrency_key.in_(concurrency_keys),
                         ConcurrencySlotsTable.c.deleted == False,  # noqa: E712
                     )
                 )
-                .with_for_update(skip_locked=True)
-                .limit(1)
-            ).fetchone()
-            if not result or not result[0]:
-                return ConcurrencySlotStatus.BLOCKED
-            if not conn.execute(
-                ConcurrencySlotsTable.update()
-                .values(run_id=run_id, step_key=step_key)
-                .where(ConcurrencySlotsTable.c.id == result[0])
-            ).rowcount:
-                return ConcurrencySlotStatus.BLOCKED
+                .group_by(ConcurrencySlotsTable.c.concurrency_key)
+            ).fetchall()
+            assigned_counts = conn.execute(
+                db_select([PendingStepsTable.c.concurrency_key, db.func.count()])
+                .where(
+                    db.and_(
+                        PendingStepsTable.c.concurrency_key.in_(concurrency_keys),
+                        PendingStepsTable.c.assigned_timestamp != None,  # noqa: E711
+                    )
+                )
+                .group_by(PendingStepsTable.c.concurrency_key)
+            ).fetchall()
 
-            return ConcurrencySlotStatus.CLAIMED
+        unassigned_slot_counts: Dict[str, int] = defaultdict(int)
+        for key, count in slot_counts:
+            unassigned_slot_counts[key] += count
+        for key, count in assigned_counts:
+            unassigned_slot_counts[key] -= count
+
+        should_assign_by_step_key = {}
+        for claim in claims:
+            should_assign = unassigned_slot_counts[claim.concurrency_key] > 0
+            if should_assign:
+                unassigned_slot_counts[claim.concurrency_key] -= 1
+            should_assign_by_step_key[claim.step_key] = should_assign
+
+        try:
+            with self.index_connection() as conn:
+                conn.execute(
+                    PendingStepsTable.insert().values(
+                        [
+                            dict(
+                                run_id=run_id,
+                                step_key=claim.step_key,
+                                concurrency_key=claim.concurrency_key,
+                                priority=claim.priority or 0,
+                                assigned_timestamp=(
+                                    db.func.now()
+                                    if should_assign_by_step_key[claim.step_key]
+                                    else None
+                                ),
+                            )
+                            for claim in claims
+                        ]
+                    )
+                )
+        except db_exc.IntegrityError:
+            # some of the steps were concurrently added, fall back to adding them one at a time
+            for claim in claims:
+                self.add_pending_step(
+                    concurrency_key=claim.concurrency_key,
+                    run_id=run_id,
+                    step_key=claim.step_key,
+                    priority=claim.priority,
+                    should_assign=should_assign_by_step_key[claim.step_key],
+                )
 
     def get_concurrency_keys(self) -> Set[str]:
         self._reconcile_concurrency_limits_from_slots()
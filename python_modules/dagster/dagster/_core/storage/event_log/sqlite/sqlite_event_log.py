@@ -35,6 +35,8 @@
 from dagster._core.storage.dagster_run import DagsterRunStatus, RunsFilter
 from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventRecordsFilter
 from dagster._core.storage.event_log.schema import (
+    RunStatsTable,
+    RunStepStatsTable,
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
 )
@@ -118,7 +120,8 @@ def upgrade(self) -> None:
         alembic_config = get_alembic_config(__file__)
         if all_run_ids:
             for run_id in tqdm(all_run_ids):
-                with self.run_connection(run_id) as conn:
+                # the run stats tables are built once the shard has been migrated
+                with self._connect(run_id, init_run_stats_tables=False) as conn:
                     run_alembic_upgrade(alembic_config, conn, run_id)
 
         print("Updating event log storage for index db on disk...")  # noqa: T201
@@ -205,7 +208,7 @@ def _initdb(self, engine: Engine) -> None:
                     retry_limit -= 1
 
     @contextmanager
-    def _connect(self, shard: str) -> Iterator[Connection]:
+    def _connect(self, shard: str, init_run_stats_tables: bool = True) -> Iterator[Connection]:
         with self._db_lock:
             check.str_param(shard, "shard")
 
@@ -214,6 +217,12 @@ def _connect(self, shard: str) -> Iterator[Connection]:
 
             if shard not in self._initialized_dbs:
                 self._initdb(engine)
+                if (
+                    init_run_stats_tables
+                    and shard != INDEX_SHARD_NAME
+                    and self.has_run_stats_tables
+                ):
+                    self._init_run_stats_tables(engine, shard)
                 self._initialized_dbs.add(shard)
 
             with engine.connect() as conn:
@@ -221,6 +230,20 @@ def _connect(self, shard: str) -> Iterator[Connection]:
                     yield conn
             engine.dispose()
 
+    def _init_run_stats_tables(self, engine: Engine, run_id: str) -> None:
+        # Run shards created before the run stats tables were added have their tables created and
+        # built from the events of the run. Building the tables always writes a row for the run, so
+        # a missing row means that the shard has not been built yet.
+        with engine.connect() as conn:
+            with conn.begin():
+                RunStatsTable.create(conn, checkfirst=True)
+                RunStepStatsTable.create(conn, checkfirst=True)
+                built = conn.execute(
+                    db_select([1]).where(RunStatsTable.c.run_id == run_id).limit(1)
+                ).fetchall()
+                if not built:
+                    self._rebuild_run_stats(conn, run_id)
+
     def run_connection(self, run_id: Optional[str] = None) -> Any:
         return self._connect(run_id)  # type: ignore  # bad sig
 
@@ -240,6 +263,7 @@ def store_event(self, event: EventLogEntry) -> None:
 
         with self.run_connection(run_id) as conn:
             conn.execute(insert_event_statement)
+            self.update_run_stats(conn, [event])
 
         if event.is_dagster_event and event.dagster_event.asset_key:  # type: ignore
             check.invariant(
@@ -514,8 +538,13 @@ def __init__(
         self._run_id = check.str_param(run_id, "run_id")
         self._cb = check.callable_param(callback, "callback")
         self._log_path = event_log_storage.path_for_shard(run_id)
+        # in WAL mode, new events are written to the write-ahead log, and only reach the db file
+        # itself when the log is checkpointed
+        self._wal_path = f"{self._log_path}-wal"
         self._cursor = cursor
-        super(SqliteEventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
+        super(SqliteEventLogStorageWatchdog, self).__init__(
+            patterns=[self._log_path, self._wal_path], **kwargs
+        )
 
     def _process_log(self) -> None:
         connection = self._event_log_storage.get_records_for_run(self._run_id, self._cursor)
@@ -538,5 +567,5 @@ def _process_log(self) -> None:
                 self._event_log_storage.end_watch(self._run_id, self._cb)
 
     def on_modified(self, event: FileSystemEvent) -> None:
-        check.invariant(event.src_path == self._log_path)
+        check.invariant(event.src_path in (self._log_path, self._wal_path))
         self._process_log()
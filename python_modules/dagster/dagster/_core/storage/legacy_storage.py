@@ -25,7 +25,11 @@
 from dagster._core.storage.schedules.base import ScheduleStorage
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._utils import PrintFn
-from dagster._utils.concurrency import ConcurrencyClaimStatus, ConcurrencyKeyInfo
+from dagster._utils.concurrency import (
+    ConcurrencyClaimStatus,
+    ConcurrencyKeyInfo,
+    ConcurrencySlotClaim,
+)
 
 if TYPE_CHECKING:
     from dagster._core.definitions.asset_check_spec import AssetCheckKey
@@ -341,6 +345,11 @@ def get_cursor_values(self, keys: Set[str]) -> Mapping[str, str]:
     def set_cursor_values(self, pairs: Mapping[str, str]) -> None:
         return self._storage.run_storage.set_cursor_values(pairs)
 
+    def compare_and_set_cursor_value(
+        self, key: str, expected_value: Optional[str], value: str
+    ) -> bool:
+        return self._storage.run_storage.compare_and_set_cursor_value(key, expected_value, value)
+
     def replace_job_origin(self, run: "DagsterRun", job_origin: "RemoteJobOrigin") -> None:
         return self._storage.run_storage.replace_job_origin(run, job_origin)
 
@@ -666,6 +675,11 @@ def check_concurrency_claim(self, concurrency_key: str, run_id: str, step_key: s
             concurrency_key, run_id, step_key
         )
 
+    def claim_concurrency_slots(
+        self, run_id: str, claims: Sequence[ConcurrencySlotClaim]
+    ) -> Sequence[ConcurrencyClaimStatus]:
+        return self._storage.event_log_storage.claim_concurrency_slots(run_id, claims)
+
     def get_concurrency_run_ids(self) -> Set[str]:
         return self._storage.event_log_storage.get_concurrency_run_ids()
 
@@ -0,0 +1,15 @@
+import threading
+
+_local = threading.local()
+
+
+def increment_storage_query_count() -> None:
+    """Records that the current thread has issued a query against storage."""
+    _local.count = getattr(_local, "count", 0) + 1
+
+
+def get_storage_query_count() -> int:
+    """Returns the number of storage queries that have been issued by the current thread. The
+    difference between two calls gives the number of queries issued by the code in between them.
+    """
+    return getattr(_local, "count", 0)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Dict, Mapping, Optional, Sequence, Set, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Mapping, NamedTuple, Optional, Sequence, Set, Tuple, Union
 
 from typing_extensions import TypedDict
 
@@ -30,6 +30,17 @@ class RunGroupInfo(TypedDict):
     runs: Sequence[DagsterRun]
 
 
+class QueuedRunsResult(NamedTuple):
+    """Return value for a query fetching a page of queued runs from the run queue. Contains the
+    runs in dequeue order, a cursor string for fetching the next page, and a boolean indicating
+    whether there are more runs to fetch.
+    """
+
+    runs: Sequence[DagsterRun]
+    cursor: Optional[str]
+    has_more: bool
+
+
 class RunStorage(ABC, MayHaveInstanceWeakref[T_DagsterInstance], DaemonCursorStorage):
     """Abstract base class for storing pipeline run history.
 
@@ -326,6 +337,30 @@ def supports_bucket_queries(self) -> bool:
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         """Get run partition data for a given partitioned job."""
 
+    @property
+    def supports_queued_run_index(self) -> bool:
+        return False
+
+    def get_queued_runs(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> QueuedRunsResult:
+        """Get a page of queued runs, in the order in which they should be considered for
+        dequeuing: by descending priority, then in the order in which they were queued. Only
+        available when `supports_queued_run_index` is True.
+
+        Args:
+            cursor (Optional[str]): The cursor returned by the previous page of results.
+            limit (Optional[int]): The maximum number of runs to return.
+        """
+        raise NotImplementedError()
+
+    def reconcile_queued_runs(self) -> Sequence[str]:
+        """Add any QUEUED runs that are missing from the run queue, e.g. runs that were queued by a
+        process that had not yet seen the queue index get built. Returns the ids of the runs that
+        were added. Only available when `supports_queued_run_index` is True.
+        """
+        raise NotImplementedError()
+
     def migrate(self, print_fn: Optional[PrintFn] = None, force_rebuild_all: bool = False) -> None:
         """Call this method to run any required data migrations."""
 
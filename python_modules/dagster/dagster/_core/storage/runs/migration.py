@@ -11,9 +11,19 @@
 from dagster._core.execution.job_backfill import PartitionBackfill
 from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunRecord
 from dagster._core.storage.runs.base import RunStorage
-from dagster._core.storage.runs.schema import BulkActionsTable, RunsTable, RunTagsTable
+from dagster._core.storage.runs.schema import (
+    BulkActionsTable,
+    QueuedRunsTable,
+    RunsTable,
+    RunTagsTable,
+)
 from dagster._core.storage.sqlalchemy_compat import db_select
-from dagster._core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG, REPOSITORY_LABEL_TAG
+from dagster._core.storage.tags import (
+    PARTITION_NAME_TAG,
+    PARTITION_SET_TAG,
+    REPOSITORY_LABEL_TAG,
+    get_run_priority,
+)
 from dagster._serdes import deserialize_value
 
 RUN_PARTITIONS = "run_partitions"
@@ -22,6 +32,7 @@
 )
 RUN_REPO_LABEL_TAGS = "run_repo_label_tags"
 BULK_ACTION_TYPES = "bulk_action_types"
+QUEUED_RUNS = "queued_runs"
 
 PrintFn: TypeAlias = Callable[[Any], None]
 MigrationFn: TypeAlias = Callable[[RunStorage, Optional[PrintFn]], None]
@@ -31,6 +42,7 @@
     RUN_PARTITIONS: lambda: migrate_run_partition,
     RUN_REPO_LABEL_TAGS: lambda: migrate_run_repo_tags,
     BULK_ACTION_TYPES: lambda: migrate_bulk_actions,
+    QUEUED_RUNS: lambda: migrate_queued_runs,
 }
 # for `dagster instance reindex`, optionally run for better read performance
 OPTIONAL_DATA_MIGRATIONS: Final[Mapping[str, Callable[[], MigrationFn]]] = {
@@ -259,3 +271,52 @@ def migrate_bulk_actions(run_storage: RunStorage, print_fn: Optional[PrintFn] =
                     .where(BulkActionsTable.c.id == storage_id)
                 )
                 cursor = storage_id
+
+
+def migrate_queued_runs(run_storage: RunStorage, print_fn: Optional[PrintFn] = None) -> None:
+    from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+
+    if not isinstance(run_storage, SqlRunStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying run storage.")
+
+    base_query = (
+        db_select([RunsTable.c.run_body, RunsTable.c.id])
+        .where(RunsTable.c.status == DagsterRunStatus.QUEUED.value)
+        .order_by(db.asc(RunsTable.c.id))
+        .limit(CHUNK_SIZE)
+    )
+
+    cursor = None
+    has_more = True
+    while has_more:
+        if cursor:
+            query = base_query.where(RunsTable.c.id > cursor)
+        else:
+            query = base_query
+
+        with run_storage.connect() as conn:
+            result_proxy = conn.execute(query)
+            rows = result_proxy.fetchall()
+            result_proxy.close()
+
+            has_more = len(rows) >= CHUNK_SIZE
+            for row in rows:
+                run = deserialize_value(cast(str, row[0]), DagsterRun)
+                cursor = row[1]
+                write_queued_run(conn, run)
+
+
+def write_queued_run(conn: Connection, run: DagsterRun) -> None:
+    try:
+        conn.execute(
+            QueuedRunsTable.insert().values(
+                run_id=run.run_id,
+                priority=get_run_priority(run.tags),
+            )
+        )
+    except db_exc.IntegrityError:
+        # run is already queued, swallow
+        pass
@@ -122,6 +122,23 @@
     db.Column("selector_id", db.Text),
 )
 
+# Queued runs, in the order that the run queue should consider them. Rows are added when a run
+# enters the QUEUED status and removed when it leaves it, so the run coordinator can page through
+# the queue by priority without scanning and sorting every queued run. Runs with the same priority
+# are dequeued in the order that their rows were added.
+QueuedRunsTable = db.Table(
+    "queued_runs",
+    RunStorageSqlMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), unique=True, nullable=False),
+    db.Column("priority", db.Integer, nullable=False, default=0),
+)
+
 InstanceInfo = db.Table(
     "instance_info",
     RunStorageSqlMetadata,
@@ -176,4 +193,5 @@
         "create_timestamp": 8,
     },
 )
+db.Index("idx_queued_runs_priority", QueuedRunsTable.c.priority, QueuedRunsTable.c.id)
 db.Index("idx_kvs_keys_unique", KeyValueStoreTable.c.key, unique=True, mysql_length=64)
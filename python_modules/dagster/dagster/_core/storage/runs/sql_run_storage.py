@@ -1,4 +1,6 @@
 import logging
+import os
+import re
 import uuid
 import zlib
 from abc import abstractmethod
@@ -6,6 +8,7 @@
 from datetime import datetime
 from enum import Enum
 from typing import (
+    AbstractSet,
     Any,
     Callable,
     ContextManager,
@@ -26,6 +29,8 @@
 from sqlalchemy.engine import Connection
 
 import dagster._check as check
+import dagster._seven as seven
+from dagster._config import ConfigTypeSnap
 from dagster._core.errors import (
     DagsterInvariantViolationError,
     DagsterRunAlreadyExists,
@@ -46,6 +51,10 @@
     create_execution_plan_snapshot_id,
     create_job_snapshot_id,
 )
+from dagster._core.snap.dagster_types import DagsterTypeSnap
+from dagster._core.snap.dep_snapshot import NodeInvocationSnap
+from dagster._core.snap.execution_plan_snapshot import ExecutionStepSnap
+from dagster._core.snap.node import GraphDefSnap, OpDefSnap
 from dagster._core.storage.dagster_run import (
     DagsterRun,
     DagsterRunStatus,
@@ -55,18 +64,21 @@
     RunsFilter,
     TagBucket,
 )
-from dagster._core.storage.runs.base import RunStorage
+from dagster._core.storage.runs.base import QueuedRunsResult, RunStorage
 from dagster._core.storage.runs.migration import (
     OPTIONAL_DATA_MIGRATIONS,
+    QUEUED_RUNS,
     REQUIRED_DATA_MIGRATIONS,
     RUN_PARTITIONS,
     MigrationFn,
+    write_queued_run,
 )
 from dagster._core.storage.runs.schema import (
     BulkActionsTable,
     DaemonHeartbeatsTable,
     InstanceInfo,
     KeyValueStoreTable,
+    QueuedRunsTable,
     RunsTable,
     RunTagsTable,
     SecondaryIndexMigrationTable,
@@ -83,13 +95,20 @@
     BACKFILL_ID_TAG,
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
     RUN_FAILURE_REASON_TAG,
+    get_run_priority,
 )
 from dagster._daemon.types import DaemonHeartbeat
-from dagster._serdes import deserialize_value, serialize_value
-from dagster._serdes.serdes import deserialize_values
+from dagster._serdes import deserialize_value, pack_value, serialize_value, serialize_value_to_bytes
+from dagster._serdes.serdes import (
+    deserialize_values,
+    get_serdes_storage_name,
+    is_binary_serialized_value,
+)
+from dagster._serdes.utils import hash_str
 from dagster._seven import JSONDecodeError
 from dagster._time import datetime_from_timestamp, get_current_datetime, utc_datetime_from_naive
 from dagster._utils import PrintFn
@@ -99,6 +118,202 @@
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
     EXECUTION_PLAN = "EXECUTION_PLAN"
+    # a sub-object of a deduplicated job or execution plan snapshot
+    CHUNK = "CHUNK"
+
+
+def _binary_snapshots_enabled() -> bool:
+    # Snapshot bodies written in the binary serdes format can only be read by dagster versions
+    # that understand it, so this is opt-in.
+    return str(os.getenv("DAGSTER_RUN_STORAGE_BINARY_SNAPSHOTS")).lower() in ("1", "true", "t")
+
+
+def _deduplicated_snapshots_enabled() -> bool:
+    # Deduplicated snapshot bodies reference chunk rows that older dagster versions can not
+    # resolve, so this is opt-in.
+    return str(os.getenv("DAGSTER_RUN_STORAGE_DEDUPLICATED_SNAPSHOTS")).lower() in (
+        "1",
+        "true",
+        "t",
+    )
+
+
+def _zstd_snapshots_enabled() -> bool:
+    # Readers need the zstandard package and a dagster version that detects zstd frames, so this is
+    # opt-in.
+    return str(os.getenv("DAGSTER_RUN_STORAGE_ZSTD_SNAPSHOTS")).lower() in ("1", "true", "t")
+
+
+# Every zstd frame starts with this magic number, while a zlib stream starts with 0x78, so readers
+# can tell the two codecs apart.
+ZSTD_FRAME_MAGIC = b"\x28\xb5\x2f\xfd"
+SNAPSHOT_ZSTD_LEVEL = 10
+
+# Prefix of (decompressed) deduplicated snapshot bodies. A NUL byte can never start a JSON
+# document, and this is distinct from the binary serdes format marker.
+DEDUPLICATED_SNAPSHOT_MARKER = b"\x00dgsdedup1"
+
+# Lists and mappings of these snapshot sub-objects are stored as content-addressed chunk rows when
+# snapshots are deduplicated. They make up most of the size of a snapshot, and most of them are
+# unchanged between two versions of the same job.
+DEDUPLICATED_SNAPSHOT_CLASSES = (
+    ConfigTypeSnap,
+    DagsterTypeSnap,
+    ExecutionStepSnap,
+    GraphDefSnap,
+    NodeInvocationSnap,
+    OpDefSnap,
+)
+
+# Average number of items per chunk. Chunk boundaries are placed after items whose hash is a
+# multiple of this, so that changing, adding or removing an item only changes the chunk it is in.
+# Single items compress poorly and cost a chunk reference each, so chunks hold runs of items.
+SNAPSHOT_CHUNK_TARGET_ITEMS = 16
+SNAPSHOT_CHUNK_BATCH_SIZE = 500
+
+# A list or mapping in the body of a deduplicated snapshot is replaced by a string referencing the
+# chunks that hold its items. json.dumps escapes the NUL byte, hence the `\\u0000`.
+_SNAPSHOT_CHUNKS_REF_PREFIX = "\x00snapshot_chunks:"
+_SNAPSHOT_CHUNKS_REF_RE = re.compile(r'"\\u0000snapshot_chunks:(list|dict):([0-9a-f,]+)"')
+
+
+def compress_snapshot_body(body: bytes) -> bytes:
+    if _zstd_snapshots_enabled():
+        return _import_zstandard().ZstdCompressor(level=SNAPSHOT_ZSTD_LEVEL).compress(body)
+    return zlib.compress(body)
+
+
+def decompress_snapshot_body(body: bytes) -> bytes:
+    if body.startswith(ZSTD_FRAME_MAGIC):
+        return _import_zstandard().ZstdDecompressor().decompress(body)
+    return zlib.decompress(body)
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise DagsterInvariantViolationError(
+            "Reading or writing zstd compressed snapshots requires the zstandard package. Install"
+            " it with `pip install dagster[zstd]`."
+        ) from e
+    return zstandard
+
+
+def serialize_snapshot_body(snapshot_obj: Union[JobSnap, ExecutionPlanSnapshot]) -> bytes:
+    if _binary_snapshots_enabled():
+        return compress_snapshot_body(serialize_value_to_bytes(snapshot_obj))
+    return compress_snapshot_body(serialize_value(snapshot_obj).encode("utf-8"))
+
+
+def serialize_deduplicated_snapshot_body(
+    snapshot_obj: Union[JobSnap, ExecutionPlanSnapshot],
+) -> Tuple[bytes, Mapping[str, bytes]]:
+    """Split a snapshot into a body and the chunks it references.
+
+    Each list or mapping of `DEDUPLICATED_SNAPSHOT_CLASSES` objects in the packed snapshot is split
+    into content-defined chunks of JSON text, keyed by their hash, and replaced by a reference to
+    those chunks. Chunks that are shared between snapshots are then only stored once.
+
+    Returns the compressed body and a mapping of chunk id to compressed chunk body.
+    """
+    chunk_storage_names = {
+        get_serdes_storage_name(klass) for klass in DEDUPLICATED_SNAPSHOT_CLASSES
+    }
+    chunks: Dict[str, bytes] = {}
+
+    def _is_chunkable(items: Iterable[Any]) -> bool:
+        return all(
+            isinstance(item, dict) and item.get("__class__") in chunk_storage_names
+            for item in items
+        )
+
+    def _chunk_items(kind: str, item_jsons: Sequence[str]) -> str:
+        chunk_ids = []
+        chunk_items = []
+        for i, item_json in enumerate(item_jsons):
+            chunk_items.append(item_json)
+            if (
+                int(hash_str(item_json)[:8], 16) % SNAPSHOT_CHUNK_TARGET_ITEMS == 0
+                or i == len(item_jsons) - 1
+            ):
+                chunk_json = ", ".join(chunk_items)
+                chunk_id = hash_str(chunk_json)
+                if chunk_id not in chunks:
+                    chunks[chunk_id] = compress_snapshot_body(chunk_json.encode("utf-8"))
+                chunk_ids.append(chunk_id)
+                chunk_items = []
+        return f"{_SNAPSHOT_CHUNKS_REF_PREFIX}{kind}:{','.join(chunk_ids)}"
+
+    def _extract_chunks(value: Any) -> Any:
+        if isinstance(value, list):
+            items = [_extract_chunks(item) for item in value]
+            if items and _is_chunkable(items):
+                return _chunk_items("list", [seven.json.dumps(item) for item in items])
+            return items
+
+        if isinstance(value, dict):
+            items = {key: _extract_chunks(item) for key, item in value.items()}
+            if items and _is_chunkable(items.values()):
+                return _chunk_items(
+                    "dict",
+                    [
+                        f"{seven.json.dumps(key)}: {seven.json.dumps(item)}"
+                        for key, item in items.items()
+                    ],
+                )
+            return items
+
+        return value
+
+    body_json = seven.json.dumps(_extract_chunks(pack_value(snapshot_obj)))
+    return (
+        compress_snapshot_body(DEDUPLICATED_SNAPSHOT_MARKER + body_json.encode("utf-8")),
+        chunks,
+    )
+
+
+def _resolve_snapshot_chunk_refs(
+    body_json: str, load_snapshot_chunks: Callable[[AbstractSet[str]], Mapping[str, bytes]]
+) -> str:
+    """Replace the chunk references in the JSON of a deduplicated snapshot body with the JSON of
+    the items they reference, loading chunks in one call per level of nesting.
+    """
+
+    def _get_chunk_ids(value_json: str) -> Set[str]:
+        return {
+            chunk_id
+            for _, chunk_ids in _SNAPSHOT_CHUNKS_REF_RE.findall(value_json)
+            for chunk_id in chunk_ids.split(",")
+        }
+
+    chunks: Dict[str, str] = {}
+    chunk_ids = _get_chunk_ids(body_json)
+    while chunk_ids:
+        loaded_chunks = load_snapshot_chunks(chunk_ids)
+        missing_chunk_ids = chunk_ids - loaded_chunks.keys()
+        if missing_chunk_ids:
+            raise DagsterSnapshotDoesNotExist(
+                f"Snapshot chunks {sorted(missing_chunk_ids)} do not exist in the run storage."
+            )
+
+        for chunk_id, chunk_body in loaded_chunks.items():
+            chunks[chunk_id] = decompress_snapshot_body(chunk_body).decode("utf-8")
+
+        chunk_ids = (
+            set().union(*(_get_chunk_ids(chunks[chunk_id]) for chunk_id in loaded_chunks))
+            - chunks.keys()
+        )
+
+    def _replace_ref(match: "re.Match[str]") -> str:
+        kind, chunk_ids = match.groups()
+        items_json = ", ".join(
+            _SNAPSHOT_CHUNKS_REF_RE.sub(_replace_ref, chunks[chunk_id])
+            for chunk_id in chunk_ids.split(",")
+        )
+        return f"[{items_json}]" if kind == "list" else f"{{{items_json}}}"
+
+    return _SNAPSHOT_CHUNKS_REF_RE.sub(_replace_ref, body_json)
 
 
 class SqlRunStorage(RunStorage):
@@ -146,12 +361,18 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
             partition=partition,
             partition_set=partition_set,
         )
+        should_enqueue = dagster_run.status == DagsterRunStatus.QUEUED and self.has_built_index(
+            QUEUED_RUNS
+        )
         with self.connect() as conn:
             try:
                 conn.execute(runs_insert)
             except db_exc.IntegrityError as exc:
                 raise DagsterRunAlreadyExists from exc
 
+            if should_enqueue:
+                write_queued_run(conn, dagster_run)
+
             tags_to_insert = dagster_run.tags_for_storage()
             if tags_to_insert:
                 conn.execute(
@@ -198,6 +419,12 @@ def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
         }:
             kwargs["end_time"] = now.timestamp()
 
+        # keep the run queue in sync with runs entering and leaving the QUEUED status
+        is_queue_transition = (new_job_status == DagsterRunStatus.QUEUED) != (
+            run.status == DagsterRunStatus.QUEUED
+        )
+        update_queue = is_queue_transition and self.has_built_index(QUEUED_RUNS)
+
         with self.connect() as conn:
             conn.execute(
                 RunsTable.update()
@@ -210,6 +437,11 @@ def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
                 )
             )
 
+            if update_queue and new_job_status == DagsterRunStatus.QUEUED:
+                write_queued_run(conn, run)
+            elif update_queue:
+                conn.execute(QueuedRunsTable.delete().where(QueuedRunsTable.c.run_id == run_id))
+
         if event.event_type == DagsterEventType.PIPELINE_FAILURE and isinstance(
             event.event_specific_data, JobFailureData
         ):
@@ -381,6 +613,78 @@ def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         count = row["count"] if row else 0
         return count
 
+    @property
+    def supports_queued_run_index(self) -> bool:
+        return self.has_built_index(QUEUED_RUNS)
+
+    def get_queued_runs(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> QueuedRunsResult:
+        check.opt_str_param(cursor, "cursor")
+        check.opt_int_param(limit, "limit")
+
+        query = (
+            db_select(
+                [
+                    RunsTable.c.run_body,
+                    RunsTable.c.status,
+                    QueuedRunsTable.c.priority,
+                    QueuedRunsTable.c.id,
+                ]
+            )
+            .select_from(
+                QueuedRunsTable.join(RunsTable, QueuedRunsTable.c.run_id == RunsTable.c.run_id)
+            )
+            # guards against queue entries that were not removed by writers that predate the index
+            .where(RunsTable.c.status == DagsterRunStatus.QUEUED.value)
+            .order_by(QueuedRunsTable.c.priority.desc(), QueuedRunsTable.c.id.asc())
+        )
+        if cursor:
+            # the cursor is the (priority, id) of the last queue entry of the previous page, which
+            # remains a valid position in the queue even if that run has since been dequeued
+            cursor_priority, cursor_id = [int(part) for part in cursor.split(":")]
+            query = query.where(
+                db.or_(
+                    QueuedRunsTable.c.priority < cursor_priority,
+                    db.and_(
+                        QueuedRunsTable.c.priority == cursor_priority,
+                        QueuedRunsTable.c.id > cursor_id,
+                    ),
+                )
+            )
+        if limit:
+            query = query.limit(limit)
+
+        rows = self.fetchall(query)
+        last_row = rows[-1] if rows else None
+        return QueuedRunsResult(
+            runs=self._rows_to_runs(rows),
+            cursor=f"{last_row['priority']}:{last_row['id']}" if last_row else cursor,
+            has_more=limit is not None and len(rows) >= limit,
+        )
+
+    def reconcile_queued_runs(self) -> Sequence[str]:
+        query = (
+            db_select([RunsTable.c.run_body, RunsTable.c.status])
+            .select_from(
+                RunsTable.join(
+                    QueuedRunsTable,
+                    RunsTable.c.run_id == QueuedRunsTable.c.run_id,
+                    isouter=True,
+                )
+            )
+            .where(RunsTable.c.status == DagsterRunStatus.QUEUED.value)
+            .where(QueuedRunsTable.c.run_id == None)  # noqa: E711
+            .order_by(RunsTable.c.id.asc())
+        )
+        missing_runs = self._rows_to_runs(self.fetchall(query))
+        if missing_runs:
+            with self.connect() as conn:
+                for run in missing_runs:
+                    write_queued_run(conn, run)
+
+        return [run.run_id for run in missing_runs]
+
     def _get_run_by_id(self, run_id: str) -> Optional[DagsterRun]:
         check.str_param(run_id, "run_id")
 
@@ -478,6 +782,12 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
         partition = all_tags.get(PARTITION_NAME_TAG)
         partition_set = all_tags.get(PARTITION_SET_TAG)
 
+        update_queue_priority = (
+            PRIORITY_TAG in new_tags
+            and run.status == DagsterRunStatus.QUEUED
+            and self.has_built_index(QUEUED_RUNS)
+        )
+
         with self.connect() as conn:
             conn.execute(
                 RunsTable.update()
@@ -509,6 +819,13 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
                     [dict(run_id=run_id, key=tag, value=new_tags[tag]) for tag in added_tags],
                 )
 
+            if update_queue_priority:
+                conn.execute(
+                    QueuedRunsTable.update()
+                    .where(QueuedRunsTable.c.run_id == run_id)
+                    .values(priority=get_run_priority(all_tags))
+                )
+
     def get_run_group(self, run_id: str) -> Tuple[str, Sequence[DagsterRun]]:
         check.str_param(run_id, "run_id")
         dagster_run = self._get_run_by_id(run_id)
@@ -559,8 +876,11 @@ def has_run(self, run_id: str) -> bool:
     def delete_run(self, run_id: str) -> None:
         check.str_param(run_id, "run_id")
         query = db.delete(RunsTable).where(RunsTable.c.run_id == run_id)
+        remove_from_queue = self.has_built_index(QUEUED_RUNS)
         with self.connect() as conn:
             conn.execute(query)
+            if remove_from_queue:
+                conn.execute(QueuedRunsTable.delete().where(QueuedRunsTable.c.run_id == run_id))
 
     def has_job_snapshot(self, job_snapshot_id: str) -> bool:
         check.str_param(job_snapshot_id, "job_snapshot_id")
@@ -585,7 +905,7 @@ def get_job_snapshot(self, job_snapshot_id: str) -> JobSnap:
 
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> bool:
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
-        return bool(self.get_execution_plan_snapshot(execution_plan_snapshot_id))
+        return self._has_snapshot_id(execution_plan_snapshot_id)
 
     def add_execution_plan_snapshot(
         self, execution_plan_snapshot: ExecutionPlanSnapshot, snapshot_id: Optional[str] = None
@@ -611,10 +931,11 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
         check.not_none_param(snapshot_obj, "snapshot_obj")
         check.inst_param(snapshot_type, "snapshot_type", SnapshotType)
 
+        snapshot_body = self._serialize_snapshot_body(snapshot_obj)
         with self.connect() as conn:
             snapshot_insert = SnapshotsTable.insert().values(
                 snapshot_id=snapshot_id,
-                snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
+                snapshot_body=snapshot_body,
                 snapshot_type=snapshot_type.value,
             )
             try:
@@ -625,6 +946,74 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
 
             return snapshot_id
 
+    def _serialize_snapshot_body(
+        self, snapshot_obj: Union[JobSnap, ExecutionPlanSnapshot]
+    ) -> bytes:
+        """Serialize a snapshot for the snapshots table. When snapshots are deduplicated, this
+        stores the chunks the returned body references, so they exist before the body does.
+        """
+        if not _deduplicated_snapshots_enabled():
+            return serialize_snapshot_body(snapshot_obj)
+
+        snapshot_body, chunks = serialize_deduplicated_snapshot_body(snapshot_obj)
+        self._add_snapshot_chunks(chunks)
+        return snapshot_body
+
+    def _add_snapshot_chunks(self, chunks: Mapping[str, bytes]) -> None:
+        existing_chunk_ids = {
+            row["snapshot_id"]
+            for row in self._fetch_snapshot_rows(chunks.keys(), [SnapshotsTable.c.snapshot_id])
+        }
+        chunk_rows = [
+            dict(
+                snapshot_id=chunk_id,
+                snapshot_body=chunk_body,
+                snapshot_type=SnapshotType.CHUNK.value,
+            )
+            for chunk_id, chunk_body in chunks.items()
+            if chunk_id not in existing_chunk_ids
+        ]
+        if not chunk_rows:
+            return
+
+        try:
+            with self.connect() as conn:
+                conn.execute(SnapshotsTable.insert(), chunk_rows)
+            return
+        except db_exc.IntegrityError:
+            # some of the chunks were concurrently added by another snapshot
+            pass
+
+        for chunk_row in chunk_rows:
+            with self.connect() as conn:
+                try:
+                    conn.execute(SnapshotsTable.insert().values(**chunk_row))
+                except db_exc.IntegrityError:
+                    # on_conflict_do_nothing equivalent
+                    pass
+
+    def _get_snapshot_chunks(self, chunk_ids: AbstractSet[str]) -> Mapping[str, bytes]:
+        return {
+            row["snapshot_id"]: row["snapshot_body"]
+            for row in self._fetch_snapshot_rows(
+                chunk_ids, [SnapshotsTable.c.snapshot_id, SnapshotsTable.c.snapshot_body]
+            )
+        }
+
+    def _fetch_snapshot_rows(
+        self, snapshot_ids: Iterable[str], columns: Sequence[Any]
+    ) -> Sequence[Any]:
+        sorted_snapshot_ids = sorted(snapshot_ids)
+        rows = []
+        for i in range(0, len(sorted_snapshot_ids), SNAPSHOT_CHUNK_BATCH_SIZE):
+            query = db_select(columns).where(
+                SnapshotsTable.c.snapshot_id.in_(
+                    sorted_snapshot_ids[i : i + SNAPSHOT_CHUNK_BATCH_SIZE]
+                )
+            )
+            rows.extend(self.fetchall(query))
+        return rows
+
     def get_run_storage_id(self) -> str:
         query = db_select([InstanceInfo.c.run_storage_id])
         row = self.fetchone(query)
@@ -653,7 +1042,11 @@ def _get_snapshot(self, snapshot_id: str) -> Optional[JobSnap]:
         row = self.fetchone(query)
 
         return (
-            defensively_unpack_execution_plan_snapshot_query(logging, [row["snapshot_body"]])  # type: ignore
+            defensively_unpack_execution_plan_snapshot_query(  # type: ignore
+                logging,
+                [row["snapshot_body"]],
+                self._get_snapshot_chunks,
+            )
             if row
             else None
         )
@@ -784,6 +1177,10 @@ def has_run_stats_index_cols(self) -> bool:
             column_names = [x.get("name") for x in db.inspect(conn).get_columns(RunsTable.name)]
             return "start_time" in column_names and "end_time" in column_names
 
+    def has_queued_runs_table(self) -> bool:
+        with self.connect() as conn:
+            return QueuedRunsTable.name in db.inspect(conn).get_table_names()
+
     def has_bulk_actions_selector_cols(self) -> bool:
         with self.connect() as conn:
             column_names = [
@@ -832,6 +1229,8 @@ def wipe(self) -> None:
             conn.execute(SnapshotsTable.delete())
             conn.execute(DaemonHeartbeatsTable.delete())
             conn.execute(BulkActionsTable.delete())
+            if self.has_queued_runs_table():
+                conn.execute(QueuedRunsTable.delete())
 
     def wipe_daemon_heartbeats(self) -> None:
         with self.connect() as conn:
@@ -1041,6 +1440,34 @@ def set_cursor_values(self, pairs: Mapping[str, str]) -> None:
                     .values(value=db.sql.case(pairs, value=KeyValueStoreTable.c.key))
                 )
 
+    def compare_and_set_cursor_value(
+        self, key: str, expected_value: Optional[str], value: str
+    ) -> bool:
+        check.str_param(key, "key")
+        check.opt_str_param(expected_value, "expected_value")
+        check.str_param(value, "value")
+
+        with self.connect() as conn:
+            if expected_value is None:
+                try:
+                    conn.execute(KeyValueStoreTable.insert().values(key=key, value=value))
+                except db_exc.IntegrityError:
+                    # the key was set by someone else
+                    return False
+                return True
+
+            result = conn.execute(
+                KeyValueStoreTable.update()
+                .where(
+                    db.and_(
+                        KeyValueStoreTable.c.key == key,
+                        KeyValueStoreTable.c.value == expected_value,
+                    )
+                )
+                .values(value=value)
+            )
+            return result.rowcount == 1
+
     # Migrating run history
     def replace_job_origin(self, run: DagsterRun, job_origin: RemoteJobOrigin) -> None:
         new_label = job_origin.repository_origin.get_label()
@@ -1068,7 +1495,9 @@ def replace_job_origin(self, run: DagsterRun, job_origin: RemoteJobOrigin) -> No
 
 
 def defensively_unpack_execution_plan_snapshot_query(
-    logger: logging.Logger, row: Sequence[Any]
+    logger: logging.Logger,
+    row: Sequence[Any],
+    load_snapshot_chunks: Optional[Callable[[AbstractSet[str]], Mapping[str, bytes]]] = None,
 ) -> Optional[Union[ExecutionPlanSnapshot, JobSnap]]:
     # minimal checking here because sqlalchemy returns a different type based on what version of
     # SqlAlchemy you are using
@@ -1081,11 +1510,34 @@ def _warn(msg: str) -> None:
         return None
 
     try:
-        uncompressed_bytes = zlib.decompress(row[0])
-    except zlib.error:
+        uncompressed_bytes = decompress_snapshot_body(row[0])
+    except DagsterInvariantViolationError:
+        # zstd compressed body without the zstandard package installed
+        raise
+    except Exception:
         _warn("Could not decompress bytes stored in snapshot table.")
         return None
 
+    if uncompressed_bytes.startswith(DEDUPLICATED_SNAPSHOT_MARKER):
+        if load_snapshot_chunks is None:
+            _warn("Deduplicated snapshot stored in snapshot table, but chunks can not be loaded.")
+            return None
+        try:
+            uncompressed_bytes = _resolve_snapshot_chunk_refs(
+                uncompressed_bytes[len(DEDUPLICATED_SNAPSHOT_MARKER) :].decode("utf-8"),
+                load_snapshot_chunks,
+            ).encode("utf-8")
+        except DagsterSnapshotDoesNotExist:
+            _warn("Could not load chunks of deduplicated snapshot stored in snapshot table.")
+            return None
+
+    if is_binary_serialized_value(uncompressed_bytes):
+        try:
+            return deserialize_value(uncompressed_bytes, (ExecutionPlanSnapshot, JobSnap))
+        except ValueError:
+            _warn("Could not parse binary serialized value in snapshot table.")
+            return None
+
     try:
         decoded_str = uncompressed_bytes.decode("utf-8")
     except UnicodeDecodeError:
@@ -12,9 +12,22 @@
 from sqlalchemy.ext.compiler import compiles
 from typing_extensions import TypeAlias
 
+from dagster._core.storage.query_count import increment_storage_query_count
 from dagster._utils import file_relative_path
 
-create_engine = db.create_engine  # exported
+
+def _count_storage_query(*_args, **_kwargs) -> None:
+    increment_storage_query_count()
+
+
+def create_engine(*args, **kwargs) -> db.engine.Engine:
+    """Creates an engine for a dagster storage. Statements issued against it are counted, so that
+    the storage cost of a block of code can be measured with get_storage_query_count. Engines
+    created outside of dagster's storages are not affected.
+    """
+    engine = db.create_engine(*args, **kwargs)
+    db.event.listen(engine, "before_cursor_execute", _count_storage_query)
+    return engine
 
 
 ALEMBIC_SCRIPTS_LOCATION = "dagster:_core/storage/alembic"
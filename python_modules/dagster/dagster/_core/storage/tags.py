@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Mapping
 
 SYSTEM_TAG_PREFIX = "dagster/"
 HIDDEN_TAG_PREFIX = ".dagster/"
@@ -121,3 +122,13 @@ def get_tag_type(tag):
         return TagType.HIDDEN
     else:
         return TagType.USER_PROVIDED
+
+
+def get_run_priority(tags: Mapping[str, str]) -> int:
+    """Returns the priority of a run with the given tags. Runs with an unparseable priority tag
+    have the default priority of 0.
+    """
+    try:
+        return int(tags.get(PRIORITY_TAG, "0"))
+    except ValueError:
+        return 0
@@ -4,18 +4,21 @@
 import string
 import uuid
 import warnings
-from collections import OrderedDict, deque
+from collections import OrderedDict, defaultdict, deque
 from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
 from contextvars import copy_context
 from typing import (
     AbstractSet,
     Any,
     Callable,
+    Dict,
     Iterable,
     Iterator,
+    List,
     Mapping,
     Optional,
     Sequence,
+    Set,
     Tuple,
     TypedDict,
     TypeVar,
@@ -73,9 +76,46 @@ def coerce_valid_log_level(log_level: Union[str, int]) -> int:
 def toposort(
     data: Mapping[T, AbstractSet[T]], sort_key: Optional[Callable[[T], Any]] = None
 ) -> Sequence[Sequence[T]]:
-    # Workaround a bug in older versions of toposort that choke on frozenset
-    data = {k: set(v) if isinstance(v, frozenset) else v for k, v in data.items()}
-    return [sorted(list(level), key=sort_key) for level in toposort_.toposort(data)]
+    """Sort the items of a dependency mapping into levels, where the items in each level only
+    depend on items in earlier levels. Matches the semantics of ``toposort.toposort``, but runs in
+    time linear in the size of the graph rather than proportional to its depth times its size.
+    """
+    # discard self-dependencies, and include items that only appear as dependencies
+    deps_by_item: Dict[T, Set[T]] = {}
+    for item, deps in data.items():
+        deps_by_item[item] = {dep for dep in deps if dep != item}
+    for deps in list(deps_by_item.values()):
+        for dep in deps:
+            if dep not in deps_by_item:
+                deps_by_item[dep] = set()
+
+    num_unresolved_deps: Dict[T, int] = {}
+    dependents: Dict[T, List[T]] = defaultdict(list)
+    for item, deps in deps_by_item.items():
+        num_unresolved_deps[item] = len(deps)
+        for dep in deps:
+            dependents[dep].append(item)
+
+    levels: List[List[T]] = []
+    level = [item for item, num_deps in num_unresolved_deps.items() if num_deps == 0]
+    while level:
+        levels.append(sorted(level, key=sort_key))
+        next_level = []
+        for item in level:
+            for dependent in dependents.get(item, []):
+                num_unresolved_deps[dependent] -= 1
+                if num_unresolved_deps[dependent] == 0:
+                    next_level.append(dependent)
+        level = next_level
+
+    num_ordered = sum(len(level) for level in levels)
+    if num_ordered != len(deps_by_item):
+        ordered = {item for level in levels for item in level}
+        raise toposort_.CircularDependencyError(
+            {item: deps - ordered for item, deps in deps_by_item.items() if item not in ordered}
+        )
+
+    return levels
 
 
 def toposort_flatten(data: Mapping[T, AbstractSet[T]]) -> Sequence[T]:
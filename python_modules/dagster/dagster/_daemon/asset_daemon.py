@@ -4,12 +4,13 @@
 import logging
 import sys
 import threading
+import uuid
 import zlib
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor
-from contextlib import ExitStack
+from contextlib import ExitStack, contextmanager
 from types import TracebackType
-from typing import Any, Dict, Mapping, Optional, Sequence, Set, Tuple, Type, cast
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, Set, Tuple, Type, cast
 
 import dagster._check as check
 from dagster._core.definitions.asset_daemon_cursor import (
@@ -65,16 +66,19 @@
 from dagster._daemon.daemon import DaemonIterator, DagsterDaemon, SpanMarker
 from dagster._daemon.sensor import is_under_min_interval, mark_sensor_state_for_tick
 from dagster._daemon.utils import DaemonErrorCapture
-from dagster._serdes import serialize_value
+from dagster._record import record
+from dagster._serdes import serialize_value, whitelist_for_serdes
 from dagster._serdes.serdes import deserialize_value
 from dagster._time import get_current_datetime, get_current_timestamp
 from dagster._utils import SingleInstigatorDebugCrashFlags, check_for_debug_crash
+from dagster._utils.security import non_secure_md5_hash_str
 
 _LEGACY_PRE_SENSOR_AUTO_MATERIALIZE_CURSOR_KEY = "ASSET_DAEMON_CURSOR"
 _PRE_SENSOR_AUTO_MATERIALIZE_CURSOR_KEY = "ASSET_DAEMON_CURSOR_NEW"
 _PRE_SENSOR_ASSET_DAEMON_PAUSED_KEY = "ASSET_DAEMON_PAUSED"
 _MIGRATED_CURSOR_TO_SENSORS_KEY = "MIGRATED_CURSOR_TO_SENSORS"
 _MIGRATED_SENSOR_NAMES_KEY = "MIGRATED_SENSOR_NAMES_KEY"
+_SENSOR_LEASE_KEY_PREFIX = "ASSET_DAEMON_SENSOR_LEASE"
 
 
 EVALUATIONS_TTL_DAYS = 30
@@ -90,6 +94,12 @@
 
 MIN_INTERVAL_LOOP_SECONDS = 5
 
+DEFAULT_SENSOR_LEASE_SECONDS = 300
+
+# How many times a sensor lease is renewed over its duration while the sensor's tick runs, so that
+# a few failed renewals do not let the lease expire under a running tick
+SENSOR_LEASE_RENEWALS_PER_LEASE = 3
+
 
 def _get_has_migrated(instance: DagsterInstance, migration_key: str) -> bool:
     return bool(
@@ -117,6 +127,51 @@ def set_has_migrated_sensor_names(instance: DagsterInstance) -> None:
     _set_has_migrated(instance, _MIGRATED_SENSOR_NAMES_KEY)
 
 
+class AssetDaemonSensorLeaseLostError(Exception):
+    """Raised to stop a tick when another asset daemon process has claimed the lease on its
+    sensor.
+    """
+
+
+@whitelist_for_serdes
+@record
+class AssetDaemonSensorLease:
+    """Records that an asset daemon process owns the evaluation of an automation condition sensor
+    until the lease expires. Used to prevent multiple sharded daemon processes from evaluating the
+    same sensor.
+    """
+
+    owner_id: str
+    expiration_timestamp: float
+
+
+def _get_sensor_lease_key(selector_id: Optional[str]) -> str:
+    return f"{_SENSOR_LEASE_KEY_PREFIX}:{selector_id or _PRE_SENSOR_AUTO_MATERIALIZE_SELECTOR_ID}"
+
+
+def _get_serialized_sensor_lease(
+    instance: DagsterInstance, selector_id: Optional[str]
+) -> Optional[str]:
+    key = _get_sensor_lease_key(selector_id)
+    return instance.daemon_cursor_storage.get_cursor_values({key}).get(key)
+
+
+def get_sensor_lease(
+    instance: DagsterInstance, selector_id: Optional[str]
+) -> Optional[AssetDaemonSensorLease]:
+    serialized_lease = _get_serialized_sensor_lease(instance, selector_id)
+    return deserialize_value(serialized_lease, AssetDaemonSensorLease) if serialized_lease else None
+
+
+def get_shard_index_for_sensor(selector_id: Optional[str], num_shards: int) -> int:
+    """Returns the shard that is responsible for evaluating the given sensor. The legacy
+    non-sensor tick (selector_id of None) is always evaluated by the first shard.
+    """
+    if selector_id is None:
+        return 0
+    return int(non_secure_md5_hash_str(selector_id.encode("utf-8")), 16) % num_shards
+
+
 def get_auto_materialize_paused(instance: DagsterInstance) -> bool:
     return (
         instance.daemon_cursor_storage.get_cursor_values({_PRE_SENSOR_ASSET_DAEMON_PAUSED_KEY}).get(
@@ -341,12 +396,176 @@ def __init__(self, settings: Mapping[str, Any], pre_sensor_interval_seconds: int
 
         self._settings = settings
 
+        # multiple daemon processes may split the automation condition sensors between them, each
+        # evaluating the sensors that hash to its shard
+        self._num_shards = settings.get("num_shards") or 1
+        self._shard_index = settings.get("shard_index") or 0
+        check.invariant(
+            0 <= self._shard_index < self._num_shards,
+            f"auto_materialize shard_index must be between 0 and num_shards - 1, got shard_index"
+            f" {self._shard_index} with num_shards {self._num_shards}",
+        )
+        self._sensor_lease_seconds = settings.get(
+            "sensor_lease_seconds", DEFAULT_SENSOR_LEASE_SECONDS
+        )
+        self._lease_owner_id = str(uuid.uuid4())
+        self._leased_selector_ids: Set[Optional[str]] = set()
+
         super().__init__()
 
     @classmethod
     def daemon_type(cls) -> str:
         return "ASSET"
 
+    @property
+    def is_sharded(self) -> bool:
+        return self._num_shards > 1
+
+    @property
+    def supports_multiple_processes(self) -> bool:
+        return self.is_sharded
+
+    def _is_assigned_to_shard(self, selector_id: Optional[str]) -> bool:
+        return get_shard_index_for_sensor(selector_id, self._num_shards) == self._shard_index
+
+    def _try_acquire_sensor_lease(
+        self, instance: DagsterInstance, selector_id: Optional[str]
+    ) -> bool:
+        """Claims or renews the lease for the given sensor. Returns False if another daemon process
+        currently holds an unexpired lease on the sensor.
+        """
+        if not self.is_sharded:
+            return True
+
+        now = get_current_timestamp()
+        serialized_lease = _get_serialized_sensor_lease(instance, selector_id)
+        lease = (
+            deserialize_value(serialized_lease, AssetDaemonSensorLease)
+            if serialized_lease
+            else None
+        )
+        if (
+            lease is not None
+            and lease.owner_id != self._lease_owner_id
+            and lease.expiration_timestamp > now
+        ):
+            return False
+
+        # only replace the lease that was just read, so that of two processes racing to claim
+        # the same expired lease exactly one succeeds
+        if not instance.daemon_cursor_storage.compare_and_set_cursor_value(
+            _get_sensor_lease_key(selector_id),
+            serialized_lease,
+            serialize_value(
+                AssetDaemonSensorLease(
+                    owner_id=self._lease_owner_id,
+                    expiration_timestamp=now + self._sensor_lease_seconds,
+                )
+            ),
+        ):
+            self._leased_selector_ids.discard(selector_id)
+            return False
+
+        self._leased_selector_ids.add(selector_id)
+        return True
+
+    def _try_renew_sensor_lease(
+        self, instance: DagsterInstance, selector_id: Optional[str]
+    ) -> bool:
+        """Extends the lease that this process holds on the given sensor. Returns False if the
+        lease has been claimed by another daemon process.
+        """
+        serialized_lease = _get_serialized_sensor_lease(instance, selector_id)
+        if (
+            not serialized_lease
+            or deserialize_value(serialized_lease, AssetDaemonSensorLease).owner_id
+            != self._lease_owner_id
+        ):
+            return False
+
+        # fails if another process claims the lease between the read and the write
+        return instance.daemon_cursor_storage.compare_and_set_cursor_value(
+            _get_sensor_lease_key(selector_id),
+            serialized_lease,
+            serialize_value(
+                AssetDaemonSensorLease(
+                    owner_id=self._lease_owner_id,
+                    expiration_timestamp=get_current_timestamp() + self._sensor_lease_seconds,
+                )
+            ),
+        )
+
+    @contextmanager
+    def _sensor_lease_heartbeat(
+        self, instance: DagsterInstance, selector_id: Optional[str]
+    ) -> Iterator[threading.Event]:
+        """Renews the lease on the given sensor from a background thread for as long as the
+        context is open, so that a tick that takes longer than the lease keeps it. The yielded
+        event is set if a renewal finds that another process has claimed the lease, after which
+        the tick must stop.
+        """
+        lease_lost = threading.Event()
+        if not self.is_sharded:
+            yield lease_lost
+            return
+
+        done = threading.Event()
+
+        def _renew_lease() -> None:
+            while not done.wait(self._sensor_lease_seconds / SENSOR_LEASE_RENEWALS_PER_LEASE):
+                try:
+                    if not self._try_renew_sensor_lease(instance, selector_id):
+                        lease_lost.set()
+                        return
+                except Exception:
+                    # retried on the next heartbeat, before the lease can expire
+                    DaemonErrorCapture.on_exception(
+                        exc_info=sys.exc_info(),
+                        logger=self._logger,
+                        log_message="Failed to renew sensor lease",
+                    )
+
+        heartbeat_thread = threading.Thread(
+            target=_renew_lease, name="asset_daemon_sensor_lease_heartbeat", daemon=True
+        )
+        heartbeat_thread.start()
+        try:
+            yield lease_lost
+        finally:
+            done.set()
+            heartbeat_thread.join()
+
+    def _release_sensor_leases(self, instance: DagsterInstance) -> None:
+        """Expires all leases held by this process, so that a replacement process can take over its
+        sensors immediately.
+        """
+        for selector_id in self._leased_selector_ids:
+            serialized_lease = _get_serialized_sensor_lease(instance, selector_id)
+            if (
+                not serialized_lease
+                or deserialize_value(serialized_lease, AssetDaemonSensorLease).owner_id
+                != self._lease_owner_id
+            ):
+                continue
+            # leaves the lease alone if another process has claimed it in the meantime
+            instance.daemon_cursor_storage.compare_and_set_cursor_value(
+                _get_sensor_lease_key(selector_id),
+                serialized_lease,
+                serialize_value(
+                    AssetDaemonSensorLease(owner_id=self._lease_owner_id, expiration_timestamp=0.0)
+                ),
+            )
+        self._leased_selector_ids.clear()
+
+    def _check_sensor_lease(
+        self, lease_lost: threading.Event, sensor: Optional[RemoteSensor]
+    ) -> None:
+        if lease_lost.is_set():
+            raise AssetDaemonSensorLeaseLostError(
+                f"Stopping tick{self._get_print_sensor_name(sensor)}, as its lease was claimed by"
+                " another asset daemon process while the tick was running."
+            )
+
     def _get_print_sensor_name(self, sensor: Optional[RemoteSensor]) -> str:
         if not sensor:
             return ""
@@ -392,12 +611,17 @@ def _initialize_evaluation_id(
 
             self._initialized_evaluation_id = True
 
-    def _get_next_evaluation_id(self):
+    def _get_next_evaluation_id(self, min_evaluation_id: int = 0):
         # Thread-safe way to generate a new evaluation ID across multiple
         # workers running asset policy sensors at once
         with self._evaluation_id_lock:
             check.invariant(self._initialized_evaluation_id)
-            self._next_evaluation_id = self._next_evaluation_id + 1
+            next_evaluation_id = max(self._next_evaluation_id, min_evaluation_id) + 1
+            if self.is_sharded:
+                # each shard uses a disjoint set of evaluation IDs, so that IDs are unique across
+                # all daemon processes
+                next_evaluation_id += (self._shard_index - next_evaluation_id) % self._num_shards
+            self._next_evaluation_id = next_evaluation_id
             return self._next_evaluation_id
 
     def core_loop(
@@ -418,9 +642,18 @@ def core_loop(
                 " migrate` to enable."
             )
 
+        if self.is_sharded:
+            self._logger.info(
+                f"Evaluating automation condition sensors for shard {self._shard_index} of"
+                f" {self._num_shards}"
+            )
+
         amp_tick_futures: Dict[Optional[str], Future] = {}
         threadpool_executor = None
         with ExitStack() as stack:
+            # registered before the threadpool so that in-flight ticks finish before leases are
+            # released
+            stack.callback(self._release_sensor_leases, instance)
             if self._settings.get("use_threads"):
                 threadpool_executor = stack.enter_context(
                     InheritContextThreadPoolExecutor(
@@ -506,6 +739,14 @@ def _run_iteration_impl(
             }
 
             if not self._checked_migrations:
+                if self._shard_index != 0 and not (
+                    get_has_migrated_to_sensors(instance)
+                    and get_has_migrated_sensor_names(instance)
+                ):
+                    # the first shard is responsible for migrating sensor state, so wait for it
+                    # before evaluating any sensors
+                    return
+
                 if not get_has_migrated_to_sensors(instance):
                     # Do a one-time migration to create the cursors for each sensor, based on the
                     # existing cursor for the legacy AMP tick
@@ -564,6 +805,9 @@ def _run_iteration_impl(
                 selector_id = None
                 auto_materialize_state = None
 
+            if not self._is_assigned_to_shard(selector_id):
+                continue
+
             if not sensor:
                 # make sure we are only running every pre_sensor_interval_seconds
                 if (
@@ -591,11 +835,23 @@ def _run_iteration_impl(
             elif is_under_min_interval(auto_materialize_state, sensor):
                 continue
 
-            if threadpool_executor:
-                # only one tick per sensor can be in flight
-                if selector_id in amp_tick_futures and not amp_tick_futures[selector_id].done():
-                    continue
+            # only one tick per sensor can be in flight
+            if (
+                threadpool_executor
+                and selector_id in amp_tick_futures
+                and not amp_tick_futures[selector_id].done()
+            ):
+                continue
+
+            if not self._try_acquire_sensor_lease(instance, selector_id):
+                self._logger.warning(
+                    f"Skipping evaluation{self._get_print_sensor_name(sensor)}, as it is currently"
+                    " leased by another asset daemon process. Make sure that each process has a"
+                    " distinct shard_index."
+                )
+                continue
 
+            if threadpool_executor:
                 future = threadpool_executor.submit(
                     self._process_auto_materialize_tick,
                     workspace_process_context,
@@ -708,6 +964,25 @@ def _process_auto_materialize_tick_generator(
         repository: Optional[RemoteRepository],
         sensor: Optional[RemoteSensor],
         debug_crash_flags: SingleInstigatorDebugCrashFlags,  # TODO No longer single instigator
+    ):
+        with self._sensor_lease_heartbeat(
+            workspace_process_context.instance, sensor.selector_id if sensor else None
+        ) as lease_lost:
+            yield from self._process_leased_auto_materialize_tick_generator(
+                workspace_process_context,
+                repository,
+                sensor,
+                debug_crash_flags,
+                lease_lost,
+            )
+
+    def _process_leased_auto_materialize_tick_generator(
+        self,
+        workspace_process_context: IWorkspaceProcessContext,
+        repository: Optional[RemoteRepository],
+        sensor: Optional[RemoteSensor],
+        debug_crash_flags: SingleInstigatorDebugCrashFlags,
+        lease_lost: threading.Event,
     ):
         evaluation_time = get_current_datetime()
 
@@ -852,7 +1127,9 @@ def _process_auto_materialize_tick_generator(
                 # Evaluation ID will always be monotonically increasing, but will not always
                 # be auto-incrementing by 1 once there are multiple AMP evaluations happening in
                 # parallel
-                next_evaluation_id = self._get_next_evaluation_id()
+                next_evaluation_id = self._get_next_evaluation_id(
+                    min_evaluation_id=stored_cursor.evaluation_id
+                )
                 tick = instance.create_tick(
                     TickData(
                         instigator_origin_id=instigator_origin_id,
@@ -886,6 +1163,7 @@ def _process_auto_materialize_tick_generator(
                     debug_crash_flags,
                     is_retry=(retry_tick is not None),
                     instigator_state=auto_materialize_instigator_state,
+                    lease_lost=lease_lost,
                 )
         except Exception:
             error_info = DaemonErrorCapture.on_exception(
@@ -909,6 +1187,7 @@ def _evaluate_auto_materialize_tick(
         debug_crash_flags: SingleInstigatorDebugCrashFlags,
         is_retry: bool,
         instigator_state: Optional[InstigatorState],
+        lease_lost: threading.Event,
     ):
         evaluation_id = check.not_none(tick.tick_data.auto_materialize_evaluation_id)
 
@@ -972,6 +1251,8 @@ def _evaluate_auto_materialize_tick(
 
             check_for_debug_crash(debug_crash_flags, "EVALUATIONS_FINISHED")
 
+            self._check_sensor_lease(lease_lost, sensor)
+
             evaluations_by_key = {
                 evaluation.key: evaluation.with_run_ids(set()) for evaluation in evaluations
             }
@@ -1035,6 +1316,9 @@ def _evaluate_auto_materialize_tick(
 
         run_request_execution_data_cache = {}
         for i, (run_request, reserved_run_id) in enumerate(zip(run_requests, reserved_run_ids)):
+            # the process that claimed the lease resumes the tick from the last submitted run
+            self._check_sensor_lease(lease_lost, sensor)
+
             # check that the run_request requires the backfill daemon rather than if the setting is enabled to
             # account for the setting changing between tick retries
             if run_request.requires_backfill_daemon():
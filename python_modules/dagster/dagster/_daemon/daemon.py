@@ -27,7 +27,11 @@
     execute_concurrency_slots_iteration,
     execute_run_monitoring_iteration,
 )
-from dagster._daemon.sensor import execute_sensor_iteration_loop
+from dagster._daemon.sensor import (
+    DEFAULT_MAX_CONCURRENT_EVALUATIONS_PER_CODE_LOCATION,
+    SensorEvaluationEventLoop,
+    execute_sensor_iteration_loop,
+)
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._scheduler.scheduler import execute_scheduler_iteration_loop
@@ -82,6 +86,11 @@ def __init__(self):
     def daemon_type(cls) -> str:
         """returns: str."""
 
+    @property
+    def supports_multiple_processes(self) -> bool:
+        """Whether multiple processes may run this daemon against the same instance at once."""
+        return False
+
     def __exit__(self, _exception_type, _exception_value, _traceback):
         pass
 
@@ -178,6 +187,7 @@ def _check_add_heartbeat(
             self._last_heartbeat_time
             and last_stored_heartbeat
             and last_stored_heartbeat.daemon_id != daemon_uuid
+            and not self.supports_multiple_processes
         ):
             self._logger.error(
                 "Another %s daemon is still sending heartbeats. You likely have multiple "
@@ -294,14 +304,34 @@ def __init__(self, settings: Mapping[str, Any]) -> None:
         self._exit_stack = ExitStack()
         self._threadpool_executor: Optional[InheritContextThreadPoolExecutor] = None
         self._submit_threadpool_executor: Optional[InheritContextThreadPoolExecutor] = None
-
-        if settings.get("use_threads"):
+        self._sensor_evaluation_loop: Optional[SensorEvaluationEventLoop] = None
+
+        if settings.get("use_asyncio"):
+            # sensor evaluations are awaited on an event loop, with the blocking work of each tick
+            # run on the loop's threadpool
+            self._sensor_evaluation_loop = self._exit_stack.enter_context(
+                SensorEvaluationEventLoop(
+                    max_concurrent_evaluations_per_code_location=settings.get(
+                        "max_concurrent_evaluations_per_code_location",
+                        DEFAULT_MAX_CONCURRENT_EVALUATIONS_PER_CODE_LOCATION,
+                    ),
+                    executor=self._exit_stack.enter_context(
+                        InheritContextThreadPoolExecutor(
+                            max_workers=settings.get("num_workers"),
+                            thread_name_prefix="sensor_daemon_worker",
+                        )
+                    ),
+                )
+            )
+        elif settings.get("use_threads"):
             self._threadpool_executor = self._exit_stack.enter_context(
                 InheritContextThreadPoolExecutor(
                     max_workers=settings.get("num_workers"),
                     thread_name_prefix="sensor_daemon_worker",
                 )
             )
+
+        if settings.get("use_asyncio") or settings.get("use_threads"):
             num_submit_workers = settings.get("num_submit_workers")
             if num_submit_workers:
                 self._submit_threadpool_executor = self._exit_stack.enter_context(
@@ -330,6 +360,7 @@ def core_loop(
             shutdown_event,
             threadpool_executor=self._threadpool_executor,
             submit_threadpool_executor=self._submit_threadpool_executor,
+            sensor_evaluation_loop=self._sensor_evaluation_loop,
         )
 
 
@@ -4,7 +4,7 @@
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Sequence
 
 from dagster import (
     DagsterEvent,
@@ -27,7 +27,7 @@
     RunRecord,
     RunsFilter,
 )
-from dagster._core.storage.tags import PRIORITY_TAG
+from dagster._core.storage.tags import get_run_priority
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import BaseWorkspaceRequestContext, IWorkspaceProcessContext
 from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
@@ -36,6 +36,9 @@
 
 PAGE_SIZE = 100
 
+# how often to check the run queue index for queued runs that are missing from it
+QUEUED_RUNS_RECONCILIATION_INTERVAL_SECONDS = 60
+
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
     """Used with the QueuedRunCoordinator on the instance. This process finds queued runs from the run
@@ -50,6 +53,7 @@ def __init__(self, interval_seconds, page_size=PAGE_SIZE) -> None:
         self._page_size = page_size
         self._global_concurrency_blocked_runs_lock = threading.Lock()
         self._global_concurrency_blocked_runs = set()
+        self._last_queued_runs_reconciliation_time: Optional[float] = None
         super().__init__(interval_seconds)
 
     def _get_executor(self, max_workers) -> ThreadPoolExecutor:
@@ -230,6 +234,17 @@ def _get_runs_to_dequeue(
                 + ",".join(list(paused_location_names))
             )
 
+        if instance.supports_queued_run_index:
+            self._maybe_reconcile_queued_runs(instance, now)
+            return self._get_runs_to_dequeue_from_queue_index(
+                instance,
+                run_queue_config,
+                in_progress_run_records,
+                max_runs_to_launch if max_concurrent_runs_enabled else None,
+                paused_location_names,
+                locations_clause,
+            )
+
         logged_this_iteration = False
         # Paginate through our runs list so we don't need to hold every run
         # in memory at once. The maximum number of runs we'll hold in memory is
@@ -262,76 +277,175 @@ def _get_runs_to_dequeue(
             batch += queued_runs
             batch = self._priority_sort(batch)
 
-            if run_queue_config.should_block_op_concurrency_limited_runs:
+            global_concurrency_limits_counter = self._get_global_concurrency_limits_counter(
+                instance, run_queue_config, batch, in_progress_run_records
+            )
+
+            to_remove = [
+                run
+                for run in batch
+                if self._is_blocked(
+                    run,
+                    tag_concurrency_limits_counter,
+                    global_concurrency_limits_counter,
+                    paused_location_names,
+                )
+            ]
+            for run in to_remove:
+                batch.remove(run)
+
+            if max_runs_to_launch >= 1:
+                batch = batch[:max_runs_to_launch]
+
+        return batch
+
+    def _maybe_reconcile_queued_runs(self, instance: DagsterInstance, now: float) -> None:
+        # a process that checked for the run queue index before it was built may have queued runs
+        # without adding them to it, so periodically add back any queued runs that are missing
+        if (
+            self._last_queued_runs_reconciliation_time is not None
+            and now - self._last_queued_runs_reconciliation_time
+            < QUEUED_RUNS_RECONCILIATION_INTERVAL_SECONDS
+        ):
+            return
+
+        self._last_queued_runs_reconciliation_time = now
+        try:
+            reconciled_run_ids = instance.reconcile_queued_runs()
+        except:
+            self._logger.exception("Failed to reconcile the run queue index with queued runs")
+            return
+
+        if reconciled_run_ids:
+            self._logger.warning(
+                f"Added {len(reconciled_run_ids)} queued runs that were missing from the run queue"
+                f" index: {', '.join(reconciled_run_ids)}"
+            )
+
+    def _get_runs_to_dequeue_from_queue_index(
+        self,
+        instance: DagsterInstance,
+        run_queue_config: RunQueueConfig,
+        in_progress_run_records: Sequence[RunRecord],
+        max_runs_to_launch: Optional[int],
+        paused_location_names: AbstractSet[str],
+        locations_clause: str,
+    ) -> List[DagsterRun]:
+        # The run storage returns queued runs already in priority order, so each run only needs to
+        # be checked once against concurrency counters that are maintained across pages, and we
+        # can stop reading the queue as soon as enough runs have been found to launch.
+        tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
+            run_queue_config.tag_concurrency_limits,
+            [record.dagster_run for record in in_progress_run_records],
+        )
+        global_concurrency_limits_counter = self._get_global_concurrency_limits_counter(
+            instance, run_queue_config, [], in_progress_run_records
+        )
+
+        batch: List[DagsterRun] = []
+        cursor = None
+        has_more = True
+        logged_this_iteration = False
+        while has_more:
+            result = instance.get_queued_runs(cursor=cursor, limit=self._page_size)
+            cursor = result.cursor
+            has_more = result.has_more
+
+            if not result.runs:
+                break
+
+            if not logged_this_iteration:
+                logged_this_iteration = True
+                self._logger.info(
+                    "Checking tag concurrency limits for queued runs." + locations_clause
+                )
+
+            if global_concurrency_limits_counter:
                 try:
-                    global_concurrency_limits_counter = GlobalOpConcurrencyLimitsCounter(
-                        instance,
-                        batch,
-                        in_progress_run_records,
-                        run_queue_config.op_concurrency_slot_buffer,
-                    )
+                    global_concurrency_limits_counter.add_queued_runs(instance, result.runs)
                 except:
-                    self._logger.exception("Failed to initialize op concurrency counter")
-                    # when we cannot initialize the global concurrency counter, we should fall back
-                    # to not blocking any runs based on op concurrency limits
+                    self._logger.exception("Failed to fetch op concurrency info for queued runs")
                     global_concurrency_limits_counter = None
-            else:
-                global_concurrency_limits_counter = None
 
-            to_remove = []
-            for run in batch:
-                if tag_concurrency_limits_counter.is_blocked(run):
-                    to_remove.append(run)
-                    continue
-                else:
-                    tag_concurrency_limits_counter.update_counters_with_launched_item(run)
-
-                if (
-                    global_concurrency_limits_counter
-                    and global_concurrency_limits_counter.is_blocked(run)
+            for run in result.runs:
+                if self._is_blocked(
+                    run,
+                    tag_concurrency_limits_counter,
+                    global_concurrency_limits_counter,
+                    paused_location_names,
                 ):
-                    to_remove.append(run)
-                    if run.run_id not in self._global_concurrency_blocked_runs:
-                        with self._global_concurrency_blocked_runs_lock:
-                            self._global_concurrency_blocked_runs.add(run.run_id)
-                        concurrency_blocked_info = json.dumps(
-                            global_concurrency_limits_counter.get_blocked_run_debug_info(run)
-                        )
-                        self._logger.info(
-                            f"Run {run.run_id} is blocked by global concurrency limits: {concurrency_blocked_info}"
-                        )
                     continue
-                elif global_concurrency_limits_counter:
-                    global_concurrency_limits_counter.update_counters_with_launched_item(run)
 
-                location_name = (
-                    run.remote_job_origin.location_name if run.remote_job_origin else None
-                )
-                if location_name and location_name in paused_location_names:
-                    to_remove.append(run)
-                    continue
+                batch.append(run)
+                if max_runs_to_launch is not None and len(batch) >= max_runs_to_launch:
+                    return batch
 
-            for run in to_remove:
-                batch.remove(run)
+        return batch
 
-            if max_runs_to_launch >= 1:
-                batch = batch[:max_runs_to_launch]
+    def _get_global_concurrency_limits_counter(
+        self,
+        instance: DagsterInstance,
+        run_queue_config: RunQueueConfig,
+        runs: Sequence[DagsterRun],
+        in_progress_run_records: Sequence[RunRecord],
+    ) -> Optional[GlobalOpConcurrencyLimitsCounter]:
+        if not run_queue_config.should_block_op_concurrency_limited_runs:
+            return None
 
-        return batch
+        try:
+            return GlobalOpConcurrencyLimitsCounter(
+                instance,
+                runs,
+                in_progress_run_records,
+                run_queue_config.op_concurrency_slot_buffer,
+            )
+        except:
+            self._logger.exception("Failed to initialize op concurrency counter")
+            # when we cannot initialize the global concurrency counter, we should fall back
+            # to not blocking any runs based on op concurrency limits
+            return None
+
+    def _is_blocked(
+        self,
+        run: DagsterRun,
+        tag_concurrency_limits_counter: TagConcurrencyLimitsCounter,
+        global_concurrency_limits_counter: Optional[GlobalOpConcurrencyLimitsCounter],
+        paused_location_names: AbstractSet[str],
+    ) -> bool:
+        """Checks whether the run can be dequeued, updating the concurrency counters with the run if
+        it is not blocked by them.
+        """
+        if tag_concurrency_limits_counter.is_blocked(run):
+            return True
+        else:
+            tag_concurrency_limits_counter.update_counters_with_launched_item(run)
+
+        if global_concurrency_limits_counter and global_concurrency_limits_counter.is_blocked(run):
+            if run.run_id not in self._global_concurrency_blocked_runs:
+                with self._global_concurrency_blocked_runs_lock:
+                    self._global_concurrency_blocked_runs.add(run.run_id)
+                concurrency_blocked_info = json.dumps(
+                    global_concurrency_limits_counter.get_blocked_run_debug_info(run)
+                )
+                self._logger.info(
+                    f"Run {run.run_id} is blocked by global concurrency limits: {concurrency_blocked_info}"
+                )
+            return True
+        elif global_concurrency_limits_counter:
+            global_concurrency_limits_counter.update_counters_with_launched_item(run)
+
+        location_name = run.remote_job_origin.location_name if run.remote_job_origin else None
+        if location_name and location_name in paused_location_names:
+            return True
+
+        return False
 
     def _get_in_progress_run_records(self, instance: DagsterInstance) -> Sequence[RunRecord]:
         return instance.get_run_records(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
 
     def _priority_sort(self, runs: Iterable[DagsterRun]) -> List[DagsterRun]:
-        def get_priority(run: DagsterRun) -> int:
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
-
         # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+        return sorted(runs, key=lambda run: get_run_priority(run.tags), reverse=True)
 
     def _is_location_pausing_dequeues(self, location_name: str, now: float) -> bool:
         with self._location_timeouts_lock:
@@ -1,3 +1,4 @@
+import asyncio
 import dataclasses
 import datetime
 import logging
@@ -5,11 +6,14 @@
 import threading
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor
-from contextlib import AbstractContextManager
+from contextlib import AbstractContextManager, asynccontextmanager
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
+    AsyncIterator,
+    Coroutine,
     Dict,
+    Generator,
     List,
     Mapping,
     NamedTuple,
@@ -21,7 +25,7 @@
     cast,
 )
 
-from typing_extensions import Self
+from typing_extensions import Self, TypeAlias, TypeGuard
 
 import dagster._check as check
 import dagster._seven as seven
@@ -37,7 +41,7 @@
 )
 from dagster._core.definitions.run_request import DagsterRunReaction, InstigatorType, RunRequest
 from dagster._core.definitions.selector import JobSubsetSelector
-from dagster._core.definitions.sensor_definition import DefaultSensorStatus
+from dagster._core.definitions.sensor_definition import DefaultSensorStatus, SensorExecutionData
 from dagster._core.errors import (
     DagsterCodeLocationLoadError,
     DagsterError,
@@ -64,7 +68,8 @@
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._scheduler.stale import resolve_stale_or_missing_assets
-from dagster._time import get_current_datetime, get_current_timestamp
+from dagster._scheduler.tick_queue import InstigatorTickQueue
+from dagster._time import datetime_from_timestamp, get_current_datetime, get_current_timestamp
 from dagster._utils import DebugCrashFlags, SingleInstigatorDebugCrashFlags, check_for_debug_crash
 from dagster._utils.error import SerializableErrorInfo
 from dagster._utils.merger import merge_dicts
@@ -73,7 +78,26 @@
     from dagster._daemon.daemon import DaemonIterator
 
 
-MIN_INTERVAL_LOOP_TIME = 5
+# a queue of the running sensors, keyed on when each is next due to tick
+SensorTickQueue: TypeAlias = InstigatorTickQueue[Tuple[RemoteSensor, InstigatorState]]
+
+
+# How often the sensor loop reloads the set of running sensors from the workspace and instance. In
+# between refreshes, the loop only wakes up for the sensors that have come due, and each tick
+# re-reads its own sensor state, so a sensor that is stopped in the meantime does not tick again.
+RUNNING_SENSORS_REFRESH_INTERVAL = 5
+
+# When a queued sensor comes due while its previous tick is still in flight, how long to wait before
+# trying to start its tick again
+IN_FLIGHT_SENSOR_TICK_RETRY_INTERVAL = 1
+
+# How far behind its due time a sensor tick may start before the scheduling lag is logged at INFO
+# instead of DEBUG
+SENSOR_SCHEDULING_LAG_LOG_THRESHOLD_SECONDS = 30
+
+# When evaluating sensors on an event loop, how many evaluations may be in flight against a single
+# code location at once
+DEFAULT_MAX_CONCURRENT_EVALUATIONS_PER_CODE_LOCATION = 100
 
 # When retrying a tick, how long to wait before ignoring it and moving on to the next one
 # (To account for the rare case where the daemon is down for a long time, starts back up, and
@@ -104,6 +128,65 @@ class BackfillSubmission(NamedTuple):
     backfill_id: str
 
 
+class SensorEvaluationEventLoop(AbstractContextManager):
+    """Runs an asyncio event loop on a background thread, so that sensor evaluations can be awaited
+    concurrently rather than each holding a thread for the duration of its gRPC call. Blocking work
+    (e.g. storage writes, run submission) is run on the loop's default executor.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_evaluations_per_code_location: int,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ):
+        self._max_concurrent_evaluations_per_code_location = check.int_param(
+            max_concurrent_evaluations_per_code_location,
+            "max_concurrent_evaluations_per_code_location",
+        )
+        self._loop = asyncio.new_event_loop()
+        if executor:
+            self._loop.set_default_executor(executor)
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="sensor_daemon_event_loop", daemon=True
+        )
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        # let any in-flight ticks run to completion, mirroring the shutdown of a threadpool
+        asyncio.run_coroutine_threadsafe(self._gen_wait_for_pending_tasks(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _gen_wait_for_pending_tasks(self) -> None:
+        current_task = asyncio.current_task()
+        pending = [task for task in asyncio.all_tasks() if task is not current_task]
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    def submit(self, coroutine: Coroutine) -> Future:
+        """Schedules the coroutine on the event loop, returning a future that may be inspected
+        from any thread.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def get_code_location_semaphore(self, location_name: str) -> asyncio.Semaphore:
+        # only accessed from within the event loop, so no locking is required
+        if location_name not in self._semaphores:
+            self._semaphores[location_name] = asyncio.Semaphore(
+                self._max_concurrent_evaluations_per_code_location
+            )
+        return self._semaphores[location_name]
+
+
 class SensorLaunchContext(AbstractContextManager):
     def __init__(
         self,
@@ -281,7 +364,9 @@ def __exit__(
                         failure_count=self._tick.failure_count,
                     )
             else:
-                error_data = DaemonErrorCapture.on_exception(sys.exc_info())
+                error_data = DaemonErrorCapture.on_exception(
+                    (exception_type, exception_value, traceback)
+                )
                 self.update_state(
                     TickStatus.FAILURE, error=error_data, failure_count=self._tick.failure_count + 1
                 )
@@ -306,15 +391,19 @@ def execute_sensor_iteration_loop(
     until: Optional[float] = None,
     threadpool_executor: Optional[ThreadPoolExecutor] = None,
     submit_threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    sensor_evaluation_loop: Optional[SensorEvaluationEventLoop] = None,
 ) -> "DaemonIterator":
     """Helper function that performs sensor evaluations on a tighter loop, while reusing grpc locations
     within a given daemon interval.  Rather than relying on the daemon machinery to run the
-    iteration loop every 30 seconds, sensors are continuously evaluated, every 5 seconds. We rely on
-    each sensor definition's min_interval to check that sensor evaluations are spaced appropriately.
+    iteration loop every 30 seconds, the running sensors are kept in a queue keyed on when each is
+    next due, and the loop sleeps until the next sensor comes due. The set of running sensors is
+    reloaded every RUNNING_SENSORS_REFRESH_INTERVAL seconds.
     """
     from dagster._daemon.daemon import SpanMarker
 
     sensor_tick_futures: Dict[str, Future] = {}
+    sensor_tick_queue: SensorTickQueue = InstigatorTickQueue()
+    next_refresh_time = 0.0
     while True:
         start_time = get_current_timestamp()
         if until and start_time >= until:
@@ -324,13 +413,31 @@ def execute_sensor_iteration_loop(
         yield SpanMarker.START_SPAN
 
         try:
-            yield from execute_sensor_iteration(
-                workspace_process_context,
-                logger,
-                threadpool_executor=threadpool_executor,
-                submit_threadpool_executor=submit_threadpool_executor,
-                sensor_tick_futures=sensor_tick_futures,
-            )
+            if start_time >= next_refresh_time:
+                # reload the set of running sensors and reschedule each of them based on its
+                # current state
+                next_refresh_time = start_time + RUNNING_SENSORS_REFRESH_INTERVAL
+                yield from execute_sensor_iteration(
+                    workspace_process_context,
+                    logger,
+                    threadpool_executor=threadpool_executor,
+                    submit_threadpool_executor=submit_threadpool_executor,
+                    sensor_tick_futures=sensor_tick_futures,
+                    sensor_evaluation_loop=sensor_evaluation_loop,
+                    sensor_tick_queue=sensor_tick_queue,
+                )
+                _log_scheduling_lag(logger, sensor_tick_queue, sensor_tick_futures)
+            else:
+                # in between refreshes, only wake up for the sensors that have come due
+                yield from execute_due_sensor_ticks(
+                    workspace_process_context,
+                    logger,
+                    sensor_tick_queue,
+                    threadpool_executor=threadpool_executor,
+                    submit_threadpool_executor=submit_threadpool_executor,
+                    sensor_tick_futures=sensor_tick_futures,
+                    sensor_evaluation_loop=sensor_evaluation_loop,
+                )
         except Exception:
             error_info = DaemonErrorCapture.on_exception(
                 exc_info=sys.exc_info(),
@@ -344,13 +451,37 @@ def execute_sensor_iteration_loop(
 
         end_time = get_current_timestamp()
 
-        loop_duration = end_time - start_time
-        sleep_time = max(0, MIN_INTERVAL_LOOP_TIME - loop_duration)
-        shutdown_event.wait(sleep_time)
+        # sleep until the next sensor is due, or until it is time to refresh the running sensors
+        wake_time = next_refresh_time
+        next_due_timestamp = sensor_tick_queue.next_due_timestamp()
+        if next_due_timestamp is not None:
+            wake_time = min(wake_time, next_due_timestamp)
+        shutdown_event.wait(max(0, wake_time - end_time))
 
         yield None
 
 
+def _log_scheduling_lag(
+    logger: logging.Logger,
+    sensor_tick_queue: "SensorTickQueue",
+    sensor_tick_futures: Mapping[str, Future],
+) -> None:
+    scheduling_lags = list(sensor_tick_queue.pop_lags().values())
+    if not scheduling_lags:
+        return
+
+    max_scheduling_lag = max(scheduling_lags)
+    num_in_flight = len([future for future in sensor_tick_futures.values() if not future.done()])
+    logger.log(
+        logging.INFO
+        if max_scheduling_lag >= SENSOR_SCHEDULING_LAG_LOG_THRESHOLD_SECONDS
+        else logging.DEBUG,
+        f"Started {len(scheduling_lags)} sensor ticks with a mean scheduling lag of"
+        f" {sum(scheduling_lags) / len(scheduling_lags):.2f} seconds (max"
+        f" {max_scheduling_lag:.2f} seconds). {num_in_flight} sensor ticks in flight.",
+    )
+
+
 def execute_sensor_iteration(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
@@ -358,6 +489,8 @@ def execute_sensor_iteration(
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     sensor_tick_futures: Optional[Dict[str, Future]] = None,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
+    sensor_evaluation_loop: Optional[SensorEvaluationEventLoop] = None,
+    sensor_tick_queue: Optional["SensorTickQueue"] = None,
 ):
     instance = workspace_process_context.instance
 
@@ -395,13 +528,17 @@ def execute_sensor_iteration(
                     ).is_running:
                         sensors[selector_id] = sensor
 
+    if sensor_tick_queue is not None:
+        # drop any sensors that are no longer running
+        for selector_id in list(sensor_tick_queue.selector_ids - sensors.keys()):
+            sensor_tick_queue.remove(selector_id)
+
     if not sensors:
         yield
         return
 
+    now = get_current_timestamp()
     for sensor in sensors.values():
-        sensor_name = sensor.name
-        sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
         sensor_state = all_sensor_states.get(sensor.selector_id)
         if not sensor_state:
             assert sensor.default_status == DefaultSensorStatus.RUNNING
@@ -416,45 +553,172 @@ def execute_sensor_iteration(
                 ),
             )
             instance.add_instigator_state(sensor_state)
+
+        if sensor_tick_queue is not None:
+            sensor_tick_queue.push(
+                sensor.selector_id,
+                get_sensor_next_tick_timestamp(sensor_state, sensor) or now,
+                (sensor, sensor_state),
+            )
+            continue
         elif is_under_min_interval(sensor_state, sensor):
             continue
 
-        if threadpool_executor:
-            if sensor_tick_futures is None:
-                check.failed("sensor_tick_futures dict must be passed with threadpool_executor")
+        yield from _dispatch_sensor_tick(
+            workspace_process_context,
+            logger,
+            sensor,
+            sensor_state,
+            debug_crash_flags.get(sensor.name) if debug_crash_flags else None,
+            tick_retention_settings,
+            threadpool_executor,
+            submit_threadpool_executor,
+            sensor_tick_futures,
+            sensor_evaluation_loop,
+        )
+
+    if sensor_tick_queue is not None:
+        yield from execute_due_sensor_ticks(
+            workspace_process_context,
+            logger,
+            sensor_tick_queue,
+            threadpool_executor=threadpool_executor,
+            submit_threadpool_executor=submit_threadpool_executor,
+            sensor_tick_futures=sensor_tick_futures,
+            debug_crash_flags=debug_crash_flags,
+            sensor_evaluation_loop=sensor_evaluation_loop,
+        )
 
-            # only allow one tick per sensor to be in flight
-            if (
-                sensor.selector_id in sensor_tick_futures
-                and not sensor_tick_futures[sensor.selector_id].done()
-            ):
-                continue
 
-            future = threadpool_executor.submit(
-                _process_tick,
+def execute_due_sensor_ticks(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    sensor_tick_queue: "SensorTickQueue",
+    threadpool_executor: Optional[ThreadPoolExecutor],
+    submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    sensor_tick_futures: Optional[Dict[str, Future]] = None,
+    debug_crash_flags: Optional[DebugCrashFlags] = None,
+    sensor_evaluation_loop: Optional[SensorEvaluationEventLoop] = None,
+):
+    """Dispatches a tick for each sensor in the queue that has come due, and reschedules each of
+    them for after its min_interval has elapsed. Each tick is started with the timestamp that it is
+    rescheduled from, so that the persisted tick start agrees with the queue, even when the tick is
+    evaluated some time after it is dispatched. A sensor whose previous tick is still in flight is
+    not ticked, and is instead retried after IN_FLIGHT_SENSOR_TICK_RETRY_INTERVAL seconds.
+    """
+    tick_retention_settings = workspace_process_context.instance.get_tick_retention_settings(
+        InstigatorType.SENSOR
+    )
+
+    now = get_current_timestamp()
+    for due_tick in sensor_tick_queue.pop_due(now):
+        sensor, sensor_state = cast(Tuple[RemoteSensor, InstigatorState], due_tick.item)
+        # unless the tick is started, keep the sensor queued to try again shortly, so that it does
+        # not wait out another full interval
+        next_due_timestamp = now + IN_FLIGHT_SENSOR_TICK_RETRY_INTERVAL
+        try:
+            dispatched = yield from _dispatch_sensor_tick(
                 workspace_process_context,
                 logger,
                 sensor,
                 sensor_state,
-                sensor_debug_crash_flags,
+                debug_crash_flags.get(sensor.name) if debug_crash_flags else None,
                 tick_retention_settings,
+                threadpool_executor,
                 submit_threadpool_executor,
+                sensor_tick_futures,
+                sensor_evaluation_loop,
+                tick_timestamp=now,
+            )
+            if dispatched:
+                next_due_timestamp = now + sensor.min_interval_seconds
+        finally:
+            sensor_tick_queue.push(sensor.selector_id, next_due_timestamp, due_tick.item)
+
+        if dispatched:
+            logger.debug(
+                f"Started tick for sensor {sensor.name} {due_tick.lag:.2f}s after it was due"
+            )
+            sensor_tick_queue.record_lag(sensor.selector_id, due_tick.lag)
+
+    yield
+
+
+def _dispatch_sensor_tick(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    sensor: RemoteSensor,
+    sensor_state: InstigatorState,
+    sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
+    tick_retention_settings,
+    threadpool_executor: Optional[ThreadPoolExecutor],
+    submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    sensor_tick_futures: Optional[Dict[str, Future]],
+    sensor_evaluation_loop: Optional[SensorEvaluationEventLoop],
+    tick_timestamp: Optional[float] = None,
+) -> Generator[Optional[SerializableErrorInfo], None, bool]:
+    """Evaluates the sensor, or submits its evaluation to the executor. Returns False if the tick
+    was not started because the sensor already has a tick in flight.
+
+    If tick_timestamp is not set, the tick is timestamped with the time at which it is evaluated.
+    """
+    if sensor_evaluation_loop or threadpool_executor:
+        if sensor_tick_futures is None:
+            check.failed(
+                "sensor_tick_futures dict must be passed with threadpool_executor or"
+                " sensor_evaluation_loop"
             )
-            sensor_tick_futures[sensor.selector_id] = future
-            yield
 
+        # only allow one tick per sensor to be in flight
+        if (
+            sensor.selector_id in sensor_tick_futures
+            and not sensor_tick_futures[sensor.selector_id].done()
+        ):
+            return False
+
+        if sensor_evaluation_loop:
+            future = sensor_evaluation_loop.submit(
+                _gen_process_tick(
+                    workspace_process_context,
+                    logger,
+                    sensor,
+                    sensor_debug_crash_flags,
+                    tick_retention_settings,
+                    submit_threadpool_executor,
+                    sensor_evaluation_loop,
+                    tick_timestamp,
+                )
+            )
         else:
-            # evaluate the sensors in a loop, synchronously, yielding to allow the sensor daemon to
-            # heartbeat
-            yield from _process_tick_generator(
+            future = check.not_none(threadpool_executor).submit(
+                _process_tick,
                 workspace_process_context,
                 logger,
                 sensor,
                 sensor_state,
                 sensor_debug_crash_flags,
                 tick_retention_settings,
-                submit_threadpool_executor=None,
+                submit_threadpool_executor,
+                tick_timestamp,
             )
+        sensor_tick_futures[sensor.selector_id] = future
+        yield
+
+    else:
+        # evaluate the sensors in a loop, synchronously, yielding to allow the sensor daemon to
+        # heartbeat
+        yield from _process_tick_generator(
+            workspace_process_context,
+            logger,
+            sensor,
+            sensor_state,
+            sensor_debug_crash_flags,
+            tick_retention_settings,
+            submit_threadpool_executor=None,
+            tick_timestamp=tick_timestamp,
+        )
+
+    return True
 
 
 def _process_tick(
@@ -465,6 +729,7 @@ def _process_tick(
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     tick_retention_settings,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    tick_timestamp: Optional[float] = None,
 ):
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
@@ -477,6 +742,7 @@ def _process_tick(
             sensor_debug_crash_flags,
             tick_retention_settings,
             submit_threadpool_executor,
+            tick_timestamp,
         )
     )
 
@@ -567,16 +833,17 @@ def _process_tick_generator(
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     tick_retention_settings,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    tick_timestamp: Optional[float] = None,
 ):
     instance = workspace_process_context.instance
     error_info = None
-    now = get_current_datetime()
-    sensor_state = check.not_none(
-        instance.get_instigator_state(
-            remote_sensor.get_remote_origin_id(), remote_sensor.selector_id
-        )
+    now = _get_tick_datetime(tick_timestamp)
+    sensor_state = instance.get_instigator_state(
+        remote_sensor.get_remote_origin_id(), remote_sensor.selector_id
     )
-    if is_under_min_interval(sensor_state, remote_sensor):
+    if not _is_sensor_still_running(sensor_state, remote_sensor):
+        return
+    elif is_under_min_interval(sensor_state, remote_sensor):
         # check the since we might have been queued before processing
         return
     else:
@@ -634,6 +901,140 @@ def _process_tick_generator(
     yield error_info
 
 
+async def _gen_process_tick(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    remote_sensor: RemoteSensor,
+    sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
+    tick_retention_settings,
+    submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    sensor_evaluation_loop: SensorEvaluationEventLoop,
+    tick_timestamp: Optional[float] = None,
+) -> Optional[SerializableErrorInfo]:
+    """Async counterpart to _process_tick_generator, which awaits the sensor evaluation rather than
+    blocking a thread on it.
+    """
+    instance = workspace_process_context.instance
+    loop = asyncio.get_running_loop()
+    error_info = None
+    now = _get_tick_datetime(tick_timestamp)
+    # all storage reads and writes are run on the executor, so that a slow storage call does not
+    # stall every other sensor evaluation on the event loop
+    sensor_state = await loop.run_in_executor(
+        None,
+        instance.get_instigator_state,
+        remote_sensor.get_remote_origin_id(),
+        remote_sensor.selector_id,
+    )
+    if not _is_sensor_still_running(sensor_state, remote_sensor):
+        return None
+    elif is_under_min_interval(sensor_state, remote_sensor):
+        # check the since we might have been queued before processing
+        return None
+    else:
+        await loop.run_in_executor(
+            None, mark_sensor_state_for_tick, instance, remote_sensor, sensor_state, now
+        )
+
+    try:
+        # get the tick that we should be evaluating for
+        tick = await loop.run_in_executor(
+            None,
+            _get_evaluation_tick,
+            instance,
+            remote_sensor,
+            _sensor_instigator_data(sensor_state),
+            now.timestamp(),
+            logger,
+        )
+
+        check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
+
+        async with _gen_sensor_launch_context(
+            SensorLaunchContext(
+                remote_sensor,
+                tick,
+                instance,
+                logger,
+                tick_retention_settings,
+            )
+        ) as tick_context:
+            check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
+            tick_context.add_log_key(tick_context.log_key)
+
+            # in cases where there is unresolved work left to do, do it
+            if len(tick.unsubmitted_run_ids_with_requests) > 0:
+                await loop.run_in_executor(
+                    None,
+                    lambda: list(
+                        _resume_tick(
+                            workspace_process_context,
+                            tick_context,
+                            tick,
+                            remote_sensor,
+                            submit_threadpool_executor,
+                            sensor_debug_crash_flags,
+                        )
+                    ),
+                )
+            else:
+                await _gen_evaluate_sensor(
+                    workspace_process_context,
+                    tick_context,
+                    remote_sensor,
+                    sensor_state,
+                    submit_threadpool_executor,
+                    sensor_evaluation_loop,
+                    sensor_debug_crash_flags,
+                )
+
+    except Exception:
+        error_info = DaemonErrorCapture.on_exception(
+            exc_info=sys.exc_info(),
+            logger=logger,
+            log_message=f"Sensor daemon caught an error for sensor {remote_sensor.name}",
+        )
+
+    return error_info
+
+
+@asynccontextmanager
+async def _gen_sensor_launch_context(
+    context: SensorLaunchContext,
+) -> AsyncIterator[SensorLaunchContext]:
+    """Enters and exits the launch context on the executor, since exiting writes the tick and
+    purges old ticks from storage.
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, context.__enter__)
+    try:
+        yield context
+    except BaseException:
+        await loop.run_in_executor(None, context.__exit__, *sys.exc_info())
+        raise
+    else:
+        await loop.run_in_executor(None, context.__exit__, None, None, None)
+
+
+def _get_tick_datetime(tick_timestamp: Optional[float]) -> datetime.datetime:
+    return (
+        datetime_from_timestamp(tick_timestamp)
+        if tick_timestamp is not None
+        else get_current_datetime()
+    )
+
+
+def _is_sensor_still_running(
+    sensor_state: Optional[InstigatorState], remote_sensor: RemoteSensor
+) -> TypeGuard[InstigatorState]:
+    # the running sensors are only reloaded periodically, so the sensor may have been stopped
+    # since it was queued
+    return (
+        sensor_state is not None
+        and remote_sensor.get_current_instigator_state(sensor_state).is_running
+    )
+
+
 def _sensor_instigator_data(state: InstigatorState) -> Optional[SensorInstigatorData]:
     instigator_data = state.instigator_data
     if instigator_data is None or isinstance(instigator_data, SensorInstigatorData):
@@ -793,12 +1194,11 @@ def _evaluate_sensor(
     instance = workspace_process_context.instance
     context.logger.info(f"Checking for new runs for sensor: {remote_sensor.name}")
     code_location = _get_code_location_for_sensor(workspace_process_context, remote_sensor)
-    repository_handle = remote_sensor.handle.repository_handle
     instigator_data = _sensor_instigator_data(state)
 
     sensor_runtime_data = code_location.get_sensor_execution_data(
         instance,
-        repository_handle,
+        remote_sensor.handle.repository_handle,
         remote_sensor.name,
         instigator_data.last_tick_timestamp if instigator_data else None,
         instigator_data.last_run_key if instigator_data else None,
@@ -809,6 +1209,74 @@ def _evaluate_sensor(
 
     yield
 
+    yield from _process_sensor_runtime_data(
+        workspace_process_context,
+        context,
+        remote_sensor,
+        sensor_runtime_data,
+        submit_threadpool_executor,
+        sensor_debug_crash_flags,
+    )
+
+
+async def _gen_evaluate_sensor(
+    workspace_process_context: IWorkspaceProcessContext,
+    context: SensorLaunchContext,
+    remote_sensor: RemoteSensor,
+    state: InstigatorState,
+    submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    sensor_evaluation_loop: "SensorEvaluationEventLoop",
+    sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags] = None,
+) -> None:
+    instance = workspace_process_context.instance
+    loop = asyncio.get_running_loop()
+    context.logger.info(f"Checking for new runs for sensor: {remote_sensor.name}")
+    code_location = await loop.run_in_executor(
+        None, _get_code_location_for_sensor, workspace_process_context, remote_sensor
+    )
+    instigator_data = _sensor_instigator_data(state)
+
+    # bound the number of evaluations that are in flight against any single code location, so
+    # that a large number of sensors does not overwhelm its server
+    async with sensor_evaluation_loop.get_code_location_semaphore(code_location.name):
+        sensor_runtime_data = await code_location.gen_sensor_execution_data(
+            instance,
+            remote_sensor.handle.repository_handle,
+            remote_sensor.name,
+            instigator_data.last_tick_timestamp if instigator_data else None,
+            instigator_data.last_run_key if instigator_data else None,
+            instigator_data.cursor if instigator_data else None,
+            context.log_key,
+            instigator_data.last_sensor_start_timestamp if instigator_data else None,
+        )
+
+    # processing the result is blocking work against storage, so hand it off to the executor
+    # rather than stalling the other evaluations on the event loop
+    await loop.run_in_executor(
+        None,
+        lambda: list(
+            _process_sensor_runtime_data(
+                workspace_process_context,
+                context,
+                remote_sensor,
+                sensor_runtime_data,
+                submit_threadpool_executor,
+                sensor_debug_crash_flags,
+            )
+        ),
+    )
+
+
+def _process_sensor_runtime_data(
+    workspace_process_context: IWorkspaceProcessContext,
+    context: SensorLaunchContext,
+    remote_sensor: RemoteSensor,
+    sensor_runtime_data: SensorExecutionData,
+    submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags] = None,
+):
+    instance = workspace_process_context.instance
+
     # Kept for backwards compatibility with sensor log keys that were previously created in the
     # sensor evaluation, rather than upfront.
     #
@@ -1189,22 +1657,31 @@ def _submit_backfill_request(
     )
 
 
-def is_under_min_interval(state: InstigatorState, remote_sensor: RemoteSensor) -> bool:
+def get_sensor_next_tick_timestamp(
+    state: InstigatorState, remote_sensor: RemoteSensor
+) -> Optional[float]:
+    """Returns the time at which the sensor's min_interval will have elapsed since its last tick,
+    or None if the sensor has not yet ticked.
+    """
     instigator_data = _sensor_instigator_data(state)
     if not instigator_data:
-        return False
+        return None
 
     if not instigator_data.last_tick_start_timestamp and not instigator_data.last_tick_timestamp:
-        return False
-
-    if not remote_sensor.min_interval_seconds:
-        return False
+        return None
 
-    elapsed = get_current_timestamp() - max(
+    return max(
         instigator_data.last_tick_timestamp or 0,
         instigator_data.last_tick_start_timestamp or 0,
-    )
-    return elapsed < remote_sensor.min_interval_seconds
+    ) + (remote_sensor.min_interval_seconds or 0)
+
+
+def is_under_min_interval(state: InstigatorState, remote_sensor: RemoteSensor) -> bool:
+    next_tick_timestamp = get_sensor_next_tick_timestamp(state, remote_sensor)
+    if next_tick_timestamp is None:
+        return False
+
+    return get_current_timestamp() < next_tick_timestamp
 
 
 def _fetch_existing_runs(
@@ -547,12 +547,9 @@ def external_schedule_execution(
             else:
                 raise
 
-    def external_sensor_execution(self, sensor_execution_args: SensorExecutionArgs) -> str:
-        check.inst_param(
-            sensor_execution_args,
-            "sensor_execution_args",
-            SensorExecutionArgs,
-        )
+    def _get_sensor_execution_timeout(
+        self, sensor_execution_args: SensorExecutionArgs
+    ) -> Tuple[int, str]:
         # The timeout for the sensor can be defined in one of three ways.
         #   1. By the default grpc timeout
         #   2. By the DEFAULT_SENSOR_GRPC_TIMEOUT environment variable
@@ -573,6 +570,15 @@ def external_sensor_execution(self, sensor_execution_args: SensorExecutionArgs)
             " chunks, using cursors to let subsequent sensor calls pick up where the previous call"
             " left off."
         )
+        return timeout, custom_timeout_message
+
+    def external_sensor_execution(self, sensor_execution_args: SensorExecutionArgs) -> str:
+        check.inst_param(
+            sensor_execution_args,
+            "sensor_execution_args",
+            SensorExecutionArgs,
+        )
+        timeout, custom_timeout_message = self._get_sensor_execution_timeout(sensor_execution_args)
 
         try:
             return self._query(
@@ -601,6 +607,45 @@ def external_sensor_execution(self, sensor_execution_args: SensorExecutionArgs)
             else:
                 raise
 
+    async def gen_external_sensor_execution(
+        self, sensor_execution_args: SensorExecutionArgs
+    ) -> str:
+        check.inst_param(
+            sensor_execution_args,
+            "sensor_execution_args",
+            SensorExecutionArgs,
+        )
+        timeout, custom_timeout_message = self._get_sensor_execution_timeout(sensor_execution_args)
+
+        try:
+            res = await self._gen_query(
+                "SyncExternalSensorExecution",
+                api_pb2.ExternalSensorExecutionRequest,
+                timeout=timeout,
+                serialized_external_sensor_execution_args=serialize_value(sensor_execution_args),
+                custom_timeout_message=custom_timeout_message,
+            )
+            return res.serialized_sensor_result
+        except Exception as e:
+            # On older servers that only have the streaming API call implemented, fall back to that API
+            if self._is_unimplemented_error(e):
+                chunks = [
+                    chunk
+                    async for chunk in self._gen_streaming_query(
+                        "ExternalSensorExecution",
+                        api_pb2.ExternalSensorExecutionRequest,
+                        timeout=timeout,
+                        serialized_external_sensor_execution_args=serialize_value(
+                            sensor_execution_args
+                        ),
+                        custom_timeout_message=custom_timeout_message,
+                    )
+                ]
+
+                return "".join([chunk.serialized_chunk for chunk in chunks])
+            else:
+                raise
+
     def external_notebook_data(self, notebook_path: str) -> bytes:
         check.str_param(notebook_path, "notebook_path")
         res = self._query(
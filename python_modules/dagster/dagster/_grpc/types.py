@@ -19,6 +19,7 @@
     RemoteJobOrigin,
     RemoteRepositoryOrigin,
 )
+from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
 from dagster._serdes import serialize_value, whitelist_for_serdes
 from dagster._serdes.serdes import SetToSequenceFieldSerializer
 from dagster._utils.error import SerializableErrorInfo
@@ -246,6 +247,9 @@ class ExecuteStepArgs(
             ("known_state", Optional[KnownExecutionState]),
             ("should_verify_step", Optional[bool]),
             ("print_serialized_events", bool),
+            # A snapshot of the plan for the steps to execute, which the step worker rehydrates
+            # instead of building the plan from the job definition
+            ("execution_plan_snapshot", Optional[ExecutionPlanSnapshot]),
         ],
     )
 ):
@@ -259,6 +263,7 @@ def __new__(
         known_state: Optional[KnownExecutionState] = None,
         should_verify_step: Optional[bool] = None,
         print_serialized_events: Optional[bool] = None,
+        execution_plan_snapshot: Optional[ExecutionPlanSnapshot] = None,
     ):
         return super(ExecuteStepArgs, cls).__new__(
             cls,
@@ -276,6 +281,9 @@ def __new__(
             print_serialized_events=check.opt_bool_param(
                 print_serialized_events, "print_serialized_events", False
             ),
+            execution_plan_snapshot=check.opt_inst_param(
+                execution_plan_snapshot, "execution_plan_snapshot", ExecutionPlanSnapshot
+            ),
         )
 
     def _get_compressed_args(self) -> str:
@@ -337,6 +337,12 @@ def get_record_annotations(obj) -> Mapping[str, Type]:
     return getattr(obj, _RECORD_ANNOTATIONS_FIELD)
 
 
+def get_record_field_remapping(obj) -> Mapping[str, str]:
+    """The field_to_new_mapping for the record, mapping field names to __new__ argument names."""
+    check.invariant(is_record(obj), "Only works for @record decorated classes")
+    return getattr(obj, _REMAPPING_FIELD)
+
+
 def get_original_class(obj):
     check.invariant(is_record(obj), "Only works for @record decorated classes")
     return getattr(obj, _ORIGINAL_CLASS_FIELD)
@@ -353,7 +359,7 @@ def as_dict_for_new(obj) -> Mapping[str, Any]:
     """Creates a dict representation of the record with field_to_new_mapping applied."""
     check.invariant(is_record(obj), "Only works for @record decorated classes")
 
-    remap = getattr(obj, _REMAPPING_FIELD)
+    remap = get_record_field_remapping(obj)
     from_obj = {}
     for k, v in as_dict(obj).items():
         if k in remap:
@@ -184,6 +184,14 @@ def should_run_next_iteration(self, schedule: RemoteSchedule, now_timestamp: flo
             return True
         return now_timestamp >= self.next_iteration_timestamp
 
+    def get_scheduling_lag(self, schedule: RemoteSchedule, now_timestamp: float) -> Optional[float]:
+        """Returns the number of seconds between when the schedule was due to be evaluated again
+        and the given timestamp, or None if its cron schedule has changed since it was last evaluated.
+        """
+        if schedule.cron_schedule != self.cron_schedule:
+            return None
+        return max(0.0, now_timestamp - self.next_iteration_timestamp)
+
 
 def execute_scheduler_iteration_loop(
     workspace_process_context: IWorkspaceProcessContext,
@@ -358,6 +366,7 @@ def launch_scheduled_runs(
         yield
         return
 
+    scheduling_lags: List[float] = []
     for schedule in running_schedules.values():
         error_info = None
         try:
@@ -410,6 +419,10 @@ def launch_scheduled_runs(
                     # Not enough time has passed for this schedule, don't bother creating a thread
                     continue
 
+                _record_scheduling_lag(
+                    logger, schedule, previous_iteration_times, now_timestamp, scheduling_lags
+                )
+
                 future = threadpool_executor.submit(
                     launch_scheduled_runs_for_schedule,
                     workspace_process_context,
@@ -442,6 +455,10 @@ def launch_scheduled_runs(
                     # Not enough time has passed for this schedule, don't bother executing
                     continue
 
+                _record_scheduling_lag(
+                    logger, schedule, previous_iteration_times, now_timestamp, scheduling_lags
+                )
+
                 # evaluate the schedules in a loop, synchronously, yielding to allow the schedule daemon to
                 # heartbeat
                 found_iteration_times = False
@@ -480,6 +497,32 @@ def launch_scheduled_runs(
             logger.exception(f"Scheduler caught an error for schedule {schedule.name}")
         yield error_info
 
+    if scheduling_lags:
+        logger.info(
+            f"Evaluated {len(scheduling_lags)} schedules with a mean scheduling lag of"
+            f" {sum(scheduling_lags) / len(scheduling_lags):.2f} seconds (max"
+            f" {max(scheduling_lags):.2f} seconds)."
+        )
+
+
+def _record_scheduling_lag(
+    logger: logging.Logger,
+    schedule: RemoteSchedule,
+    previous_iteration_times: Optional[ScheduleIterationTimes],
+    now_timestamp: float,
+    scheduling_lags: List[float],
+) -> None:
+    scheduling_lag = (
+        previous_iteration_times.get_scheduling_lag(schedule, now_timestamp)
+        if previous_iteration_times
+        else None
+    )
+    if scheduling_lag is None:
+        return
+
+    logger.debug(f"Evaluating schedule {schedule.name} {scheduling_lag:.2f}s after it was due")
+    scheduling_lags.append(scheduling_lag)
+
 
 def launch_scheduled_runs_for_schedule(
     workspace_process_context: IWorkspaceProcessContext,
@@ -0,0 +1,118 @@
+import heapq
+import itertools
+from typing import AbstractSet, Dict, Generic, List, Mapping, NamedTuple, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# once this many stale entries have accumulated in the heap, it is rebuilt from the live entries
+_MIN_HEAP_SIZE_TO_COMPACT = 1000
+
+
+class DueInstigatorTick(NamedTuple):
+    """An instigator whose tick has come due.
+
+    Attributes:
+        selector_id (str): The selector id of the instigator.
+        due_timestamp (float): The time at which the instigator was due to tick.
+        lag (float): The number of seconds between the due time and the time at which the tick was
+            removed from the queue.
+        item (Any): The object that was queued alongside the instigator.
+    """
+
+    selector_id: str
+    due_timestamp: float
+    lag: float
+    item: object
+
+
+class InstigatorTickQueue(Generic[T]):
+    """A priority queue of instigators, keyed on the time at which each is next due to tick. Allows
+    a daemon to pull only the instigators that are due, rather than checking every instigator on
+    each loop, and to sleep until the next one is due.
+
+    Each instigator appears in the queue at most once. Pushing an instigator that is already queued
+    replaces its due time.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, str]] = []
+        self._entries: Dict[str, Tuple[float, int, T]] = {}
+        self._counter = itertools.count()
+        self._lags: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, selector_id: str) -> bool:
+        return selector_id in self._entries
+
+    @property
+    def selector_ids(self) -> AbstractSet[str]:
+        return self._entries.keys()
+
+    def push(self, selector_id: str, due_timestamp: float, item: T) -> None:
+        sequence_number = next(self._counter)
+        self._entries[selector_id] = (due_timestamp, sequence_number, item)
+        heapq.heappush(self._heap, (due_timestamp, sequence_number, selector_id))
+        self._maybe_compact()
+
+    def remove(self, selector_id: str) -> None:
+        # the heap entry is discarded lazily, the next time it reaches the top of the heap
+        self._entries.pop(selector_id, None)
+
+    def next_due_timestamp(self) -> Optional[float]:
+        self._discard_stale_entries()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, timestamp: float) -> List[DueInstigatorTick]:
+        """Removes and returns every instigator that is due at the given timestamp, in order of
+        their due times.
+        """
+        due_ticks = []
+        while True:
+            self._discard_stale_entries()
+            if not self._heap or self._heap[0][0] > timestamp:
+                break
+
+            due_timestamp, _, selector_id = heapq.heappop(self._heap)
+            _, _, item = self._entries.pop(selector_id)
+            due_ticks.append(
+                DueInstigatorTick(
+                    selector_id=selector_id,
+                    due_timestamp=due_timestamp,
+                    lag=max(0.0, timestamp - due_timestamp),
+                    item=item,
+                )
+            )
+        return due_ticks
+
+    def record_lag(self, selector_id: str, lag: float) -> None:
+        """Records the number of seconds between when the instigator was due to tick and when its
+        tick actually started.
+        """
+        self._lags[selector_id] = lag
+
+    def pop_lags(self) -> Mapping[str, float]:
+        """Returns the lag of each instigator whose tick has started since the last call to this
+        method, keyed by selector id.
+        """
+        lags = self._lags
+        self._lags = {}
+        return lags
+
+    def _is_stale(self, heap_entry: Tuple[float, int, str]) -> bool:
+        _, sequence_number, selector_id = heap_entry
+        entry = self._entries.get(selector_id)
+        return entry is None or entry[1] != sequence_number
+
+    def _discard_stale_entries(self) -> None:
+        while self._heap and self._is_stale(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def _maybe_compact(self) -> None:
+        if len(self._heap) > max(_MIN_HEAP_SIZE_TO_COMPACT, 2 * len(self._entries)):
+            self._heap = [
+                (due_timestamp, sequence_number, selector_id)
+                for selector_id, (due_timestamp, sequence_number, _) in self._entries.items()
+            ]
+            heapq.heapify(self._heap)
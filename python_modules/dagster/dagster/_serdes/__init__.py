@@ -9,9 +9,11 @@
     SerializableNonScalarKeyMapping as SerializableNonScalarKeyMapping,
     WhitelistMap as WhitelistMap,
     deserialize_value as deserialize_value,
+    deserialize_value_lazily as deserialize_value_lazily,
     deserialize_values as deserialize_values,
     pack_value as pack_value,
     serialize_value as serialize_value,
+    serialize_value_to_bytes as serialize_value_to_bytes,
     unpack_value as unpack_value,
     whitelist_for_serdes as whitelist_for_serdes,
 )
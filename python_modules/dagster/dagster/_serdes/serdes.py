@@ -15,6 +15,7 @@
 
 import collections.abc
 import dataclasses
+import os
 from abc import ABC, abstractmethod
 from dataclasses import is_dataclass
 from enum import Enum
@@ -48,11 +49,13 @@
 
 import dagster._check as check
 import dagster._seven as seven
+from dagster._check import EvalContext
 from dagster._model.pydantic_compat_layer import ModelFieldCompat, model_fields
 from dagster._record import (
     IHaveNew,
     as_dict_for_new,
     get_record_annotations,
+    get_record_field_remapping,
     has_generated_new,
     is_record,
 )
@@ -461,6 +464,16 @@ def is_whitelisted_for_serdes_object(
     return False
 
 
+def get_serdes_storage_name(klass: Type, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> str:
+    """Get the name a class decorated with `@whitelist_for_serdes` is serialized under, i.e. the
+    value of the `__class__` key in its packed representation.
+    """
+    serializer = whitelist_map.object_serializers.get(klass.__name__)
+    if serializer is None:
+        raise SerdesUsageError(f"Class {klass.__name__} is not whitelisted for serdes.")
+    return serializer.get_storage_name()
+
+
 ###################################################################################################
 # Serializers
 ###################################################################################################
@@ -469,8 +482,10 @@ def is_whitelisted_for_serdes_object(
 class UnpackContext:
     """values are unpacked bottom up."""
 
-    def __init__(self):
+    def __init__(self, compiled: bool = False):
         self.observed_unknown_serdes_values: Set[UnknownSerdesValue] = set()
+        # whether objects should be unpacked via their serializer's compiled unpacker
+        self.compiled = compiled
 
     def assert_no_unknown_values(self, obj: UnpackedValue) -> PackableValue:
         if isinstance(obj, UnknownSerdesValue):
@@ -548,6 +563,20 @@ def get_storage_name(self) -> str:
     set(),
 )
 
+_SCALAR_TYPES: Final[FrozenSet[Type]] = frozenset({int, float, str, bool, type(None)})
+
+ObjectHandler: TypeAlias = Callable[[SerializableObject, WhitelistMap, str], JsonSerializableValue]
+CompiledPacker: TypeAlias = Callable[
+    [Any, WhitelistMap, ObjectHandler, str], Dict[str, JsonSerializableValue]
+]
+CompiledUnpacker: TypeAlias = Callable[
+    [Dict[str, UnpackedValue], WhitelistMap, "UnpackContext"], Any
+]
+
+
+def _compiled_serdes_enabled() -> bool:
+    return str(os.getenv("DAGSTER_SERDES_COMPILED_PACKERS")).lower() in ("1", "true", "t")
+
 
 class ObjectSerializer(Serializer, Generic[T]):
     # NOTE: See `whitelist_for_serdes` docstring for explanations of parameters.
@@ -609,11 +638,19 @@ def unpack(
 
             return self.klass(**unpacked)
         except Exception as exc:
-            value = self.handle_unpack_error(exc, context, unpacked_dict)
-            if isinstance(context, UnpackContext):
-                context.assert_no_unknown_values(value)
-                context.clear_ignored_unknown_values(unpacked_dict)
-            return value
+            return self._recover_from_unpack_error(exc, context, unpacked_dict)
+
+    def _recover_from_unpack_error(
+        self,
+        exc: Exception,
+        context: UnpackContext,
+        unpacked_dict: Dict[str, UnpackedValue],
+    ) -> Any:
+        value = self.handle_unpack_error(exc, context, unpacked_dict)
+        if isinstance(context, UnpackContext):
+            context.assert_no_unknown_values(value)
+            context.clear_ignored_unknown_values(unpacked_dict)
+        return value
 
     # Hook: Modify the contents of the unpacked dict before domain object construction during
     # deserialization.
@@ -638,7 +675,7 @@ def pack_items(
         self,
         value: T,
         whitelist_map: WhitelistMap,
-        object_handler: Callable[[SerializableObject, WhitelistMap, str], JsonSerializableValue],
+        object_handler: ObjectHandler,
         descent_path: str,
     ) -> Iterator[Tuple[str, JsonSerializableValue]]:
         yield "__class__", self.get_storage_name()
@@ -682,6 +719,179 @@ def constructor_param_names(self) -> Sequence[str]: ...
     def get_storage_name(self) -> str:
         return self.storage_name or self.klass.__name__
 
+    # ##### COMPILED PACK / UNPACK
+    #
+    # The generic pack_items / unpack paths re-resolve storage names, field serializers and skip
+    # rules for every field of every object. The compiled variants below produce the same output,
+    # but resolve all of that once per class the first time the class is packed or unpacked.
+
+    def pack_compiled(
+        self,
+        value: T,
+        whitelist_map: WhitelistMap,
+        object_handler: ObjectHandler,
+        descent_path: str,
+    ) -> Dict[str, JsonSerializableValue]:
+        """Equivalent to `dict(self.pack_items(...))`, using a packer specialized for this class."""
+        return self._compiled_packer(value, whitelist_map, object_handler, descent_path)
+
+    def unpack_compiled(
+        self,
+        unpacked_dict: Dict[str, UnpackedValue],
+        whitelist_map: WhitelistMap,
+        context: UnpackContext,
+    ) -> T:
+        """Equivalent to `self.unpack(...)`, using an unpacker specialized for this class."""
+        return self._compiled_unpacker(unpacked_dict, whitelist_map, context)
+
+    # Hook: Return the keys that object_as_mapping produces for every instance of the class, in
+    # order, or None if they can not be determined statically.
+    def get_static_mapping_keys(self) -> Optional[Sequence[str]]:
+        return None
+
+    # Hook: Return source lines that bind the values of object_as_mapping(_value) to the given
+    # local variable names. The lines may `return _pack_generic(value, ...)` to bail out for
+    # instances that do not match the static layout.
+    def get_compiled_field_binding_src(self, local_names: Sequence[str]) -> Optional[str]:
+        return None
+
+    def _pack_generic(
+        self,
+        value: T,
+        whitelist_map: WhitelistMap,
+        object_handler: ObjectHandler,
+        descent_path: str,
+    ) -> Dict[str, JsonSerializableValue]:
+        return dict(self.pack_items(value, whitelist_map, object_handler, descent_path))
+
+    @cached_property
+    def _compiled_packer(self) -> CompiledPacker:
+        keys = self.get_static_mapping_keys()
+        binding_src = (
+            self.get_compiled_field_binding_src([f"_f{i}" for i in range(len(keys))])
+            if keys is not None
+            else None
+        )
+        # subclasses that customize pack_items can only be driven through the generic path
+        if (
+            keys is None
+            or binding_src is None
+            or type(self).pack_items is not ObjectSerializer.pack_items
+        ):
+            return self._pack_generic
+
+        global_ns: Dict[str, Any] = {
+            "_klass": self.klass,
+            "_before_pack": self.before_pack,
+            "_pack_generic": self._pack_generic,
+            "_transform": _transform_for_serialization,
+            "_SCALAR_TYPES": _SCALAR_TYPES,
+            "_EMPTY_VALUES_TO_SKIP": EMPTY_VALUES_TO_SKIP,
+            "_old_fields": dict(self.old_fields),
+        }
+        lines = [
+            "def __compiled_pack__(value, whitelist_map, object_handler, descent_path):",
+            "    if type(value) is not _klass:",
+            "        return _pack_generic(value, whitelist_map, object_handler, descent_path)",
+        ]
+        if type(self).before_pack is not ObjectSerializer.before_pack:
+            lines.append("    _value = _before_pack(value)")
+        else:
+            lines.append("    _value = value")
+        lines.extend(f"    {line}" for line in binding_src.splitlines())
+        lines.append(f"    _packed = {{'__class__': {self.get_storage_name()!r}}}")
+
+        for i, key in enumerate(keys):
+            local = f"_f{i}"
+            indent = "    "
+            if key in self.skip_when_empty_fields:
+                lines.append(f"{indent}if {local} not in _EMPTY_VALUES_TO_SKIP:")
+                indent += "    "
+            elif key in self.skip_when_none_fields:
+                lines.append(f"{indent}if {local} is not None:")
+                indent += "    "
+
+            storage_key = repr(self.storage_field_names.get(key, key))
+            path = f"descent_path + {'.' + key!r}"
+            custom = self.field_serializers.get(key)
+            if custom:
+                global_ns[f"_custom{i}"] = custom
+                lines.append(
+                    f"{indent}_packed[{storage_key}] = _custom{i}.pack("
+                    f"{local}, whitelist_map=whitelist_map, descent_path={path})"
+                )
+            else:
+                lines.extend(
+                    [
+                        f"{indent}if {local}.__class__ in _SCALAR_TYPES:",
+                        f"{indent}    _packed[{storage_key}] = {local}",
+                        f"{indent}else:",
+                        f"{indent}    _packed[{storage_key}] = _transform("
+                        f"{local}, whitelist_map, object_handler, {path})",
+                    ]
+                )
+
+        if self.old_fields:
+            lines.append("    _packed.update(_old_fields)")
+        lines.append("    return _packed")
+
+        return EvalContext(global_ns=global_ns, local_ns={}, lazy_imports={}).compile_fn(
+            "\n".join(lines), "__compiled_pack__"
+        )
+
+    @cached_property
+    def _compiled_unpacker(self) -> CompiledUnpacker:
+        if type(self).unpack is not ObjectSerializer.unpack:
+            return self.unpack
+
+        param_names = set(self.constructor_param_names)
+        # storage key -> constructor param, resolved the same way unpack resolves each key
+        loaded_names = {
+            key: self.loaded_field_names.get(key, key)
+            for key in param_names | set(self.loaded_field_names)
+            if self.loaded_field_names.get(key, key) in param_names
+        }
+        custom_fields = [
+            (name, serializer)
+            for name, serializer in self.field_serializers.items()
+            if name in param_names
+        ]
+        klass = self.klass
+        before_unpack = (
+            self.before_unpack
+            if type(self).before_unpack is not ObjectSerializer.before_unpack
+            else None
+        )
+        unpack_generic = self.unpack
+        recover = self._recover_from_unpack_error
+
+        def _compiled_unpack(
+            unpacked_dict: Dict[str, UnpackedValue],
+            whitelist_map: WhitelistMap,
+            context: UnpackContext,
+        ) -> Any:
+            # unknown values need the per-field bookkeeping of the generic path
+            if context.observed_unknown_serdes_values:
+                return unpack_generic(unpacked_dict, whitelist_map, context)
+            try:
+                if before_unpack:
+                    unpacked_dict = before_unpack(context, unpacked_dict)
+                kwargs = {
+                    loaded_names[key]: value
+                    for key, value in unpacked_dict.items()
+                    if key in loaded_names
+                }
+                for name, serializer in custom_fields:
+                    if name in kwargs:
+                        kwargs[name] = serializer.unpack(
+                            kwargs[name], whitelist_map=whitelist_map, context=context
+                        )
+                return klass(**kwargs)
+            except Exception as exc:
+                return recover(exc, context, unpacked_dict)
+
+        return _compiled_unpack
+
 
 T_NamedTuple = TypeVar("T_NamedTuple", default=NamedTuple)
 
@@ -700,6 +910,20 @@ def object_as_mapping(self, value: T_NamedTuple) -> Mapping[str, Any]:
         # Value is always a NamedTuple, we just can't express that in the type of T_NamedTuple.
         return value._asdict()  # type: ignore
 
+    def get_static_mapping_keys(self) -> Optional[Sequence[str]]:
+        if type(self).object_as_mapping is not NamedTupleSerializer.object_as_mapping:
+            return None
+        if is_record(self.klass):
+            remap = get_record_field_remapping(self.klass)
+            return [remap.get(field, field) for field in self.klass._fields]  # type: ignore
+        return list(self.klass._fields)  # type: ignore
+
+    def get_compiled_field_binding_src(self, local_names: Sequence[str]) -> Optional[str]:
+        if not local_names:
+            return ""
+        # records ban iteration, so read the underlying tuple directly
+        return f"({', '.join(local_names)},) = tuple.__iter__(_value)"
+
     @cached_property
     def constructor_param_names(self) -> Sequence[str]:
         if has_generated_new(self.klass):
@@ -733,6 +957,23 @@ class DataclassSerializer(ObjectSerializer[T_Dataclass]):
     def object_as_mapping(self, value: T_Dataclass) -> Mapping[str, Any]:
         return value.__dict__
 
+    def get_static_mapping_keys(self) -> Optional[Sequence[str]]:
+        if type(self).object_as_mapping is not DataclassSerializer.object_as_mapping:
+            return None
+        return list(f.name for f in dataclasses.fields(self.klass))
+
+    def get_compiled_field_binding_src(self, local_names: Sequence[str]) -> Optional[str]:
+        keys = tuple(check.not_none(self.get_static_mapping_keys()))
+        # __dict__ may carry extra attributes (e.g. cached properties) or a different order, in
+        # which case the generic path is needed to produce identical output
+        lines = [
+            "_dict = _value.__dict__",
+            f"if tuple(_dict) != {keys!r}:",
+            "    return _pack_generic(value, whitelist_map, object_handler, descent_path)",
+        ]
+        lines.extend(f"{local} = _dict[{key!r}]" for local, key in zip(local_names, keys))
+        return "\n".join(lines)
+
     @cached_property
     def constructor_param_names(self) -> Sequence[str]:
         return list(f.name for f in dataclasses.fields(self.klass))
@@ -833,7 +1074,7 @@ def serialize_value(
     serializable_value = _transform_for_serialization(
         val,
         whitelist_map=whitelist_map,
-        object_handler=_wrap_object,
+        object_handler=_wrap_object_compiled if _compiled_serdes_enabled() else _wrap_object,
         descent_path=_root(val),
     )
     return seven.json.dumps(serializable_value, **json_kwargs)
@@ -897,14 +1138,14 @@ def pack_value(
         val,
         whitelist_map=whitelist_map,
         descent_path=descent_path,
-        object_handler=_pack_object,
+        object_handler=_pack_object_compiled if _compiled_serdes_enabled() else _pack_object,
     )
 
 
 def _transform_for_serialization(
     val: PackableValue,
     whitelist_map: WhitelistMap,
-    object_handler: Callable[[SerializableObject, WhitelistMap, str], JsonSerializableValue],
+    object_handler: ObjectHandler,
     descent_path: str,
 ) -> JsonSerializableValue:
     # this is a hot code path so we handle the common base cases without isinstance
@@ -931,6 +1172,8 @@ def _transform_for_serialization(
             )
             for key, value in cast(dict, val).items()
         }
+    if tval is LazyUnpackedObject:
+        val = cast(LazyUnpackedObject, val).get_unpacked()
     if tval is SerializableNonScalarKeyMapping:
         return {
             "__mapping_items__": [
@@ -1043,6 +1286,17 @@ def _pack_object(
     return dict(serializer.pack_items(obj, whitelist_map, _pack_object, descent_path))
 
 
+def _pack_object_compiled(
+    obj: SerializableObject, whitelist_map: WhitelistMap, descent_path: str
+) -> Mapping[str, JsonSerializableValue]:
+    # the object_handler for _transform_for_serialization to produce dicts for objects using
+    # the per-class compiled packers
+
+    klass_name = obj.__class__.__name__
+    serializer = whitelist_map.object_serializers[klass_name]
+    return serializer.pack_compiled(obj, whitelist_map, _pack_object_compiled, descent_path)
+
+
 class _LazySerializationWrapper(dict):
     """An object used to allow us to drive serialization iteratively
     over the tree of objects via json.dumps, instead of having to create
@@ -1086,6 +1340,27 @@ def _wrap_object(
     return _LazySerializationWrapper(obj, whitelist_map, descent_path)
 
 
+class _CompiledLazySerializationWrapper(_LazySerializationWrapper):
+    """Variant of _LazySerializationWrapper that packs each object with its compiled packer."""
+
+    __slots__ = []
+
+    def items(self) -> Iterator[Tuple[str, JsonSerializableValue]]:
+        klass_name = self._obj.__class__.__name__
+        serializer = self._whitelist_map.object_serializers[klass_name]
+        yield from serializer.pack_compiled(
+            self._obj, self._whitelist_map, _wrap_object_compiled, self._descent_path
+        ).items()
+
+
+def _wrap_object_compiled(
+    obj: SerializableObject,
+    whitelist_map: WhitelistMap,
+    descent_path: str,
+) -> "_CompiledLazySerializationWrapper":
+    return _CompiledLazySerializationWrapper(obj, whitelist_map, descent_path)
+
+
 ###################################################################################################
 # Deserialize / Unpack
 ###################################################################################################
@@ -1096,7 +1371,7 @@ def _wrap_object(
 
 @overload
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: Tuple[Type[T_PackableValue], Type[U_PackableValue]],
     whitelist_map: WhitelistMap = ...,
 ) -> Union[T_PackableValue, U_PackableValue]: ...
@@ -1104,7 +1379,7 @@ def deserialize_value(
 
 @overload
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: Type[T_PackableValue],
     whitelist_map: WhitelistMap = ...,
 ) -> T_PackableValue: ...
@@ -1112,14 +1387,14 @@ def deserialize_value(
 
 @overload
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: None = ...,
     whitelist_map: WhitelistMap = ...,
 ) -> PackableValue: ...
 
 
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: Optional[
         Union[Type[T_PackableValue], Tuple[Type[T_PackableValue], Type[U_PackableValue]]]
     ] = None,
@@ -1131,15 +1406,18 @@ def deserialize_value(
 
     - Parse the input string as JSON with an object_hook for custom types.
     - Optionally, check that the resulting object is of the expected type.
+
+    Bytes produced by `serialize_value_to_bytes` are also accepted, and are decoded from the
+    binary format instead of JSON.
     """
-    check.str_param(val, "val")
+    check.inst_param(val, "val", (str, bytes))
 
     return deserialize_values([val], as_type, whitelist_map)[0]
 
 
 @overload
 def deserialize_values(
-    vals: Iterable[str],
+    vals: Iterable[Union[str, bytes]],
     as_type: Type[T_PackableValue],
     whitelist_map: WhitelistMap = ...,
 ) -> Sequence[T_PackableValue]: ...
@@ -1147,7 +1425,7 @@ def deserialize_values(
 
 @overload
 def deserialize_values(
-    vals: Iterable[str],
+    vals: Iterable[Union[str, bytes]],
     as_type: None = ...,
     whitelist_map: WhitelistMap = ...,
 ) -> Sequence[PackableValue]: ...
@@ -1155,7 +1433,7 @@ def deserialize_values(
 
 @overload
 def deserialize_values(
-    vals: Iterable[str],
+    vals: Iterable[Union[str, bytes]],
     as_type: Optional[
         Union[Type[T_PackableValue], Tuple[Type[T_PackableValue], Type[U_PackableValue]]]
     ],
@@ -1164,7 +1442,7 @@ def deserialize_values(
 
 
 def deserialize_values(
-    vals: Iterable[str],
+    vals: Iterable[Union[str, bytes]],
     as_type: Optional[
         Union[Type[T_PackableValue], Tuple[Type[T_PackableValue], Type[U_PackableValue]]]
     ] = None,
@@ -1175,12 +1453,14 @@ def deserialize_values(
         whitelist_map.object_type_map
     ):
         unpacked_values = []
+        compiled = _compiled_serdes_enabled()
         for val in vals:
-            context = UnpackContext()
-            unpacked_value = seven.json.loads(
-                val,
-                object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context),
-            )
+            context = UnpackContext(compiled=compiled)
+            object_hook = partial(_unpack_object, whitelist_map=whitelist_map, context=context)
+            if isinstance(val, bytes):
+                unpacked_value = _loads_bytes(val, object_hook)
+            else:
+                unpacked_value = seven.json.loads(val, object_hook=object_hook)
             unpacked_value = context.finalize_unpack(unpacked_value)
             if as_type and not (
                 is_named_tuple_instance(unpacked_value)
@@ -1214,6 +1494,8 @@ def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContex
 
         val.pop("__class__")
         deserializer = whitelist_map.object_deserializers[klass_name]
+        if context.compiled:
+            return deserializer.unpack_compiled(val, whitelist_map, context)
         return deserializer.unpack(val, whitelist_map, context)
 
     if "__enum__" in val:
@@ -1293,7 +1575,7 @@ def unpack_value(
     - {"__class__": "<class>", ...}: becomes an instance of the class, where `class` is a
         NamedTuple, dataclass or pydantic model
     """
-    context = UnpackContext() if context is None else context
+    context = UnpackContext(compiled=_compiled_serdes_enabled()) if context is None else context
     unpacked_value = _unpack_value(
         val,
         whitelist_map,
@@ -1322,6 +1604,191 @@ def _unpack_value(
     return val
 
 
+###################################################################################################
+# Lazy Deserialize
+###################################################################################################
+
+
+def deserialize_value_lazily(
+    val: Union[str, bytes],
+    as_type: Optional[
+        Union[Type[T_PackableValue], Tuple[Type[T_PackableValue], Type[U_PackableValue]]]
+    ] = None,
+    lazy_types: Iterable[Type] = (),
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> Union[PackableValue, T_PackableValue, Union[T_PackableValue, U_PackableValue]]:
+    """Deserialize a value like `deserialize_value`, but leave every nested object of one of the
+    `lazy_types` as its packed dict until it is first used.
+
+    Deferred objects are represented by `LazyUnpackedObject` stand-ins that pass `isinstance`
+    checks for their class and unpack themselves on first attribute access. This lets callers that
+    only touch a few large sub-objects (e.g. a handful of the `JobSnap`s in a `RepositorySnap`)
+    skip the cost of unpacking the rest. Errors from unpacking a deferred object, such as unknown
+    classes, surface on first access rather than here.
+    """
+    check.inst_param(val, "val", (str, bytes))
+    lazy_types = set(lazy_types)
+    lazy_storage_names = {
+        storage_name
+        for storage_name, serializer in whitelist_map.object_deserializers.items()
+        if serializer.klass in lazy_types
+    }
+
+    raw = _loads_bytes(val, None) if isinstance(val, bytes) else seven.json.loads(val)
+    with disable_dagster_warnings(), check.EvalContext.contextual_namespace(
+        whitelist_map.object_type_map
+    ):
+        context = UnpackContext(compiled=_compiled_serdes_enabled())
+        unpacked_value = _unpack_value_lazily(raw, whitelist_map, context, lazy_storage_names)
+        unpacked_value = context.finalize_unpack(unpacked_value)
+
+    if as_type and not isinstance(unpacked_value, as_type):
+        raise DeserializationError(
+            f"Deserialized object was not expected type {as_type}, got {type(unpacked_value)}"
+        )
+    return unpacked_value
+
+
+def _unpack_value_lazily(
+    val: JsonSerializableValue,
+    whitelist_map: WhitelistMap,
+    context: UnpackContext,
+    lazy_storage_names: AbstractSet[str],
+) -> UnpackedValue:
+    if isinstance(val, list):
+        return [
+            _unpack_value_lazily(item, whitelist_map, context, lazy_storage_names) for item in val
+        ]
+
+    if isinstance(val, dict):
+        klass_name = val.get("__class__")
+        if klass_name in lazy_storage_names:
+            return LazyUnpackedObject(val, whitelist_map)
+
+        unpacked_vals = {
+            k: _unpack_value_lazily(v, whitelist_map, context, lazy_storage_names)
+            for k, v in val.items()
+        }
+        return _unpack_object(unpacked_vals, whitelist_map, context)
+
+    return val
+
+
+_NOT_UNPACKED: Final = object()
+
+
+class LazyUnpackedObject:
+    """Stand-in for a whitelisted object that holds its packed dict and unpacks it on first use.
+
+    `__class__` reports the class of the object it stands in for, so `isinstance` checks (including
+    the ones in generated `@record` constructors) treat it as that class. Attribute access and the
+    common dunder methods are forwarded to the unpacked object.
+    """
+
+    __slots__ = ("_packed", "_whitelist_map", "_unpacked")
+
+    def __init__(self, packed: Dict[str, JsonSerializableValue], whitelist_map: WhitelistMap):
+        self._packed = packed
+        self._whitelist_map = whitelist_map
+        self._unpacked = _NOT_UNPACKED
+
+    @property
+    def __class__(self) -> Type:  # type: ignore
+        return self._whitelist_map.object_deserializers[cast(str, self._packed["__class__"])].klass
+
+    @property
+    def is_unpacked(self) -> bool:
+        return self._unpacked is not _NOT_UNPACKED
+
+    def get_unpacked(self) -> Any:
+        if self._unpacked is _NOT_UNPACKED:
+            with disable_dagster_warnings(), check.EvalContext.contextual_namespace(
+                self._whitelist_map.object_type_map
+            ):
+                self._unpacked = unpack_value(self._packed, whitelist_map=self._whitelist_map)
+            # the packed form is no longer needed once unpacked
+            self._packed = {"__class__": self._packed["__class__"]}
+        return self._unpacked
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get_unpacked(), name)
+
+    def __eq__(self, other: object) -> bool:
+        return self.get_unpacked() == other
+
+    def __ne__(self, other: object) -> bool:
+        return self.get_unpacked() != other
+
+    def __hash__(self) -> int:
+        return hash(self.get_unpacked())
+
+    def __repr__(self) -> str:
+        return repr(self.get_unpacked())
+
+    def __bool__(self) -> bool:
+        return bool(self.get_unpacked())
+
+    def __reduce__(self):
+        return self.get_unpacked().__reduce__()
+
+
+###################################################################################################
+# Binary format
+###################################################################################################
+
+# Prefix for values written by serialize_value_to_bytes. A NUL byte can never start a JSON
+# document, so readers can distinguish the two formats.
+BINARY_FORMAT_MARKER: Final = b"\x00dgs1"
+
+
+def serialize_value_to_bytes(
+    val: PackableValue,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> bytes:
+    """Serialize an object to a compact binary (msgpack) encoding prefixed with
+    `BINARY_FORMAT_MARKER`.
+
+    The value is converted with `pack_value`, so the encoded structure is the same one
+    `serialize_value` writes as JSON. `deserialize_value` reads both formats. Values msgpack can not
+    represent (integers wider than 64 bits) are written as JSON text instead.
+
+    Requires the `msgpack` package (`pip install dagster[msgpack]`).
+    """
+    msgpack = _import_msgpack()
+    packed = pack_value(val, whitelist_map=whitelist_map)
+    try:
+        return BINARY_FORMAT_MARKER + msgpack.packb(packed, use_bin_type=True)
+    except OverflowError:
+        return seven.json.dumps(packed).encode("utf-8")
+
+
+def is_binary_serialized_value(val: bytes) -> bool:
+    return val.startswith(BINARY_FORMAT_MARKER)
+
+
+def _loads_bytes(val: bytes, object_hook: Optional[Callable[[dict], Any]]) -> Any:
+    if not is_binary_serialized_value(val):
+        return seven.json.loads(val.decode("utf-8"), object_hook=object_hook)
+
+    return _import_msgpack().unpackb(
+        memoryview(val)[len(BINARY_FORMAT_MARKER) :],
+        raw=False,
+        strict_map_key=False,
+        object_hook=object_hook,
+    )
+
+
+def _import_msgpack():
+    try:
+        import msgpack
+    except ImportError as e:
+        raise SerdesUsageError(
+            "The binary serdes format requires the msgpack package. Install it with `pip install"
+            " dagster[msgpack]`."
+        ) from e
+    return msgpack
+
+
 ###################################################################################################
 # Validation
 ###################################################################################################
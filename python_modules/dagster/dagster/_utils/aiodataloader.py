@@ -1,6 +1,7 @@
 # Copied from https://github.com/syrusakbary/aiodataloader
 
 import sys
+import threading
 from asyncio import (
     AbstractEventLoop,
     Future,
@@ -11,11 +12,13 @@
     iscoroutinefunction,
 )
 from collections import namedtuple
+from concurrent.futures import Future as ConcurrentFuture
 from functools import partial
 from typing import (
     Any,
     Callable,
     Coroutine,
+    Dict,
     Generic,
     Iterable,
     Iterator,
@@ -61,6 +64,10 @@ def __init__(
 class BlockingDataLoader(Generic[KeyT, ReturnT]):
     """Currently, the cache is not shared between blocking and non-blocking DataLoaders, as it is
     challenging to drive the event loop properly while managing a shared cache.
+
+    A single loader may be shared between threads. The lock only guards the loader's bookkeeping,
+    never a call to `batch_load_fn`, so threads loading different keys fetch them in parallel. A
+    thread loading a key that another thread is already fetching waits for that fetch to finish.
     """
 
     def __init__(
@@ -71,6 +78,9 @@ def __init__(
     ):
         self._cache = {}
         self._to_query = {}
+        # futures for the keys that are currently being fetched, by cache key
+        self._in_flight: Dict[Union[CacheKeyT, KeyT], "ConcurrentFuture[ReturnT]"] = {}
+        self._lock = threading.Lock()
 
         self.get_cache_key = get_cache_key or (lambda x: x)
 
@@ -79,29 +89,61 @@ def __init__(
 
     def prepare(self, keys: Iterable[KeyT]) -> None:
         # ensure that the provided keys will be fetched as a unit in the next fetch
+        with self._lock:
+            self._prepare(keys)
+
+    def _prepare(self, keys: Iterable[KeyT]) -> None:
         for key in keys:
             cache_key = self.get_cache_key(key)
-            if cache_key not in self._cache:
+            if cache_key not in self._cache and cache_key not in self._in_flight:
                 self._to_query[cache_key] = key
 
     def blocking_load(self, key: KeyT) -> ReturnT:
         """Loads the provided key synchronously, pulling from the cache if possible."""
-        self.prepare([key])
-
-        if self._to_query:
-            for chunk in get_chunks(
-                list(self._to_query.values()),
-                self.max_batch_size or len(self._to_query),
-            ):
+        cache_key = self.get_cache_key(key)
+        with self._lock:
+            if cache_key in self._cache:
+                return self._cache[cache_key]
+
+            self._prepare([key])
+            # claim everything that is queued up, including the requested key unless another
+            # thread is already fetching it
+            to_query = list(self._to_query.values())
+            self._to_query = {}
+            for k in to_query:
+                self._in_flight[self.get_cache_key(k)] = ConcurrentFuture()
+            future = self._in_flight[cache_key]
+
+        if to_query:
+            self._fetch(to_query)
+
+        return future.result()
+
+    def _fetch(self, keys: List[KeyT]) -> None:
+        try:
+            for chunk in get_chunks(keys, self.max_batch_size or len(keys)):
                 # uses independent event loop from the async system
-                chunk_results = self.batch_load_fn(chunk)
-                for k, v in zip(chunk, chunk_results):
-                    self._cache[self.get_cache_key(k)] = v
-
-        self._to_query = {}
-        return self._cache[self.get_cache_key(key)]
+                chunk_results = list(self.batch_load_fn(chunk))
+                if len(chunk_results) != len(chunk):
+                    raise TypeError(
+                        "BlockingDataLoader must be constructed with a function which accepts "
+                        "Iterable<key> and returns an Iterable of values with the same length."
+                    )
+                with self._lock:
+                    for k, v in zip(chunk, chunk_results):
+                        cache_key = self.get_cache_key(k)
+                        self._cache[cache_key] = v
+                        self._in_flight.pop(cache_key).set_result(v)
+        except Exception as e:
+            # do not cache failed loads, but make sure that no thread waits on them forever
+            with self._lock:
+                for k in keys:
+                    future = self._in_flight.pop(self.get_cache_key(k), None)
+                    if future:
+                        future.set_exception(e)
 
     def blocking_load_many(self, keys: Iterable[KeyT]) -> Iterable[ReturnT]:
+        keys = list(keys)
         self.prepare(keys)
         return [self.blocking_load(key) for key in keys]
 
@@ -1,4 +1,5 @@
 import logging
+import threading
 from collections import defaultdict
 from datetime import datetime
 from typing import (
@@ -89,6 +90,10 @@ def __init__(
 
         self._dynamic_partitions_cache: Dict[str, Sequence[str]] = {}
 
+        # updating the asset status cache writes to storage, which must not happen concurrently
+        # when conditions are evaluated in parallel
+        self._asset_status_cache_lock = threading.RLock()
+
         self._evaluation_time = evaluation_time if evaluation_time else get_current_datetime()
 
         self._respect_materialization_data_versions = (
@@ -128,13 +133,14 @@ def _get_updated_cache_value(self, *, asset_key: AssetKey) -> Optional["AssetSta
         )
 
         partitions_def = check.not_none(self.asset_graph.get(asset_key).partitions_def)
-        return get_and_update_asset_status_cache_value(
-            instance=self.instance,
-            asset_key=asset_key,
-            partitions_def=partitions_def,
-            dynamic_partitions_loader=self,
-            loading_context=self._loading_context,
-        )
+        with self._asset_status_cache_lock:
+            return get_and_update_asset_status_cache_value(
+                instance=self.instance,
+                asset_key=asset_key,
+                partitions_def=partitions_def,
+                dynamic_partitions_loader=self,
+                loading_context=self._loading_context,
+            )
 
     @cached_method
     def get_failed_or_in_progress_subset(self, *, asset_key: AssetKey) -> PartitionsSubset:
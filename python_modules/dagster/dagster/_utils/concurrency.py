@@ -53,6 +53,17 @@ def with_sleep_interval(self, interval: float):
         )
 
 
+@record
+class ConcurrencySlotClaim:
+    """A request to claim a concurrency slot for a step, used to claim slots for many steps of a run
+    at once.
+    """
+
+    concurrency_key: str
+    step_key: str
+    priority: Optional[int] = None
+
+
 @record
 class PendingStepInfo:
     run_id: str
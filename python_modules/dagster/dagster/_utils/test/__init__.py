@@ -3,7 +3,7 @@
 import tempfile
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import Any, Dict, List, Mapping, Optional, Set, Type, Union, cast
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Type, Union, cast
 
 # top-level include is dangerous in terms of incurring circular deps
 from dagster import (
@@ -46,7 +46,7 @@
 from dagster._core.utility_ops import create_stub_op
 from dagster._serdes import ConfigurableClass
 from dagster._serdes.config_class import ConfigurableClassData
-from dagster._utils.concurrency import ConcurrencyClaimStatus
+from dagster._utils.concurrency import ConcurrencyClaimStatus, ConcurrencySlotClaim
 
 # re-export
 from dagster._utils.temp_file import (
@@ -346,6 +346,19 @@ def check_concurrency_claim(
             return claim_status
         return claim_status.with_sleep_interval(float(self._sleep_interval))
 
+    def claim_concurrency_slots(
+        self, run_id: str, claims: Sequence[ConcurrencySlotClaim]
+    ) -> Sequence[ConcurrencyClaimStatus]:
+        for claim in claims:
+            self._check_calls[claim.step_key] += 1
+        claim_statuses = super().claim_concurrency_slots(run_id, claims)
+        if not self._sleep_interval:
+            return claim_statuses
+        return [
+            claim_status.with_sleep_interval(float(self._sleep_interval))
+            for claim_status in claim_statuses
+        ]
+
 
 def get_all_direct_subclasses_of_marker(marker_interface_cls: Type) -> List[Type]:
     import dagster as dagster
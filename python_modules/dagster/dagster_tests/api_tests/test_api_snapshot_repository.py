@@ -2,6 +2,7 @@
 import sys
 from contextlib import contextmanager
 
+import dagster._check as check
 import pytest
 from dagster import IntMetadataValue, TextMetadataValue, job, op, repository
 from dagster._api.snapshot_repository import (
@@ -20,7 +21,7 @@
 from dagster._core.remote_representation.origin import RemoteRepositoryOrigin
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
-from dagster._serdes.serdes import deserialize_value
+from dagster._serdes.serdes import LazyUnpackedObject, deserialize_value
 
 from dagster_tests.api_tests.utils import get_bar_repo_code_location
 
@@ -49,6 +50,30 @@ def test_streaming_external_repositories_api_grpc(instance):
         assert async_repository_snaps == repository_snaps
 
 
+def test_streaming_external_repositories_lazy_job_snapshots(instance, monkeypatch):
+    with get_bar_repo_code_location(instance) as code_location:
+        eager_snaps = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location
+        )
+
+        monkeypatch.setenv("DAGSTER_LAZY_LOAD_JOB_SNAPSHOTS", "1")
+        lazy_snaps = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location
+        )
+
+        lazy_job_datas = check.not_none(lazy_snaps["bar_repo"].job_datas)
+        assert all(isinstance(job_data.job, LazyUnpackedObject) for job_data in lazy_job_datas)
+        assert not any(job_data.job.is_unpacked for job_data in lazy_job_datas)
+
+        # accessing one job only unpacks that job
+        first, *rest = lazy_job_datas
+        assert first.job.name == first.name
+        assert first.job.is_unpacked
+        assert not any(job_data.job.is_unpacked for job_data in rest)
+
+        assert lazy_snaps == eager_snaps
+
+
 def test_streaming_external_repositories_error(instance):
     with get_bar_repo_code_location(instance) as code_location:
         code_location.repository_names = {"does_not_exist"}
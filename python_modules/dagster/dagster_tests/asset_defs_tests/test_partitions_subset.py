@@ -1,9 +1,20 @@
+import json
 from typing import cast
 from unittest.mock import Mock
 
 import pytest
-from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
-from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster import (
+    DailyPartitionsDefinition,
+    DynamicPartitionsDefinition,
+    MultiPartitionsDefinition,
+    StaticPartitionsDefinition,
+)
+from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
+    BitmapPartitionsSubset,
+    DefaultPartitionsSubset,
+    SerializedPartitionsSubset,
+)
 from dagster._core.definitions.time_window_partitions import (
     PartitionKeysTimeWindowPartitionsSubset,
     PersistedTimeWindow,
@@ -11,6 +22,7 @@
     TimeWindowPartitionsSubset,
 )
 from dagster._core.errors import DagsterInvalidDeserializationVersionError
+from dagster._core.instance import DynamicPartitionsStore
 from dagster._core.test_utils import freeze_time
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._time import create_datetime, get_current_datetime
@@ -54,6 +66,85 @@ def test_static_partitions_subset_current_version_serialization():
     assert deserialized.get_partition_keys() == {"baz", "foo"}
 
 
+class BaselineDefaultPartitionsSubset(DefaultPartitionsSubset):
+    """Reads serialized subsets the way DefaultPartitionsSubset did before other serialized forms
+    were added, like a process that is still running an older version of dagster.
+    """
+
+    @classmethod
+    def from_serialized(cls, partitions_def, serialized):
+        data = json.loads(serialized)
+
+        if isinstance(data, list):
+            return cls(subset=set(data))
+        else:
+            if data.get("version") != cls.SERIALIZATION_VERSION:
+                raise DagsterInvalidDeserializationVersionError(
+                    f"Attempted to deserialize partition subset with version {data.get('version')},"
+                    f" but only version {cls.SERIALIZATION_VERSION} is supported."
+                )
+            return cls(subset=set(data.get("subset")))
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def,
+        serialized,
+        serialized_partitions_def_unique_id,
+        serialized_partitions_def_class_name,
+    ):
+        if serialized_partitions_def_class_name is not None:
+            return serialized_partitions_def_class_name == partitions_def.__class__.__name__
+
+        data = json.loads(serialized)
+        return isinstance(data, list) or (
+            data.get("subset") is not None and data.get("version") == cls.SERIALIZATION_VERSION
+        )
+
+
+def test_baseline_reader_rejects_bitmap_subset_serialization(monkeypatch) -> None:
+    monkeypatch.setenv("DAGSTER_BITMAP_PARTITIONS_SUBSETS", "1")
+    static_partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d"])
+    serialized_subset = static_partitions_def.subset_with_partition_keys(["a", "c"]).serialize()
+
+    assert not BaselineDefaultPartitionsSubset.can_deserialize(
+        static_partitions_def, serialized_subset, None, None
+    )
+    with pytest.raises(DagsterInvalidDeserializationVersionError, match="version 2"):
+        BaselineDefaultPartitionsSubset.from_serialized(static_partitions_def, serialized_subset)
+
+    # both serialized forms can be read with or without the bitmap representation enabled
+    default_serialized_subset = DefaultPartitionsSubset({"a", "c"}).serialize()
+    for serialized in [serialized_subset, default_serialized_subset]:
+        assert static_partitions_def.deserialize_subset(serialized) == (
+            static_partitions_def.subset_with_partition_keys(["a", "c"])
+        )
+        assert DefaultPartitionsSubset.from_serialized(
+            static_partitions_def, serialized
+        ) == DefaultPartitionsSubset({"a", "c"})
+
+
+def test_baseline_reader_rejects_multi_partitions_subset_serialization(monkeypatch) -> None:
+    monkeypatch.setenv("DAGSTER_MULTI_PARTITIONS_SUBSETS", "1")
+    monkeypatch.setenv("DAGSTER_BITMAP_PARTITIONS_SUBSETS", "1")
+    multi_partitions_def = MultiPartitionsDefinition(
+        {"abc": StaticPartitionsDefinition(["a", "b", "c"]), "xyz": static_partitions}
+    )
+    serialized_subset = multi_partitions_def.subset_with_partition_keys(["a|a", "c|b"]).serialize()
+
+    assert not BaselineDefaultPartitionsSubset.can_deserialize(
+        multi_partitions_def, serialized_subset, None, None
+    )
+    with pytest.raises(DagsterInvalidDeserializationVersionError, match="version 3"):
+        BaselineDefaultPartitionsSubset.from_serialized(multi_partitions_def, serialized_subset)
+
+    monkeypatch.delenv("DAGSTER_MULTI_PARTITIONS_SUBSETS")
+    assert set(multi_partitions_def.deserialize_subset(serialized_subset).get_partition_keys()) == {
+        "a|a",
+        "c|b",
+    }
+
+
 def test_time_window_subset_cannot_deserialize_invalid_version():
     daily_partitions_def = DailyPartitionsDefinition(start_date="2023-01-01")
     serialized_subset = (
@@ -213,3 +304,100 @@ def test_partitions_set_short_circuiting() -> None:
 
     # Test short-circuiting of -. Returns an empty DefaultPartitionsSubset
     assert (default_ps - all_ps) == DefaultPartitionsSubset.empty_subset()
+
+
+def test_bitmap_partitions_subset(monkeypatch) -> None:
+    monkeypatch.setenv("DAGSTER_BITMAP_PARTITIONS_SUBSETS", "1")
+    static_partitions_def = StaticPartitionsDefinition([str(i) for i in range(100)])
+    assert type(static_partitions_def.empty_subset()) is BitmapPartitionsSubset
+
+    evens = static_partitions_def.subset_with_partition_keys([str(i) for i in range(0, 100, 2)])
+    first_ten = static_partitions_def.subset_with_partition_keys([str(i) for i in range(10)])
+    assert len(evens) == 50
+    assert "2" in evens and "3" not in evens and "nonexistent" not in evens
+
+    assert set((evens | first_ten).get_partition_keys()) == {
+        *(str(i) for i in range(0, 100, 2)),
+        *(str(i) for i in range(10)),
+    }
+    assert set((evens & first_ten).get_partition_keys()) == {"0", "2", "4", "6", "8"}
+    assert set((first_ten - evens).get_partition_keys()) == {"1", "3", "5", "7", "9"}
+    assert (first_ten - first_ten).is_empty
+    assert evens & first_ten == static_partitions_def.subset_with_partition_keys(
+        ["8", "6", "4", "2", "0"]
+    )
+
+    # operations with subsets that are not backed by the same index
+    default_subset = DefaultPartitionsSubset({"1", "2", "nonexistent"})
+    assert set((first_ten & default_subset).get_partition_keys()) == {"1", "2"}
+    assert set((first_ten - default_subset).get_partition_keys()) == {
+        "0",
+        *(str(i) for i in range(3, 10)),
+    }
+    assert first_ten.get_partition_key_ranges(static_partitions_def)[0].end == "9"
+    all_subset = AllPartitionsSubset(static_partitions_def, Mock(), get_current_datetime())
+    assert evens | all_subset is all_subset
+    assert evens & all_subset is evens
+
+    # serialized subsets can be read with and without the bitmap representation enabled
+    serialized = SerializedPartitionsSubset.from_subset(evens, static_partitions_def, Mock())
+    assert serialized.can_deserialize(static_partitions_def)
+    assert serialized.deserialize(static_partitions_def) == evens
+    monkeypatch.delenv("DAGSTER_BITMAP_PARTITIONS_SUBSETS")
+    assert set(serialized.deserialize(static_partitions_def).get_partition_keys()) == set(
+        evens.get_partition_keys()
+    )
+
+    round_trip_subset = deserialize_value(serialize_value(evens.to_serializable_subset()))  # type: ignore
+    assert isinstance(round_trip_subset, DefaultPartitionsSubset)
+    assert set(round_trip_subset.get_partition_keys()) == set(evens.get_partition_keys())
+
+
+def test_bitmap_partitions_subset_dynamic_partitions_def(monkeypatch) -> None:
+    monkeypatch.setenv("DAGSTER_BITMAP_PARTITIONS_SUBSETS", "1")
+    dynamic_partitions_def = DynamicPartitionsDefinition(name="fruits")
+
+    subset = dynamic_partitions_def.empty_subset().with_partition_keys(["apple", "banana"])
+    assert isinstance(subset, BitmapPartitionsSubset)
+    other_subset = dynamic_partitions_def.empty_subset().with_partition_keys(["banana", "cherry"])
+    assert set((subset | other_subset).get_partition_keys()) == {"apple", "banana", "cherry"}
+    assert set((subset - other_subset).get_partition_keys()) == {"apple"}
+
+    dynamic_partitions_store = Mock(spec=DynamicPartitionsStore)
+    dynamic_partitions_store.get_dynamic_partitions.return_value = ["apple", "banana", "cherry"]
+    assert list(
+        subset.get_partition_keys_not_in_subset(
+            dynamic_partitions_def, dynamic_partitions_store=dynamic_partitions_store
+        )
+    ) == ["cherry"]
+
+    deserialized = dynamic_partitions_def.deserialize_subset(subset.serialize())
+    assert deserialized == subset
+
+
+def test_bitmap_partitions_subset_dynamic_partitions_deleted_keys(monkeypatch) -> None:
+    monkeypatch.setenv("DAGSTER_BITMAP_PARTITIONS_SUBSETS", "1")
+    dynamic_partitions_def = DynamicPartitionsDefinition(name="fruits")
+    dynamic_partitions_store = Mock(spec=DynamicPartitionsStore)
+
+    subset = dynamic_partitions_def.empty_subset().with_partition_keys(["apple", "banana"])
+    key_index = dynamic_partitions_def.get_partition_key_index()
+    assert len(key_index) == 2
+
+    # no keys were deleted, so the index is kept
+    dynamic_partitions_store.get_dynamic_partitions.return_value = ["apple", "banana", "cherry"]
+    dynamic_partitions_def.get_partition_keys(dynamic_partitions_store=dynamic_partitions_store)
+    assert dynamic_partitions_def.get_partition_key_index() is key_index
+
+    # once a registered key is deleted, new subsets use a new index without it
+    dynamic_partitions_store.get_dynamic_partitions.return_value = ["banana", "cherry"]
+    dynamic_partitions_def.get_partition_keys(dynamic_partitions_store=dynamic_partitions_store)
+    assert dynamic_partitions_def.get_partition_key_index() is not key_index
+    new_subset = dynamic_partitions_def.empty_subset().with_partition_keys(["banana", "cherry"])
+    assert len(dynamic_partitions_def.get_partition_key_index()) == 2
+
+    # subsets built against the old index are still valid
+    assert set(subset.get_partition_keys()) == {"apple", "banana"}
+    assert set((subset | new_subset).get_partition_keys()) == {"apple", "banana", "cherry"}
+    assert set((new_subset - subset).get_partition_keys()) == {"cherry"}
+    assert set((subset & new_subset).get_partition_keys()) == {"banana"}
@@ -0,0 +1,77 @@
+import tempfile
+
+import pytest
+from click.testing import CliRunner
+from dagster import AutomationCondition, asset, evaluate_automation_conditions, materialize
+from dagster._cli.asset import asset_condition_profile_command
+from dagster._core.test_utils import instance_for_test
+
+
+@asset(automation_condition=AutomationCondition.eager())
+def upstream() -> None: ...
+
+
+@asset(deps=[upstream], automation_condition=AutomationCondition.eager())
+def downstream() -> None: ...
+
+
+@pytest.fixture(name="instance_runner")
+def mock_instance_runner():
+    with tempfile.TemporaryDirectory() as dagster_home_temp:
+        with instance_for_test(temp_dir=dagster_home_temp) as instance:
+            runner = CliRunner(env={"DAGSTER_HOME": dagster_home_temp})
+            yield instance, runner
+
+
+def _store_evaluations(instance, evaluation_id: int) -> None:
+    materialize([upstream], instance=instance)
+    result = evaluate_automation_conditions([upstream, downstream], instance)
+    instance.schedule_storage.add_auto_materialize_asset_evaluations(
+        evaluation_id, [r.serializable_evaluation.with_run_ids(set()) for r in result.results]
+    )
+
+
+def test_condition_profile_errors(instance_runner):
+    _, runner = instance_runner
+    result = runner.invoke(asset_condition_profile_command)
+    assert result.exit_code == 2
+    assert "Error, you must specify an asset key or use `--evaluation-id`" in result.output
+
+    result = runner.invoke(asset_condition_profile_command, ["--evaluation-id", "1", "upstream"])
+    assert result.exit_code == 2
+    assert "Error, cannot use more than one of: asset key, `--evaluation-id`." in result.output
+
+
+def test_condition_profile_no_evaluations(instance_runner):
+    _, runner = instance_runner
+    result = runner.invoke(asset_condition_profile_command, ["--evaluation-id", "1"])
+    assert result.exit_code == 0
+    assert "No evaluations found." in result.output
+
+
+@pytest.mark.parametrize("sort_by", ["time", "queries"])
+def test_condition_profile_evaluation_id(instance_runner, sort_by):
+    instance, runner = instance_runner
+    _store_evaluations(instance, evaluation_id=5)
+
+    result = runner.invoke(
+        asset_condition_profile_command,
+        ["--evaluation-id", "5", "--sort-by", sort_by, "--limit", "4"],
+    )
+    assert result.exit_code == 0, result.output
+    lines = result.output.strip().split("\n")
+    assert "self queries" in lines[0]
+    assert len(lines) == 5
+    assert all("upstream /" in line or "downstream /" in line for line in lines[1:])
+
+
+def test_condition_profile_key(instance_runner):
+    instance, runner = instance_runner
+    _store_evaluations(instance, evaluation_id=5)
+
+    result = runner.invoke(asset_condition_profile_command, ["downstream", "--limit", "100"])
+    assert result.exit_code == 0, result.output
+    lines = result.output.strip().split("\n")[1:]
+    assert lines
+    assert all("downstream /" in line for line in lines)
+    assert not any("upstream /" in line for line in lines)
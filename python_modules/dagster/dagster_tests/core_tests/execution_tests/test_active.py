@@ -1,7 +1,7 @@
 import math
 import tempfile
 from collections import defaultdict
-from typing import List, Set
+from typing import List, Sequence, Set
 
 import pytest
 from dagster import job, op
@@ -15,6 +15,7 @@
 from dagster._core.storage.tags import GLOBAL_CONCURRENCY_TAG
 from dagster._core.test_utils import instance_for_test
 from dagster._core.utils import make_new_run_id
+from dagster._utils.concurrency import ConcurrencySlotClaim
 from dagster._utils.error import SerializableErrorInfo
 
 
@@ -245,6 +246,11 @@ def claim(self, concurrency_key: str, step_key: str, priority: int = 0):
         self._pending_claims.add(step_key)
         return False
 
+    def claim_steps(self, step_claims: Sequence[ConcurrencySlotClaim]) -> Set[str]:
+        for step_claim in step_claims:
+            self._pending_claims.add(step_claim.step_key)
+        return set()
+
     def interval_to_next_pending_claim_check(self) -> float:
         return self._interval
 
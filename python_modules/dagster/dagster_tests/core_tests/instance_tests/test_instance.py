@@ -1,6 +1,8 @@
 import os
 import re
 import tempfile
+import threading
+import time
 from typing import Any, Mapping, Optional
 from unittest.mock import MagicMock, patch
 
@@ -8,7 +10,9 @@
 import yaml
 from dagster import (
     AssetKey,
+    DagsterEventType,
     DailyPartitionsDefinition,
+    EventRecordsFilter,
     StaticPartitionsDefinition,
     _check as check,
     _seven,
@@ -59,7 +63,7 @@
     new_cwd,
 )
 from dagster._daemon.asset_daemon import AssetDaemon
-from dagster._serdes import ConfigurableClass
+from dagster._serdes import ConfigurableClass, create_snapshot_id
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
 
@@ -285,6 +289,35 @@ def test_create_execution_plan_snapshot():
         assert run.execution_plan_snapshot_id == create_execution_plan_snapshot_id(ep_snapshot)
 
 
+def test_snapshot_ids_memoized():
+    @op
+    def noop_op():
+        pass
+
+    @job
+    def memoized_job():
+        noop_op()
+
+    with instance_for_test() as instance, patch(
+        "dagster._core.snap.job_snapshot.create_snapshot_id",
+        wraps=create_snapshot_id,
+    ) as job_snapshot_id_mock, patch(
+        "dagster._core.snap.execution_plan_snapshot.create_snapshot_id",
+        wraps=create_snapshot_id,
+    ) as execution_plan_snapshot_id_mock:
+        run_one = instance.create_run_for_job(memoized_job)
+        run_two = instance.create_run_for_job(memoized_job)
+
+        # the job snapshot is hashed once per job definition, each run builds its own plan snapshot
+        assert job_snapshot_id_mock.call_count == 1
+        assert execution_plan_snapshot_id_mock.call_count == 2
+
+        assert run_one.job_snapshot_id == run_two.job_snapshot_id
+        assert run_one.job_snapshot_id == create_job_snapshot_id(memoized_job.get_job_snapshot())
+        assert instance.has_job_snapshot(run_one.job_snapshot_id)
+        assert instance.get_execution_plan_snapshot(run_one.execution_plan_snapshot_id)
+
+
 def test_submit_run():
     with instance_for_test(
         overrides={
@@ -778,3 +811,151 @@ def test_invalid_run_id():
             match="run_id must be a valid UUID. Got invalid_run_id",
         ):
             create_run_for_test(instance, job_name="foo_job", run_id="invalid_run_id")
+
+
+def test_event_write_buffer(monkeypatch):
+    @op
+    def chatty_op(context):
+        for i in range(20):
+            context.log.info(f"message {i}")
+        return 1
+
+    @job
+    def chatty_job():
+        chatty_op()
+
+    with instance_for_test() as instance:
+        result = chatty_job.execute_in_process(instance=instance)
+        unbuffered = [
+            (record.dagster_event_type, record.message)
+            for record in instance.all_logs(result.run_id)
+        ]
+
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BUFFER_SIZE", "5")
+    # make sure flushes are driven by size and barrier events rather than the timer
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BUFFER_FLUSH_INTERVAL_SECONDS", "60")
+    with instance_for_test() as instance:
+        with patch.object(
+            instance.event_log_storage,
+            "store_event_batch",
+            wraps=instance.event_log_storage.store_event_batch,
+        ) as store_event_batch:
+            result = chatty_job.execute_in_process(instance=instance)
+            assert result.success
+            assert store_event_batch.call_count > 0
+            assert all(len(call.args[0]) <= 5 for call in store_event_batch.call_args_list)
+
+        # run lifecycle events are barriers, so the run status reflects the final event
+        assert instance.get_run_by_id(result.run_id).is_success
+        buffered = [
+            (record.dagster_event_type, record.message)
+            for record in instance.all_logs(result.run_id)
+        ]
+
+    assert len(buffered) == len(unbuffered)
+    assert [message for _, message in buffered if message.startswith("message")] == [
+        f"message {i}" for i in range(20)
+    ]
+    assert [event_type for event_type, _ in buffered] == [
+        event_type for event_type, _ in unbuffered
+    ]
+
+
+def test_event_write_buffer_flushes_by_time(monkeypatch):
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BUFFER_SIZE", "100")
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BUFFER_FLUSH_INTERVAL_SECONDS", "0.1")
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance, job_name="foo_job")
+        notified = []
+        instance.add_event_listener(
+            run.run_id, lambda event: notified.append((event, threading.get_ident()))
+        )
+
+        with patch.object(
+            instance.event_log_storage,
+            "store_event",
+            wraps=instance.event_log_storage.store_event,
+        ) as store_event:
+            instance.report_engine_event("buffered", run)
+            assert store_event.call_count == 0
+
+            start = time.time()
+            while not store_event.call_count:
+                assert time.time() - start < 10, "buffered event was never flushed"
+                time.sleep(0.05)
+
+        # subscribers are only notified on the thread that handles or reads events
+        assert notified == []
+        instance.report_engine_event("next", run)
+        assert [event.message for event, _ in notified] == ["buffered"]
+        assert {thread_id for _, thread_id in notified} == {threading.get_ident()}
+
+
+def test_event_write_buffer_visible_to_instance_reads(monkeypatch):
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BUFFER_SIZE", "100")
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BUFFER_FLUSH_INTERVAL_SECONDS", "60")
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance, job_name="foo_job")
+        instance.report_engine_event("buffered", run)
+        records = instance.get_event_records(
+            EventRecordsFilter(event_type=DagsterEventType.ENGINE_EVENT)
+        )
+        assert [record.event_log_entry.message for record in records] == ["buffered"]
+
+        instance.report_engine_event("also buffered", run)
+        assert [event.message for event in instance.all_logs(run.run_id)] == [
+            "buffered",
+            "also buffered",
+        ]
+
+
+def test_event_write_buffer_keeps_events_on_failed_write(monkeypatch):
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BUFFER_SIZE", "100")
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BUFFER_FLUSH_INTERVAL_SECONDS", "0.1")
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance, job_name="foo_job")
+        store_event = instance.event_log_storage.store_event
+
+        with patch.object(
+            instance.event_log_storage, "store_event", side_effect=Exception("storage is down")
+        ) as failing_store_event:
+            instance.report_engine_event("buffered", run)
+
+            # the background thread keeps retrying the failed write
+            start = time.time()
+            while failing_store_event.call_count < 2:
+                assert time.time() - start < 10, "failed write was never retried"
+                time.sleep(0.05)
+
+            # callers flushing the buffer see the error
+            with pytest.raises(Exception, match="storage is down"):
+                instance.flush_buffered_events()
+
+        with patch.object(
+            instance.event_log_storage, "store_event", wraps=store_event
+        ) as store_event:
+            instance.flush_buffered_events()
+            assert store_event.call_count == 1
+
+        assert [event.message for event in instance.all_logs(run.run_id)] == ["buffered"]
+
+
+def test_event_write_buffer_shared_across_threads(monkeypatch):
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BUFFER_SIZE", "100")
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BUFFER_FLUSH_INTERVAL_SECONDS", "60")
+    with instance_for_test() as instance:
+        barrier = threading.Barrier(8)
+        buffers = []
+
+        def _get_buffer():
+            barrier.wait()
+            buffers.append(instance._get_event_write_buffer())  # noqa: SLF001
+
+        threads = [threading.Thread(target=_get_buffer) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(buffers) == 8
+        assert len({id(buffer) for buffer in buffers}) == 1
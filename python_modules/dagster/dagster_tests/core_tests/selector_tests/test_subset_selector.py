@@ -1,10 +1,16 @@
+import random
+
 import pytest
 from dagster import In, asset, define_asset_job, in_process_executor, job, op, repository
 from dagster._core.errors import DagsterExecutionStepNotFoundError, DagsterInvalidSubsetError
 from dagster._core.selector.subset_selector import (
     MAX_NUM,
+    ReachabilityIndex,
     Traverser,
     clause_to_subset,
+    fetch_connected,
+    fetch_sinks,
+    fetch_sources,
     generate_dep_graph,
     parse_clause,
     parse_op_queries,
@@ -87,6 +93,74 @@ def test_traverser_invalid():
     assert traverser.fetch_upstream(item_name="some_solid", depth=1) == set()
 
 
+def test_reachability_index():
+    graph = generate_dep_graph(foo_job)
+    index = ReachabilityIndex(graph)
+
+    assert index.get_ancestors("multiply_two") == {"add_nums", "return_one", "return_two"}
+    assert index.get_descendants("return_one") == {"add_nums", "multiply_two", "add_one"}
+    assert index.get_ancestors_of_items(["add_nums", "return_two"]) == {"return_one", "return_two"}
+    assert index.is_ancestor("return_two", "add_one")
+    assert not index.is_ancestor("add_one", "return_two")
+    assert not index.is_ancestor("return_one", "return_two")
+    assert [index.get_level(op_name) for op_name in ["return_one", "add_nums", "add_one"]] == [
+        0,
+        1,
+        3,
+    ]
+    assert index.get_connected_component("add_one") == set(graph["upstream"].keys())
+    assert index.get_ancestors("some_solid") == set()
+    assert index.get_sinks({"return_one", "add_nums"}) == {"add_nums"}
+    assert index.get_sources({"add_nums", "add_one"}) == {"add_nums"}
+
+
+def test_reachability_index_cycles_and_self_dependencies():
+    index = ReachabilityIndex(
+        {
+            "upstream": {"a": {"a"}, "b": {"a", "c"}, "c": {"b"}, "d": {"c"}, "e": set()},
+            "downstream": {"a": {"a", "b"}, "b": {"c"}, "c": {"b", "d"}, "d": set(), "e": set()},
+        }
+    )
+
+    assert index.get_ancestors("a") == set()
+    assert index.get_ancestors("b") == {"a", "b", "c"}
+    assert index.get_descendants("a") == {"b", "c", "d"}
+    assert index.get_level("b") == index.get_level("c") == 1
+    assert index.get_level("d") == 2
+    assert index.get_connected_component("e") == {"e"}
+    assert index.get_connected_component("a") == {"a", "b", "c", "d"}
+
+    # an item in a cycle is neither its own ancestor nor its own descendant within a selection
+    assert index.get_sinks({"b"}) == index.get_sources({"b"}) == {"b"}
+    assert index.get_sinks({"b", "c"}) == index.get_sources({"b", "c"}) == set()
+    assert index.get_sources({"a", "b", "c", "d"}) == {"a"}
+    assert index.get_sinks({"a", "b", "c", "d"}) == {"d"}
+    assert index.get_sources({"c", "e"}) == index.get_sinks({"c", "e"}) == {"c", "e"}
+
+
+def test_reachability_index_matches_traversal():
+    rng = random.Random(0)
+    items = [f"item_{i}" for i in range(200)]
+    upstream = {
+        item: {rng.choice(items[:i]) for _ in range(rng.randint(0, 3))} if i else set()
+        for i, item in enumerate(items)
+    }
+    downstream = {item: set() for item in items}
+    for item, parents in upstream.items():
+        for parent in parents:
+            downstream[parent].add(item)
+    graph = {"upstream": upstream, "downstream": downstream}
+    index = ReachabilityIndex(graph)
+
+    for item in items:
+        assert index.get_ancestors(item) == fetch_connected(item, graph, direction="upstream")
+        assert index.get_descendants(item) == fetch_connected(item, graph, direction="downstream")
+
+    selection = set(rng.sample(items, 50))
+    assert index.get_sinks(selection) == fetch_sinks(graph, selection)
+    assert index.get_sources(selection) == fetch_sources(graph, selection)
+
+
 def test_parse_clause():
     assert parse_clause("some_solid") == (0, "some_solid", 0)
     assert parse_clause("*some_solid") == (MAX_NUM, "some_solid", 0)
@@ -6,12 +6,14 @@
 
 import dagster.version
 import pytest
+import toposort as toposort_
 from dagster._core.libraries import DagsterLibraryRegistry
 from dagster._core.test_utils import environ
 from dagster._core.utils import (
     InheritContextThreadPoolExecutor,
     check_dagster_package_version,
     parse_env_var,
+    toposort,
 )
 from dagster._utils import hash_collection, library_version_from_core_version
 
@@ -168,3 +170,25 @@ def sleepy_thread():
         f = None
         # now they dont
         assert executor.weak_tracked_futures_count == 0
+
+
+def test_toposort():
+    data = {
+        "d": {"b", "c"},
+        "b": {"a"},
+        "c": frozenset({"a", "c"}),
+        "e": {"d", "f"},
+    }
+    expected = [sorted(level) for level in toposort_.toposort({k: set(v) for k, v in data.items()})]
+    assert toposort(data) == expected == [["a", "f"], ["b", "c"], ["d"], ["e"]]
+
+    assert toposort({"a": set(), "B": set(), "c": set()}) == [["B", "a", "c"]]
+    assert toposort({"a": set(), "B": set(), "c": set()}, sort_key=str.lower) == [["a", "B", "c"]]
+    assert toposort({}) == []
+
+
+def test_toposort_circular_dependency():
+    with pytest.raises(toposort_.CircularDependencyError) as exc_info:
+        toposort({"a": set(), "b": {"a", "d"}, "c": {"b"}, "d": {"c"}, "e": {"d"}})
+
+    assert exc_info.value.data == {"b": {"d"}, "c": {"b"}, "d": {"c"}, "e": {"d"}}
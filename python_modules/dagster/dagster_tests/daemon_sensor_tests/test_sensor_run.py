@@ -4,11 +4,12 @@
 import string
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
 from typing import Any
 from unittest import mock
 
+import dagster._daemon.sensor as sensor_module
 import pytest
 from dagster import (
     AssetKey,
@@ -90,8 +91,15 @@
 from dagster._core.workspace.context import WorkspaceProcessContext
 from dagster._daemon import get_default_daemon_logger
 from dagster._daemon.daemon import SpanMarker
-from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._daemon.sensor import (
+    SensorEvaluationEventLoop,
+    execute_due_sensor_ticks,
+    execute_sensor_iteration,
+    execute_sensor_iteration_loop,
+    get_sensor_next_tick_timestamp,
+)
 from dagster._record import copy
+from dagster._scheduler.tick_queue import InstigatorTickQueue
 from dagster._time import create_datetime, get_current_datetime
 from dagster._vendored.dateutil.relativedelta import relativedelta
 from mock import patch
@@ -1046,7 +1054,13 @@ def asset_sensor_repo():
 FUTURES_TIMEOUT = 75
 
 
-def evaluate_sensors(workspace_context, executor, submit_executor=None, timeout=FUTURES_TIMEOUT):
+def evaluate_sensors(
+    workspace_context,
+    executor,
+    submit_executor=None,
+    timeout=FUTURES_TIMEOUT,
+    sensor_evaluation_loop=None,
+):
     logger = get_default_daemon_logger("SensorDaemon")
     futures = {}
     list(
@@ -1056,6 +1070,7 @@ def evaluate_sensors(workspace_context, executor, submit_executor=None, timeout=
             threadpool_executor=executor,
             sensor_tick_futures=futures,
             submit_threadpool_executor=submit_executor,
+            sensor_evaluation_loop=sensor_evaluation_loop,
         )
     )
 
@@ -1210,6 +1225,97 @@ def test_simple_sensor(instance, workspace_context, remote_repo, executor):
         )
 
 
+def test_simple_sensor_asyncio(instance, workspace_context, remote_repo):
+    freeze_datetime = create_datetime(year=2019, month=2, day=27, hour=23, minute=59, second=59)
+
+    with ExitStack() as stack:
+        sensor_evaluation_loop = stack.enter_context(
+            SensorEvaluationEventLoop(
+                max_concurrent_evaluations_per_code_location=1,
+                executor=stack.enter_context(ThreadPoolExecutor(max_workers=1)),
+            )
+        )
+        with freeze_time(freeze_datetime):
+            sensor = remote_repo.get_sensor("simple_sensor")
+            instance.add_instigator_state(
+                InstigatorState(
+                    sensor.get_remote_origin(),
+                    InstigatorType.SENSOR,
+                    InstigatorStatus.RUNNING,
+                )
+            )
+
+            evaluate_sensors(workspace_context, None, sensor_evaluation_loop=sensor_evaluation_loop)
+
+            assert instance.get_runs_count() == 0
+            ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
+            assert len(ticks) == 1
+            validate_tick(ticks[0], sensor, freeze_datetime, TickStatus.SKIPPED)
+
+            freeze_datetime = freeze_datetime + relativedelta(seconds=45)
+
+        with freeze_time(freeze_datetime):
+            evaluate_sensors(workspace_context, None, sensor_evaluation_loop=sensor_evaluation_loop)
+            wait_for_all_runs_to_start(instance)
+            assert instance.get_runs_count() == 1
+            run = instance.get_runs()[0]
+            validate_run_started(run)
+            ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
+            assert len(ticks) == 2
+            validate_tick(ticks[0], sensor, freeze_datetime, TickStatus.SUCCESS, [run.run_id])
+
+
+def test_error_sensor_asyncio(instance, workspace_context, remote_repo):
+    freeze_datetime = create_datetime(year=2019, month=2, day=27, hour=23, minute=59, second=59)
+
+    with ExitStack() as stack:
+        sensor_evaluation_loop = stack.enter_context(
+            SensorEvaluationEventLoop(
+                max_concurrent_evaluations_per_code_location=1,
+                executor=stack.enter_context(ThreadPoolExecutor(max_workers=1)),
+            )
+        )
+        with freeze_time(freeze_datetime):
+            sensor = remote_repo.get_sensor("error_sensor")
+            instance.add_instigator_state(
+                InstigatorState(
+                    sensor.get_remote_origin(),
+                    InstigatorType.SENSOR,
+                    InstigatorStatus.RUNNING,
+                )
+            )
+
+            evaluate_sensors(workspace_context, None, sensor_evaluation_loop=sensor_evaluation_loop)
+
+            # the launch context is exited on the executor thread, and still records the error
+            assert instance.get_runs_count() == 0
+            ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
+            assert len(ticks) == 1
+            validate_tick(
+                ticks[0],
+                sensor,
+                freeze_datetime,
+                TickStatus.FAILURE,
+                [],
+                "Error occurred during the execution of evaluation_fn for sensor error_sensor",
+            )
+
+
+def test_sensor_next_tick_timestamp(remote_repo):
+    sensor = remote_repo.get_sensor("simple_sensor")
+    assert sensor.min_interval_seconds == 30
+
+    state = InstigatorState(
+        sensor.get_remote_origin(), InstigatorType.SENSOR, InstigatorStatus.RUNNING
+    )
+    assert get_sensor_next_tick_timestamp(state, sensor) is None
+
+    state = state.with_data(
+        SensorInstigatorData(last_tick_timestamp=900.0, last_tick_start_timestamp=950.0)
+    )
+    assert get_sensor_next_tick_timestamp(state, sensor) == 980.0
+
+
 def test_sensors_keyed_on_selector_not_origin(
     instance: DagsterInstance,
     workspace_context: WorkspaceProcessContext,
@@ -1688,6 +1794,185 @@ def fake_sleep(s):
         assert sum(sleeps) == 65
 
 
+def test_sensor_loop_wakes_when_sensor_is_due(
+    monkeypatch, instance, workspace_context, remote_repo
+):
+    freeze_datetime = create_datetime(year=2019, month=2, day=28)
+
+    with ExitStack() as stack:
+        stack.enter_context(freeze_time(freeze_datetime))
+        waits = []
+
+        def advance_time(s):
+            stack.enter_context(freeze_time(get_current_datetime() + datetime.timedelta(seconds=s)))
+
+        def fake_wait(s):
+            waits.append(s)
+            advance_time(s)
+
+        monkeypatch.setattr(time, "sleep", advance_time)
+
+        shutdown_event = mock.MagicMock()
+        shutdown_event.wait.side_effect = fake_wait
+
+        # 60 second custom interval
+        sensor = remote_repo.get_sensor("custom_interval_sensor")
+
+        instance.add_instigator_state(
+            InstigatorState(
+                sensor.get_remote_origin(),
+                InstigatorType.SENSOR,
+                InstigatorStatus.RUNNING,
+            )
+        )
+
+        evaluate_sensors(workspace_context, None)
+        ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
+        assert len(ticks) == 1
+
+        # each tick starts a second after the loop dispatches it, as if it were waiting on a busy
+        # thread
+        process_tick_generator = sensor_module._process_tick_generator  # noqa: SLF001
+
+        def slow_process_tick_generator(*args, **kwargs):
+            advance_time(1)
+            return process_tick_generator(*args, **kwargs)
+
+        monkeypatch.setattr(sensor_module, "_process_tick_generator", slow_process_tick_generator)
+
+        # start the loop out of phase with the sensor's interval, so that the sensor comes due in
+        # between two refreshes of the running sensors
+        stack.enter_context(freeze_time(freeze_datetime + relativedelta(seconds=2)))
+        list(
+            execute_sensor_iteration_loop(
+                workspace_context,
+                get_default_daemon_logger("dagster.daemon.SensorDaemon"),
+                shutdown_event=shutdown_event,
+                until=(freeze_datetime + relativedelta(seconds=185)).timestamp(),
+            )
+        )
+
+        ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
+        # each tick starts exactly when the sensor comes due, rather than being pushed back by the
+        # time it took to start the previous tick
+        assert [tick.timestamp for tick in ticks] == [
+            (freeze_datetime + relativedelta(seconds=seconds)).timestamp()
+            for seconds in [180, 120, 60, 0]
+        ]
+        # the loop only wakes up to reload the running sensors, and when the sensor comes due
+        assert waits == ([5] * 11 + [3, 1]) * 3 + [5]
+
+
+def test_sensor_stopped_between_refreshes(instance, workspace_context, remote_repo):
+    freeze_datetime = create_datetime(year=2019, month=2, day=28)
+    logger = get_default_daemon_logger("dagster.daemon.SensorDaemon")
+    sensor_tick_queue = InstigatorTickQueue()
+
+    with freeze_time(freeze_datetime):
+        sensor = remote_repo.get_sensor("custom_interval_sensor")
+        instance.start_sensor(sensor)
+
+        list(
+            execute_sensor_iteration(
+                workspace_context,
+                logger,
+                threadpool_executor=None,
+                submit_threadpool_executor=None,
+                sensor_tick_queue=sensor_tick_queue,
+            )
+        )
+        assert len(instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)) == 1
+
+        instance.stop_sensor(sensor.get_remote_origin_id(), sensor.selector_id, sensor)
+
+    with freeze_time(freeze_datetime + relativedelta(seconds=60)):
+        # the sensor is still queued, but its tick checks the stored state before evaluating
+        assert sensor.selector_id in sensor_tick_queue
+        list(
+            execute_due_sensor_ticks(
+                workspace_context,
+                logger,
+                sensor_tick_queue,
+                threadpool_executor=None,
+                submit_threadpool_executor=None,
+            )
+        )
+        assert len(instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)) == 1
+
+
+def test_sensor_retried_while_tick_in_flight(instance, workspace_context, remote_repo):
+    freeze_datetime = create_datetime(year=2019, month=2, day=28)
+    logger = get_default_daemon_logger("dagster.daemon.SensorDaemon")
+    sensor_tick_queue = InstigatorTickQueue()
+
+    with freeze_time(freeze_datetime):
+        # 60 second custom interval
+        sensor = remote_repo.get_sensor("custom_interval_sensor")
+        instance.start_sensor(sensor)
+        sensor_state = instance.get_instigator_state(
+            sensor.get_remote_origin_id(), sensor.selector_id
+        )
+        sensor_tick_queue.push(
+            sensor.selector_id, freeze_datetime.timestamp(), (sensor, sensor_state)
+        )
+
+        # the previous tick of the sensor has not finished yet
+        in_flight_future = Future()
+        sensor_tick_futures = {sensor.selector_id: in_flight_future}
+        threadpool_executor = mock.MagicMock()
+
+        list(
+            execute_due_sensor_ticks(
+                workspace_context,
+                logger,
+                sensor_tick_queue,
+                threadpool_executor=threadpool_executor,
+                submit_threadpool_executor=None,
+                sensor_tick_futures=sensor_tick_futures,
+            )
+        )
+        assert threadpool_executor.submit.call_count == 0
+        # rather than waiting out a whole interval, the sensor is retried shortly
+        assert sensor_tick_queue.next_due_timestamp() == freeze_datetime.timestamp() + 1
+
+    in_flight_future.set_result(None)
+    with freeze_time(freeze_datetime + relativedelta(seconds=1)):
+        list(
+            execute_due_sensor_ticks(
+                workspace_context,
+                logger,
+                sensor_tick_queue,
+                threadpool_executor=threadpool_executor,
+                submit_threadpool_executor=None,
+                sensor_tick_futures=sensor_tick_futures,
+            )
+        )
+        assert threadpool_executor.submit.call_count == 1
+        # once the tick has started, the sensor is next due after its interval
+        assert sensor_tick_queue.next_due_timestamp() == freeze_datetime.timestamp() + 61
+
+
+@pytest.mark.parametrize(
+    "scheduling_lags, expected_level",
+    [({"a": 0.5, "b": 2.0}, logging.DEBUG), ({"a": 0.5, "b": 45.0}, logging.INFO)],
+)
+def test_log_scheduling_lag(scheduling_lags, expected_level):
+    logger = mock.MagicMock()
+    sensor_tick_queue = mock.MagicMock()
+    sensor_tick_queue.pop_lags.return_value = scheduling_lags
+
+    sensor_module._log_scheduling_lag(logger, sensor_tick_queue, {})  # noqa: SLF001
+
+    # the lag is only logged at INFO when ticks are starting well after they are due
+    assert logger.log.call_count == 1
+    assert logger.log.call_args[0][0] == expected_level
+
+    # nothing is logged when no ticks have started since the last refresh
+    sensor_tick_queue.pop_lags.return_value = {}
+    sensor_module._log_scheduling_lag(logger, sensor_tick_queue, {})  # noqa: SLF001
+    assert logger.log.call_count == 1
+
+
 def test_sensor_start_stop(executor, instance, workspace_context, remote_repo):
     freeze_datetime = create_datetime(year=2019, month=2, day=27)
     with freeze_time(freeze_datetime):
@@ -2910,6 +3195,14 @@ def test_settings():
     with instance_for_test(overrides={"sensors": settings}) as thread_inst:
         assert thread_inst.get_settings("sensors") == settings
 
+    settings = {
+        "use_asyncio": True,
+        "num_workers": 4,
+        "max_concurrent_evaluations_per_code_location": 50,
+    }
+    with instance_for_test(overrides={"sensors": settings}) as asyncio_inst:
+        assert asyncio_inst.get_settings("sensors") == settings
+
 
 @pytest.mark.parametrize("sensor_name", ["logging_sensor", "multi_asset_logging_sensor"])
 def test_sensor_logging(executor, instance, workspace_context, remote_repo, sensor_name) -> None:
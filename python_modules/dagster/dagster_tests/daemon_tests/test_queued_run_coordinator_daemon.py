@@ -13,6 +13,8 @@
 from dagster._core.remote_representation.handle import JobHandle, RepositoryHandle
 from dagster._core.remote_representation.origin import ManagedGrpcPythonEnvCodeLocationOrigin
 from dagster._core.storage.dagster_run import IN_PROGRESS_RUN_STATUSES, DagsterRunStatus
+from dagster._core.storage.runs.migration import QUEUED_RUNS
+from dagster._core.storage.runs.schema import QueuedRunsTable, SecondaryIndexMigrationTable
 from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._core.test_utils import (
     create_run_for_test,
@@ -1137,6 +1139,9 @@ def test_multiple_blocks(
 
 
 class TestQueuedRunCoordinatorDaemon(QueuedRunCoordinatorDaemonTests):
+    # whether the run storage maintains the queued runs index
+    use_queued_run_index = True
+
     @pytest.fixture
     def instance(self, run_coordinator_config):
         overrides = {
@@ -1156,8 +1161,39 @@ def instance(self, run_coordinator_config):
         }
 
         with instance_for_test(overrides=overrides) as instance:
+            if not self.use_queued_run_index:
+                with instance.run_storage.connect() as conn:
+                    conn.execute(
+                        SecondaryIndexMigrationTable.delete().where(
+                            SecondaryIndexMigrationTable.c.name == QUEUED_RUNS
+                        )
+                    )
+                assert not instance.supports_queued_run_index
             yield instance
 
     @pytest.fixture()
     def daemon(self, page_size):
         return QueuedRunCoordinatorDaemon(interval_seconds=1, page_size=page_size)
+
+    def test_reconcile_runs_missing_from_queue_index(
+        self, instance, workspace_context, daemon, job_handle
+    ):
+        if not self.use_queued_run_index:
+            pytest.skip("requires the queued runs index")
+
+        indexed_run_id, missing_run_id = [make_new_run_id() for _ in range(2)]
+        self.create_queued_run(instance, job_handle, run_id=indexed_run_id)
+        self.create_queued_run(instance, job_handle, run_id=missing_run_id)
+        # simulate a run that was queued by a process that had not seen the index get built
+        with instance.run_storage.connect() as conn:
+            conn.execute(QueuedRunsTable.delete().where(QueuedRunsTable.c.run_id == missing_run_id))
+
+        list(daemon.run_iteration(workspace_context))
+
+        assert self.get_run_ids(instance.run_launcher.queue()) == [indexed_run_id, missing_run_id]
+
+
+class TestQueuedRunCoordinatorDaemonWithoutQueueIndex(TestQueuedRunCoordinatorDaemon):
+    # simulate a run storage that has not yet been migrated to maintain the queued runs index, so
+    # that the daemon falls back to scanning and sorting all queued runs
+    use_queued_run_index = False
@@ -174,3 +174,44 @@ def test_without_automation_condition() -> None:
 
     with pytest.raises(CheckError, match="fewer than 2 operands"):
         orig.without(a).without(b)
+
+
+def test_evaluation_profile() -> None:
+    state = (
+        AutomationConditionScenarioState(
+            one_asset, automation_condition=AutomationCondition.eager()
+        )
+        .with_asset_properties(partitions_def=daily_partitions_def)
+        .with_current_time(time_partitions_start_datetime)
+        .with_current_time_advanced(days=6, minutes=1)
+    )
+    _, result = state.evaluate("A")
+    evaluation = result.serializable_evaluation
+
+    nodes = list(evaluation.iter_nodes())
+    assert len(nodes) > 1
+    for node in nodes:
+        assert node.num_storage_queries is not None
+        assert node.self_num_storage_queries is not None
+        assert node.self_num_storage_queries >= 0
+        assert node.candidate_subset_size is not None
+        assert node.duration is not None
+        assert node.self_duration is not None
+        # a parent's cost includes the cost of its children
+        assert node.num_storage_queries >= sum(
+            child.num_storage_queries or 0 for child in node.child_evaluations
+        )
+
+    # checking whether the asset is missing requires querying storage
+    assert evaluation.num_storage_queries > 0
+    # the root node is evaluated over the full candidate subset
+    assert evaluation.candidate_subset_size == 6
+
+    # profiling information survives serialization
+    deserialized = deserialize_value(serialize_value(evaluation), as_type=type(evaluation))
+    assert [node.num_storage_queries for node in deserialized.iter_nodes()] == [
+        node.num_storage_queries for node in nodes
+    ]
+    assert [node.candidate_subset_size for node in deserialized.iter_nodes()] == [
+        node.candidate_subset_size for node in nodes
+    ]
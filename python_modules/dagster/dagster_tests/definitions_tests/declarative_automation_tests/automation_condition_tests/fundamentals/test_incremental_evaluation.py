@@ -0,0 +1,147 @@
+import datetime
+
+from dagster import (
+    AssetKey,
+    AutomationCondition,
+    DailyPartitionsDefinition,
+    Definitions,
+    asset,
+    evaluate_automation_conditions,
+    materialize,
+)
+from dagster._core.test_utils import instance_for_test
+
+
+@asset(automation_condition=AutomationCondition.eager())
+def a() -> None: ...
+
+
+@asset(deps=[a], automation_condition=AutomationCondition.eager())
+def b() -> None: ...
+
+
+@asset(automation_condition=AutomationCondition.eager())
+def c() -> None: ...
+
+
+@asset(
+    partitions_def=DailyPartitionsDefinition("2020-01-01"),
+    automation_condition=AutomationCondition.eager(),
+)
+def daily() -> None: ...
+
+
+@asset(automation_condition=AutomationCondition.on_cron("0 * * * *"))
+def hourly_cron() -> None: ...
+
+
+defs = Definitions(assets=[a, b, c, daily, hourly_cron])
+
+
+def _evaluated_keys(result) -> set:
+    return {r.key for r in result.results}
+
+
+def test_incremental_evaluation() -> None:
+    with instance_for_test(
+        overrides={"auto_materialize": {"incremental_evaluation": True}}
+    ) as instance:
+        materialize([a, b, c], instance=instance)
+        materialize([daily], instance=instance, partition_key="2020-01-31")
+        materialize([hourly_cron], instance=instance)
+        current_time = datetime.datetime(2020, 2, 1, 23, 40)
+
+        # nothing can be skipped until its result is unchanged from that of the previous evaluation
+        result = None
+        for _ in range(3):
+            result = evaluate_automation_conditions(
+                defs,
+                instance,
+                evaluation_time=current_time,
+                cursor=result.cursor if result else None,
+            )
+            assert _evaluated_keys(result) == {a.key, b.key, c.key, daily.key, hourly_cron.key}
+            assert result.total_requested == 0
+            current_time += datetime.timedelta(minutes=1)
+
+        # nothing has changed, so nothing is evaluated
+        result = evaluate_automation_conditions(
+            defs, instance, evaluation_time=current_time, cursor=result.cursor
+        )
+        assert _evaluated_keys(result) == set()
+        assert result.total_requested == 0
+
+        # a new materialization of a impacts a and its downstream asset b
+        materialize([a], instance=instance)
+        current_time += datetime.timedelta(minutes=1)
+        result = evaluate_automation_conditions(
+            defs, instance, evaluation_time=current_time, cursor=result.cursor
+        )
+        assert _evaluated_keys(result) == {a.key, b.key}
+        assert result.get_requested_partitions(AssetKey("b")) == {None}
+
+        # b was requested on the previous tick, so it is evaluated until its result settles
+        current_time += datetime.timedelta(minutes=1)
+        result = evaluate_automation_conditions(
+            defs, instance, evaluation_time=current_time, cursor=result.cursor
+        )
+        assert b.key in _evaluated_keys(result)
+        assert c.key not in _evaluated_keys(result)
+        assert result.total_requested == 0
+
+        # the cron tick passes, and a new daily partition is added
+        current_time = datetime.datetime(2020, 2, 2, 0, 5)
+        result = evaluate_automation_conditions(
+            defs, instance, evaluation_time=current_time, cursor=result.cursor
+        )
+        assert {daily.key, hourly_cron.key} <= _evaluated_keys(result)
+        assert c.key not in _evaluated_keys(result)
+        assert result.get_requested_partitions(AssetKey("daily")) == {"2020-02-01"}
+        assert result.get_num_requested(AssetKey("hourly_cron")) == 1
+
+
+def test_incremental_evaluation_max_skip_seconds() -> None:
+    with instance_for_test(
+        overrides={
+            "auto_materialize": {
+                "incremental_evaluation": True,
+                "incremental_evaluation_max_skip_seconds": 600,
+            }
+        }
+    ) as instance:
+        materialize([c], instance=instance)
+        current_time = datetime.datetime(2020, 2, 1, 0, 5)
+
+        result = None
+        for _ in range(3):
+            result = evaluate_automation_conditions(
+                [c],
+                instance,
+                evaluation_time=current_time,
+                cursor=result.cursor if result else None,
+            )
+            assert _evaluated_keys(result) == {c.key}
+            current_time += datetime.timedelta(minutes=1)
+
+        result = evaluate_automation_conditions(
+            [c], instance, evaluation_time=current_time, cursor=result.cursor
+        )
+        assert _evaluated_keys(result) == set()
+
+        # the previous evaluation is too old to be reused
+        current_time += datetime.timedelta(minutes=10)
+        result = evaluate_automation_conditions(
+            [c], instance, evaluation_time=current_time, cursor=result.cursor
+        )
+        assert _evaluated_keys(result) == {c.key}
+
+
+def test_incremental_evaluation_disabled() -> None:
+    with instance_for_test() as instance:
+        materialize([a, b, c], instance=instance)
+        result = None
+        for _ in range(3):
+            result = evaluate_automation_conditions(
+                [a, b, c], instance, cursor=result.cursor if result else None
+            )
+            assert _evaluated_keys(result) == {a.key, b.key, c.key}
@@ -0,0 +1,67 @@
+from dagster import (
+    AssetKey,
+    AutomationCondition,
+    Definitions,
+    asset,
+    evaluate_automation_conditions,
+    materialize,
+    multi_asset,
+)
+from dagster._core.definitions.asset_spec import AssetSpec
+from dagster._core.test_utils import instance_for_test
+
+
+def _get_defs() -> Definitions:
+    @asset(automation_condition=AutomationCondition.eager())
+    def root() -> None: ...
+
+    leaves = [
+        asset(
+            name=f"leaf_{i}",
+            deps=[root],
+            automation_condition=AutomationCondition.eager(),
+        )(lambda: None)
+        for i in range(10)
+    ]
+
+    @asset(
+        deps=[leaf.key for leaf in leaves],
+        automation_condition=AutomationCondition.eager(),
+    )
+    def sink() -> None: ...
+
+    @multi_asset(
+        specs=[
+            AssetSpec("m1", deps=[root], automation_condition=AutomationCondition.eager()),
+            AssetSpec("m2", automation_condition=AutomationCondition.eager()),
+        ]
+    )
+    def m(): ...
+
+    return Definitions(assets=[root, *leaves, sink, m])
+
+
+def test_parallel_evaluation_matches_serial() -> None:
+    defs = _get_defs()
+    results = {}
+    for num_workers in [1, 4]:
+        with instance_for_test(
+            overrides={"auto_materialize": {"evaluation_num_workers": num_workers}}
+        ) as instance:
+            result = evaluate_automation_conditions(defs, instance)
+            assert result.total_requested == 0
+
+            materialize([defs.get_assets_def(AssetKey("root"))], instance=instance)
+            results[num_workers] = evaluate_automation_conditions(
+                defs, instance, cursor=result.cursor
+            )
+
+    serial, parallel = results[1], results[4]
+    # results are returned in the same (topological) order
+    assert [r.key for r in serial.results] == [r.key for r in parallel.results]
+    for serial_result, parallel_result in zip(serial.results, parallel.results):
+        assert serial_result.true_subset.size == parallel_result.true_subset.size
+    # every leaf, m1 and m2 are requested, but sink is not as its parents are missing
+    assert serial.total_requested == parallel.total_requested == 12
+    # m2 is requested alongside m1
+    assert parallel.get_num_requested(AssetKey("m2")) == 1
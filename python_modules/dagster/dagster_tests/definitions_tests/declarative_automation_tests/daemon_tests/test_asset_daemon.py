@@ -1,8 +1,11 @@
 import dataclasses
 import datetime
+import time
 from contextlib import contextmanager, nullcontext
 from typing import Any, Generator, Mapping, Optional, Sequence, cast
+from unittest import mock
 
+import dagster._check as check
 import pytest
 from dagster import (
     AssetSpec,
@@ -17,7 +20,11 @@
 from dagster._core.definitions.automation_condition_sensor_definition import (
     AutomationConditionSensorDefinition,
 )
+from dagster._core.definitions.automation_tick_evaluation_context import (
+    AutomationTickEvaluationContext,
+)
 from dagster._core.definitions.sensor_definition import DefaultSensorStatus
+from dagster._core.remote_representation import RemoteSensor
 from dagster._core.scheduler.instigation import (
     InstigatorStatus,
     InstigatorTick,
@@ -33,15 +40,21 @@
     SENSOR_NAME_TAG,
     TICK_ID_TAG,
 )
+from dagster._core.test_utils import freeze_time
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._daemon.asset_daemon import (
     _PRE_SENSOR_AUTO_MATERIALIZE_CURSOR_KEY,
     _PRE_SENSOR_AUTO_MATERIALIZE_INSTIGATOR_NAME,
     _PRE_SENSOR_AUTO_MATERIALIZE_ORIGIN_ID,
     _PRE_SENSOR_AUTO_MATERIALIZE_SELECTOR_ID,
+    AssetDaemon,
+    AssetDaemonSensorLease,
+    _get_sensor_lease_key,
     asset_daemon_cursor_from_instigator_serialized_cursor,
     get_has_migrated_sensor_names,
     get_has_migrated_to_sensors,
+    get_sensor_lease,
+    get_shard_index_for_sensor,
     set_auto_materialize_paused,
 )
 from dagster._serdes.serdes import deserialize_value, serialize_value
@@ -60,6 +73,7 @@
 )
 from dagster_tests.definitions_tests.declarative_automation_tests.scenario_utils.asset_daemon_scenario import (
     AssetDaemonScenario,
+    AssetDaemonScenarioState,
     AssetRuleEvaluationSpec,
 )
 from dagster_tests.definitions_tests.declarative_automation_tests.scenario_utils.base_scenario import (
@@ -825,6 +839,224 @@ def test_auto_materialize_sensor_ticks(num_threads):
                     prev_evaluation_id = evaluation_id
 
 
+def _get_sensor_evaluation_ids(instance: DagsterInstance) -> Mapping[str, Sequence[int]]:
+    evaluation_ids = {}
+    for sensor_state in instance.schedule_storage.all_instigator_state(
+        instigator_type=InstigatorType.SENSOR
+    ):
+        ticks = instance.get_ticks(sensor_state.instigator_origin_id, sensor_state.selector_id)
+        evaluation_ids[sensor_state.selector_id] = [
+            tick.tick_data.auto_materialize_evaluation_id for tick in ticks
+        ]
+    return evaluation_ids
+
+
+def test_sharded_asset_daemon() -> None:
+    with get_daemon_instance() as instance:
+        state = AssetDaemonScenarioState(
+            daemon_sensor_scenario.initial_spec, instance=instance, is_daemon=True
+        )
+        current_time = get_current_datetime()
+
+        def _run_iteration(daemon: AssetDaemon) -> None:
+            with state._create_workspace_context() as workspace_context:  # noqa: SLF001
+                list(
+                    daemon._run_iteration_impl(  # noqa: SLF001
+                        workspace_context,
+                        threadpool_executor=None,
+                        amp_tick_futures={},
+                        debug_crash_flags={},
+                    )
+                )
+
+        with freeze_time(current_time), state._create_workspace_context() as workspace_context:  # noqa: SLF001
+            workspace = workspace_context.create_request_context()
+            repo = next(
+                iter(workspace.get_code_location("test_location").get_repositories().values())
+            )
+            sensors = [sensor for sensor in repo.get_sensors()]
+            for sensor in sensors:
+                instance.start_sensor(sensor)
+        assert len(sensors) == 3
+        shard_by_selector_id = {
+            sensor.selector_id: get_shard_index_for_sensor(sensor.selector_id, 2)
+            for sensor in sensors
+        }
+
+        shards = [
+            AssetDaemon(
+                settings={"num_shards": 2, "shard_index": i}, pre_sensor_interval_seconds=42
+            )
+            for i in range(2)
+        ]
+
+        # each shard only evaluates the sensors that are assigned to it
+        with freeze_time(current_time):
+            _run_iteration(shards[0])
+        evaluation_ids = _get_sensor_evaluation_ids(instance)
+        for selector_id, shard_index in shard_by_selector_id.items():
+            assert len(evaluation_ids[selector_id]) == (1 if shard_index == 0 else 0)
+
+        with freeze_time(current_time):
+            _run_iteration(shards[1])
+        evaluation_ids = _get_sensor_evaluation_ids(instance)
+        for selector_id, shard_index in shard_by_selector_id.items():
+            assert len(evaluation_ids[selector_id]) == 1
+            # evaluation ids are unique across shards
+            assert evaluation_ids[selector_id][0] % 2 == shard_index
+
+        # a second process configured with the same shard cannot evaluate sensors that are leased
+        # by the first
+        duplicate_shard = AssetDaemon(
+            settings={"num_shards": 2, "shard_index": 0}, pre_sensor_interval_seconds=42
+        )
+        current_time += datetime.timedelta(minutes=1)
+        with freeze_time(current_time):
+            _run_iteration(duplicate_shard)
+        assert _get_sensor_evaluation_ids(instance) == evaluation_ids
+
+        # the lease holder continues to evaluate its sensors
+        with freeze_time(current_time):
+            _run_iteration(shards[0])
+        evaluation_ids = _get_sensor_evaluation_ids(instance)
+        for selector_id, shard_index in shard_by_selector_id.items():
+            assert len(evaluation_ids[selector_id]) == (2 if shard_index == 0 else 1)
+
+        # once the leases are released, the other process takes over
+        shards[0]._release_sensor_leases(instance)  # noqa: SLF001
+        current_time += datetime.timedelta(minutes=1)
+        with freeze_time(current_time):
+            _run_iteration(duplicate_shard)
+        evaluation_ids = _get_sensor_evaluation_ids(instance)
+        for selector_id, shard_index in shard_by_selector_id.items():
+            assert len(evaluation_ids[selector_id]) == (3 if shard_index == 0 else 1)
+            if shard_index == 0:
+                lease = check.not_none(get_sensor_lease(instance, selector_id))
+                assert lease.owner_id == duplicate_shard._lease_owner_id  # noqa: SLF001
+
+
+def _run_sharded_iteration_with_evaluate(instance: DagsterInstance, daemon: AssetDaemon, evaluate):
+    state = AssetDaemonScenarioState(
+        daemon_sensor_scenario.initial_spec, instance=instance, is_daemon=True
+    )
+    with state._create_workspace_context() as workspace_context:  # noqa: SLF001
+        with mock.patch.object(AutomationTickEvaluationContext, "evaluate", evaluate):
+            list(
+                daemon._run_iteration_impl(  # noqa: SLF001
+                    workspace_context,
+                    threadpool_executor=None,
+                    amp_tick_futures={},
+                    debug_crash_flags={},
+                )
+            )
+
+
+def _start_sharded_sensors(instance: DagsterInstance) -> Sequence[RemoteSensor]:
+    state = AssetDaemonScenarioState(
+        daemon_sensor_scenario.initial_spec, instance=instance, is_daemon=True
+    )
+    with state._create_workspace_context() as workspace_context:  # noqa: SLF001
+        workspace = workspace_context.create_request_context()
+        repo = next(iter(workspace.get_code_location("test_location").get_repositories().values()))
+        sensors = list(repo.get_sensors())
+    for sensor in sensors:
+        instance.start_sensor(sensor)
+    # only evaluate the sensors on the shard of the first sensor
+    shard_index = get_shard_index_for_sensor(sensors[0].selector_id, 2)
+    return [
+        sensor
+        for sensor in sensors
+        if get_shard_index_for_sensor(sensor.selector_id, 2) == shard_index
+    ]
+
+
+def test_sharded_asset_daemon_tick_outlives_lease() -> None:
+    with get_daemon_instance() as instance:
+        sensors = _start_sharded_sensors(instance)
+        settings = {
+            "num_shards": 2,
+            "shard_index": get_shard_index_for_sensor(sensors[0].selector_id, 2),
+            "sensor_lease_seconds": 1,
+        }
+        daemon = AssetDaemon(settings=settings, pre_sensor_interval_seconds=42)
+        duplicate_shard = AssetDaemon(settings=settings, pre_sensor_interval_seconds=42)
+
+        evaluate = AutomationTickEvaluationContext.evaluate
+        claimed_leases = []
+
+        def _slow_evaluate(self):
+            # each tick takes longer than the lease on its sensor
+            time.sleep(2)
+            # only the lease of the sensor whose tick is running is still current
+            running_selector_ids = []
+            for sensor in sensors:
+                lease = get_sensor_lease(instance, sensor.selector_id)
+                if lease and lease.expiration_timestamp > time.time():
+                    running_selector_ids.append(sensor.selector_id)
+            assert len(running_selector_ids) == 1
+            claimed_leases.append(
+                duplicate_shard._try_acquire_sensor_lease(instance, running_selector_ids[0])  # noqa: SLF001
+            )
+            return evaluate(self)
+
+        _run_sharded_iteration_with_evaluate(instance, daemon, _slow_evaluate)
+
+        # the lease was renewed while each tick ran, so no other process could claim it
+        assert claimed_leases and not any(claimed_leases)
+        for sensor in sensors:
+            ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
+            assert [tick.status for tick in ticks] == [TickStatus.SUCCESS]
+            lease = check.not_none(get_sensor_lease(instance, sensor.selector_id))
+            assert lease.owner_id == daemon._lease_owner_id  # noqa: SLF001
+
+
+def test_sharded_asset_daemon_stops_tick_when_lease_is_lost() -> None:
+    with get_daemon_instance() as instance:
+        sensors = _start_sharded_sensors(instance)
+        daemon = AssetDaemon(
+            settings={
+                "num_shards": 2,
+                "shard_index": get_shard_index_for_sensor(sensors[0].selector_id, 2),
+                "sensor_lease_seconds": 1,
+            },
+            pre_sensor_interval_seconds=42,
+        )
+
+        evaluate = AutomationTickEvaluationContext.evaluate
+
+        def _evaluate_and_lose_lease(self):
+            # another process claims the leases while the tick is running
+            for sensor in sensors:
+                instance.daemon_cursor_storage.set_cursor_values(
+                    {
+                        _get_sensor_lease_key(sensor.selector_id): serialize_value(
+                            AssetDaemonSensorLease(
+                                owner_id="other_process",
+                                expiration_timestamp=time.time() + 300,
+                            )
+                        )
+                    }
+                )
+            # wait for the next renewal of the lease
+            time.sleep(1)
+            return evaluate(self)
+
+        _run_sharded_iteration_with_evaluate(instance, daemon, _evaluate_and_lose_lease)
+
+        # the first tick stopped before submitting any runs, and the sensors that are now leased
+        # by the other process were skipped
+        assert instance.get_runs() == []
+        tick_statuses = [
+            tick.status
+            for sensor in sensors
+            for tick in instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
+        ]
+        assert tick_statuses == [TickStatus.FAILURE]
+        for sensor in sensors:
+            lease = check.not_none(get_sensor_lease(instance, sensor.selector_id))
+            assert lease.owner_id == "other_process"
+
+
 def test_default_purge() -> None:
     with get_daemon_instance(
         extra_overrides={"auto_materialize": {"use_sensors": False}}
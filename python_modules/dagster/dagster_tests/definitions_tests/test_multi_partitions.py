@@ -18,8 +18,16 @@
 )
 from dagster._check import CheckError
 from dagster._core.definitions.asset_graph import AssetGraph
-from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsDefinition
-from dagster._core.definitions.time_window_partitions import TimeWindow, get_time_partitions_def
+from dagster._core.definitions.multi_dimensional_partitions import (
+    MultiPartitionsDefinition,
+    MultiPartitionsSubset,
+)
+from dagster._core.definitions.partition import DefaultPartitionsSubset
+from dagster._core.definitions.time_window_partitions import (
+    TimeWindow,
+    TimeWindowPartitionsSubset,
+    get_time_partitions_def,
+)
 from dagster._core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
 from dagster._core.storage.tags import get_multidimensional_partition_tag
 from dagster._core.test_utils import instance_for_test
@@ -681,3 +689,93 @@ def test_multipartitions_range_cartesian_multiple_keys_in_both_ranges():
         MultiPartitionKey({"a": "2024-01-03", "b": "3"}),
         MultiPartitionKey({"a": "2024-01-03", "b": "4"}),
     ]
+
+
+def test_multi_partitions_subset(monkeypatch):
+    monkeypatch.setenv("DAGSTER_MULTI_PARTITIONS_SUBSETS", "1")
+    partitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2024-01-01", end_date="2024-01-11"),
+            "static": StaticPartitionsDefinition(["a", "b", "c"]),
+        }
+    )
+
+    def keys(static_key, dates):
+        return {
+            MultiPartitionKey({"date": f"2024-01-{day:02d}", "static": static_key}) for day in dates
+        }
+
+    subset = partitions_def.empty_subset().with_partition_keys(
+        keys("a", range(1, 6)) | keys("b", [3, 4, 8])
+    )
+    assert isinstance(subset, MultiPartitionsSubset)
+    assert len(subset) == 8
+    assert subset.get_partition_keys() == keys("a", range(1, 6)) | keys("b", [3, 4, 8])
+    assert "2024-01-03|a" in subset
+    assert "2024-01-03|c" not in subset
+    assert "2024-01-03" not in subset
+    assert subset.get_partition_keys_not_in_subset(partitions_def) == (
+        keys("a", range(6, 11)) | keys("b", [1, 2, 5, 6, 7, 9, 10]) | keys("c", range(1, 11))
+    )
+
+    # the primary (time) dimension is stored as time windows for each secondary key
+    a_subset = subset.subsets_by_secondary_key["a"]
+    assert isinstance(a_subset, TimeWindowPartitionsSubset)
+    assert len(a_subset.included_time_windows) == 1
+    assert set(subset.get_subset_for_dimension_key("date", "2024-01-03").get_partition_keys()) == {
+        "a",
+        "b",
+    }
+    assert set(subset.get_dimension_subset("static").get_partition_keys()) == {"a", "b"}
+    assert len(subset.get_dimension_subset("date")) == 6
+
+    other = partitions_def.empty_subset().with_partition_keys(keys("b", [4, 5]) | keys("c", [1]))
+    assert (subset | other).get_partition_keys() == subset.get_partition_keys() | (
+        other.get_partition_keys()
+    )
+    assert (subset & other).get_partition_keys() == keys("b", [4])
+    assert (subset - other).get_partition_keys() == keys("a", range(1, 6)) | keys("b", [3, 8])
+    assert (subset - subset).is_empty
+    assert (subset - DefaultPartitionsSubset(set(keys("a", range(1, 11))))) == (
+        partitions_def.empty_subset().with_partition_keys(keys("b", [3, 4, 8]))
+    )
+
+    serialized = subset.serialize()
+    assert partitions_def.deserialize_subset(serialized) == subset
+    assert partitions_def.can_deserialize_subset(serialized, None, None)
+
+    # subsets can be read back with the setting in either state
+    monkeypatch.delenv("DAGSTER_MULTI_PARTITIONS_SUBSETS")
+    assert partitions_def.deserialize_subset(serialized) == DefaultPartitionsSubset(
+        subset.get_partition_keys()
+    )
+    monkeypatch.setenv("DAGSTER_MULTI_PARTITIONS_SUBSETS", "1")
+    assert (
+        partitions_def.deserialize_subset(
+            DefaultPartitionsSubset(subset.get_partition_keys()).serialize()
+        )
+        == subset
+    )
+
+
+def test_multi_partitions_subset_static_dimensions(monkeypatch):
+    monkeypatch.setenv("DAGSTER_MULTI_PARTITIONS_SUBSETS", "1")
+    partitions_def = MultiPartitionsDefinition(
+        {
+            "abc": StaticPartitionsDefinition(["a", "b", "c"]),
+            "xyz": StaticPartitionsDefinition(["x", "y", "z"]),
+        }
+    )
+    partition_keys = {
+        MultiPartitionKey({"abc": "a", "xyz": "x"}),
+        MultiPartitionKey({"abc": "b", "xyz": "x"}),
+        MultiPartitionKey({"abc": "c", "xyz": "z"}),
+    }
+
+    subset = partitions_def.subset_with_partition_keys(partition_keys)
+    assert isinstance(subset, MultiPartitionsSubset)
+    assert subset.get_partition_keys() == partition_keys
+    assert set(subset.subsets_by_secondary_key) == {"x", "z"}
+    assert set(subset.get_subset_for_dimension_key("xyz", "x").get_partition_keys()) == {"a", "b"}
+    assert partitions_def.deserialize_subset(subset.serialize()) == subset
+    assert subset.to_serializable_subset() == DefaultPartitionsSubset(partition_keys)
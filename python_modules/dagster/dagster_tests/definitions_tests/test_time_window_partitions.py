@@ -2,6 +2,7 @@
 import random
 from datetime import datetime, timedelta
 from typing import Optional, Sequence, cast
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -1847,3 +1848,125 @@ def test_persisted_time_window_serdes():
     deserialized_time_window = deserialize_value(serialized_time_window, PersistedTimeWindow)
     assert isinstance(deserialized_time_window, PersistedTimeWindow)
     assert serialize_value(deserialized_time_window) == serialized_time_window
+
+
+def _partitions_def_results(
+    partitions_def: TimeWindowPartitionsDefinition, current_time: datetime
+) -> tuple:
+    # methods with an lru_cache are shared between equal partitions definitions
+    for method in [
+        TimeWindowPartitionsDefinition.time_window_for_partition_key,
+        TimeWindowPartitionsDefinition.time_windows_for_partition_keys,
+        TimeWindowPartitionsDefinition.get_partition_keys_in_time_window,
+        TimeWindowPartitionsDefinition._get_first_partition_window,  # noqa: SLF001
+        TimeWindowPartitionsDefinition._get_last_partition_window,  # noqa: SLF001
+    ]:
+        method.cache_clear()  # type: ignore
+
+    partition_keys = partitions_def.get_partition_keys(current_time=current_time)
+    sampled_keys = partition_keys[:3] + partition_keys[-3:]
+    return (
+        partition_keys,
+        partitions_def.get_num_partitions(current_time=current_time),
+        partitions_def.get_partition_keys_between_indexes(2, 7, current_time=current_time),
+        partitions_def.get_first_partition_window(current_time=current_time),
+        partitions_def.get_last_partition_window(current_time=current_time),
+        [partitions_def.time_window_for_partition_key(key) for key in sampled_keys],
+        partitions_def.time_windows_for_partition_keys(frozenset(sampled_keys), validate=False),
+        [partitions_def.has_partition_key(key, current_time=current_time) for key in sampled_keys],
+        [
+            partitions_def.get_partition_key_for_timestamp(
+                current_time.timestamp() - offset, end_closed=end_closed
+            )
+            for offset in [0, 1, 3600, 86400]
+            for end_closed in [True, False]
+        ],
+        partitions_def.get_partition_keys_in_range(
+            PartitionKeyRange(partition_keys[0], partition_keys[-1])
+        )
+        if partition_keys
+        else None,
+    )
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        DailyPartitionsDefinition(start_date="2023-01-01"),
+        DailyPartitionsDefinition(start_date="2023-01-01", hour_offset=7, minute_offset=30),
+        DailyPartitionsDefinition(start_date="2023-01-01", end_offset=2),
+        DailyPartitionsDefinition(start_date="2023-01-01", end_offset=-3, end_date="2023-03-01"),
+        HourlyPartitionsDefinition(start_date="2023-03-01-00:00", minute_offset=15),
+        HourlyPartitionsDefinition(start_date="2023-03-01-00:00", end_offset=-1),
+        TimeWindowPartitionsDefinition(
+            start="2023-03-10-00:00", fmt="%Y-%m-%d-%H:%M", cron_schedule="*/5 * * * *"
+        ),
+        TimeWindowPartitionsDefinition(
+            start="2023-03-10-00:00",
+            fmt="%Y-%m-%d-%H:%M",
+            cron_schedule="*/15 * * * *",
+            timezone="America/New_York",
+            end_offset=1,
+        ),
+        TimeWindowPartitionsDefinition(
+            start="2023-10-31-00:00",
+            fmt="%Y-%m-%d-%H:%M",
+            cron_schedule="*/5 * * * *",
+            timezone="America/New_York",
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "current_time",
+    [
+        create_datetime(2022, 12, 1),
+        create_datetime(2023, 1, 1, 0, 1),
+        create_datetime(2023, 1, 3),
+        create_datetime(2023, 3, 13, 12, 7),
+        create_datetime(2023, 11, 6, 3, 30),
+    ],
+)
+def test_fixed_period_fast_path_matches_iteration(
+    partitions_def: TimeWindowPartitionsDefinition, current_time: datetime
+) -> None:
+    assert partitions_def._fixed_period_seconds  # noqa: SLF001
+    fast_results = _partitions_def_results(partitions_def, current_time)
+
+    with mock.patch.object(TimeWindowPartitionsDefinition, "_fixed_period_seconds", None):
+        iterated_results = _partitions_def_results(
+            copy(partitions_def),  # fresh instance, without the cached fixed period
+            current_time,
+        )
+
+    assert fast_results == iterated_results
+
+
+@pytest.mark.parametrize(
+    "partitions_def, expected",
+    [
+        (DailyPartitionsDefinition(start_date="2023-01-01"), 86400),
+        (DailyPartitionsDefinition(start_date="2023-01-01", timezone="America/New_York"), None),
+        (HourlyPartitionsDefinition(start_date="2023-01-01-00:00"), 3600),
+        (HourlyPartitionsDefinition(start_date="2023-01-01-00:00", timezone="Asia/Kolkata"), None),
+        (WeeklyPartitionsDefinition(start_date="2023-01-01"), None),
+        (
+            TimeWindowPartitionsDefinition(
+                start="2023-01-01",
+                fmt=DATE_FORMAT,
+                cron_schedule="*/5 * * * *",
+                timezone="Asia/Kolkata",
+            ),
+            300,
+        ),
+        (
+            TimeWindowPartitionsDefinition(
+                start="2023-01-01", fmt=DATE_FORMAT, cron_schedule="*/5 3 * * *"
+            ),
+            None,
+        ),
+    ],
+)
+def test_fixed_period_seconds(
+    partitions_def: TimeWindowPartitionsDefinition, expected: Optional[int]
+) -> None:
+    assert partitions_def._fixed_period_seconds == expected  # noqa: SLF001
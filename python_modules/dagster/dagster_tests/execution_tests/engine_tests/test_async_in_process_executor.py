@@ -0,0 +1,231 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from threading import Thread
+
+import pytest
+from dagster import (
+    DagsterEventType,
+    Field,
+    In,
+    Output,
+    String,
+    _seven,
+    async_in_process_executor,
+    job,
+    op,
+    reconstructable,
+)
+from dagster._core.execution.api import execute_job
+from dagster._core.test_utils import instance_for_test
+from dagster._utils import send_interrupt
+
+_lock = threading.Lock()
+_in_flight = {"current": 0, "max": 0}
+
+
+def _reset_in_flight():
+    _in_flight["current"] = 0
+    _in_flight["max"] = 0
+
+
+def _enter():
+    with _lock:
+        _in_flight["current"] += 1
+        _in_flight["max"] = max(_in_flight["max"], _in_flight["current"])
+
+
+def _exit():
+    with _lock:
+        _in_flight["current"] -= 1
+
+
+@op
+async def fetch():
+    _enter()
+    try:
+        await asyncio.sleep(0.5)
+    finally:
+        _exit()
+    return 1
+
+
+@op(ins={"values": In()})
+def total(values):
+    return sum(values)
+
+
+@job(executor_def=async_in_process_executor)
+def fetch_job():
+    total([fetch.alias(f"fetch_{i}")() for i in range(10)])
+
+
+def _run_config(max_concurrent):
+    return {"execution": {"config": {"max_concurrent": max_concurrent}}}
+
+
+def test_async_steps_execute_concurrently():
+    _reset_in_flight()
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(fetch_job), instance=instance, run_config=_run_config(10)
+        ) as result:
+            assert result.success
+            assert result.output_for_node("total") == 10
+
+        # the ops are awaited concurrently, so more than one of them is sleeping at a time
+        assert _in_flight["max"] > 1
+
+
+def test_max_concurrent():
+    _reset_in_flight()
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(fetch_job), instance=instance, run_config=_run_config(2)
+        ) as result:
+            assert result.success
+            assert result.output_for_node("total") == 10
+
+        assert _in_flight["max"] <= 2
+
+
+@op
+def sync_fetch():
+    _enter()
+    try:
+        time.sleep(0.1)
+    finally:
+        _exit()
+    return 1
+
+
+@job(executor_def=async_in_process_executor)
+def mixed_fetch_job():
+    total(
+        [fetch.alias(f"fetch_{i}")() for i in range(10)]
+        + [sync_fetch.alias(f"sync_fetch_{i}")() for i in range(4)]
+    )
+
+
+def test_sync_step_threads_sized_separately():
+    _reset_in_flight()
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(mixed_fetch_job),
+            instance=instance,
+            run_config={
+                "execution": {"config": {"max_concurrent": 14, "max_sync_step_threads": 1}}
+            },
+        ) as result:
+            assert result.success
+            assert result.output_for_node("total") == 14
+
+        # a single thread executes the sync steps, which does not limit the async steps
+        assert _in_flight["max"] > 2
+
+
+@op
+async def async_add_one(num):
+    await asyncio.sleep(0)
+    return num + 1
+
+
+@op
+def sync_double(num):
+    return num * 2
+
+
+@op
+async def async_gen_add_one(num):
+    await asyncio.sleep(0)
+    yield Output(num + 1)
+
+
+@op
+async def async_fail(_num):
+    await asyncio.sleep(0)
+    raise Exception("bad fetch")
+
+
+@op
+def should_not_run(_num):
+    assert False
+
+
+@job(executor_def=async_in_process_executor)
+def mixed_job():
+    sync_double(
+        async_gen_add_one(sync_double.alias("double")(async_add_one(sync_double.alias("one")())))
+    )
+    should_not_run(async_fail(sync_double.alias("two")()))
+
+
+def test_mixed_sync_and_async_steps():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(mixed_job),
+            instance=instance,
+            run_config={
+                "ops": {
+                    "one": {"inputs": {"num": {"value": 1}}},
+                    "two": {"inputs": {"num": {"value": 1}}},
+                }
+            },
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            # ((1 * 2 + 1) * 2 + 1) * 2
+            assert result.output_for_node("sync_double") == 14
+
+            assert [event.step_key for event in result.get_step_failure_events()] == ["async_fail"]
+            assert not result.events_for_node("should_not_run")
+
+
+@op(config_schema={"tempfile": Field(String)})
+async def write_a_file(context):
+    with open(context.op_config["tempfile"], "w", encoding="utf8") as ff:
+        ff.write("yup")
+
+    await asyncio.sleep(30)
+    raise Exception("Timed out")
+
+
+@job(executor_def=async_in_process_executor)
+def write_files_job():
+    write_a_file.alias("write_1")()
+    write_a_file.alias("write_2")()
+
+
+def _send_interrupt_when_written(temp_files):
+    while not all([os.path.exists(temp_file) for temp_file in temp_files]):
+        time.sleep(0.1)
+    send_interrupt()
+
+
+@pytest.mark.skipif(_seven.IS_WINDOWS, reason="Interrupts handled differently on windows")
+def test_interrupt_cancels_async_steps():
+    with tempfile.TemporaryDirectory() as tempdir:
+        with instance_for_test(temp_dir=tempdir) as instance:
+            file_1 = os.path.join(tempdir, "file_1")
+            file_2 = os.path.join(tempdir, "file_2")
+
+            Thread(target=_send_interrupt_when_written, args=([file_1, file_2],)).start()
+
+            start = time.time()
+            with execute_job(
+                reconstructable(write_files_job),
+                run_config={
+                    "ops": {
+                        "write_1": {"config": {"tempfile": file_1}},
+                        "write_2": {"config": {"tempfile": file_2}},
+                    },
+                },
+                instance=instance,
+            ) as result:
+                event_types = [event.event_type for event in result.all_events]
+                assert event_types.count(DagsterEventType.STEP_FAILURE) == 2
+                assert DagsterEventType.PIPELINE_FAILURE in event_types
+
+            assert time.time() - start < 30
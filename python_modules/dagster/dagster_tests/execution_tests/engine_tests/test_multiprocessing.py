@@ -1,6 +1,7 @@
 import os
 import sys
 import time
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -16,6 +17,7 @@
     multiprocess_executor,
     op,
     reconstructable,
+    resource,
 )
 from dagster._check import CheckError
 from dagster._core.definitions.metadata import MetadataValue
@@ -23,6 +25,7 @@
 from dagster._core.events import DagsterEvent, DagsterEventType
 from dagster._core.execution import execution_result
 from dagster._core.execution.api import execute_job
+from dagster._core.executor import multiprocess
 from dagster._core.instance import DagsterInstance
 from dagster._core.storage.mem_io_manager import mem_io_manager
 from dagster._core.test_utils import instance_for_test
@@ -41,6 +44,34 @@ def test_diamond_simple_execution():
     assert result.output_for_node("adder") == 11
 
 
+@pytest.mark.parametrize("send_execution_plan_snapshot", [True, False])
+def test_diamond_multi_execution_plan_snapshot(send_execution_plan_snapshot):
+    with instance_for_test() as instance, mock.patch(
+        "dagster._core.executor.multiprocess._get_step_execution_plan_snapshot",
+        wraps=multiprocess._get_step_execution_plan_snapshot,  # noqa: SLF001
+    ) as get_step_execution_plan_snapshot:
+        with execute_job(
+            reconstructable(define_diamond_job),
+            instance=instance,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "send_execution_plan_snapshot": send_execution_plan_snapshot
+                        }
+                    }
+                }
+            },
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+        # the snapshots are only built when they are sent to the step processes
+        assert get_step_execution_plan_snapshot.call_count == (
+            4 if send_execution_plan_snapshot else 0
+        )
+
+
 def compute_event(result: execution_result.ExecutionResult, op_name: str) -> DagsterEvent:
     for event in result.events_for_node(op_name):
         if event.step_kind_value == "COMPUTE":
@@ -497,3 +528,95 @@ def get_dynamic_op_failure_job():
 )
 def test_dynamic_failure_retry(job_fn, config_fn):
     assert_expected_failure_behavior(job_fn, config_fn)
+
+
+_active_tracked_resources = []
+
+
+@resource
+def tracked_resource():
+    _active_tracked_resources.append(os.getpid())
+    try:
+        yield
+    finally:
+        _active_tracked_resources.pop()
+
+
+@op(ins={"start": In(Nothing)}, required_resource_keys={"tracked"})
+def worker_pid_op(_context):
+    # the resources of earlier steps executed by this worker should have been torn down
+    assert _active_tracked_resources == [os.getpid()]
+    return os.getpid()
+
+
+@job(resource_defs={"tracked": tracked_resource})
+def worker_pool_job():
+    worker_pid_op.alias("first")(worker_pid_op.alias("second")(worker_pid_op.alias("third")()))
+
+
+def _worker_pool_run_config(**worker_pool_config):
+    return {
+        "execution": {
+            "config": {
+                "multiprocess": {"max_concurrent": 1, "worker_pool": worker_pool_config},
+            }
+        },
+    }
+
+
+def test_worker_pool():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(worker_pool_job),
+            instance=instance,
+            run_config=_worker_pool_run_config(),
+        ) as result:
+            assert result.success
+            pids = {result.output_for_node(name) for name in ["first", "second", "third"]}
+            assert len(pids) == 1
+            assert os.getpid() not in pids
+
+
+@pytest.mark.parametrize(
+    "worker_pool_config",
+    [
+        {"max_steps_per_worker": 1},
+        pytest.param(
+            {"max_worker_memory_mb": 1},
+            marks=pytest.mark.skipif(os.name == "nt", reason="No memory limit on windows"),
+        ),
+    ],
+)
+def test_worker_pool_recycle(worker_pool_config):
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(worker_pool_job),
+            instance=instance,
+            run_config=_worker_pool_run_config(**worker_pool_config),
+        ) as result:
+            assert result.success
+            pids = {result.output_for_node(name) for name in ["first", "second", "third"]}
+            assert len(pids) == 3
+
+            recycle_messages = [
+                event.message
+                for event in result.all_events
+                if event.event_type == DagsterEventType.ENGINE_EVENT
+                and "stopping worker process" in (event.message or "")
+            ]
+            assert len(recycle_messages) == 3
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_worker_pool_crash():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(sys_exit_job),
+            instance=instance,
+            run_config={"execution": {"config": {"multiprocess": {"worker_pool": {}}}}},
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("sys_exit")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"
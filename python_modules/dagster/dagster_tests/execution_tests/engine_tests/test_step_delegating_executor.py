@@ -3,6 +3,7 @@
 import tempfile
 import threading
 import time
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -23,6 +24,7 @@
 from dagster._core.definitions.reconstruct import ReconstructableJob, ReconstructableRepository
 from dagster._core.definitions.repository_definition import AssetsDefinitionCacheableData
 from dagster._core.events import DagsterEventType
+from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.api import ReexecutionOptions, execute_job
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.step_delegating import (
@@ -30,6 +32,7 @@
     StepDelegatingExecutor,
     StepHandler,
 )
+from dagster._core.executor.step_delegating.step_delegating_executor import StepEventWaiter
 from dagster._core.storage.tags import GLOBAL_CONCURRENCY_TAG
 from dagster._core.test_utils import environ, instance_for_test
 from dagster._utils.merger import merge_dicts
@@ -50,6 +53,7 @@ class TestStepHandler(StepHandler):
     check_step_health_count = 0
     terminate_step_count = 0
     verify_step_count = 0
+    execution_plan_snapshot_count = 0
 
     @property
     def name(self):
@@ -58,6 +62,8 @@ def name(self):
     def launch_step(self, step_handler_context):
         if step_handler_context.execute_step_args.should_verify_step:
             TestStepHandler.verify_step_count += 1
+        if step_handler_context.execute_step_args.execution_plan_snapshot:
+            TestStepHandler.execution_plan_snapshot_count += 1
         if step_handler_context.execute_step_args.step_keys_to_execute[0] == "baz_op":
             TestStepHandler.saw_baz_op = True
             assert step_handler_context.step_tags["baz_op"] == {"foo": "bar"}
@@ -84,6 +90,7 @@ def reset(cls):
         cls.check_step_health_count = 0
         cls.terminate_step_count = 0
         cls.verify_step_count = 0
+        cls.execution_plan_snapshot_count = 0
 
     @classmethod
     def wait_for_processes(cls):
@@ -208,6 +215,24 @@ def test_dynamic_execute():
     )
 
 
+def test_execute_send_execution_plan_snapshot():
+    from dagster_tests.execution_tests.engine_tests.test_jobs import define_dynamic_job
+
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        result = execute_job(
+            reconstructable(define_dynamic_job),
+            instance=instance,
+            run_config={"execution": {"config": {"send_execution_plan_snapshot": True}}},
+        )
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    assert TestStepHandler.launch_step_count == 11
+    assert TestStepHandler.execution_plan_snapshot_count == 11
+    assert len(result.get_step_success_events()) == 11
+
+
 def test_skipping():
     from dagster_tests.execution_tests.engine_tests.test_jobs import define_skpping_job
 
@@ -256,6 +281,78 @@ def test_execute_intervals():
     # assert TestStepHandler.check_step_health_count >= 3
 
 
+def test_execute_watch_event_log():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        result = execute_job(
+            reconstructable(foo_job),
+            instance=instance,
+            run_config={"execution": {"config": {"watch_event_log": True}}},
+        )
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    assert TestStepHandler.launch_step_count == 3
+
+
+def test_step_event_waiter():
+    waiter = StepEventWaiter()
+
+    def _entry(step_key):
+        return EventLogEntry(
+            error_info=None,
+            level="debug",
+            user_message="",
+            run_id="foo",
+            timestamp=time.time(),
+            step_key=step_key,
+        )
+
+    # events that are not for a step do not wake the executor
+    waiter.on_event(_entry(None), "")
+    start = time.time()
+    waiter.wait(0.5)
+    assert time.time() - start >= 0.5
+
+    threading.Timer(0.1, lambda: waiter.on_event(_entry("bar_op"), "")).start()
+    start = time.time()
+    waiter.wait(30)
+    assert time.time() - start < 30
+
+    # the wakeup is consumed by the wait
+    start = time.time()
+    waiter.wait(0.5)
+    assert time.time() - start >= 0.5
+
+
+def test_execute_batched_step_handler_calls():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        with mock.patch.object(
+            TestStepHandler,
+            "launch_steps",
+            autospec=True,
+            side_effect=StepHandler.launch_steps,
+        ) as launch_steps, mock.patch.object(
+            TestStepHandler,
+            "check_steps_health",
+            autospec=True,
+            side_effect=StepHandler.check_steps_health,
+        ) as check_steps_health:
+            result = execute_job(
+                reconstructable(foo_job),
+                instance=instance,
+                run_config={"execution": {"config": {"check_step_health_interval_seconds": 0}}},
+            )
+            TestStepHandler.wait_for_processes()
+
+    assert result.success
+    assert TestStepHandler.launch_step_count == 3
+    # the two bar ops are launched together, then baz_op once they have both completed
+    assert [len(call.args[1]) for call in launch_steps.call_args_list] == [2, 1]
+    assert check_steps_health.called
+
+
 @op(tags={"database": "tiny"})
 def slow_op(_):
     time.sleep(2)
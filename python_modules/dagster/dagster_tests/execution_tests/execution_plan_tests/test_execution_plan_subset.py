@@ -1,7 +1,25 @@
-from dagster import DependencyDefinition, GraphDefinition, In, Int, Out, Output, op
+from dagster import (
+    DependencyDefinition,
+    DynamicOut,
+    DynamicOutput,
+    GraphDefinition,
+    In,
+    Int,
+    Out,
+    Output,
+    job,
+    op,
+)
 from dagster._core.definitions.job_base import InMemoryJob
 from dagster._core.execution.api import create_execution_plan, execute_plan
+from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.instance import DagsterInstance
+from dagster._core.snap.execution_plan_snapshot import (
+    ExecutionPlanSnapshot,
+    snapshot_from_execution_plan,
+)
+from dagster._core.test_utils import instance_for_test
+from dagster._serdes import deserialize_value, serialize_value
 
 
 def define_two_int_pipeline():
@@ -114,3 +132,76 @@ def has_tag(context):
     )
 
     assert called["yup"]
+
+
+def define_dynamic_job():
+    @op(out=DynamicOut())
+    def emit():
+        for i in range(2):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def double(num):
+        return num * 2
+
+    @op
+    def total(nums):
+        return sum(nums)
+
+    @job
+    def dynamic_job():
+        total(emit().map(double).collect())
+
+    return dynamic_job
+
+
+def test_rehydrate_isolated_subset_plan():
+    job_def = define_dynamic_job()
+    execution_plan = create_execution_plan(job_def)
+    dynamic_mappings = {"emit": {"result": ["0", "1"]}}
+    execution_plan.resolve(dynamic_mappings)
+
+    with instance_for_test() as instance:
+        dagster_run = instance.create_run_for_job(job_def=job_def, execution_plan=execution_plan)
+
+        for step_keys in (["emit"], ["double[0]", "double[1]"], ["total"]):
+            snapshot = deserialize_value(
+                serialize_value(
+                    snapshot_from_execution_plan(
+                        execution_plan.build_isolated_subset_plan(step_keys, job_def),
+                        job_def.get_job_snapshot_id(),
+                    )
+                ),
+                ExecutionPlanSnapshot,
+            )
+            # only the steps to execute and the steps they depend on are included
+            assert len(snapshot.steps) < len(execution_plan.steps)
+
+            known_state = KnownExecutionState(
+                dynamic_mappings=dynamic_mappings if step_keys != ["emit"] else {}
+            )
+            rehydrated_plan = create_execution_plan(
+                job_def,
+                step_keys_to_execute=step_keys,
+                known_state=known_state,
+                execution_plan_snapshot=snapshot,
+            )
+            built_plan = create_execution_plan(
+                job_def, step_keys_to_execute=step_keys, known_state=known_state
+            )
+
+            assert rehydrated_plan.step_keys_to_execute == built_plan.step_keys_to_execute
+            assert rehydrated_plan.artifacts_persisted == built_plan.artifacts_persisted
+            for step in rehydrated_plan.get_steps_to_execute_in_topo_order():
+                assert step == built_plan.get_step_by_key(step.key)
+
+            events = execute_plan(
+                rehydrated_plan,
+                InMemoryJob(job_def),
+                dagster_run=dagster_run,
+                instance=instance,
+            )
+            assert len(find_events(events, event_type="STEP_SUCCESS")) == len(step_keys)
+
+        output_events = find_events(events, event_type="STEP_OUTPUT")
+        assert output_events[0].step_key == "total"
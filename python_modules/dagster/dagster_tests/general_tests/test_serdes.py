@@ -21,8 +21,12 @@
     WhitelistMap,
     _whitelist_for_serdes,
     deserialize_value,
+    deserialize_value_lazily,
+    deserialize_values,
+    is_binary_serialized_value,
     pack_value,
     serialize_value,
+    serialize_value_to_bytes,
     unpack_value,
 )
 from dagster._serdes.utils import hash_str
@@ -1190,3 +1194,184 @@ def foo(self):
     assert (
         deserialize_value(serialize_value(r, whitelist_map=test_env), whitelist_map=test_env) == r
     )
+
+
+def test_compiled_packers(monkeypatch) -> None:
+    test_env = WhitelistMap.create()
+
+    class Inner(NamedTuple):
+        x: int
+
+    _whitelist_for_serdes(test_env)(Inner)
+
+    @_whitelist_for_serdes(
+        test_env,
+        storage_name="StoredOuter",
+        storage_field_names={"renamed": "stored_renamed"},
+        old_fields={"removed": None},
+        skip_when_empty_fields={"empty"},
+        skip_when_none_fields={"none"},
+        field_serializers={"items": SetToSequenceFieldSerializer},
+    )
+    class Outer(NamedTuple):
+        inner: Inner
+        renamed: str
+        items: AbstractSet[str]
+        nested: Mapping[str, Sequence[Inner]]
+        empty: Sequence[int] = []
+        none: Optional[str] = None
+
+    @_whitelist_for_serdes(test_env)
+    @record_custom(field_to_new_mapping={"foo_str": "foo"})
+    class Remapped(IHaveNew):
+        foo_str: str
+        inner: Inner
+
+        def __new__(cls, foo: str, inner: Inner):
+            return super().__new__(cls, foo_str=foo, inner=inner)
+
+    @_whitelist_for_serdes(test_env)
+    @dataclasses.dataclass
+    class DataclassObj:
+        a: int
+        inner: Inner
+
+    values = [
+        Outer(
+            inner=Inner(1),
+            renamed="r",
+            empty=[],
+            none=None,
+            items={"b", "a"},
+            nested={"k": [Inner(2), Inner(3)]},
+        ),
+        Outer(
+            inner=Inner(1),
+            renamed="r",
+            empty=[1],
+            none="n",
+            items=set(),
+            nested={},
+        ),
+        Remapped(foo="f", inner=Inner(4)),
+        DataclassObj(a=1, inner=Inner(5)),
+        [Inner(6), {"k": DataclassObj(a=2, inner=Inner(7))}],
+    ]
+
+    # dataclass instances carrying extra attributes fall back to the generic path
+    with_extra = DataclassObj(a=3, inner=Inner(8))
+    with_extra.__dict__["extra"] = 1
+    values.append(with_extra)
+
+    generic = [
+        (serialize_value(v, whitelist_map=test_env), pack_value(v, whitelist_map=test_env))
+        for v in values
+    ]
+
+    monkeypatch.setenv("DAGSTER_SERDES_COMPILED_PACKERS", "1")
+    for value, (serialized, packed) in zip(values, generic):
+        assert serialize_value(value, whitelist_map=test_env) == serialized
+        assert pack_value(value, whitelist_map=test_env) == packed
+
+    for serialized, _ in generic[:-1]:
+        monkeypatch.setenv("DAGSTER_SERDES_COMPILED_PACKERS", "1")
+        compiled = deserialize_value(serialized, whitelist_map=test_env)
+        monkeypatch.delenv("DAGSTER_SERDES_COMPILED_PACKERS")
+        assert compiled == deserialize_value(serialized, whitelist_map=test_env)
+
+    for name in ["Outer", "Remapped", "DataclassObj"]:
+        serializer = test_env.object_serializers[name]
+        assert serializer._compiled_packer.__name__ == "__compiled_pack__"  # noqa: SLF001
+
+    # unknown values in ignored fields are tolerated, as on the generic path
+    monkeypatch.setenv("DAGSTER_SERDES_COMPILED_PACKERS", "1")
+    assert deserialize_value(
+        '{"__class__": "Inner", "x": 1, "gone": {"__class__": "Unknown"}}',
+        whitelist_map=test_env,
+    ) == Inner(1)
+    with pytest.raises(DeserializationError, match="Unknown"):
+        deserialize_value(
+            '{"__class__": "Inner", "x": {"__class__": "Unknown"}}',
+            whitelist_map=test_env,
+        )
+
+
+def test_binary_format() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Color(Enum):
+        RED = 1
+
+    @_whitelist_for_serdes(test_env)
+    class Foo(NamedTuple):
+        color: Color
+        items: AbstractSet[str]
+        mapping: Mapping[str, Sequence[float]]
+        nested: Optional["Foo"]
+
+    val = Foo(
+        color=Color.RED,
+        items={"a", "b"},
+        mapping={"x": [1.5, 2.0]},
+        nested=Foo(color=Color.RED, items=set(), mapping={}, nested=None),
+    )
+
+    binary = serialize_value_to_bytes(val, whitelist_map=test_env)
+    assert is_binary_serialized_value(binary)
+    assert len(binary) < len(serialize_value(val, whitelist_map=test_env))
+    assert deserialize_value(binary, Foo, whitelist_map=test_env) == val
+
+    # readers accept both formats, including json as bytes
+    json_bytes = serialize_value(val, whitelist_map=test_env).encode("utf-8")
+    assert not is_binary_serialized_value(json_bytes)
+    assert deserialize_values([binary, json_bytes], Foo, whitelist_map=test_env) == [val, val]
+
+    # values msgpack can not represent fall back to json
+    long_int = 2**70
+    fallback = serialize_value_to_bytes({"big": long_int})
+    assert not is_binary_serialized_value(fallback)
+    assert deserialize_value(fallback) == {"big": long_int}
+
+
+def test_deserialize_value_lazily() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Heavy(NamedTuple):
+        name: str
+        values: Sequence[int]
+
+    @_whitelist_for_serdes(test_env)
+    @record
+    class Container:
+        heavies: Sequence[Heavy]
+        label: str
+
+    val = Container(heavies=[Heavy("a", [1, 2]), Heavy("b", [3])], label="c")
+    serialized = serialize_value(val, whitelist_map=test_env)
+
+    lazy = deserialize_value_lazily(
+        serialized, Container, lazy_types=[Heavy], whitelist_map=test_env
+    )
+    assert lazy.label == "c"
+    first, second = lazy.heavies
+    assert isinstance(first, Heavy)
+    assert not first.is_unpacked and not second.is_unpacked
+
+    assert first.name == "a"
+    assert first.is_unpacked
+    assert not second.is_unpacked
+
+    # re-serialization and equality go through the unpacked objects
+    assert lazy == val
+    assert serialize_value(lazy, whitelist_map=test_env) == serialized
+
+    # unknown classes within deferred objects surface on first access
+    with_unknown = serialized.replace('"values": [3]', '"values": {"__class__": "Unknown"}')
+    lazy = deserialize_value_lazily(
+        with_unknown, Container, lazy_types=[Heavy], whitelist_map=test_env
+    )
+    assert lazy.heavies[0].values == [1, 2]
+    with pytest.raises(DeserializationError, match="Unknown"):
+        lazy.heavies[1].values  # noqa: B018
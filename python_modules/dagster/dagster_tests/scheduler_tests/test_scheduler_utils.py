@@ -1,6 +1,7 @@
 MINUTE_BOUNDARY = 1670596320
 
 from dagster._scheduler.scheduler import _get_next_scheduler_iteration_time
+from dagster._scheduler.tick_queue import InstigatorTickQueue
 
 
 def test_next_iteration_time():
@@ -12,3 +13,48 @@ def test_next_iteration_time():
     assert _get_next_scheduler_iteration_time(MINUTE_BOUNDARY + 59.99) == MINUTE_BOUNDARY + 60
 
     assert _get_next_scheduler_iteration_time(MINUTE_BOUNDARY + 60) == MINUTE_BOUNDARY + 120
+
+
+def test_instigator_tick_queue():
+    queue = InstigatorTickQueue()
+    assert queue.next_due_timestamp() is None
+    assert queue.pop_due(MINUTE_BOUNDARY) == []
+
+    queue.push("a", MINUTE_BOUNDARY + 30, "item_a")
+    queue.push("b", MINUTE_BOUNDARY + 10, "item_b")
+    queue.push("c", MINUTE_BOUNDARY + 20, "item_c")
+    assert len(queue) == 3
+    assert queue.next_due_timestamp() == MINUTE_BOUNDARY + 10
+
+    # pushing an instigator that is already queued replaces its due time
+    queue.push("b", MINUTE_BOUNDARY + 40, "item_b")
+    assert len(queue) == 3
+    assert queue.next_due_timestamp() == MINUTE_BOUNDARY + 20
+
+    queue.remove("c")
+    assert "c" not in queue
+    assert queue.next_due_timestamp() == MINUTE_BOUNDARY + 30
+
+    due_ticks = queue.pop_due(MINUTE_BOUNDARY + 45)
+    assert [(tick.selector_id, tick.lag, tick.item) for tick in due_ticks] == [
+        ("a", 15.0, "item_a"),
+        ("b", 5.0, "item_b"),
+    ]
+    assert len(queue) == 0
+    assert queue.next_due_timestamp() is None
+
+    queue.record_lag("a", 15.0)
+    assert queue.pop_lags() == {"a": 15.0}
+    assert queue.pop_lags() == {}
+
+
+def test_instigator_tick_queue_compacts_stale_entries():
+    queue = InstigatorTickQueue()
+    for i in range(5000):
+        queue.push(str(i % 10), MINUTE_BOUNDARY + i, None)
+
+    assert len(queue) == 10
+    assert len(queue._heap) <= 1000  # noqa: SLF001
+    assert [tick.selector_id for tick in queue.pop_due(MINUTE_BOUNDARY + 5000)] == [
+        str(i) for i in range(10)
+    ]
@@ -4,9 +4,14 @@
 
 from dagster import job, op
 from dagster._core.storage.runs.sql_run_storage import (
+    ZSTD_FRAME_MAGIC,
     defensively_unpack_execution_plan_snapshot_query,
+    serialize_deduplicated_snapshot_body,
+    serialize_snapshot_body,
 )
-from dagster._serdes import serialize_value
+from dagster._core.test_utils import environ
+from dagster._serdes import serialize_value, serialize_value_to_bytes
+from dagster._serdes.serdes import BINARY_FORMAT_MARKER
 
 
 def test_defensive_job_not_a_string():
@@ -99,3 +104,112 @@ def noop_job():
     )
 
     assert mock_logger.warning.call_count == 0
+
+
+def test_correctly_fetch_decompress_parse_binary_snapshot():
+    @op
+    def noop_op(_):
+        pass
+
+    @job
+    def noop_job():
+        noop_op()
+
+    noop_job_snapshot = noop_job.get_job_snapshot()
+
+    mock_logger = mock.MagicMock()
+    assert (
+        defensively_unpack_execution_plan_snapshot_query(
+            mock_logger,
+            [zlib.compress(serialize_value_to_bytes(noop_job_snapshot))],
+        )
+        == noop_job_snapshot
+    )
+    assert mock_logger.warning.call_count == 0
+
+    assert (
+        defensively_unpack_execution_plan_snapshot_query(
+            mock_logger,
+            [zlib.compress(BINARY_FORMAT_MARKER + b"\xc1")],
+        )
+        is None
+    )
+    mock_logger.warning.assert_called_with(
+        "get-pipeline-snapshot: Could not parse binary serialized value in snapshot table."
+    )
+
+
+def _get_noop_job_snapshot():
+    @op
+    def noop_op(_):
+        pass
+
+    @job
+    def noop_job():
+        noop_op()
+
+    return noop_job.get_job_snapshot()
+
+
+def test_correctly_fetch_decompress_parse_zstd_snapshot():
+    noop_job_snapshot = _get_noop_job_snapshot()
+
+    with environ({"DAGSTER_RUN_STORAGE_ZSTD_SNAPSHOTS": "1"}):
+        snapshot_body = serialize_snapshot_body(noop_job_snapshot)
+    assert snapshot_body.startswith(ZSTD_FRAME_MAGIC)
+
+    mock_logger = mock.MagicMock()
+    assert (
+        defensively_unpack_execution_plan_snapshot_query(mock_logger, [snapshot_body])
+        == noop_job_snapshot
+    )
+    assert mock_logger.warning.call_count == 0
+
+    assert (
+        defensively_unpack_execution_plan_snapshot_query(mock_logger, [ZSTD_FRAME_MAGIC + b"junk"])
+        is None
+    )
+    mock_logger.warning.assert_called_with(
+        "get-pipeline-snapshot: Could not decompress bytes stored in snapshot table."
+    )
+
+
+def test_correctly_fetch_decompress_parse_deduplicated_snapshot():
+    noop_job_snapshot = _get_noop_job_snapshot()
+    snapshot_body, chunks = serialize_deduplicated_snapshot_body(noop_job_snapshot)
+    assert chunks
+
+    loaded_chunk_ids = []
+
+    def _load_snapshot_chunks(chunk_ids):
+        loaded_chunk_ids.append(chunk_ids)
+        return {chunk_id: chunks[chunk_id] for chunk_id in chunk_ids}
+
+    mock_logger = mock.MagicMock()
+    assert (
+        defensively_unpack_execution_plan_snapshot_query(
+            mock_logger, [snapshot_body], _load_snapshot_chunks
+        )
+        == noop_job_snapshot
+    )
+    assert mock_logger.warning.call_count == 0
+    # nested chunks are loaded in one batch per level
+    assert set().union(*loaded_chunk_ids) == set(chunks.keys())
+    assert len(loaded_chunk_ids) < len(chunks)
+
+    assert defensively_unpack_execution_plan_snapshot_query(mock_logger, [snapshot_body]) is None
+    mock_logger.warning.assert_called_with(
+        "get-pipeline-snapshot: Deduplicated snapshot stored in snapshot table, but chunks can not"
+        " be loaded."
+    )
+
+    assert (
+        defensively_unpack_execution_plan_snapshot_query(
+            mock_logger, [snapshot_body], lambda chunk_ids: {}
+        )
+        is None
+    )
+    mock_logger.warning.assert_called_with(
+        "get-pipeline-snapshot: Could not load chunks of deduplicated snapshot stored in snapshot"
+        " table."
+    )
@@ -6,6 +6,7 @@
 from concurrent.futures import ThreadPoolExecutor
 
 import pytest
+import sqlalchemy as db
 import yaml
 from dagster import (
     DagsterEventType,
@@ -25,6 +26,7 @@
 from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus
 from dagster._core.storage.event_log import SqliteEventLogStorage
 from dagster._core.storage.local_compute_log_manager import LocalComputeLogManager
+from dagster._core.storage.query_count import get_storage_query_count
 from dagster._core.storage.root import LocalArtifactStorage
 from dagster._core.storage.runs import SqliteRunStorage
 from dagster._core.test_utils import environ
@@ -306,3 +308,21 @@ def _run(_):
     gc.collect()
 
     assert baseline == len(DagsterInstance._TEMP_DIRS)  # noqa: SLF001
+
+
+def test_storage_query_count():
+    with tempfile.TemporaryDirectory() as tempdir:
+        with DagsterInstance.local_temp(tempdir) as instance:
+            start_count = get_storage_query_count()
+            instance.get_runs()
+            assert get_storage_query_count() > start_count
+
+        # queries against engines that dagster's storages did not create are not counted
+        engine = db.create_engine(f"sqlite:///{os.path.join(tempdir, 'other.db')}")
+        try:
+            start_count = get_storage_query_count()
+            with engine.connect() as conn:
+                conn.execute(db.text("SELECT 1"))
+            assert get_storage_query_count() == start_count
+        finally:
+            engine.dispose()
@@ -1,4 +1,5 @@
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 from typing import Any, Callable, Mapping, Optional
@@ -8,6 +9,9 @@
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
 from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.sqlite.consolidated_sqlite_event_log import (
+    ConsolidatedSqliteEventLogStorage,
+)
 from dagster._core.utils import make_new_run_id
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
@@ -61,6 +65,32 @@ def dispose(self) -> None:
             self._watcher = None
 
 
+class ConsolidatedSqlitePollingEventLogStorage(ConsolidatedSqliteEventLogStorage):
+    """Consolidated SQLite-backed event log storage that uses SqlPollingEventWatcher for watching
+    runs. Unlike the run-sharded storage, storage ids are comparable across runs, so the watcher
+    polls all watched runs with a single query.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super(ConsolidatedSqlitePollingEventLogStorage, self).__init__(*args, **kwargs)
+        self._watcher: Optional[SqlPollingEventWatcher] = None
+
+    def watch(self, run_id, cursor, callback):
+        if self._watcher is None:
+            self._watcher = SqlPollingEventWatcher(self)
+
+        self._watcher.watch_run(run_id, cursor, callback)
+
+    def end_watch(self, run_id, handler):
+        if self._watcher:
+            self._watcher.unwatch_run(run_id, handler)
+
+    def dispose(self) -> None:
+        if self._watcher:
+            self._watcher.close()
+            self._watcher = None
+
+
 RUN_ID = make_new_run_id()
 
 
@@ -146,3 +176,100 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def test_watch_many_runs():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        run_ids = [make_new_run_id() for _ in range(5)]
+        watched = {run_id: [] for run_id in run_ids}
+
+        def _watch_fn(run_id):
+            return lambda event, _cursor: watched[run_id].append(event)
+
+        watch_fns = {run_id: _watch_fn(run_id) for run_id in run_ids}
+
+        # events stored before watching are delivered when the watch starts with no cursor
+        storage.store_event(create_event(0, run_ids[0]))
+
+        for run_id in run_ids:
+            storage.watch(run_id, None, watch_fns[run_id])
+
+        # all of the runs are polled by a single thread
+        assert len([t for t in threading.enumerate() if t.name == "sql-event-watch"]) == 1
+
+        for i in range(1, 4):
+            for run_id in run_ids:
+                storage.store_event(create_event(i, run_id))
+
+        attempts = 50
+        while any(len(watched[run_id]) < 3 for run_id in run_ids) and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(evt.message) for evt in watched[run_ids[0]]] == [0, 1, 2, 3]
+        for run_id in run_ids[1:]:
+            assert [int(evt.message) for evt in watched[run_id]] == [1, 2, 3]
+            assert all(evt.run_id == run_id for evt in watched[run_id])
+
+        storage.end_watch(run_ids[0], watch_fns[run_ids[0]])
+        storage.store_event(create_event(4, run_ids[0]))
+        storage.store_event(create_event(4, run_ids[1]))
+
+        attempts = 50
+        while len(watched[run_ids[1]]) < 4 and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(evt.message) for evt in watched[run_ids[1]]] == [1, 2, 3, 4]
+        assert len(watched[run_ids[0]]) == 4
+
+        storage.dispose()
+        assert not [t for t in threading.enumerate() if t.name == "sql-event-watch"]
+
+
+class LateCommitSqlitePollingEventLogStorage(ConsolidatedSqlitePollingEventLogStorage):
+    """Hides the records of some storage ids from the watcher, as if their write had not yet been
+    committed.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super(LateCommitSqlitePollingEventLogStorage, self).__init__(*args, **kwargs)
+        self.uncommitted_storage_ids = set()
+
+    def get_records_for_runs(self, run_cursors, limit=None):
+        return [
+            record
+            for record in super().get_records_for_runs(run_cursors, limit=limit)
+            if record.storage_id not in self.uncommitted_storage_ids
+        ]
+
+
+def test_watch_many_runs_late_commit():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = LateCommitSqlitePollingEventLogStorage(tmpdir_path)
+        run_ids = [make_new_run_id() for _ in range(2)]
+        watched = {run_id: [] for run_id in run_ids}
+        for run_id in run_ids:
+            storage.watch(run_id, None, lambda event, _cursor: watched[event.run_id].append(event))
+
+        # the event of the second run gets the lower storage id but commits after the other one
+        storage.uncommitted_storage_ids = {(storage.get_maximum_record_id() or 0) + 1}
+        storage.store_event(create_event(1, run_ids[1]))
+        storage.store_event(create_event(1, run_ids[0]))
+
+        attempts = 50
+        while not watched[run_ids[0]] and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+        assert [int(evt.message) for evt in watched[run_ids[0]]] == [1]
+        assert watched[run_ids[1]] == []
+
+        storage.uncommitted_storage_ids = set()
+        attempts = 50
+        while not watched[run_ids[1]] and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+        assert [int(evt.message) for evt in watched[run_ids[1]]] == [1]
+
+        storage.dispose()
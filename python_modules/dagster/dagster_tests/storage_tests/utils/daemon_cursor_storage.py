@@ -33,3 +33,17 @@ def test_kvs(self, storage):
             "bar": "2",
             "key": "3",
         }
+
+    def test_compare_and_set_cursor_value(self, storage):
+        # an unset key is only set when no value is expected
+        assert not storage.compare_and_set_cursor_value("key", "value", "new-value")
+        assert storage.get_cursor_values({"key"}) == {}
+        assert storage.compare_and_set_cursor_value("key", None, "value")
+        assert not storage.compare_and_set_cursor_value("key", None, "other-value")
+        assert storage.get_cursor_values({"key"}) == {"key": "value"}
+
+        # a set key is only replaced while it still has the expected value
+        assert not storage.compare_and_set_cursor_value("key", "stale-value", "other-value")
+        assert storage.compare_and_set_cursor_value("key", "value", "new-value")
+        assert not storage.compare_and_set_cursor_value("key", "value", "other-value")
+        assert storage.get_cursor_values({"key"}) == {"key": "new-value"}
@@ -4,6 +4,7 @@
 import re
 import string
 import sys
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack, contextmanager
@@ -94,9 +95,14 @@
 from dagster._core.storage.event_log.base import EventLogStorage
 from dagster._core.storage.event_log.migration import (
     EVENT_LOG_DATA_MIGRATIONS,
+    RUN_STATS_TABLES,
     migrate_asset_key_data,
 )
-from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
+from dagster._core.storage.event_log.schema import (
+    RunStatsTable,
+    RunStepStatsTable,
+    SqlEventLogStorageTable,
+)
 from dagster._core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster._core.storage.io_manager import IOManager
 from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
@@ -112,7 +118,7 @@
 from dagster._loggers import colored_console_logger
 from dagster._serdes.serdes import deserialize_value
 from dagster._time import get_current_datetime
-from dagster._utils.concurrency import ConcurrencySlotStatus
+from dagster._utils.concurrency import ConcurrencySlotClaim, ConcurrencySlotStatus
 
 # py36 & 37 list.append not hashable
 
@@ -843,6 +849,126 @@ def test_event_log_step_stats(
         assert len(d_stats.expectation_results) == 2
         assert len(c_stats.attempts_list) == 1
 
+    def test_run_stats_tables(
+        self,
+        test_run_id: str,
+        storage: EventLogStorage,
+    ):
+        if not isinstance(storage, SqlEventLogStorage) or not storage.has_run_stats_tables:
+            pytest.skip("storage does not maintain run stats tables")
+
+        if not storage.is_run_sharded:
+            assert storage.has_secondary_index(RUN_STATS_TABLES)
+
+        events, _ = _synthesize_events(return_one_op_func, run_id=test_run_id)
+        for event in [*events, *_stats_records(run_id=test_run_id)]:
+            storage.store_event(event)
+
+        def _step_stats_by_key(step_stats):
+            return {stats.step_key: stats for stats in step_stats}
+
+        def _assert_stats_from_event_log(run_id, run_stats, step_stats):
+            with mock.patch.object(storage, "_can_read_run_stats_tables", return_value=False):
+                assert storage.get_stats_for_run(run_id) == run_stats
+                assert _step_stats_by_key(storage.get_step_stats_for_run(run_id)) == step_stats
+
+        run_stats = storage.get_stats_for_run(test_run_id)
+        step_stats = _step_stats_by_key(storage.get_step_stats_for_run(test_run_id))
+        assert run_stats.steps_succeeded == 3
+        assert run_stats.materializations == 3
+        assert run_stats.start_time and run_stats.end_time
+        assert step_stats["D"].status == StepEventStatus.SUCCESS
+        assert len(step_stats["D"].materialization_events) == 3
+        assert len(step_stats["D"].expectation_results) == 2
+        d_stats = storage.get_step_stats_for_run(test_run_id, step_keys=["D"])
+        assert d_stats == [step_stats["D"]]
+
+        # the stats tables agree with aggregating the event log
+        _assert_stats_from_event_log(test_run_id, run_stats, step_stats)
+
+        # events stored in a batch are folded into a single update of each row
+        batch_run_id = make_new_run_id()
+        storage.store_event_batch(
+            [
+                event._replace(run_id=batch_run_id)
+                for event in [*events, *_stats_records(run_id=batch_run_id)]
+            ]
+        )
+        assert storage.get_stats_for_run(batch_run_id) == run_stats._replace(run_id=batch_run_id)
+        _assert_stats_from_event_log(
+            batch_run_id,
+            storage.get_stats_for_run(batch_run_id),
+            _step_stats_by_key(storage.get_step_stats_for_run(batch_run_id)),
+        )
+
+        # rebuilding the stats from the event log gives the same stats
+        storage.rebuild_run_stats(test_run_id)
+        assert storage.get_stats_for_run(test_run_id) == run_stats
+        assert _step_stats_by_key(storage.get_step_stats_for_run(test_run_id)) == step_stats
+
+        # as does the data migration run by `dagster instance migrate`, or building the tables of a
+        # run shard as it is first connected to
+        with storage.run_connection(test_run_id) as conn:
+            if storage.is_run_sharded:
+                # a run shard created before the tables were added
+                RunStatsTable.drop(conn)
+                RunStepStatsTable.drop(conn)
+            else:
+                conn.execute(RunStatsTable.delete())
+                conn.execute(RunStepStatsTable.delete())
+        if storage.is_run_sharded:
+            storage._initialized_dbs = set()  # noqa: SLF001
+        else:
+            storage.reindex_events(force=True)
+        assert storage.get_stats_for_run(test_run_id) == run_stats
+        assert _step_stats_by_key(storage.get_step_stats_for_run(test_run_id)) == step_stats
+
+        storage.delete_events(test_run_id)
+        assert storage.get_stats_for_run(test_run_id).steps_succeeded == 0
+        assert storage.get_step_stats_for_run(test_run_id) == []
+
+    def test_rebuild_run_stats_with_concurrent_events(
+        self,
+        test_run_id: str,
+        storage: EventLogStorage,
+    ):
+        if not isinstance(storage, SqlEventLogStorage) or not storage.has_run_stats_tables:
+            pytest.skip("storage does not maintain run stats tables")
+        if isinstance(storage, InMemoryEventLogStorage):
+            pytest.skip("in-memory storage shares a single connection across threads")
+
+        records = _stats_records(run_id=test_run_id)
+        for event in records[:4]:
+            storage.store_event(event)
+
+        # the remaining events are stored while the rebuild is reading the event log
+        original_get_stats = storage._get_stats_for_run_from_event_log  # noqa: SLF001
+        store_thread = None
+
+        def _get_stats_while_storing(conn, run_id):
+            nonlocal store_thread
+            store_thread = threading.Thread(
+                target=lambda: [storage.store_event(event) for event in records[4:]]
+            )
+            store_thread.start()
+            time.sleep(0.1)
+            return original_get_stats(conn, run_id)
+
+        with mock.patch.object(
+            storage, "_get_stats_for_run_from_event_log", side_effect=_get_stats_while_storing
+        ):
+            storage.rebuild_run_stats(test_run_id)
+        assert store_thread
+        store_thread.join()
+
+        run_stats = storage.get_stats_for_run(test_run_id)
+        step_stats = storage.get_step_stats_for_run(test_run_id)
+        assert run_stats.steps_succeeded == 2
+        assert run_stats.materializations == 3
+        with mock.patch.object(storage, "_can_read_run_stats_tables", return_value=False):
+            assert storage.get_stats_for_run(test_run_id) == run_stats
+            assert storage.get_step_stats_for_run(test_run_id) == step_stats
+
     def test_secondary_index(self, storage: EventLogStorage):
         if not isinstance(storage, SqlEventLogStorage) or isinstance(
             storage, InMemoryEventLogStorage
@@ -4318,6 +4444,43 @@ def test_get_maximum_record_id(self, storage: EventLogStorage):
 
         assert storage.get_maximum_record_id() == index + 10
 
+    def test_get_records_for_runs(self, storage: EventLogStorage):
+        if not isinstance(storage, SqlEventLogStorage) or storage.is_run_sharded:
+            pytest.skip("storage does not support fetching records across runs")
+
+        run_ids = [make_new_run_id() for _ in range(3)]
+        unwatched_run_id = make_new_run_id()
+        for i in range(3):
+            for run_id in [*run_ids, unwatched_run_id]:
+                storage.store_event(create_test_event_log_record(str(i), run_id=run_id))
+
+        records = storage.get_records_for_runs({run_id: None for run_id in run_ids})
+        assert len(records) == 9
+        assert {record.event_log_entry.run_id for record in records} == set(run_ids)
+        storage_ids = [record.storage_id for record in records]
+        assert storage_ids == sorted(storage_ids)
+
+        assert (
+            storage.get_records_for_runs({run_id: None for run_id in run_ids}, limit=4)
+            == records[:4]
+        )
+
+        # each run is only fetched after its own cursor
+        run_cursors = {
+            run_ids[0]: EventLogCursor.from_storage_id(records[-1].storage_id).to_string(),
+            run_ids[1]: EventLogCursor.from_storage_id(records[1].storage_id).to_string(),
+            run_ids[2]: None,
+        }
+        assert storage.get_records_for_runs(run_cursors) == [
+            record
+            for record in records
+            if record.event_log_entry.run_id == run_ids[2]
+            or (
+                record.event_log_entry.run_id == run_ids[1]
+                and record.storage_id > records[1].storage_id
+            )
+        ]
+
     def test_get_materialization_tag(
         self,
         storage: EventLogStorage,
@@ -4922,6 +5085,65 @@ def claim(key, run_id, step_key, priority=0):
 
         assert claim("foo", run_id, "e") == ConcurrencySlotStatus.CLAIMED
 
+    def test_concurrency_batch_claim(self, storage: EventLogStorage):
+        if not storage.supports_global_concurrency_limits:
+            pytest.skip("storage does not support global op concurrency")
+
+        run_id = make_new_run_id()
+
+        def batch_claim(*claims):
+            claim_statuses = storage.claim_concurrency_slots(
+                run_id,
+                [
+                    ConcurrencySlotClaim(concurrency_key=key, step_key=step_key, priority=priority)
+                    for key, step_key, priority in claims
+                ],
+            )
+            return [claim_status.slot_status for claim_status in claim_statuses]
+
+        storage.set_concurrency_slots("foo", 3)
+        storage.set_concurrency_slots("bar", 1)
+
+        # claims are granted in order, across keys
+        assert batch_claim(
+            ("foo", "step_1", 0),
+            ("bar", "step_2", 0),
+            ("foo", "step_3", 0),
+            ("bar", "step_4", 0),
+            ("foo", "step_5", 0),
+            ("foo", "step_6", 0),
+        ) == [
+            ConcurrencySlotStatus.CLAIMED,
+            ConcurrencySlotStatus.CLAIMED,
+            ConcurrencySlotStatus.CLAIMED,
+            ConcurrencySlotStatus.BLOCKED,
+            ConcurrencySlotStatus.CLAIMED,
+            ConcurrencySlotStatus.BLOCKED,
+        ]
+
+        # re-claiming is idempotent for the steps that already hold a slot
+        assert batch_claim(("foo", "step_1", 0), ("bar", "step_4", 0)) == [
+            ConcurrencySlotStatus.CLAIMED,
+            ConcurrencySlotStatus.BLOCKED,
+        ]
+
+        # a higher priority pending step is assigned the freed slot ahead of older steps
+        assert batch_claim(("foo", "step_7", 2)) == [ConcurrencySlotStatus.BLOCKED]
+        storage.free_concurrency_slot_for_step(run_id, "step_1")
+        storage.free_concurrency_slot_for_step(run_id, "step_2")
+        assert batch_claim(("foo", "step_6", 0), ("foo", "step_7", 2), ("bar", "step_4", 0)) == [
+            ConcurrencySlotStatus.BLOCKED,
+            ConcurrencySlotStatus.CLAIMED,
+            ConcurrencySlotStatus.CLAIMED,
+        ]
+
+        foo_info = storage.get_concurrency_info("foo")
+        assert foo_info.active_slot_count == 3
+        assert foo_info.pending_step_count == 1
+        bar_info = storage.get_concurrency_info("bar")
+        assert bar_info.active_slot_count == 1
+        assert bar_info.pending_step_count == 0
+
     def test_concurrency_allocate_from_pending(self, storage: EventLogStorage):
         if not storage.supports_global_concurrency_limits:
             pytest.skip("storage does not support global op concurrency")
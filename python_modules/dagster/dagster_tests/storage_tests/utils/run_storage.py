@@ -31,17 +31,20 @@
 from dagster._core.storage.root import LocalArtifactStorage
 from dagster._core.storage.runs.base import RunStorage
 from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
-from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+from dagster._core.storage.runs.schema import QueuedRunsTable, SnapshotsTable
+from dagster._core.storage.runs.sql_run_storage import SnapshotType, SqlRunStorage
+from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._core.storage.tags import (
     BACKFILL_ID_TAG,
     PARENT_RUN_ID_TAG,
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
     RUN_FAILURE_REASON_TAG,
 )
-from dagster._core.test_utils import freeze_time
+from dagster._core.test_utils import environ, freeze_time
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.utils import make_new_run_id
 from dagster._daemon.daemon import SensorDaemon
@@ -1161,6 +1164,82 @@ def test_add_get_execution_snapshot(self, storage: RunStorage):
 
             assert not storage.has_execution_plan_snapshot(snapshot_id)
 
+    @pytest.mark.parametrize("zstd", [False, True])
+    def test_add_get_deduplicated_snapshot(self, storage: RunStorage, zstd: bool):
+        from dagster._core.execution.api import create_execution_plan
+        from dagster._core.snap import snapshot_from_execution_plan
+
+        if not isinstance(storage, SqlRunStorage):
+            pytest.skip("Snapshot deduplication is only implemented for SQL run storages")
+
+        @op
+        def upstream():
+            return 1
+
+        @op
+        def downstream(value):
+            return value
+
+        @job
+        def first_version():
+            downstream(upstream())
+
+        @op
+        def another_downstream(value):
+            return value
+
+        @job
+        def second_version():
+            value = upstream()
+            downstream(value)
+            another_downstream(value)
+
+        def _count_chunks() -> int:
+            return len(
+                storage.fetchall(
+                    db_select([SnapshotsTable.c.snapshot_id]).where(
+                        SnapshotsTable.c.snapshot_type == SnapshotType.CHUNK.value
+                    )
+                )
+            )
+
+        with environ(
+            {
+                "DAGSTER_RUN_STORAGE_DEDUPLICATED_SNAPSHOTS": "1",
+                "DAGSTER_RUN_STORAGE_ZSTD_SNAPSHOTS": "1" if zstd else "0",
+            }
+        ):
+            first_snapshot = first_version.get_job_snapshot()
+            first_snapshot_id = storage.add_job_snapshot(first_snapshot)
+            first_chunk_count = _count_chunks()
+            assert first_chunk_count > 0
+
+            second_snapshot = second_version.get_job_snapshot()
+            second_snapshot_id = storage.add_job_snapshot(second_snapshot)
+            # the ops, config types and dagster types shared with the first version are not stored
+            # again
+            assert 0 < _count_chunks() - first_chunk_count < first_chunk_count
+
+            assert serialize_pp(storage.get_job_snapshot(first_snapshot_id)) == serialize_pp(
+                first_snapshot
+            )
+            assert serialize_pp(storage.get_job_snapshot(second_snapshot_id)) == serialize_pp(
+                second_snapshot
+            )
+
+            ep_snapshot = snapshot_from_execution_plan(
+                create_execution_plan(second_version), second_snapshot_id
+            )
+            ep_snapshot_id = storage.add_execution_plan_snapshot(ep_snapshot)
+            assert serialize_pp(
+                storage.get_execution_plan_snapshot(ep_snapshot_id)
+            ) == serialize_pp(ep_snapshot)
+
+        # readers do not need the flags to load deduplicated snapshots
+        assert serialize_pp(storage.get_job_snapshot(first_snapshot_id)) == serialize_pp(
+            first_snapshot
+        )
+
     def test_fetch_run_filter(self, storage):
         assert storage
         one = make_new_run_id()
@@ -1744,6 +1823,102 @@ def test_secondary_index(self, storage):
         for name in REQUIRED_DATA_MIGRATIONS.keys():
             assert storage.has_built_index(name)
 
+    def test_queued_runs(self, storage: RunStorage):
+        if not storage.supports_queued_run_index:
+            pytest.skip("storage does not support the queued run index")
+
+        def _run_event(run_id, event_type):
+            storage.handle_run_event(
+                run_id,
+                DagsterEvent(
+                    message="a message",
+                    event_type_value=event_type.value,
+                    job_name="foo",
+                ),
+            )
+
+        def _queued_run_ids(cursor=None, limit=None):
+            return [run.run_id for run in storage.get_queued_runs(cursor=cursor, limit=limit).runs]
+
+        def _add_run(run_id, status=DagsterRunStatus.QUEUED, tags=None):
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    job_name="foo",
+                    status=status,
+                    tags=tags,
+                    remote_job_origin=self.fake_job_origin("foo"),
+                )
+            )
+
+        [one, two, three, four] = [make_new_run_id() for _ in range(4)]
+        _add_run(one)
+        _add_run(two, tags={PRIORITY_TAG: "5"})
+        _add_run(three, tags={PRIORITY_TAG: "-1"})
+        # runs that are not queued are not added to the queue until they are enqueued
+        _add_run(four, status=DagsterRunStatus.NOT_STARTED)
+        assert _queued_run_ids() == [two, one, three]
+
+        _run_event(four, DagsterEventType.RUN_ENQUEUED)
+        assert _queued_run_ids() == [two, one, four, three]
+
+        # page through the queue
+        result = storage.get_queued_runs(limit=3)
+        assert [run.run_id for run in result.runs] == [two, one, four]
+        assert result.has_more
+        result = storage.get_queued_runs(cursor=result.cursor, limit=3)
+        assert [run.run_id for run in result.runs] == [three]
+        assert not result.has_more
+
+        # the cursor remains valid after the run it points to leaves the queue
+        cursor = storage.get_queued_runs(limit=2).cursor
+        _run_event(one, DagsterEventType.RUN_STARTING)
+        assert _queued_run_ids(cursor=cursor) == [four, three]
+        assert _queued_run_ids() == [two, four, three]
+
+        # updating the priority tag of a queued run moves it within the queue
+        storage.add_run_tags(three, {PRIORITY_TAG: "10"})
+        assert _queued_run_ids() == [three, two, four]
+
+        _run_event(two, DagsterEventType.RUN_CANCELED)
+        assert _queued_run_ids() == [three, four]
+
+        if self.can_delete_runs():
+            storage.delete_run(three)
+            assert _queued_run_ids() == [four]
+
+        storage.wipe()
+        assert _queued_run_ids() == []
+
+    def test_reconcile_queued_runs(self, storage: RunStorage):
+        if not storage.supports_queued_run_index or not isinstance(storage, SqlRunStorage):
+            pytest.skip("storage does not support the queued run index")
+
+        [one, two, three] = [make_new_run_id() for _ in range(3)]
+        for run_id, status in [
+            (one, DagsterRunStatus.QUEUED),
+            (two, DagsterRunStatus.QUEUED),
+            (three, DagsterRunStatus.STARTED),
+        ]:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    job_name="foo",
+                    status=status,
+                    remote_job_origin=self.fake_job_origin("foo"),
+                )
+            )
+        assert storage.reconcile_queued_runs() == []
+
+        # simulate a run that was queued by a process that did not know about the index
+        with storage.connect() as conn:
+            conn.execute(QueuedRunsTable.delete().where(QueuedRunsTable.c.run_id == one))
+        assert [run.run_id for run in storage.get_queued_runs().runs] == [two]
+
+        assert storage.reconcile_queued_runs() == [one]
+        assert [run.run_id for run in storage.get_queued_runs().runs] == [two, one]
+        assert storage.reconcile_queued_runs() == []
+
     def test_handle_run_event_job_success_test(self, storage, instance):
         run_id = make_new_run_id()
         run_to_add = TestRunStorage.build_run(job_name="pipeline_name", run_id=run_id)
@@ -1,5 +1,7 @@
 import asyncio
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from typing import Iterable, List, NamedTuple
 from unittest import mock
@@ -7,7 +9,7 @@
 import pytest
 from dagster._core.loader import InstanceLoadableBy, LoadingContext
 from dagster._model import DagsterModel
-from dagster._utils.aiodataloader import DataLoader
+from dagster._utils.aiodataloader import BlockingDataLoader, DataLoader
 
 
 class Context:
@@ -197,3 +199,59 @@ def test_sync_loadable_by() -> None:
     d2 = LoadableThing.blocking_get(context, "d")
     assert d1 == d2
     assert context.instance.query.call_count == 2
+
+
+def test_blocking_loader_threads() -> None:
+    loading = threading.Barrier(2, timeout=10)
+    calls = []
+
+    def batch_load_fn(keys: Iterable[str]) -> List[str]:
+        keys = list(keys)
+        calls.append(keys)
+        if keys != ["same"]:
+            # both threads must be inside batch_load_fn at the same time
+            loading.wait()
+        return [f"{key}_value" for key in keys]
+
+    loader = BlockingDataLoader(batch_load_fn=batch_load_fn)
+
+    # different keys are fetched in parallel
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(loader.blocking_load, ["a", "b"]))
+    assert results == ["a_value", "b_value"]
+    assert sorted(calls) == [["a"], ["b"]]
+
+    # loads of the same key wait for the fetch that is already in flight
+    calls.clear()
+    release = threading.Event()
+    original_batch_load_fn = loader.batch_load_fn
+
+    def slow_batch_load_fn(keys: Iterable[str]) -> List[str]:
+        release.wait(10)
+        return original_batch_load_fn(keys)
+
+    loader.batch_load_fn = slow_batch_load_fn
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(loader.blocking_load, "same") for _ in range(4)]
+        release.set()
+        assert [future.result() for future in futures] == ["same_value"] * 4
+    assert calls == [["same"]]
+
+
+def test_blocking_loader_exception() -> None:
+    class TestException(Exception): ...
+
+    fail = True
+
+    def batch_load_fn(keys: Iterable[str]) -> List[str]:
+        if fail:
+            raise TestException()
+        return list(keys)
+
+    loader = BlockingDataLoader(batch_load_fn=batch_load_fn)
+    with pytest.raises(TestException):
+        loader.blocking_load("a")
+
+    # failed loads are not cached
+    fail = False
+    assert loader.blocking_load("a") == "a"
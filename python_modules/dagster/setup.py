@@ -117,11 +117,14 @@ def get_version() -> str:
     ],
     extras_require={
         "docker": ["docker"],
+        "msgpack": ["msgpack>=1.0"],
+        "zstd": ["zstandard>=0.19"],
         "test": [
             "buildkite-test-collector",
             "docker",
             f"grpcio-tools>={GRPC_VERSION_FLOOR}",
             "mock==3.0.5",
+            "msgpack>=1.0",
             "mypy-protobuf",
             "objgraph",
             "pytest-cov==5.0.0",
@@ -136,6 +139,7 @@ def get_version() -> str:
             "morefs[asynclocal]",
             "fsspec<2024.5.0",  # morefs incompatibly
             "rapidfuzz",
+            "zstandard>=0.19",
         ],
         "mypy": ["mypy==1.8.0"],
         "pyright": [
@@ -2,7 +2,7 @@
 import sys
 import time
 from enum import Enum
-from typing import Any, Callable, List, Optional, Set, TypeVar
+from typing import Any, Callable, List, Mapping, Optional, Set, TypeVar
 
 import kubernetes.client
 import kubernetes.client.rest
@@ -28,6 +28,7 @@
 DEFAULT_WAIT_TIMEOUT = 86400.0  # 1 day
 DEFAULT_WAIT_BETWEEN_ATTEMPTS = 10.0  # 10 seconds
 DEFAULT_JOB_POD_COUNT = 1  # expect job:pod to be 1:1 by default
+JOB_LIST_PAGE_SIZE = 500
 
 
 class WaitForPodState(Enum):
@@ -475,6 +476,36 @@ def _get_job_status():
 
         return k8s_api_retry(_get_job_status, max_retries=3, timeout=wait_time_between_attempts)
 
+    def get_job_statuses(
+        self,
+        namespace: str,
+        label_selector: str,
+        wait_time_between_attempts=DEFAULT_WAIT_BETWEEN_ATTEMPTS,
+    ) -> Mapping[str, V1JobStatus]:
+        """Returns the status of every job in the namespace that matches the label selector, keyed
+        by job name. The jobs are listed in pages, so that the statuses of many jobs can be fetched
+        with a handful of API calls rather than one call per job.
+        """
+        statuses = {}
+        continue_token = None
+        while True:
+
+            def _list_jobs(continue_token=continue_token):
+                return self.batch_api.list_namespaced_job(
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    limit=JOB_LIST_PAGE_SIZE,
+                    _continue=continue_token,
+                )
+
+            jobs = k8s_api_retry(_list_jobs, max_retries=3, timeout=wait_time_between_attempts)
+            for job in jobs.items:
+                statuses[job.metadata.name] = job.status
+
+            continue_token = jobs.metadata._continue  # noqa: SLF001
+            if not continue_token:
+                return statuses
+
     def delete_job(
         self,
         job_name,
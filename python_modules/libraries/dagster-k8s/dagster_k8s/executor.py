@@ -1,4 +1,4 @@
-from typing import Iterator, List, Optional, cast
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, cast
 
 import kubernetes.config
 from dagster import (
@@ -23,6 +23,7 @@
     StepHandlerContext,
 )
 from dagster._utils.merger import merge_dicts
+from kubernetes.client.models import V1JobStatus
 
 from dagster_k8s.client import DagsterKubernetesClient
 from dagster_k8s.container_context import K8sContainerContext
@@ -35,6 +36,7 @@
     get_user_defined_k8s_config,
 )
 from dagster_k8s.launcher import K8sRunLauncher
+from dagster_k8s.utils import sanitize_k8s_label
 
 _K8S_EXECUTOR_CONFIG_SCHEMA = merge_dicts(
     DagsterK8sJobConfig.config_type_job(),
@@ -316,6 +318,42 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckSt
             namespace=container_context.namespace,
             job_name=job_name,
         )
+        return self._get_step_health(step_key, job_name, status)
+
+    def check_steps_health(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> Sequence[CheckStepHealthResult]:
+        if not step_handler_contexts:
+            return []
+
+        # list all of the run's step jobs in each namespace at once, rather than reading each job
+        # individually
+        run_id = step_handler_contexts[0].execute_step_args.run_id
+        label_selector = (
+            f"app.kubernetes.io/component=step_worker,dagster/run-id={sanitize_k8s_label(run_id)}"
+        )
+        statuses_by_namespace: Dict[str, Mapping[str, V1JobStatus]] = {}
+
+        results = []
+        for step_handler_context in step_handler_contexts:
+            step_key = self._get_step_key(step_handler_context)
+            job_name = self._get_k8s_step_job_name(step_handler_context)
+            namespace = check.not_none(self._get_container_context(step_handler_context).namespace)
+            if namespace not in statuses_by_namespace:
+                statuses_by_namespace[namespace] = self._api_client.get_job_statuses(
+                    namespace=namespace, label_selector=label_selector
+                )
+            status = statuses_by_namespace[namespace].get(job_name)
+            if status is None:
+                # user-defined job labels may override the labels that the jobs are listed by, so
+                # read any job that was not listed individually before reporting it as missing
+                status = self._api_client.get_job_status(namespace=namespace, job_name=job_name)
+            results.append(self._get_step_health(step_key, job_name, status))
+        return results
+
+    def _get_step_health(
+        self, step_key: str, job_name: str, status: Optional[V1JobStatus]
+    ) -> CheckStepHealthResult:
         if not status:
             return CheckStepHealthResult.unhealthy(
                 reason=f"Kubernetes job {job_name} for step {step_key} could not be found."
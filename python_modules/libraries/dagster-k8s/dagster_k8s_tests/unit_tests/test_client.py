@@ -21,6 +21,7 @@
     V1Job,
     V1JobList,
     V1JobStatus,
+    V1ListMeta,
     V1ObjectMeta,
     V1Pod,
     V1PodList,
@@ -63,6 +64,34 @@ def assert_logger_calls(mock_logger, log_messages):
         assert args[0] == log_message
 
 
+def test_get_job_statuses():
+    mock_client = create_mocked_client()
+
+    def _job(name, status):
+        return V1Job(metadata=V1ObjectMeta(name=name), status=status)
+
+    mock_client.batch_api.list_namespaced_job.side_effect = [
+        V1JobList(
+            items=[_job("a_job", V1JobStatus(active=1)), _job("b_job", V1JobStatus(failed=1))],
+            metadata=V1ListMeta(_continue="next_page"),
+        ),
+        V1JobList(items=[_job("c_job", V1JobStatus(succeeded=1))], metadata=V1ListMeta()),
+    ]
+
+    statuses = mock_client.get_job_statuses(namespace="a_namespace", label_selector="foo=bar")
+    assert statuses == {
+        "a_job": V1JobStatus(active=1),
+        "b_job": V1JobStatus(failed=1),
+        "c_job": V1JobStatus(succeeded=1),
+    }
+
+    # the second page is fetched with the continue token from the first
+    first_call, second_call = mock_client.batch_api.list_namespaced_job.call_args_list
+    assert first_call.kwargs["label_selector"] == "foo=bar"
+    assert first_call.kwargs["_continue"] is None
+    assert second_call.kwargs["_continue"] == "next_page"
+
+
 #####
 # wait_for_job tests
 #####
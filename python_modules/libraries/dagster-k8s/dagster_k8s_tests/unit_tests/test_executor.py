@@ -1,6 +1,7 @@
 import json
 from unittest import mock
 
+import kubernetes
 import pytest
 from dagster import job, op, repository
 from dagster._config import process_config, resolve_to_config_type
@@ -10,7 +11,10 @@
 from dagster._core.execution.context_creation_job import create_context_free_log_manager
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.init import InitExecutorContext
-from dagster._core.executor.step_delegating.step_handler.base import StepHandlerContext
+from dagster._core.executor.step_delegating.step_handler.base import (
+    CheckStepHealthResult,
+    StepHandlerContext,
+)
 from dagster._core.remote_representation.handle import RepositoryHandle
 from dagster._core.storage.fs_io_manager import fs_io_manager
 from dagster._core.test_utils import (
@@ -24,7 +28,8 @@
 from dagster._utils.hosted_user_process import remote_job_from_recon_job
 from dagster_k8s.container_context import K8sContainerContext
 from dagster_k8s.executor import _K8S_EXECUTOR_CONFIG_SCHEMA, K8sStepHandler, k8s_job_executor
-from dagster_k8s.job import UserDefinedDagsterK8sConfig
+from dagster_k8s.job import UserDefinedDagsterK8sConfig, get_k8s_job_name
+from kubernetes.client.models import V1Job, V1JobList, V1JobStatus, V1ListMeta, V1ObjectMeta
 
 
 @job(
@@ -475,6 +480,73 @@ def test_step_handler(kubeconfig_file, k8s_instance):
     assert labels["dagster/run-id"] == run.run_id
 
 
+def test_step_handler_check_steps_health(kubeconfig_file, k8s_instance):
+    mock_k8s_client_batch_api = mock.MagicMock()
+    handler = K8sStepHandler(
+        image="bizbuz",
+        container_context=K8sContainerContext(namespace="foo"),
+        load_incluster_config=False,
+        kubeconfig_file=kubeconfig_file,
+        k8s_client_batch_api=mock_k8s_client_batch_api,
+    )
+
+    run = create_run_for_test(
+        k8s_instance,
+        job_name="bar",
+        job_code_origin=reconstructable(bar).get_python_origin(),
+    )
+    step_handler_context = _step_handler_context(
+        job_def=reconstructable(bar),
+        dagster_run=run,
+        instance=k8s_instance,
+        executor=_get_executor(k8s_instance, reconstructable(bar)),
+    )
+    job_name = f"dagster-step-{get_k8s_job_name(run.run_id, 'foo')}"
+
+    def _job_list(*jobs):
+        return V1JobList(items=list(jobs), metadata=V1ListMeta())
+
+    mock_k8s_client_batch_api.list_namespaced_job.return_value = _job_list(
+        V1Job(metadata=V1ObjectMeta(name=job_name), status=V1JobStatus(active=1))
+    )
+    assert handler.check_steps_health([step_handler_context]) == [CheckStepHealthResult.healthy()]
+
+    # all of the run's step jobs are listed with a single call, instead of reading each job
+    mock_k8s_client_batch_api.list_namespaced_job.assert_called_once()
+    _args, kwargs = mock_k8s_client_batch_api.list_namespaced_job.call_args
+    assert kwargs["namespace"] == "foo"
+    assert kwargs["label_selector"] == (
+        f"app.kubernetes.io/component=step_worker,dagster/run-id={run.run_id}"
+    )
+    assert not mock_k8s_client_batch_api.read_namespaced_job_status.called
+
+    mock_k8s_client_batch_api.list_namespaced_job.return_value = _job_list(
+        V1Job(metadata=V1ObjectMeta(name=job_name), status=V1JobStatus(failed=1))
+    )
+    [result] = handler.check_steps_health([step_handler_context])
+    assert not result.is_healthy
+    assert result.unhealthy_reason == (f"Discovered failed Kubernetes job {job_name} for step foo.")
+
+    # a job that is not listed, e.g. because its labels were overridden, is read individually
+    mock_k8s_client_batch_api.list_namespaced_job.return_value = _job_list()
+    mock_k8s_client_batch_api.read_namespaced_job_status.return_value = V1Job(
+        metadata=V1ObjectMeta(name=job_name), status=V1JobStatus(active=1)
+    )
+    assert handler.check_steps_health([step_handler_context]) == [CheckStepHealthResult.healthy()]
+    args, kwargs = mock_k8s_client_batch_api.read_namespaced_job_status.call_args
+    assert args == (job_name,)
+    assert kwargs["namespace"] == "foo"
+
+    mock_k8s_client_batch_api.read_namespaced_job_status.side_effect = (
+        kubernetes.client.rest.ApiException(status=404, reason="Not Found")
+    )
+    [result] = handler.check_steps_health([step_handler_context])
+    assert not result.is_healthy
+    assert result.unhealthy_reason == (
+        f"Kubernetes job {job_name} for step foo could not be found."
+    )
+
+
 def test_step_handler_user_defined_config(kubeconfig_file, k8s_instance):
     mock_k8s_client_batch_api = mock.MagicMock()
     with environ({"FOO_TEST": "bar"}):
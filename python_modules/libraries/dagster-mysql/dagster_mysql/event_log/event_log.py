@@ -17,6 +17,7 @@
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
+from dagster._core.storage.event_log.schema import ConcurrencySlotsTable
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -170,6 +171,27 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
                 except db_exc.IntegrityError:
                     pass
 
+    def _claim_free_concurrency_slot(
+        self, conn: Connection, concurrency_key: str, run_id: str, step_key: str
+    ) -> bool:
+        # Overload base implementation to find and claim the free slot in a single statement, so
+        # that claiming a slot is one round trip. MySQL does not allow the updated table to be
+        # selected from in a subquery, but does support limiting the rows of an update.
+        return bool(
+            conn.execute(
+                ConcurrencySlotsTable.update()
+                .values(run_id=run_id, step_key=step_key)
+                .where(
+                    db.and_(
+                        ConcurrencySlotsTable.c.concurrency_key == concurrency_key,
+                        ConcurrencySlotsTable.c.step_key == None,  # noqa: E711
+                        ConcurrencySlotsTable.c.deleted == False,  # noqa: E712
+                    )
+                )
+                .with_dialect_options(mysql_limit=1)
+            ).rowcount
+        )
+
     def _connect(self) -> ContextManager[Connection]:
         return create_mysql_connection(self._engine, __file__, "event log")
 
@@ -144,11 +144,13 @@ def upgrade(self) -> None:
         with self.connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
 
-    def has_built_index(self, migration_name: str) -> None:
+    def has_built_index(self, migration_name: str) -> bool:
+        # only cache indexes that have been built, so that a data migration run from another
+        # process is picked up without restarting this one
         if migration_name not in self._index_migration_cache:
-            self._index_migration_cache[migration_name] = super(
-                MySQLRunStorage, self
-            ).has_built_index(migration_name)
+            if not super(MySQLRunStorage, self).has_built_index(migration_name):
+                return False
+            self._index_migration_cache[migration_name] = True
         return self._index_migration_cache[migration_name]
 
     def mark_index_built(self, migration_name: str) -> None:
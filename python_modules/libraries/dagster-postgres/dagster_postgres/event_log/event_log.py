@@ -4,11 +4,12 @@
 import dagster._check as check
 import sqlalchemy as db
 import sqlalchemy.dialects as db_dialects
+import sqlalchemy.exc as db_exc
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
-from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS, BATCH_WRITABLE_EVENTS
+from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.config import pg_config
 from dagster._core.storage.event_log import (
@@ -21,6 +22,7 @@
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
 from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
+from dagster._core.storage.event_log.schema import ConcurrencySlotsTable
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -28,7 +30,7 @@
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
-from dagster._core.storage.sqlalchemy_compat import db_select
+from dagster._core.storage.sqlalchemy_compat import db_scalar_subquery, db_select
 from dagster._serdes import ConfigurableClass, ConfigurableClassData, deserialize_value
 from sqlalchemy import event
 from sqlalchemy.engine import Connection
@@ -174,21 +176,30 @@ def store_event(self, event: EventLogEntry) -> None:
         check.inst_param(event, "event", EventLogEntry)
 
         insert_event_statement = self.prepare_insert_event(event)  # from SqlEventLogStorage.py
-        with self._connect() as conn:
-            result = conn.execute(
-                insert_event_statement.returning(
-                    SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+
+        def _insert_event() -> int:
+            with self.run_transaction(event.run_id) as conn:
+                result = conn.execute(
+                    insert_event_statement.returning(
+                        SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+                    )
                 )
-            )
-            res = result.fetchone()
-            result.close()
+                res = result.fetchone()
+                result.close()
 
-            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
-            conn.execute(
-                db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
-                {"notify_id": res[0] + "_" + str(res[1])},  # type: ignore
-            )
-            event_id = int(res[1])  # type: ignore
+                # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+                conn.execute(
+                    db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                    {"notify_id": res[0] + "_" + str(res[1])},  # type: ignore
+                )
+                self.update_run_stats(conn, [event])
+                return int(res[1])  # type: ignore
+
+        try:
+            event_id = _insert_event()
+        except db_exc.IntegrityError:
+            # a run stats row was inserted concurrently, and is updated on the second attempt
+            event_id = _insert_event()
 
         if (
             event.is_dagster_event
@@ -210,23 +221,57 @@ def store_event(self, event: EventLogEntry) -> None:
     def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
         check.sequence_param(events, "event", of_type=EventLogEntry)
 
-        check.invariant(
-            all(event.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS for event in events),
-            f"{BATCH_WRITABLE_EVENTS} are the only currently supported events for batch writes.",
-        )
-
         insert_event_statement = self.prepare_insert_event_batch(events)
-        with self._connect() as conn:
-            result = conn.execute(insert_event_statement.returning(SqlEventLogStorageTable.c.id))
-            event_ids = [cast(int, row[0]) for row in result.fetchall()]
 
-        # We only update the asset table with the last event
-        self.store_asset_event(events[-1], event_ids[-1])
+        def _insert_events() -> Sequence[int]:
+            with self.run_transaction(None) as conn:
+                result = conn.execute(
+                    insert_event_statement.returning(
+                        SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+                    )
+                )
+                rows = result.fetchall()
+
+                # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+                conn.execute(
+                    db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                    [{"notify_id": row[0] + "_" + str(row[1])} for row in rows],
+                )
+                self.update_run_stats(conn, events)
+                return [cast(int, row[1]) for row in rows]
+
+        try:
+            event_ids = _insert_events()
+        except db_exc.IntegrityError:
+            # a run stats row was inserted concurrently, and is updated on the second attempt
+            event_ids = _insert_events()
 
         if any((event_id is None for event_id in event_ids)):
             raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
 
-        self.store_asset_event_tags(events, event_ids)
+        asset_events = [
+            (event, event_id)
+            for event, event_id in zip(events, event_ids)
+            if event.is_dagster_event
+            and event.dagster_event_type in ASSET_EVENTS
+            and event.get_dagster_event().asset_key
+        ]
+        if asset_events:
+            # We only update the asset table with the last event of each type for each asset
+            last_asset_events = {
+                (event.get_dagster_event().asset_key, event.dagster_event_type): (event, event_id)
+                for event, event_id in asset_events
+            }
+            for event, event_id in last_asset_events.values():
+                self.store_asset_event(event, event_id)
+
+            self.store_asset_event_tags(
+                [event for event, _ in asset_events], [event_id for _, event_id in asset_events]
+            )
+
+        for event, event_id in zip(events, event_ids):
+            if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(event, event_id)
 
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
@@ -300,6 +345,31 @@ def add_dynamic_partitions(
                 .on_conflict_do_nothing(),
             )
 
+    def _claim_free_concurrency_slot(
+        self, conn: Connection, concurrency_key: str, run_id: str, step_key: str
+    ) -> bool:
+        # Overload base implementation to find and claim the free slot in a single statement, so
+        # that claiming a slot is one round trip
+        free_slot_query = (
+            db_select([ConcurrencySlotsTable.c.id])
+            .where(
+                db.and_(
+                    ConcurrencySlotsTable.c.concurrency_key == concurrency_key,
+                    ConcurrencySlotsTable.c.step_key == None,  # noqa: E711
+                    ConcurrencySlotsTable.c.deleted == False,  # noqa: E712
+                )
+            )
+            .with_for_update(skip_locked=True)
+            .limit(1)
+        )
+        return bool(
+            conn.execute(
+                ConcurrencySlotsTable.update()
+                .values(run_id=run_id, step_key=step_key)
+                .where(ConcurrencySlotsTable.c.id == db_scalar_subquery(free_slot_query))
+            ).rowcount
+        )
+
     def _connect(self) -> ContextManager[Connection]:
         return create_pg_connection(self._engine)
 
@@ -309,6 +379,19 @@ def run_connection(self, run_id: Optional[str] = None) -> ContextManager[Connect
     def index_connection(self) -> ContextManager[Connection]:
         return self._connect()
 
+    @contextmanager
+    def run_transaction(self, run_id: Optional[str]) -> Iterator[Connection]:
+        """Context manager yielding a connection to access the event logs for a specific run that
+        has begun a transaction.
+        """
+        with self.run_connection(run_id) as conn:
+            if conn.in_transaction():
+                yield conn
+            else:
+                conn = conn.execution_options(isolation_level="READ COMMITTED")  # noqa: PLW2901
+                with conn.begin():
+                    yield conn
+
     @contextmanager
     def index_transaction(self) -> Iterator[Connection]:
         """Context manager yielding a connection to the index shard that has begun a transaction."""
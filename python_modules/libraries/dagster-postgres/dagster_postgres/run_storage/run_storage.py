@@ -1,4 +1,3 @@
-import zlib
 from typing import ContextManager, Mapping, Optional
 
 import dagster._check as check
@@ -163,10 +162,12 @@ def upgrade(self) -> None:
             run_alembic_upgrade(pg_alembic_config(__file__), conn)
 
     def has_built_index(self, migration_name: str) -> bool:
+        # only cache indexes that have been built, so that a data migration run from another
+        # process is picked up without restarting this one
         if migration_name not in self._index_migration_cache:
-            self._index_migration_cache[migration_name] = super(
-                PostgresRunStorage, self
-            ).has_built_index(migration_name)
+            if not super(PostgresRunStorage, self).has_built_index(migration_name):
+                return False
+            self._index_migration_cache[migration_name] = True
         return self._index_migration_cache[migration_name]
 
     def mark_index_built(self, migration_name: str) -> None:
@@ -222,12 +223,13 @@ def set_cursor_values(self, pairs: Mapping[str, str]) -> None:
             conn.execute(upsert_stmt)
 
     def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
+        snapshot_body = self._serialize_snapshot_body(snapshot_obj)
         with self.connect() as conn:
             snapshot_insert = (
                 db_dialects.postgresql.insert(SnapshotsTable)
                 .values(
                     snapshot_id=snapshot_id,
-                    snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
+                    snapshot_body=snapshot_body,
                     snapshot_type=snapshot_type.value,
                 )
                 .on_conflict_do_nothing()